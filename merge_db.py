@@ -42,8 +42,10 @@ if str(SRC_DIR) not in sys.path:
 
 try:
     import pandas as pd
+    import pyarrow.parquet as pq
     from models.data_models import PreloadedDatasetMetadata, DatasetType
     from utils.data_path_config import DataPathConfig
+    from utils.dataset_detector import detect_parquet_type
 except ImportError as e:
     print(f"[ERROR] Failed to import project modules: {e}", file=sys.stderr)
     print("       Make sure to run this script from the project root directory.", file=sys.stderr)
@@ -60,45 +62,39 @@ logging.basicConfig(
 logger = logging.getLogger("merge_db")
 
 
-def _detect_dataset_type(df: "pd.DataFrame") -> DatasetType | None:
-    """parquet DataFrame 컬럼으로 DE/GO 타입 자동 판별"""
-    cols = set(df.columns)
-    de_required = {"gene_id", "log2fc", "adj_pvalue"}
-    go_required = {"term_id", "description", "fdr"}
-    if de_required.issubset(cols):
-        return DatasetType.DIFFERENTIAL_EXPRESSION
-    if go_required.issubset(cols):
-        return DatasetType.GO_ANALYSIS
-    return None
+def _detect_dataset_type(parquet_file: Path) -> DatasetType | None:
+    """parquet 스키마(footer)만 읽어 ATAC / chromVAR / Multi-Group / DE / GO 타입 자동 판별"""
+    return detect_parquet_type(parquet_file)
 
 
 def _make_metadata_from_parquet(parquet_file: Path) -> PreloadedDatasetMetadata | None:
     """parquet 파일에서 최소 메타데이터 자동 생성"""
     import re
     try:
-        df = pd.read_parquet(parquet_file, engine="pyarrow")
+        dataset_type = _detect_dataset_type(parquet_file)
     except Exception as e:
         logger.warning(f"  Cannot read '{parquet_file.name}': {e}")
         return None
 
-    dataset_type = _detect_dataset_type(df)
     if dataset_type is None:
         logger.warning(
             f"  Cannot determine type of '{parquet_file.name}' "
-            "(no DE or GO standard columns). Skipping."
+            "(no ATAC, chromVAR, Multi-Group, DE or GO standard columns). Skipping."
         )
         return None
 
-    row_count = len(df)
+    # 행 수는 footer, 유의 유전자 수는 필요한 컬럼만 읽어 계산
+    row_count = pq.ParquetFile(parquet_file).metadata.num_rows
     gene_count = 0
     significant_genes = 0
 
     if dataset_type == DatasetType.DIFFERENTIAL_EXPRESSION:
         gene_count = row_count
-        if "adj_pvalue" in df.columns:
+        if "adj_pvalue" in pq.read_schema(parquet_file).names:
             try:
+                padj = pd.read_parquet(parquet_file, engine="pyarrow", columns=["adj_pvalue"])
                 significant_genes = int(
-                    (pd.to_numeric(df["adj_pvalue"], errors="coerce") < 0.05).sum()
+                    (pd.to_numeric(padj["adj_pvalue"], errors="coerce") < 0.05).sum()
                 )
             except Exception:
                 pass
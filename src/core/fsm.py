@@ -51,6 +51,7 @@ class Event(Enum):
     LOAD_DATA = auto()               # 데이터 로드 시작
     DATA_LOAD_SUCCESS = auto()       # 데이터 로드 성공
     DATA_LOAD_FAILED = auto()        # 데이터 로드 실패
+    LOAD_CANCELLED = auto()          # 데이터 로드 취소 (사용자)
     START_FILTER = auto()            # 필터링 시작
     FILTER_SUCCESS = auto()          # 필터링 성공
     FILTER_FAILED = auto()           # 필터링 실패
@@ -124,6 +125,7 @@ class FSM:
         # LOADING_DATA 상태에서의 전환
         self.add_transition(State.LOADING_DATA, Event.DATA_LOAD_SUCCESS, State.DATA_LOADED)
         self.add_transition(State.LOADING_DATA, Event.DATA_LOAD_FAILED, State.ERROR)
+        self.add_transition(State.LOADING_DATA, Event.LOAD_CANCELLED, State.IDLE)
         
         # DATA_LOADED 상태에서의 전환
         self.add_transition(State.DATA_LOADED, Event.START_FILTER, State.FILTERING)
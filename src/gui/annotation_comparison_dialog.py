@@ -32,6 +32,7 @@ class AnnotationComparisonDialog(BasePlotDialog):
         self.logger = logging.getLogger(__name__)
         self.datasets = datasets
         self._matrix_df = None  # 마지막 집계 (카테고리 × 데이터셋), Export용
+        self._long_df = None    # _build_long_df 결과 (데이터셋은 다이얼로그 동안 고정)
         super().__init__("Genomic Annotation Comparison", parent, figsize=(9, 6))
         # 카테고리가 많아 그림 안 범례는 막대를 가림 → 기본을 플롯 밖 우측으로
         self._labels.legend_pos_combo.blockSignals(True)
@@ -96,8 +97,8 @@ class AnnotationComparisonDialog(BasePlotDialog):
         for w in (self._all_radio, self._sig_radio,
                   self._count_radio, self._prop_radio, self._enr_radio):
             w.toggled.connect(self._on_controls_changed)
-        self._fdr_spin.valueChanged.connect(self._update_plot)
-        self._lfc_spin.valueChanged.connect(self._update_plot)
+        self._fdr_spin.valueChanged.connect(self._schedule_replot)
+        self._lfc_spin.valueChanged.connect(self._schedule_replot)
 
     def _on_controls_changed(self, checked: bool):
         # toggled는 해제/선택 두 번 발생 → 선택된 경우에만 처리
@@ -123,7 +124,9 @@ class AnnotationComparisonDialog(BasePlotDialog):
 
     def _build_long_df(self):
         """데이터셋들을 long-format(dataset/annotation/log2fc/adj_pvalue)으로 병합.
-        (df, order) 반환."""
+        (df, order) 반환. 숫자 변환은 데이터셋 캐시(numeric_column)를 쓰고 결과는 재사용한다."""
+        if self._long_df is not None:
+            return self._long_df
         ann_col = StandardColumns.ANNOTATION
         lfc_col, padj_col = StandardColumns.LOG2FC, StandardColumns.ADJ_PVALUE
         frames, order = [], []
@@ -137,14 +140,15 @@ class AnnotationComparisonDialog(BasePlotDialog):
             frames.append(pd.DataFrame({
                 'dataset': label,
                 'annotation': df[ann_col].values,
-                'log2fc': (pd.to_numeric(df[lfc_col], errors='coerce').values
+                'log2fc': (ds.numeric_column(lfc_col)
                            if lfc_col in df.columns else np.full(n, np.nan)),
-                'adj_pvalue': (pd.to_numeric(df[padj_col], errors='coerce').values
+                'adj_pvalue': (ds.numeric_column(padj_col)
                                if padj_col in df.columns else np.full(n, np.nan)),
             }))
         long_df = pd.concat(frames, ignore_index=True) if frames else \
             pd.DataFrame(columns=['dataset', 'annotation', 'log2fc', 'adj_pvalue'])
-        return long_df, order
+        self._long_df = (long_df, order)
+        return self._long_df
 
     def _plot_params(self, order=None) -> dict:
         if order is None:
@@ -19,6 +19,20 @@ from PyQt6.QtCore import Qt, QTimer
 from utils import figure_theme, figure_export
 from gui.widgets.figure_style_panel import FigureStylePanel
 from gui.widgets.plot_labels_panel import PlotLabelsPanel
+from gui.plot_layers import cache_data_layers, reuse_data_layers
+
+
+# 스핀박스 연타/타이핑 중의 재렌더를 한 번으로 묶는 지연 (ms)
+REPLOT_DEBOUNCE_MS = 150
+
+
+def debounce_timer(parent, slot, interval_ms: int = REPLOT_DEBOUNCE_MS) -> QTimer:
+    """start() 를 여러 번 불러도 마지막 호출 후 interval_ms 뒤에 slot 을 한 번 부르는 타이머."""
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(interval_ms)
+    timer.timeout.connect(slot)
+    return timer
 
 
 class BasePlotDialog(QDialog):
@@ -33,6 +47,14 @@ class BasePlotDialog(QDialog):
 
     선택 (기본값: empty → 버튼 숨김):
       _extra_buttons() → list[(label, callback)]  ← Export Data 등 추가 버튼
+      _apply_labels()                       ← 멀티 Axes 다이얼로그의 레이블 적용
+
+    다시 그리기
+    ───────────
+    _update_plot() 은 즉시 그린다. 위젯 신호(스핀박스 연타 등)는 _schedule_replot 에
+    연결해 REPLOT_DEBOUNCE_MS 동안 모아서 한 번만 그린다. PlotLabelsPanel 변경은 _do_plot 을 다시 돌리지 않고 기존 axes 에
+    _apply_labels() 만 다시 적용한다 (데이터 artist·라벨 배치·클러스터링 재사용).
+    큰 scatter 는 cache_data_layers() 로 묶어 그 재그리기에서 래스터화도 건너뛴다.
     """
 
     def __init__(self, title: str, parent=None, figsize=(10, 8)):
@@ -47,11 +69,17 @@ class BasePlotDialog(QDialog):
         self.figure = Figure(figsize=figsize)
         self.canvas = FigureCanvas(self.figure)
 
+        self._replot_timer = debounce_timer(self, self._replot)
+        self._restyle_timer = debounce_timer(self, self._restyle)
+        self._outside_legend = None  # 마지막 전체 렌더 때의 PlotLabelsPanel.outside_legend()
+        self._data_layers = []       # 큰 scatter 의 픽셀 캐시 (gui/plot_layers.py)
+
+        # 테마는 rcParams 로 artist 생성 시점에 반영되므로 전체를 다시 그린다
         self._style = FigureStylePanel()
-        self._style.changed.connect(self._update_plot)
+        self._style.changed.connect(self._schedule_replot)
 
         self._labels = PlotLabelsPanel()
-        self._labels.changed.connect(self._update_plot)
+        self._labels.changed.connect(self._restyle_timer.start)
 
         self._init_layout()
 
@@ -266,10 +294,44 @@ class BasePlotDialog(QDialog):
         if self.figure.axes:
             self._labels.apply_to_axes(self.figure.axes[0])
 
+    def _hover_controller(self, on_move):
+        """canvas 의 hover throttle/툴팁 blit 헬퍼 (처음 호출 시 on_move 로 생성)."""
+        hover = getattr(self, '_hover', None)
+        if hover is None:
+            from gui.hover_picker import HoverController
+            hover = self._hover = HoverController(self.canvas, on_move)
+        return hover
+
     def _update_plot(self):
+        """전체 다시 그리기 (즉시)."""
+        self._replot()
+
+    def _schedule_replot(self, *_args):
+        """위젯 신호용: 연속 변경을 모아 마지막 변경 후 한 번만 _update_plot 한다.
+
+        신호 인자(valueChanged 의 값 등)는 버린다 — QTimer.start 에 직접 연결하면
+        start(msec) 오버로드로 값이 간격으로 들어간다.
+        """
+        self._replot_timer.start()
+
+    def _replot(self):
+        self._replot_timer.stop()
+        self._restyle_timer.stop()
         with figure_theme.theme_context(self._style.theme_name()):
             self._do_plot()
             self._apply_labels()
+        self._outside_legend = self._labels.outside_legend()
+        self._data_layers = cache_data_layers(self.figure)
+        self.canvas.draw_idle()
+
+    def _restyle(self):
+        """레이블/범례만 바뀐 경우: 그려진 axes 에 _apply_labels() 만 다시 적용한다."""
+        if not self.figure.axes or self._labels.outside_legend() != self._outside_legend:
+            self._replot()
+            return
+        with figure_theme.theme_context(self._style.theme_name()):
+            self._apply_labels()
+        reuse_data_layers(self._data_layers)
         self.canvas.draw_idle()
 
     def _save_figure(self):
@@ -25,6 +25,7 @@ from PyQt6.QtWidgets import (
 )
 
 from gui.base_plot_dialog import BasePlotDialog
+from gui.hover_picker import PointPicker
 from models.data_models import Dataset
 from models.standard_columns import StandardColumns as SC
 from utils.export_paths import remembered_save_path
@@ -53,16 +54,14 @@ class ChromVARDialog(BasePlotDialog):
 
         # hover 상태 — _do_plot() 에서 갱신
         self._annot = None                  # 현재 axes의 annotation 객체
-        self._hover_pairs: list = []        # [(PathCollection, df_subset), ...]
+        self._hover_df: Optional[pd.DataFrame] = None   # 그려진 점들 (picker 위치 = 행 위치)
+        self._picker = None                 # _hover_df 의 PointPicker
         self._hover_x_col: str = ""         # hover 시 X 좌표 컬럼명
         self._hover_y_col: str = ""         # hover 시 Y 좌표 컬럼명
 
         title = f"chromVAR TF Activity — {dataset.name}"
         super().__init__(title, parent, figsize=(9, 7))
 
-        # canvas에 한 번만 연결 (figure.clear() 후에도 canvas는 유지됨)
-        self.canvas.mpl_connect("motion_notify_event", self._on_hover)
-
         self._update_plot()
 
     # ── Controls ──────────────────────────────────────────────────────────
@@ -121,7 +120,7 @@ class ChromVARDialog(BasePlotDialog):
 
         for w in [self._padj_cut, self._delta_cut, self._top_n,
                   self._dot_size, self._heatmap_top_n]:
-            w.valueChanged.connect(self._update_plot)
+            w.valueChanged.connect(self._schedule_replot)
 
         self._on_mode_changed()
 
@@ -142,7 +141,9 @@ class ChromVARDialog(BasePlotDialog):
         self.figure.clear()
         # hover 상태 초기화 (이전 axes 참조 무효화)
         self._annot = None
-        self._hover_pairs = []
+        self._hover_df = None
+        self._picker = None
+        self._hover_controller(self._on_hover).attach(None)
 
         mode = self._mode.currentText()
         if "Heatmap" in mode:
@@ -171,17 +172,17 @@ class ChromVARDialog(BasePlotDialog):
         sig_down = (df[SC.CHROMVAR_PADJ] <= padj_cut) & (delta <= -delta_cut)
         ns = ~(sig_up | sig_down)
 
-        sc_ns = ax.scatter(
+        ax.scatter(
             delta[ns], neg_log[ns],
             c="#cccccc", s=self._dot_size.value(), alpha=0.5,
             label=f"NS (n={ns.sum()})", zorder=1, edgecolors="none",
         )
-        sc_up = ax.scatter(
+        ax.scatter(
             delta[sig_up], neg_log[sig_up],
             c="#e15759", s=self._dot_size.value(), alpha=0.85,
             label=f"Increased (n={sig_up.sum()})", zorder=2, edgecolors="none",
         )
-        sc_dn = ax.scatter(
+        ax.scatter(
             delta[sig_down], neg_log[sig_down],
             c="#4e79a7", s=self._dot_size.value(), alpha=0.85,
             label=f"Decreased (n={sig_down.sum()})", zorder=2, edgecolors="none",
@@ -204,13 +205,9 @@ class ChromVARDialog(BasePlotDialog):
 
         # hover 설정
         self._annot = self._make_annot(ax)
-        self._hover_pairs = [
-            (sc_ns,  df[ns].reset_index(drop=True)),
-            (sc_up,  df[sig_up].reset_index(drop=True)),
-            (sc_dn,  df[sig_down].reset_index(drop=True)),
-        ]
         self._hover_x_col = SC.CHROMVAR_DELTA
         self._hover_y_col = "chromvar_neg_log_padj"
+        self._set_hover_points(ax, df, delta, neg_log)
 
     # ── Scatter ───────────────────────────────────────────────────────────
 
@@ -237,15 +234,15 @@ class ChromVARDialog(BasePlotDialog):
         sig_down = (df[SC.CHROMVAR_PADJ] <= padj_cut) & (delta <= -delta_cut)
         ns = ~(sig_up | sig_down)
 
-        sc_ns = ax.scatter(
+        ax.scatter(
             x[ns], y[ns], c="#cccccc", s=self._dot_size.value(),
             alpha=0.4, label=f"NS (n={ns.sum()})", zorder=1, edgecolors="none",
         )
-        sc_up = ax.scatter(
+        ax.scatter(
             x[sig_up], y[sig_up], c="#e15759", s=self._dot_size.value(),
             alpha=0.85, label=f"Increased (n={sig_up.sum()})", zorder=2, edgecolors="none",
         )
-        sc_dn = ax.scatter(
+        ax.scatter(
             x[sig_down], y[sig_down], c="#4e79a7", s=self._dot_size.value(),
             alpha=0.85, label=f"Decreased (n={sig_down.sum()})", zorder=2, edgecolors="none",
         )
@@ -265,13 +262,9 @@ class ChromVARDialog(BasePlotDialog):
 
         # hover 설정
         self._annot = self._make_annot(ax)
-        self._hover_pairs = [
-            (sc_ns,  df[ns].reset_index(drop=True)),
-            (sc_up,  df[sig_up].reset_index(drop=True)),
-            (sc_dn,  df[sig_down].reset_index(drop=True)),
-        ]
         self._hover_x_col = SC.CHROMVAR_MEAN_BASE
         self._hover_y_col = SC.CHROMVAR_MEAN_COMPARE
+        self._set_hover_points(ax, df, x, y)
 
     # ── Multi-condition Heatmap ───────────────────────────────────────────
 
@@ -316,7 +309,8 @@ class ChromVARDialog(BasePlotDialog):
 
         # hover 없음 (heatmap 모드)
         self._annot = None
-        self._hover_pairs = []
+        self._hover_df = None
+        self._picker = None
 
     # ── Hover ─────────────────────────────────────────────────────────────
 
@@ -334,52 +328,34 @@ class ChromVARDialog(BasePlotDialog):
             zorder=1000,
         )
         annot.set_visible(False)
+        self._hover_controller(self._on_hover).attach(annot)
         return annot
 
+    def _set_hover_points(self, ax, df: pd.DataFrame, x, y):
+        """hover 대상 점 (그린 모든 점) 과 picker 설정."""
+        self._hover_df = df.reset_index(drop=True)
+        self._picker = PointPicker(ax, x, y)
+
     def _on_hover(self, event):
         """motion_notify_event 핸들러 — Volcano/Scatter 모드에서만 동작."""
-        if self._annot is None or not self._hover_pairs:
+        if self._annot is None or self._picker is None:
             return
         if event.inaxes is None:
-            if self._annot.get_visible():
-                self._annot.set_visible(False)
-                self.canvas.draw_idle()
+            self._hover.hide()
             return
 
         ax = event.inaxes
         xlim = ax.get_xlim()
         ylim = ax.get_ylim()
 
-        # 각 scatter collection을 순회하며 가장 가까운 점 탐색
-        hit_row = None
-        hit_x = hit_y = 0.0
-        min_dist = float("inf")
-
-        for sc, sub_df in self._hover_pairs:
-            if sub_df.empty:
-                continue
-            # contains() 로 픽셀 반경 내 점 확인
-            cont, ind = sc.contains(event)
-            if not cont:
-                continue
-            # 여러 점이 잡히면 마우스와 가장 가까운 것 선택
-            offsets = sc.get_offsets()
-            for i in ind["ind"]:
-                if i >= len(offsets):
-                    continue
-                px, py = offsets[i]
-                d = (px - event.xdata) ** 2 + (py - event.ydata) ** 2
-                if d < min_dist:
-                    min_dist = d
-                    hit_x, hit_y = px, py
-                    if i < len(sub_df):
-                        hit_row = sub_df.iloc[i]
-
-        if hit_row is None:
-            if self._annot.get_visible():
-                self._annot.set_visible(False)
-                self.canvas.draw_idle()
+        # 마우스에서 축 정규화 거리 0.02 이내의 최근접 점 (KD-tree)
+        pos = self._picker.nearest(event.xdata, event.ydata, radius=0.02)
+        if pos is None:
+            self._hover.hide()
             return
+        hit_row = self._hover_df.iloc[pos]
+        hit_x = float(hit_row[self._hover_x_col])
+        hit_y = float(hit_row[self._hover_y_col])
 
         # 툴팁 텍스트 구성
         name_col = SC.CHROMVAR_TF_NAME if SC.CHROMVAR_TF_NAME in hit_row.index else SC.CHROMVAR_MOTIF_ID
@@ -416,8 +392,7 @@ class ChromVARDialog(BasePlotDialog):
         ox = -110 if x_ratio > 0.75 else 15
         oy = -90  if y_ratio > 0.75 else 15
         self._annot.set_position((ox, oy))
-        self._annot.set_visible(True)
-        self.canvas.draw_idle()
+        self._hover.show()
 
     # ── 공용 헬퍼 ────────────────────────────────────────────────────────
 
@@ -435,6 +410,8 @@ class ChromVARDialog(BasePlotDialog):
         return df.reset_index(drop=True)
 
     def _label_top(self, ax, df, sig_mask, sort_series, y_vals, x_vals=None):
+        from plots.label_layout import place_labels
+
         n = self._top_n.value()
         if n == 0:
             return
@@ -445,17 +422,14 @@ class ChromVARDialog(BasePlotDialog):
         sig_df = sig_df.reindex(
             sort_series[sig_mask].abs().sort_values(ascending=False).index
         ).head(n)
+        texts = []
         for _, row in sig_df.iterrows():
             x_val = row[x_vals.name] if x_vals is not None else row[SC.CHROMVAR_DELTA]
             y_val = row[y_vals.name]
             color = "#e15759" if row[SC.CHROMVAR_DELTA] > 0 else "#4e79a7"
-            ax.annotate(
-                str(row[name_col]),
-                (x_val, y_val),
-                fontsize=7,
-                xytext=(4, 4), textcoords="offset points",
-                color=color,
-            )
+            texts.append(ax.text(x_val, y_val, str(row[name_col]), fontsize=7, color=color))
+        # 겹치지 않게 배치 + 리더선 (시간 제한)
+        place_labels(ax, texts)
 
     # ── Export ────────────────────────────────────────────────────────────
 
@@ -27,6 +27,7 @@ class CountSummaryDialog(BasePlotDialog):
         self.logger = logging.getLogger(__name__)
         self.datasets = datasets
         self._counts_df = None  # 마지막 집계 결과 (Export용)
+        self._long_df = None    # _build_long_df 결과 (데이터셋은 다이얼로그 동안 고정)
         # 막대 색 (사용자 지정 가능). _setup_controls 가 super().__init__ 안에서 호출되므로
         # 그 전에 초기화한다.
         self._up_color = '#c0392b'
@@ -45,7 +46,7 @@ class CountSummaryDialog(BasePlotDialog):
         self._fdr_spin.setRange(0.0, 1.0)
         self._fdr_spin.setSingleStep(0.01)
         self._fdr_spin.setValue(0.05)
-        self._fdr_spin.valueChanged.connect(self._update_plot)
+        self._fdr_spin.valueChanged.connect(self._schedule_replot)
         form.addRow("FDR ≤", self._fdr_spin)
 
         self._lfc_spin = QDoubleSpinBox()
@@ -53,11 +54,11 @@ class CountSummaryDialog(BasePlotDialog):
         self._lfc_spin.setRange(0.0, 20.0)
         self._lfc_spin.setSingleStep(0.1)
         self._lfc_spin.setValue(1.0)
-        self._lfc_spin.valueChanged.connect(self._update_plot)
+        self._lfc_spin.valueChanged.connect(self._schedule_replot)
         form.addRow("|log2FC| ≥", self._lfc_spin)
 
         self._pct_check = QCheckBox("Show as % of total")
-        self._pct_check.toggled.connect(self._update_plot)
+        self._pct_check.toggled.connect(self._schedule_replot)
         form.addRow(self._pct_check)
 
         group.setLayout(form)
@@ -101,7 +102,12 @@ class CountSummaryDialog(BasePlotDialog):
     # ── Plot ──────────────────────────────────────────────────────────────
 
     def _build_long_df(self):
-        """데이터셋들을 long-format(dataset/log2fc/adj_pvalue)으로 병합. (df, order) 반환."""
+        """데이터셋들을 long-format(dataset/log2fc/adj_pvalue)으로 병합. (df, order) 반환.
+
+        숫자 변환은 데이터셋 캐시(numeric_column)를 쓰고, 결과는 다이얼로그 동안 재사용한다.
+        """
+        if self._long_df is not None:
+            return self._long_df
         lfc_col = StandardColumns.LOG2FC
         padj_col = StandardColumns.ADJ_PVALUE
         frames, order = [], []
@@ -113,12 +119,35 @@ class CountSummaryDialog(BasePlotDialog):
                 continue
             frames.append(pd.DataFrame({
                 'dataset': label,
-                'log2fc': pd.to_numeric(df[lfc_col], errors='coerce').values,
-                'adj_pvalue': pd.to_numeric(df[padj_col], errors='coerce').values,
+                'log2fc': ds.numeric_column(lfc_col),
+                'adj_pvalue': ds.numeric_column(padj_col),
             }))
         long_df = pd.concat(frames, ignore_index=True) if frames else \
             pd.DataFrame(columns=['dataset', 'log2fc', 'adj_pvalue'])
-        return long_df, order
+        self._long_df = (long_df, order)
+        return self._long_df
+
+    def _count_table(self, order) -> pd.DataFrame:
+        """label/up/down/total — 데이터셋 significance index 로 임계값별 개수를 이진 탐색."""
+        lfc_col = StandardColumns.LOG2FC
+        padj_col = StandardColumns.ADJ_PVALUE
+        fdr_max, lfc_min = self._fdr_spin.value(), self._lfc_spin.value()
+        per_label = {}
+        for ds in self.datasets:
+            label = ds.metadata.get('experiment_condition') or ds.name
+            df = ds.dataframe
+            up = down = total = 0
+            if df is not None and lfc_col in df.columns and padj_col in df.columns:
+                index = ds.significance_index(lfc_col, padj_col)
+                up, down = index.counts(fdr_max, lfc_min)
+                total = index.total
+            prev = per_label.get(label, (0, 0, 0))
+            per_label[label] = (prev[0] + up, prev[1] + down, prev[2] + total)
+        rows = []
+        for label in order:
+            up, down, total = per_label.get(label, (0, 0, 0))
+            rows.append({'label': label, 'up': up, 'down': down, 'total': total})
+        return pd.DataFrame(rows)
 
     def _plot_params(self, order=None) -> dict:
         if order is None:
@@ -141,7 +170,8 @@ class CountSummaryDialog(BasePlotDialog):
         self.figure.clear()
         ax = self.figure.add_subplot(111)
         long_df, order = self._build_long_df()
-        self._counts_df = render_count_summary(ax, long_df, self._plot_params(order))
+        self._counts_df = render_count_summary(ax, long_df, self._plot_params(order),
+                                               counts=self._count_table(order))
         self.figure.tight_layout()
         self.canvas.draw()
 
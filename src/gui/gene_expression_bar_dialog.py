@@ -186,7 +186,7 @@ class GeneExpressionBarDialog(BasePlotDialog):
         self.top_n_spin = QSpinBox()
         self.top_n_spin.setRange(1, 60)
         self.top_n_spin.setValue(min(15, max(1, self._gene_total())))
-        self.top_n_spin.valueChanged.connect(self._update_plot)
+        self.top_n_spin.valueChanged.connect(self._schedule_replot)
         settings_layout.addRow("Max genes:", self.top_n_spin)
 
         self.sort_combo = QComboBox()
@@ -194,21 +194,21 @@ class GeneExpressionBarDialog(BasePlotDialog):
         if StandardColumns.LOG2FC in self.df.columns:
             items.append("|log2FC| (desc)")
         self.sort_combo.addItems(items)
-        self.sort_combo.currentTextChanged.connect(self._update_plot)
+        self.sort_combo.currentTextChanged.connect(self._schedule_replot)
         settings_layout.addRow("Sort genes by:", self.sort_combo)
 
         self.error_combo = QComboBox()
         self.error_combo.addItems(["SEM", "SD", "None"])
-        self.error_combo.currentTextChanged.connect(self._update_plot)
+        self.error_combo.currentTextChanged.connect(self._schedule_replot)
         settings_layout.addRow("Error bars:", self.error_combo)
 
         self.points_check = QCheckBox("Show individual points")
         self.points_check.setChecked(True)
-        self.points_check.toggled.connect(self._update_plot)
+        self.points_check.toggled.connect(self._schedule_replot)
         settings_layout.addRow("", self.points_check)
 
         self.logy_check = QCheckBox("Log scale (Y)")
-        self.logy_check.toggled.connect(self._update_plot)
+        self.logy_check.toggled.connect(self._schedule_replot)
         settings_layout.addRow("", self.logy_check)
 
         settings_group.setLayout(settings_layout)
@@ -219,16 +219,16 @@ class GeneExpressionBarDialog(BasePlotDialog):
         sig_layout = QFormLayout()
 
         self.sig_check = QCheckBox("Show significance stars")
-        self.sig_check.toggled.connect(self._update_plot)
+        self.sig_check.toggled.connect(self._schedule_replot)
         sig_layout.addRow("", self.sig_check)
 
         self.ref_combo = QComboBox()
-        self.ref_combo.currentTextChanged.connect(self._update_plot)
+        self.ref_combo.currentTextChanged.connect(self._schedule_replot)
         sig_layout.addRow("Reference group:", self.ref_combo)
 
         self.test_combo = QComboBox()
         self.test_combo.addItems(["t-test (Welch)", "Mann-Whitney U"])
-        self.test_combo.currentTextChanged.connect(self._update_plot)
+        self.test_combo.currentTextChanged.connect(self._schedule_replot)
         sig_layout.addRow("Test:", self.test_combo)
 
         sig_layout.addRow(QLabel("vs reference: * ≤.05  ** ≤.01\n*** ≤.001  **** ≤.0001  ns"))
@@ -39,7 +39,7 @@ class GOBarChartDialog(BasePlotDialog):
         self.top_n_spin = QSpinBox()
         self.top_n_spin.setRange(5, 50)
         self.top_n_spin.setValue(15)
-        self.top_n_spin.valueChanged.connect(self._update_plot)
+        self.top_n_spin.valueChanged.connect(self._schedule_replot)
         settings_layout.addRow("Top N terms:", self.top_n_spin)
 
         self.x_axis_combo = QComboBox()
@@ -49,7 +49,7 @@ class GOBarChartDialog(BasePlotDialog):
 
         self.sort_combo = QComboBox()
         self.sort_combo.addItems(["FDR (ascending)", "Gene Count (descending)", "Alphabetical"])
-        self.sort_combo.currentTextChanged.connect(self._update_plot)
+        self.sort_combo.currentTextChanged.connect(self._schedule_replot)
         settings_layout.addRow("Sort by:", self.sort_combo)
 
         self.bar_color_btn = QPushButton("Choose Bar Color")
@@ -59,7 +59,7 @@ class GOBarChartDialog(BasePlotDialog):
 
         self.horizontal_check = QCheckBox("Horizontal bars")
         self.horizontal_check.setChecked(True)
-        self.horizontal_check.toggled.connect(self._update_plot)
+        self.horizontal_check.toggled.connect(self._schedule_replot)
         settings_layout.addRow("", self.horizontal_check)
 
         settings_group.setLayout(settings_layout)
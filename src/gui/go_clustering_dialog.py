@@ -21,7 +21,9 @@ from PyQt6.QtGui import QFont, QBrush, QColor, QPixmap, QIcon
 from models.standard_columns import StandardColumns
 from gui.widgets.figure_style_panel import FigureStylePanel
 from utils import figure_theme, figure_export
-import pandas as pd
+from utils.gene_sets import gene_set_sizes, gene_sets as to_gene_sets, to_gene_list_series
+from utils.graph_layout import GraphLayoutCache
+from gui.hover_picker import HoverController, PointPicker
 import matplotlib
 import matplotlib.patches
 matplotlib.use('QtAgg')
@@ -31,16 +33,15 @@ try:
 except ImportError:
     from matplotlib.backends.backend_qt import NavigationToolbar2QT as NavigationToolbar  # type: ignore
 from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
 from matplotlib.patches import Polygon
 from scipy.spatial import ConvexHull
 
 import pandas as pd
 import numpy as np
 import networkx as nx
-from math import ceil, sqrt
+from math import ceil
 
-from utils.go_clustering import GOClustering
+from utils.go_clustering import GOClustering, TermSimilarityCache
 from utils.export_paths import remembered_save_path
 
 
@@ -89,16 +90,14 @@ class ClusteringWorker(QThread):
                 logger.info(f"Found gene column: {gene_col}")
                 
                 if gene_col:
-                    self.df['_gene_set'] = self.df[gene_col].apply(
-                        lambda x: set(str(x).split('/')) if pd.notna(x) and str(x).strip() else set()
-                    )
+                    self.df['_gene_set'] = to_gene_list_series(self.df[gene_col])
                     # Log sample gene sets
-                    non_empty = [gs for gs in self.df['_gene_set'] if len(gs) > 0]
-                    logger.info(f"Created _gene_set: {len(non_empty)} non-empty out of {len(self.df)}")
+                    non_empty = int((gene_set_sizes(self.df['_gene_set']) > 0).sum())
+                    logger.info(f"Created _gene_set: {non_empty} non-empty out of {len(self.df)}")
                 else:
                     # No gene column found - create empty sets
                     logger.warning("No gene column found! Creating empty gene sets.")
-                    self.df['_gene_set'] = [set() for _ in range(len(self.df))]
+                    self.df['_gene_set'] = to_gene_list_series([None] * len(self.df), index=self.df.index)
             
             self.progress.emit(30)
             # fit(비싼 Jaccard+linkage) 후 cut — 이후 다이얼로그가 이 인스턴스로 임계값만
@@ -151,7 +150,14 @@ class GOClusteringDialog(QDialog):
         self._clustering = None       # fit() 된 GOClustering 캐시 → 임계값 라이브 재-cut
         self.network_graph = None
         self.node_positions = None
+        self._node_picker = None  # (node_positions, nodes, PointPicker, 노드별 hover 반경)
         self.cluster_colors = {}
+        # clustered_df 단위 Jaccard 유사도 캐시 (네트워크 edge 임계값 변경 시 재사용)
+        self._similarity_cache = None
+        self._similarity_source = (None, None)
+        # 네트워크 배치 캐시 (상세 뷰 / 클러스터 격자 뷰)
+        self._detail_layout_cache = GraphLayoutCache()
+        self._grid_layout_cache = GraphLayoutCache(max_entries=256)
         
         # Visualization settings (will be updated from widgets)
         self.node_size = 100
@@ -576,7 +582,8 @@ class GOClusteringDialog(QDialog):
         # Matplotlib figure — 실제 크기는 클러스터 수에 따라 _draw_network_graph에서 동적 조정
         self.figure = Figure(figsize=(10, 8))
         self.canvas = FigureCanvas(self.figure)
-        self.canvas.mpl_connect('motion_notify_event', self._on_network_hover)
+        # hover 는 throttle 후 처리 (툴팁은 Qt setToolTip 이라 다시 그릴 artist 없음)
+        self._network_hover = HoverController(self.canvas, self._on_network_hover)
         self.canvas.mpl_connect('button_press_event', self._on_grid_click)
         # 가로는 뷰포트에 맞추고, 세로만 확장되도록 설정
         self.canvas.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
@@ -716,6 +723,15 @@ class GOClusteringDialog(QDialog):
             self._draw_cluster_detail(cluster_id, members)
             self.tab_widget.setCurrentIndex(4)  # Cluster Detail 탭
 
+    def _term_similarity(self, gene_col: str) -> TermSimilarityCache:
+        """clustered_df 의 gene_col 로 만든 유사도 캐시 (clustered_df 가 바뀔 때만 재생성)."""
+        source_df, source_col = self._similarity_source
+        if self._similarity_cache is None or source_df is not self.clustered_df or source_col != gene_col:
+            self._similarity_cache = TermSimilarityCache(
+                self.clustered_df[gene_col], self.clustered_df.index)
+            self._similarity_source = (self.clustered_df, gene_col)
+        return self._similarity_cache
+
     def _draw_cluster_detail(self, cluster_id, members):
         """단일 클러스터의 확대 네트워크를 detail_figure에 렌더링."""
         if self.clustered_df is None or not members:
@@ -744,16 +760,8 @@ class GOClusteringDialog(QDialog):
             (c for c in ['_gene_set', 'gene_symbols', 'geneID', 'Genes', 'genes']
              if c in member_df.columns), None
         )
-        if gene_col == '_gene_set':
-            gene_sets = [
-                gs if isinstance(gs, set) else set()
-                for gs in member_df['_gene_set']
-            ]
-        elif gene_col:
-            gene_sets = [
-                set(str(g).split('/')) if pd.notna(g) else set()
-                for g in member_df[gene_col]
-            ]
+        if gene_col:
+            gene_sets = to_gene_sets(member_df[gene_col])
         else:
             gene_sets = [set() for _ in members]
 
@@ -766,15 +774,9 @@ class GOClusteringDialog(QDialog):
                        gene_set=gene_sets[i])
 
         threshold = self.detail_edge_spin.value()
-        for i in range(len(node_list)):
-            for j in range(i + 1, len(node_list)):
-                gi, gj = gene_sets[i], gene_sets[j]
-                union = len(gi | gj)
-                if union == 0:
-                    continue
-                jaccard = len(gi & gj) / union
-                if jaccard >= threshold:
-                    G.add_edge(node_list[i], node_list[j], weight=jaccard)
+        if gene_col:
+            src, dst, weights = self._term_similarity(gene_col).edges(node_list, threshold)
+            G.add_weighted_edges_from(zip(src, dst, weights.tolist()))
 
         self.detail_figure.clear()
         ax = self.detail_figure.add_subplot(111)
@@ -788,7 +790,7 @@ class GOClusteringDialog(QDialog):
         n = len(G.nodes())
         if n > 2:
             k_val = max(1.0, 3.0 / max(1, n ** 0.3))
-            pos = nx.spring_layout(G, k=k_val, iterations=100, seed=42)
+            pos = self._detail_layout_cache.layout(G, 'spring', k=k_val, iterations=100, seed=42)
         elif n == 2:
             nlist = list(G.nodes())
             pos = {nlist[0]: (-0.5, 0), nlist[1]: (0.5, 0)}
@@ -1064,18 +1066,9 @@ class GOClusteringDialog(QDialog):
                 break
         
         if gene_col:
-            for i, row1 in self.clustered_df.iterrows():
-                genes1 = set(str(row1[gene_col]).split('/'))
-                for j, row2 in self.clustered_df.iterrows():
-                    if i >= j:
-                        continue
-                    genes2 = set(str(row2[gene_col]).split('/'))
-                    intersection = len(genes1 & genes2)
-                    union = len(genes1 | genes2)
-                    if union > 0:
-                        similarity = intersection / union
-                        if similarity > 0.3:
-                            G.add_edge(i, j, weight=similarity)
+            src, dst, weights = self._term_similarity(gene_col).edges(
+                self.clustered_df.index, 0.3, inclusive=False)
+            G.add_weighted_edges_from(zip(src, dst, weights.tolist()))
         
         self.network_graph = G
         
@@ -1148,7 +1141,7 @@ class GOClusteringDialog(QDialog):
                 n = len(members)
                 if n > 1:
                     k_val   = max(1.0, 3.0 / (n ** 0.3))
-                    raw_pos = nx.spring_layout(subgraph, k=k_val, iterations=80, seed=42)
+                    raw_pos = self._grid_layout_cache.layout(subgraph, 'spring', k=k_val, iterations=80, seed=42)
                     # 정규화: [PAD, 1-PAD] 범위로
                     xs = [p[0] for p in raw_pos.values()]
                     ys = [p[1] for p in raw_pos.values()]
@@ -1374,20 +1367,30 @@ class GOClusteringDialog(QDialog):
         
         self.canvas.draw()
         
+    def _network_picker(self, ax):
+        """node_positions 의 (nodes, PointPicker, hover 반경) — 네트워크를 다시 그리면 새로 만든다."""
+        cached = self._node_picker
+        if cached is None or cached[0] is not self.node_positions:
+            nodes = list(self.node_positions)
+            xy = np.array([self.node_positions[n] for n in nodes], dtype=float).reshape(-1, 2)
+            is_rep = self.clustered_df.loc[nodes, 'is_representative'].to_numpy(dtype=bool)
+            picker = PointPicker(ax, xy[:, 0], xy[:, 1], normalized=False)
+            cached = (self.node_positions, nodes, picker, np.where(is_rep, 0.3, 0.15))
+            self._node_picker = cached
+        return cached[1:]
+
     def _on_network_hover(self, event):
         """Handle mouse hover over network graph"""
         if event.inaxes is None or self.node_positions is None:
             return
-        mouse_x, mouse_y = event.xdata, event.ydata
+        nodes, picker, thresholds = self._network_picker(event.inaxes)
+        # 대표 term 은 0.3, 나머지는 0.15 (데이터 좌표) 안의 가장 가까운 노드
         closest_node = None
-        min_distance = float('inf')
-        for node, (x, y) in self.node_positions.items():
-            distance = sqrt((mouse_x - x)**2 + (mouse_y - y)**2)
-            is_rep = self.clustered_df.loc[node, 'is_representative']
-            threshold = 0.3 if is_rep else 0.15
-            if distance < threshold and distance < min_distance:
-                closest_node = node
-                min_distance = distance
+        positions, distances = picker.neighbours(event.xdata, event.ydata, radius=0.3)
+        for pos, distance in zip(positions, distances):
+            if distance < thresholds[pos]:
+                closest_node = nodes[pos]
+                break
         if closest_node is not None:
             row = self.clustered_df.loc[closest_node]
             desc_col = None
@@ -59,12 +59,12 @@ class GOComparisonDotPlotDialog(BasePlotDialog):
         self.top_n_spin = QSpinBox()
         self.top_n_spin.setRange(5, 100)
         self.top_n_spin.setValue(20)
-        self.top_n_spin.valueChanged.connect(self._update_plot)
+        self.top_n_spin.valueChanged.connect(self._schedule_replot)
         settings_layout.addRow("Top N terms:", self.top_n_spin)
 
         self.sort_combo = QComboBox()
         self.sort_combo.addItems(["Average FE (desc)", "Average FDR (asc)"])
-        self.sort_combo.currentTextChanged.connect(self._update_plot)
+        self.sort_combo.currentTextChanged.connect(self._schedule_replot)
         settings_layout.addRow("Sort by:", self.sort_combo)
 
         n_ds = max(len(self.dataset_names), 1)
@@ -75,12 +75,12 @@ class GOComparisonDotPlotDialog(BasePlotDialog):
             "Only show terms present (non-NaN FE) in at least N datasets.\n"
             "Set to max for intersection only."
         )
-        self.min_datasets_spin.valueChanged.connect(self._update_plot)
+        self.min_datasets_spin.valueChanged.connect(self._schedule_replot)
         settings_layout.addRow("Present in ≥ N datasets:", self.min_datasets_spin)
 
         self.size_combo = QComboBox()
         self.size_combo.addItems(["Fold Enrichment", "Gene Count"])
-        self.size_combo.currentTextChanged.connect(self._update_plot)
+        self.size_combo.currentTextChanged.connect(self._schedule_replot)
         settings_layout.addRow("Dot Size:", self.size_combo)
 
         self.transpose_check = QCheckBox("Transpose (X: Terms, Y: Datasets)")
@@ -99,7 +99,7 @@ class GOComparisonDotPlotDialog(BasePlotDialog):
         self.palette_combo.addItems(
             ["YlOrRd", "viridis", "plasma", "coolwarm", "RdBu_r", "Spectral_r", "RdYlGn_r"]
         )
-        self.palette_combo.currentTextChanged.connect(self._update_plot)
+        self.palette_combo.currentTextChanged.connect(self._schedule_replot)
         colorbar_layout.addRow("Color Palette:", self.palette_combo)
 
         self.color_min_spin = QDoubleSpinBox()
@@ -107,7 +107,7 @@ class GOComparisonDotPlotDialog(BasePlotDialog):
         self.color_min_spin.setDecimals(2)
         self.color_min_spin.setValue(0.0)
         self.color_min_spin.setSingleStep(0.5)
-        self.color_min_spin.valueChanged.connect(self._update_plot)
+        self.color_min_spin.valueChanged.connect(self._schedule_replot)
         colorbar_layout.addRow("-log10(FDR) Min:", self.color_min_spin)
 
         self.color_max_spin = QDoubleSpinBox()
@@ -115,7 +115,7 @@ class GOComparisonDotPlotDialog(BasePlotDialog):
         self.color_max_spin.setDecimals(2)
         self.color_max_spin.setValue(5.0)
         self.color_max_spin.setSingleStep(0.5)
-        self.color_max_spin.valueChanged.connect(self._update_plot)
+        self.color_max_spin.valueChanged.connect(self._schedule_replot)
         color_auto_btn = QPushButton("Auto")
         color_auto_btn.setMaximumWidth(55)
         color_auto_btn.clicked.connect(self._auto_color_range)
@@ -39,7 +39,7 @@ class GODotPlotDialog(BasePlotDialog):
         self.top_n_spin = QSpinBox()
         self.top_n_spin.setRange(5, 100)
         self.top_n_spin.setValue(20)
-        self.top_n_spin.valueChanged.connect(self._update_plot)
+        self.top_n_spin.valueChanged.connect(self._schedule_replot)
         settings_layout.addRow("Top N terms:", self.top_n_spin)
 
         self.x_axis_combo = QComboBox()
@@ -49,7 +49,7 @@ class GODotPlotDialog(BasePlotDialog):
 
         self.size_combo = QComboBox()
         self.size_combo.addItems(["Gene Count", "Gene Ratio", "Fold Enrichment"])
-        self.size_combo.currentTextChanged.connect(self._update_plot)
+        self.size_combo.currentTextChanged.connect(self._schedule_replot)
         settings_layout.addRow("Dot Size:", self.size_combo)
 
         # 표시 순서 (선택은 항상 FDR 최소 Top N; 이 콤보는 순서만 결정)
@@ -59,7 +59,7 @@ class GODotPlotDialog(BasePlotDialog):
             "Top N term 선택은 항상 FDR(유의성) 기준이며,\n"
             "이 옵션은 뽑힌 term의 표시 순서만 바꿉니다."
         )
-        self.sort_combo.currentTextChanged.connect(self._update_plot)
+        self.sort_combo.currentTextChanged.connect(self._schedule_replot)
         settings_layout.addRow("Sort by:", self.sort_combo)
 
         settings_group.setLayout(settings_layout)
@@ -74,7 +74,7 @@ class GODotPlotDialog(BasePlotDialog):
             "YlOrRd", "RdYlGn_r", "viridis", "plasma",
             "coolwarm", "seismic", "Spectral_r", "RdBu_r"
         ])
-        self.palette_combo.currentTextChanged.connect(self._update_plot)
+        self.palette_combo.currentTextChanged.connect(self._schedule_replot)
         colorbar_layout.addRow("Color Palette:", self.palette_combo)
 
         self.color_min_spin = QDoubleSpinBox()
@@ -82,7 +82,7 @@ class GODotPlotDialog(BasePlotDialog):
         self.color_min_spin.setDecimals(4)
         self.color_min_spin.setValue(0)
         self.color_min_spin.setSingleStep(0.01)
-        self.color_min_spin.valueChanged.connect(self._update_plot)
+        self.color_min_spin.valueChanged.connect(self._schedule_replot)
         colorbar_layout.addRow("FDR Min:", self.color_min_spin)
 
         self.color_max_spin = QDoubleSpinBox()
@@ -90,7 +90,7 @@ class GODotPlotDialog(BasePlotDialog):
         self.color_max_spin.setDecimals(4)
         self.color_max_spin.setValue(0.05)
         self.color_max_spin.setSingleStep(0.01)
-        self.color_max_spin.valueChanged.connect(self._update_plot)
+        self.color_max_spin.valueChanged.connect(self._schedule_replot)
         color_auto_btn = QPushButton("Auto")
         color_auto_btn.setMaximumWidth(60)
         color_auto_btn.clicked.connect(self._auto_color_range)
@@ -28,6 +28,8 @@ from models.data_models import Dataset
 from models.standard_columns import StandardColumns
 from gui.base_plot_dialog import BasePlotDialog
 from utils.export_paths import remembered_save_path
+from utils.go_clustering import TermSimilarityCache
+from utils.graph_layout import GraphLayoutCache
 
 
 class GONetworkDialog(BasePlotDialog):
@@ -38,6 +40,10 @@ class GONetworkDialog(BasePlotDialog):
         self.df = dataset.dataframe.copy() if dataset.dataframe is not None else pd.DataFrame()
         self.is_clustered = StandardColumns.CLUSTER_ID in self.df.columns
         self.G: Optional[nx.Graph] = None
+        # 데이터셋 단위 Jaccard 유사도 캐시 (처음 네트워크를 그릴 때 생성)
+        self._similarity_cache: Optional[TermSimilarityCache] = None
+        # 배치 캐시: 스타일만 바뀐 재그리기는 재계산 없음, 임계값 변경은 warm-start
+        self._layout_cache = GraphLayoutCache()
 
         # 유효 클러스터 ID (숫자 문자열만)
         if self.is_clustered:
@@ -57,7 +63,7 @@ class GONetworkDialog(BasePlotDialog):
 
     def _setup_controls(self, layout: QVBoxLayout):
         self._ctrl_tabs = QTabWidget()
-        self._ctrl_tabs.currentChanged.connect(self._update_plot)
+        self._ctrl_tabs.currentChanged.connect(self._schedule_replot)
 
         # ── Tab 1: Network ───────────────────────────────────────────────────
         net_widget = QWidget()
@@ -68,7 +74,7 @@ class GONetworkDialog(BasePlotDialog):
         self._cluster_combo.addItem("All (Representatives)")
         for cid in self._valid_ids:
             self._cluster_combo.addItem(f"Cluster {cid}")
-        self._cluster_combo.currentTextChanged.connect(self._update_plot)
+        self._cluster_combo.currentTextChanged.connect(self._schedule_replot)
         net_form.addRow("Cluster:", self._cluster_combo)
 
         self._fdr_spin = QDoubleSpinBox()
@@ -76,7 +82,7 @@ class GONetworkDialog(BasePlotDialog):
         self._fdr_spin.setValue(0.05)
         self._fdr_spin.setDecimals(3)
         self._fdr_spin.setSingleStep(0.01)
-        self._fdr_spin.valueChanged.connect(self._update_plot)
+        self._fdr_spin.valueChanged.connect(self._schedule_replot)
         net_form.addRow("FDR ≤:", self._fdr_spin)
 
         self._edge_spin = QDoubleSpinBox()
@@ -84,27 +90,27 @@ class GONetworkDialog(BasePlotDialog):
         self._edge_spin.setValue(0.1)
         self._edge_spin.setDecimals(2)
         self._edge_spin.setSingleStep(0.05)
-        self._edge_spin.valueChanged.connect(self._update_plot)
+        self._edge_spin.valueChanged.connect(self._schedule_replot)
         net_form.addRow("Edge (Jaccard ≥):", self._edge_spin)
 
         self._net_node_size_combo = QComboBox()
         self._net_node_size_combo.addItems(["Gene Count", "Degree", "Uniform"])
-        self._net_node_size_combo.currentTextChanged.connect(self._update_plot)
+        self._net_node_size_combo.currentTextChanged.connect(self._schedule_replot)
         net_form.addRow("Node size:", self._net_node_size_combo)
 
         self._net_node_color_combo = QComboBox()
         self._net_node_color_combo.addItems(["FDR", "Ontology", "Direction", "Cluster"])
-        self._net_node_color_combo.currentTextChanged.connect(self._update_plot)
+        self._net_node_color_combo.currentTextChanged.connect(self._schedule_replot)
         net_form.addRow("Node color:", self._net_node_color_combo)
 
         self._layout_combo = QComboBox()
         self._layout_combo.addItems(["Spring", "Kamada-Kawai", "Circular", "Spectral"])
-        self._layout_combo.currentTextChanged.connect(self._update_plot)
+        self._layout_combo.currentTextChanged.connect(self._schedule_replot)
         net_form.addRow("Layout:", self._layout_combo)
 
         self._show_labels_check = QCheckBox("Show labels")
         self._show_labels_check.setChecked(True)
-        self._show_labels_check.toggled.connect(self._update_plot)
+        self._show_labels_check.toggled.connect(self._schedule_replot)
         net_form.addRow("", self._show_labels_check)
 
         # Network 탭 비활성화 — 재사용 시 아래 주석 해제
@@ -120,7 +126,7 @@ class GONetworkDialog(BasePlotDialog):
         # 재료가 이미 유의성 필터를 거쳤으므로 색은 '강도(Fold Enrichment)'에 쓰고,
         # 유의성(FDR)은 랭킹용 X축으로 둔다 → 색/크기와 정보 중복을 피한다.
         self._xaxis_combo.setCurrentText("-log10(FDR)")
-        self._xaxis_combo.currentTextChanged.connect(self._update_plot)
+        self._xaxis_combo.currentTextChanged.connect(self._schedule_replot)
         dot_form.addRow("X axis:", self._xaxis_combo)
 
         self._dot_color_combo = QComboBox()
@@ -130,24 +136,24 @@ class GONetworkDialog(BasePlotDialog):
             "Fold Enrichment", "Fold Enrichment (median)", "FDR", "Ontology", "Direction",
         ])
         self._dot_color_combo.setCurrentText("Fold Enrichment")
-        self._dot_color_combo.currentTextChanged.connect(self._update_plot)
+        self._dot_color_combo.currentTextChanged.connect(self._schedule_replot)
         dot_form.addRow("Color by:", self._dot_color_combo)
 
         # 점 크기 기준: 클러스터 멤버 수(주제 폭) 또는 대표 term의 유전자 수(근거)
         self._dot_size_combo = QComboBox()
         self._dot_size_combo.addItems(["Cluster size", "Gene count"])
-        self._dot_size_combo.currentTextChanged.connect(self._update_plot)
+        self._dot_size_combo.currentTextChanged.connect(self._schedule_replot)
         dot_form.addRow("Dot size by:", self._dot_size_combo)
 
         self._dot_sort_combo = QComboBox()
         self._dot_sort_combo.addItems(["FDR", "Cluster Size", "Term Name"])
-        self._dot_sort_combo.currentTextChanged.connect(self._update_plot)
+        self._dot_sort_combo.currentTextChanged.connect(self._schedule_replot)
         dot_form.addRow("Sort by:", self._dot_sort_combo)
 
         self._top_n_spin = QSpinBox()
         self._top_n_spin.setRange(5, 200)
         self._top_n_spin.setValue(30)
-        self._top_n_spin.valueChanged.connect(self._update_plot)
+        self._top_n_spin.valueChanged.connect(self._schedule_replot)
         dot_form.addRow("Top N clusters:", self._top_n_spin)
 
         # 무엇을 남길지: 가장 유의한 것(FDR) vs 가장 강한 것(Fold Enrichment)
@@ -156,7 +162,7 @@ class GONetworkDialog(BasePlotDialog):
         self._top_n_by_combo.setToolTip(
             "Top N 을 무엇으로 고를지: FDR(가장 유의) 또는 Fold Enrichment(가장 강한 enrichment).\n"
             "클러스터가 많을 때 FDR로만 자르면 강하게 enrich된 항목이 빠질 수 있다.")
-        self._top_n_by_combo.currentTextChanged.connect(self._update_plot)
+        self._top_n_by_combo.currentTextChanged.connect(self._schedule_replot)
         dot_form.addRow("Top N by:", self._top_n_by_combo)
 
         # singleton(1-멤버) 항목도 size-1 로 포함 → 다중-term 클러스터 대표와 함께 랭킹.
@@ -166,7 +172,7 @@ class GONetworkDialog(BasePlotDialog):
         self._include_singletons_check.setToolTip(
             "체크 해제 시 다중-term 클러스터(멤버>1)만 표시. 클러스터링에서 혼자 남은\n"
             "singleton term 은 제외된다. 클러스터·singleton 이 많으면 켜두는 것을 권장.")
-        self._include_singletons_check.toggled.connect(self._update_plot)
+        self._include_singletons_check.toggled.connect(self._schedule_replot)
         dot_form.addRow("", self._include_singletons_check)
 
         # ── Dot Size ─────────────────────────────────────────────────────────
@@ -180,7 +186,7 @@ class GONetworkDialog(BasePlotDialog):
         self._dot_size_min_spin.setDecimals(0)
         self._dot_size_min_spin.setSingleStep(10.0)
         self._dot_size_min_spin.setToolTip("단일 멤버 클러스터의 최소 점 크기 (pt²)")
-        self._dot_size_min_spin.valueChanged.connect(self._update_plot)
+        self._dot_size_min_spin.valueChanged.connect(self._schedule_replot)
         size_form.addRow("Min size:", self._dot_size_min_spin)
 
         self._dot_size_scale_spin = QDoubleSpinBox()
@@ -189,12 +195,12 @@ class GONetworkDialog(BasePlotDialog):
         self._dot_size_scale_spin.setDecimals(1)
         self._dot_size_scale_spin.setSingleStep(5.0)
         self._dot_size_scale_spin.setToolTip("멤버 수 × 이 값 = 점 크기 (pt²)")
-        self._dot_size_scale_spin.valueChanged.connect(self._update_plot)
+        self._dot_size_scale_spin.valueChanged.connect(self._schedule_replot)
         size_form.addRow("Scale (×members):", self._dot_size_scale_spin)
 
         self._size_legend_check = QCheckBox("Show size legend")
         self._size_legend_check.setChecked(True)
-        self._size_legend_check.toggled.connect(self._update_plot)
+        self._size_legend_check.toggled.connect(self._schedule_replot)
         size_form.addRow("", self._size_legend_check)
 
         dot_form.addRow(size_group)
@@ -211,7 +217,7 @@ class GONetworkDialog(BasePlotDialog):
         self._xauto_check = QCheckBox("Auto")
         self._xauto_check.setChecked(True)
         self._xauto_check.toggled.connect(self._on_xauto_toggled)
-        self._xauto_check.toggled.connect(self._update_plot)
+        self._xauto_check.toggled.connect(self._schedule_replot)
         xrange_layout.addWidget(self._xauto_check)
         xrange_layout.addWidget(QLabel("Min:"))
         self._xmin_spin = QDoubleSpinBox()
@@ -219,7 +225,7 @@ class GONetworkDialog(BasePlotDialog):
         self._xmin_spin.setValue(0.0)
         self._xmin_spin.setDecimals(2)
         self._xmin_spin.setEnabled(False)
-        self._xmin_spin.valueChanged.connect(self._update_plot)
+        self._xmin_spin.valueChanged.connect(self._schedule_replot)
         xrange_layout.addWidget(self._xmin_spin)
         xrange_layout.addWidget(QLabel("Max:"))
         self._xmax_spin = QDoubleSpinBox()
@@ -227,7 +233,7 @@ class GONetworkDialog(BasePlotDialog):
         self._xmax_spin.setValue(10.0)
         self._xmax_spin.setDecimals(2)
         self._xmax_spin.setEnabled(False)
-        self._xmax_spin.valueChanged.connect(self._update_plot)
+        self._xmax_spin.valueChanged.connect(self._schedule_replot)
         xrange_layout.addWidget(self._xmax_spin)
         axis_form.addRow("X:", xrange_row)
 
@@ -238,7 +244,7 @@ class GONetworkDialog(BasePlotDialog):
         self._yauto_check = QCheckBox("Auto")
         self._yauto_check.setChecked(True)
         self._yauto_check.toggled.connect(self._on_yauto_toggled)
-        self._yauto_check.toggled.connect(self._update_plot)
+        self._yauto_check.toggled.connect(self._schedule_replot)
         yrange_layout.addWidget(self._yauto_check)
         yrange_layout.addWidget(QLabel("Min:"))
         self._ymin_spin = QSpinBox()
@@ -246,7 +252,7 @@ class GONetworkDialog(BasePlotDialog):
         self._ymin_spin.setValue(0)
         self._ymin_spin.setEnabled(False)
         self._ymin_spin.setToolTip("Visible row index (0 = bottom term)")
-        self._ymin_spin.valueChanged.connect(self._update_plot)
+        self._ymin_spin.valueChanged.connect(self._schedule_replot)
         yrange_layout.addWidget(self._ymin_spin)
         yrange_layout.addWidget(QLabel("Max:"))
         self._ymax_spin = QSpinBox()
@@ -254,7 +260,7 @@ class GONetworkDialog(BasePlotDialog):
         self._ymax_spin.setValue(30)
         self._ymax_spin.setEnabled(False)
         self._ymax_spin.setToolTip("Visible row index (n-1 = top term)")
-        self._ymax_spin.valueChanged.connect(self._update_plot)
+        self._ymax_spin.valueChanged.connect(self._schedule_replot)
         yrange_layout.addWidget(self._ymax_spin)
         axis_form.addRow("Y (rows):", yrange_row)
 
@@ -272,7 +278,7 @@ class GONetworkDialog(BasePlotDialog):
         self._zauto_check = QCheckBox("Auto")
         self._zauto_check.setChecked(True)
         self._zauto_check.toggled.connect(self._on_zauto_toggled)
-        self._zauto_check.toggled.connect(self._update_plot)
+        self._zauto_check.toggled.connect(self._schedule_replot)
         zrange_layout.addWidget(self._zauto_check)
         zrange_layout.addWidget(QLabel("Min FDR:"))
         self._zmin_spin = QDoubleSpinBox()
@@ -282,7 +288,7 @@ class GONetworkDialog(BasePlotDialog):
         self._zmin_spin.setSingleStep(0.0001)
         self._zmin_spin.setEnabled(False)
         self._zmin_spin.setToolTip("Color scale lower bound (most significant FDR)")
-        self._zmin_spin.valueChanged.connect(self._update_plot)
+        self._zmin_spin.valueChanged.connect(self._schedule_replot)
         zrange_layout.addWidget(self._zmin_spin)
         zrange_layout.addWidget(QLabel("Max:"))
         self._zmax_spin = QDoubleSpinBox()
@@ -292,7 +298,7 @@ class GONetworkDialog(BasePlotDialog):
         self._zmax_spin.setSingleStep(0.005)
         self._zmax_spin.setEnabled(False)
         self._zmax_spin.setToolTip("Color scale upper bound (least significant FDR)")
-        self._zmax_spin.valueChanged.connect(self._update_plot)
+        self._zmax_spin.valueChanged.connect(self._schedule_replot)
         zrange_layout.addWidget(self._zmax_spin)
         cbar_form.addRow("Z range:", zrange_row)
 
@@ -301,12 +307,12 @@ class GONetworkDialog(BasePlotDialog):
             'YlOrRd_r', 'RdPu_r', 'Blues_r', 'Greens_r', 'Purples_r',
             'viridis_r', 'plasma_r', 'magma_r', 'BuPu_r', 'RdYlBu',
         ])
-        self._cbar_cmap_combo.currentTextChanged.connect(self._update_plot)
+        self._cbar_cmap_combo.currentTextChanged.connect(self._schedule_replot)
         cbar_form.addRow("Colormap:", self._cbar_cmap_combo)
 
         self._cbar_pos_combo = QComboBox()
         self._cbar_pos_combo.addItems(["right", "left", "bottom", "top"])
-        self._cbar_pos_combo.currentTextChanged.connect(self._update_plot)
+        self._cbar_pos_combo.currentTextChanged.connect(self._schedule_replot)
         cbar_form.addRow("Position:", self._cbar_pos_combo)
 
         self._cbar_size_spin = QDoubleSpinBox()
@@ -314,7 +320,7 @@ class GONetworkDialog(BasePlotDialog):
         self._cbar_size_spin.setValue(0.6)
         self._cbar_size_spin.setSingleStep(0.05)
         self._cbar_size_spin.setDecimals(2)
-        self._cbar_size_spin.valueChanged.connect(self._update_plot)
+        self._cbar_size_spin.valueChanged.connect(self._schedule_replot)
         cbar_form.addRow("Size:", self._cbar_size_spin)
 
         dot_form.addRow(cbar_group)
@@ -366,20 +372,20 @@ class GONetworkDialog(BasePlotDialog):
 
     # ── Helpers ───────────────────────────────────────────────────────────────
 
-    def _get_gene_sets(self, df: pd.DataFrame) -> dict:
-        """index → set(genes) 딕셔너리 반환."""
-        gene_col = next(
+    @staticmethod
+    def _gene_column(df: pd.DataFrame) -> Optional[str]:
+        return next(
             (c for c in [StandardColumns.GENE_SYMBOLS, 'geneID', 'Genes', 'genes']
              if c in df.columns), None
         )
-        result = {}
-        for idx, row in df.iterrows():
-            if gene_col:
-                val = row.get(gene_col, '')
-                result[idx] = set(str(val).split('/')) if pd.notna(val) and str(val).strip() else set()
-            else:
-                result[idx] = set()
-        return result
+
+    def _get_similarity_cache(self) -> TermSimilarityCache:
+        """전체 term 의 incidence 행렬을 한 번만 만들고 재사용."""
+        if self._similarity_cache is None:
+            gene_col = self._gene_column(self.df)
+            genes = self.df[gene_col] if gene_col else [None] * len(self.df)
+            self._similarity_cache = TermSimilarityCache(genes, self.df.index)
+        return self._similarity_cache
 
     def _get_representatives(self, df: pd.DataFrame) -> pd.DataFrame:
         """각 유효 클러스터에서 FDR 최솟값 term 1개를 대표로 추출."""
@@ -402,33 +408,37 @@ class GONetworkDialog(BasePlotDialog):
         return df[mask].copy()
 
     def _build_network(self, plot_df: pd.DataFrame, edge_threshold: float) -> nx.Graph:
-        """Jaccard 유사도 기반 네트워크 구성."""
-        gene_sets = self._get_gene_sets(plot_df)
+        """Jaccard 유사도 기반 네트워크 구성.
+
+        유사도 행렬은 TermSimilarityCache 가 node 집합별로 캐시하므로,
+        edge 임계값만 바뀐 재그리기는 캐시된 행렬을 다시 자르기만 한다.
+        """
         desc_col = next(
             (c for c in [StandardColumns.DESCRIPTION, 'Description', 'Term', 'term']
              if c in plot_df.columns), None
         )
+        labels = (plot_df[desc_col].astype(str) if desc_col
+                  else pd.Series(plot_df.index.astype(str), index=plot_df.index))
+        labels = labels.where(labels.str.len() <= 55, labels.str[:52] + '...')
+        clusters = (plot_df[StandardColumns.CLUSTER_ID]
+                    if StandardColumns.CLUSTER_ID in plot_df.columns
+                    else pd.Series('', index=plot_df.index))
 
         G = nx.Graph()
-        for idx, row in plot_df.iterrows():
-            label = str(row[desc_col]) if desc_col else str(idx)
-            if len(label) > 55:
-                label = label[:52] + '...'
-            G.add_node(idx,
-                       label=label,
-                       cluster=row.get(StandardColumns.CLUSTER_ID, ''))
-
-        nodes = list(plot_df.index)
-        for i in range(len(nodes)):
-            for j in range(i + 1, len(nodes)):
-                gi = gene_sets.get(nodes[i], set())
-                gj = gene_sets.get(nodes[j], set())
-                union = len(gi | gj)
-                if union == 0:
-                    continue
-                jac = len(gi & gj) / union
-                if jac >= edge_threshold:
-                    G.add_edge(nodes[i], nodes[j], weight=jac)
+        G.add_nodes_from(
+            (idx, {'label': label, 'cluster': cluster})
+            for idx, label, cluster in zip(plot_df.index, labels, clusters)
+        )
+
+        try:
+            src, dst, weights = self._get_similarity_cache().edges(plot_df.index, edge_threshold)
+        except KeyError:
+            # plot_df 가 self.df 에 없는 행을 포함하면 그 자리에서 계산
+            gene_col = self._gene_column(plot_df)
+            genes = plot_df[gene_col] if gene_col else [None] * len(plot_df)
+            src, dst, weights = TermSimilarityCache(genes, plot_df.index).edges(
+                plot_df.index, edge_threshold)
+        G.add_weighted_edges_from(zip(src, dst, weights.tolist()))
         return G
 
     def _compute_layout(self, G: nx.Graph) -> dict:
@@ -436,16 +446,13 @@ class GONetworkDialog(BasePlotDialog):
         n = len(G.nodes())
         if layout == "Spring":
             k = max(0.5, 2.0 / max(1, n ** 0.5))
-            return nx.spring_layout(G, k=k, seed=42, iterations=60)
+            return self._layout_cache.layout(G, 'spring', k=k, seed=42, iterations=60)
         elif layout == "Kamada-Kawai":
-            try:
-                return nx.kamada_kawai_layout(G)
-            except Exception:
-                return nx.spring_layout(G, seed=42)
+            return self._layout_cache.layout(G, 'kamada_kawai', seed=42)
         elif layout == "Circular":
-            return nx.circular_layout(G)
+            return self._layout_cache.layout(G, 'circular')
         else:
-            return nx.spectral_layout(G) if n > 2 else nx.spring_layout(G, seed=42)
+            return self._layout_cache.layout(G, 'spectral', seed=42)
 
     def _node_colors(self, G: nx.Graph, plot_df: pd.DataFrame, color_by: str):
         """(colors, cmap, use_colorbar, colorbar_label, legend_handles) 반환."""
@@ -0,0 +1,176 @@
+"""
+Hover Picking
+
+scatter 플롯의 hover 툴팁 공통 처리.
+
+- PointPicker: 점 좌표를 축 정규화 좌표(0~1)의 KD-tree 로 색인해 최근접 점을 O(log n)
+  으로 찾는다. 축 범위(줌/팬)나 스케일이 바뀌면 다음 질의 때 다시 만든다.
+- HoverController: motion_notify_event 를 QTimer 로 묶어(throttle) 마지막 이벤트만
+  처리하고, 툴팁 annotation 은 blit 으로 그 artist 만 다시 그린다 (전체 draw_idle 없음).
+
+Usage:
+    self._hover = HoverController(self.canvas, self._on_hover)   # canvas 당 한 번
+    ...
+    self.annot = ax.annotate(...)
+    self._hover.attach(self.annot)                # 다시 그릴 때마다
+    self._picker = PointPicker(ax, df['x'], df['y'])
+
+    def _on_hover(self, event):
+        pos = self._picker.nearest(event.xdata, event.ydata, radius=0.05)
+        if pos is None:
+            self._hover.hide()
+            return
+        self.annot.xy = ...
+        self._hover.show()
+"""
+
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+from PyQt6.QtCore import QTimer
+
+
+# motion 이벤트 처리 간격 (ms) — 이 사이에 들어온 이벤트는 마지막 것만 처리
+HOVER_INTERVAL_MS = 30
+
+
+class PointPicker:
+    """(x, y) 점들의 최근접 질의 (radius 는 축 정규화 좌표 단위, normalized=False 면 데이터 단위)"""
+
+    def __init__(self, ax, x, y, normalized: bool = True):
+        self.ax = ax
+        self.normalized = normalized
+        xy = np.column_stack([np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)])
+        finite = np.isfinite(xy).all(axis=1)
+        # 트리 안 위치 → 원래 위치
+        self._positions = np.flatnonzero(finite)
+        self._xy = xy[finite]
+        self._tree = None
+        self._view = None
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def _view_key(self):
+        if not self.normalized:
+            return None
+        ax = self.ax
+        return (ax.get_xlim(), ax.get_ylim(), ax.get_xscale(), ax.get_yscale())
+
+    def _to_space(self, xy: np.ndarray) -> np.ndarray:
+        if not self.normalized:
+            return xy
+        # 데이터 → 축 정규화 좌표 (log 축도 처리)
+        return (self.ax.transScale + self.ax.transLimits).transform(xy)
+
+    def _ensure_tree(self):
+        view = self._view_key()
+        if self._tree is None or view != self._view:
+            from scipy.spatial import cKDTree
+            self._tree = cKDTree(self._to_space(self._xy))
+            self._view = view
+        return self._tree
+
+    def neighbours(self, x: Optional[float], y: Optional[float],
+                   radius: float) -> Tuple[np.ndarray, np.ndarray]:
+        """radius 안의 점 (원래 위치, 거리) — 거리 오름차순."""
+        empty = (np.empty(0, dtype=np.int64), np.empty(0))
+        if x is None or y is None or not len(self._positions):
+            return empty
+        tree = self._ensure_tree()
+        point = self._to_space(np.array([[x, y]], dtype=np.float64))[0]
+        hits = np.asarray(tree.query_ball_point(point, radius), dtype=np.int64)
+        if not len(hits):
+            return empty
+        dist = np.hypot(*(tree.data[hits] - point).T)
+        order = np.argsort(dist, kind='stable')
+        return self._positions[hits[order]], dist[order]
+
+    def nearest(self, x: Optional[float], y: Optional[float],
+                radius: float = np.inf) -> Optional[int]:
+        """radius 미만 거리의 최근접 점의 원래 위치 (없으면 None)."""
+        if x is None or y is None or not len(self._positions):
+            return None
+        tree = self._ensure_tree()
+        point = self._to_space(np.array([[x, y]], dtype=np.float64))[0]
+        dist, i = tree.query(point, distance_upper_bound=radius)
+        if not np.isfinite(dist) or dist >= radius:
+            return None
+        return int(self._positions[i])
+
+
+class HoverController:
+    """canvas 의 hover 이벤트 throttle + 툴팁 annotation blit"""
+
+    def __init__(self, canvas, on_move: Callable, interval_ms: int = HOVER_INTERVAL_MS):
+        self.canvas = canvas
+        self.annot = None
+        self._on_move = on_move
+        self._pending = None
+        self._background = None
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._flush)
+        self._cids = [
+            canvas.mpl_connect('motion_notify_event', self._on_motion),
+            canvas.mpl_connect('draw_event', self._on_draw),
+        ]
+
+    def attach(self, annot):
+        """새로 그린 figure 의 툴팁 annotation 지정 (전체 draw 에서는 제외하고 blit 으로만 그린다)."""
+        if annot is not None:
+            annot.set_animated(True)
+        self.annot = annot
+        self._background = None
+
+    def disconnect(self):
+        self._timer.stop()
+        for cid in self._cids:
+            self.canvas.mpl_disconnect(cid)
+        self._cids = []
+
+    def show(self):
+        if self.annot is not None:
+            self.annot.set_visible(True)
+            self.refresh()
+
+    def hide(self):
+        if self.annot is not None and self.annot.get_visible():
+            self.annot.set_visible(False)
+            self.refresh()
+
+    def refresh(self):
+        """annotation 만 다시 그린다 (배경이 없거나 blit 불가면 draw_idle)."""
+        annot = self.annot
+        if annot is None:
+            return
+        if self._background is None or not self.canvas.supports_blit \
+                or annot.figure is not self.canvas.figure:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        if annot.get_visible():
+            self.canvas.figure.draw_artist(annot)
+        self.canvas.blit(self.canvas.figure.bbox)
+
+    # ── 이벤트 ────────────────────────────────────────────────────────────
+
+    def _on_motion(self, event):
+        self._pending = event
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _flush(self):
+        event, self._pending = self._pending, None
+        if event is not None:
+            self._on_move(event)
+
+    def _on_draw(self, event):
+        # 전체 draw 직후: annotation 없는 배경을 저장하고 (보이는 중이면) 그 위에 다시 그린다
+        if not self.canvas.supports_blit:
+            return
+        self._background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        annot = self.annot
+        if annot is not None and annot.get_visible() and annot.figure is self.canvas.figure:
+            self.canvas.figure.draw_artist(annot)
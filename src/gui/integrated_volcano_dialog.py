@@ -56,14 +56,14 @@ class IntegratedVolcanoDialog(BasePlotDialog):
         self.padj_spin.setRange(0.0001, 1.0)
         self.padj_spin.setDecimals(4)
         self.padj_spin.setValue(0.05)
-        self.padj_spin.valueChanged.connect(self._update_plot)
+        self.padj_spin.valueChanged.connect(self._schedule_replot)
         thresh_form.addRow("RNA padj ≤", self.padj_spin)
 
         self.lfc_spin = QDoubleSpinBox()
         self.lfc_spin.setRange(0.0, 10.0)
         self.lfc_spin.setDecimals(4)
         self.lfc_spin.setValue(1.0)
-        self.lfc_spin.valueChanged.connect(self._update_plot)
+        self.lfc_spin.valueChanged.connect(self._schedule_replot)
         thresh_form.addRow("RNA |log2FC| ≥", self.lfc_spin)
 
         layout.addWidget(thresh_group)
@@ -75,12 +75,12 @@ class IntegratedVolcanoDialog(BasePlotDialog):
         self.base_size_spin = QSpinBox()
         self.base_size_spin.setRange(5, 200)
         self.base_size_spin.setValue(30)
-        self.base_size_spin.valueChanged.connect(self._update_plot)
+        self.base_size_spin.valueChanged.connect(self._schedule_replot)
         size_form.addRow("Base size:", self.base_size_spin)
 
         self.scale_by_peak_cb = QCheckBox("Scale by peak count")
         self.scale_by_peak_cb.setChecked(True)
-        self.scale_by_peak_cb.stateChanged.connect(self._update_plot)
+        self.scale_by_peak_cb.stateChanged.connect(self._schedule_replot)
         size_form.addRow("", self.scale_by_peak_cb)
 
         layout.addWidget(size_group)
@@ -20,6 +20,7 @@ from PyQt6.QtCore import Qt
 
 from models.data_models import Dataset
 from gui.base_plot_dialog import BasePlotDialog
+from gui.hover_picker import PointPicker
 from utils.export_paths import remembered_save_path
 
 
@@ -77,6 +78,7 @@ class MAPlotDialog(BasePlotDialog):
 
         # hover state
         self._scatter_collections = []
+        self._deg_picker = None
 
         super().__init__(f"MA Plot — {dataset.name}", parent, figsize=(self.fig_width, self.fig_height))
         self._update_plot()
@@ -93,7 +95,7 @@ class MAPlotDialog(BasePlotDialog):
         self.padj_spin.setDecimals(4)
         self.padj_spin.setSingleStep(0.01)
         self.padj_spin.setValue(self.padj_threshold)
-        self.padj_spin.valueChanged.connect(self._update_plot)
+        self.padj_spin.valueChanged.connect(self._schedule_replot)
         settings_layout.addRow("P-adj Threshold:", self.padj_spin)
 
         self.log2fc_spin = QDoubleSpinBox()
@@ -101,7 +103,7 @@ class MAPlotDialog(BasePlotDialog):
         self.log2fc_spin.setDecimals(4)
         self.log2fc_spin.setSingleStep(0.1)
         self.log2fc_spin.setValue(self.log2fc_threshold)
-        self.log2fc_spin.valueChanged.connect(self._update_plot)
+        self.log2fc_spin.valueChanged.connect(self._schedule_replot)
         settings_layout.addRow("Log2FC Threshold:", self.log2fc_spin)
 
         # Colors
@@ -123,7 +125,7 @@ class MAPlotDialog(BasePlotDialog):
         self.size_spin = QSpinBox()
         self.size_spin.setRange(1, 100)
         self.size_spin.setValue(self.dot_size)
-        self.size_spin.valueChanged.connect(self._update_plot)
+        self.size_spin.valueChanged.connect(self._schedule_replot)
         settings_layout.addRow("Dot Size:", self.size_spin)
 
         # X-axis range
@@ -131,14 +133,14 @@ class MAPlotDialog(BasePlotDialog):
         self.x_min_spin.setRange(-5, 100)
         self.x_min_spin.setDecimals(1)
         self.x_min_spin.setValue(self.x_min if self.x_min is not None else 0.0)
-        self.x_min_spin.valueChanged.connect(self._update_plot)
+        self.x_min_spin.valueChanged.connect(self._schedule_replot)
         settings_layout.addRow("X Min:", self.x_min_spin)
 
         self.x_max_spin = QDoubleSpinBox()
         self.x_max_spin.setRange(-5, 100)
         self.x_max_spin.setDecimals(1)
         self.x_max_spin.setValue(self.x_max if self.x_max is not None else 20.0)
-        self.x_max_spin.valueChanged.connect(self._update_plot)
+        self.x_max_spin.valueChanged.connect(self._schedule_replot)
         x_auto_btn = QPushButton("Auto")
         x_auto_btn.setMaximumWidth(60)
         x_auto_btn.clicked.connect(self._auto_x_range)
@@ -155,14 +157,14 @@ class MAPlotDialog(BasePlotDialog):
         self.y_min_spin.setRange(-100, 0)
         self.y_min_spin.setDecimals(1)
         self.y_min_spin.setValue(self.y_min if self.y_min is not None else -6.0)
-        self.y_min_spin.valueChanged.connect(self._update_plot)
+        self.y_min_spin.valueChanged.connect(self._schedule_replot)
         settings_layout.addRow("Y Min:", self.y_min_spin)
 
         self.y_max_spin = QDoubleSpinBox()
         self.y_max_spin.setRange(0, 100)
         self.y_max_spin.setDecimals(1)
         self.y_max_spin.setValue(self.y_max if self.y_max is not None else 6.0)
-        self.y_max_spin.valueChanged.connect(self._update_plot)
+        self.y_max_spin.valueChanged.connect(self._schedule_replot)
         y_auto_btn = QPushButton("Auto")
         y_auto_btn.setMaximumWidth(60)
         y_auto_btn.clicked.connect(self._auto_y_range)
@@ -210,7 +212,7 @@ class MAPlotDialog(BasePlotDialog):
         self.annot_top_n_spin = QSpinBox()
         self.annot_top_n_spin.setRange(1, 200)
         self.annot_top_n_spin.setValue(self.annotation_top_n)
-        self.annot_top_n_spin.valueChanged.connect(self._update_plot)
+        self.annot_top_n_spin.valueChanged.connect(self._schedule_replot)
         annot_layout.addRow("Top N genes:", self.annot_top_n_spin)
 
         custom_list_layout = QHBoxLayout()
@@ -229,7 +231,7 @@ class MAPlotDialog(BasePlotDialog):
         self.annot_size_spin = QSpinBox()
         self.annot_size_spin.setRange(5, 20)
         self.annot_size_spin.setValue(self.annotation_label_size)
-        self.annot_size_spin.valueChanged.connect(self._update_plot)
+        self.annot_size_spin.valueChanged.connect(self._schedule_replot)
         annot_layout.addRow("Label size:", self.annot_size_spin)
 
         annot_group.setLayout(annot_layout)
@@ -377,8 +379,16 @@ class MAPlotDialog(BasePlotDialog):
 
         # 렌더는 순수 함수 src/plots/ma.py::render_ma 에 있으며 재현 번들과 공유한다.
         from plots.ma import render_ma
-        result = render_ma(ax, self.dataset.dataframe, self._plot_params())
+        params = self._plot_params()
+        regulation = None
+        df = self.dataset.dataframe
+        if df is not None and 'log2fc' in df.columns and 'adj_pvalue' in df.columns:
+            # 임계값만 바뀐 재렌더는 데이터셋 significance index 의 memo 로 분류
+            regulation = self.dataset.significance_index('log2fc', 'adj_pvalue').regulation(
+                params['padj_threshold'], params['log2fc_threshold'])
+        result = render_ma(ax, df, params, regulation=regulation)
         if result is None:
+            self._deg_picker = None
             self.canvas.draw()
             return
 
@@ -391,7 +401,8 @@ class MAPlotDialog(BasePlotDialog):
             zorder=1000,
         )
         self.annot.set_visible(False)
-        self.canvas.mpl_connect('motion_notify_event', self._on_hover)
+        self._hover_controller(self._on_hover).attach(self.annot)
+        self._deg_picker = PointPicker(ax, self.deg_data['_x'], self.deg_data['_y'])
         self.canvas.draw()
 
     def _plot_params(self) -> dict:
@@ -471,29 +482,19 @@ class MAPlotDialog(BasePlotDialog):
 
     def _on_hover(self, event):
         annot = getattr(self, 'annot', None)
-        deg = getattr(self, 'deg_data', None)
-        if annot is None or deg is None or len(deg) == 0 or event.inaxes is None:
-            if annot is not None and annot.get_visible():
-                annot.set_visible(False)
-                self.canvas.draw_idle()
+        picker = self._deg_picker
+        if annot is None or picker is None or len(picker) == 0 or event.inaxes is None:
+            self._hover.hide()
             return
         x, y = event.xdata, event.ydata
         if x is None or y is None:
             return
-        ax = event.inaxes
-        xlim, ylim = ax.get_xlim(), ax.get_ylim()
-        xs = (xlim[1] - xlim[0]) or 1.0
-        ys = (ylim[1] - ylim[0]) or 1.0
-        dist = np.sqrt(((deg['_x'] - x) / xs * 10) ** 2 + ((deg['_y'] - y) / ys * 10) ** 2)
-        if dist.empty:
-            return
-        idx = dist.idxmin()
-        if dist[idx] >= 0.5:
-            if annot.get_visible():
-                annot.set_visible(False)
-                self.canvas.draw_idle()
+        # 축 정규화 거리 0.05 이내의 최근접 DEG 점 (KD-tree)
+        pos = picker.nearest(x, y, radius=0.05)
+        if pos is None:
+            self._hover.hide()
             return
-        row = deg.loc[idx]
+        row = self.deg_data.iloc[pos]
         gene_col = next((c for c in ('nearest_gene', 'symbol', 'gene_id', 'peak_id')
                          if c in row.index), None)
         name = str(row[gene_col]) if gene_col else 'Unknown'
@@ -502,8 +503,7 @@ class MAPlotDialog(BasePlotDialog):
         annot.xy = (row['_x'], row['_y'])
         annot.set_text(f"Gene: {name}\nlog₂FC: {row['log2fc']:.3f}\n"
                        f"Mean acc: {base_mean:.1f}\nPadj: {padj_val:.2e}")
-        annot.set_visible(True)
-        self.canvas.draw_idle()
+        self._hover.show()
 
     # ── Export ────────────────────────────────────────────────────────────
 
@@ -16,10 +16,9 @@ from PyQt6.QtGui import QAction, QIcon, QFont, QActionGroup, QPixmap, QShortcut,
 import logging
 from pathlib import Path
 from typing import Optional, List, Dict
-import numpy as np
 import pandas as pd
 
-from core.fsm import FSM, State, Event
+from core.fsm import FSM, State
 from core.logger import QtLogHandler, LogBuffer, get_audit_logger
 from gui.filter_panel import FilterPanel
 from gui.dataset_tree_panel import DatasetTreePanel
@@ -36,6 +35,7 @@ from gui.pandas_table_model import DataFrameTableModel
 from models.data_models import FilterMode, DatasetType
 from presenters.main_presenter import MainPresenter
 from utils.export_paths import remembered_save_path
+from utils.identifier_index import frame_identifier_index
 
 
 class MainWindow(QMainWindow):
@@ -65,6 +65,8 @@ class MainWindow(QMainWindow):
         self.presenter.filter_completed.connect(self._on_filter_completed)
         self.presenter.error_occurred.connect(self._on_presenter_error)
         self.presenter.progress_updated.connect(self._on_progress_updated)
+        self.presenter.database_dataset_ready.connect(self._on_database_dataset_ready)
+        self.presenter.database_load_finished.connect(self._on_database_load_finished)
         
         # 설정 값
         self.column_display_level = "basic"  # "basic", "de", "full" - 기본값: basic
@@ -86,10 +88,15 @@ class MainWindow(QMainWindow):
         # 상용 프로그램과 동일하게: Save 는 이 경로가 있으면 대화상자 없이 바로 덮어쓰고,
         # 없으면(새 세션) Save As 와 동일하게 대화상자를 띄운다. 창 제목에도 반영한다.
         self._current_project_path: Optional[str] = None
+
+        # 실행 중인 비교 worker (완료 시 제거)
+        self._comparison_workers: list = []
         
         # Database Manager 초기화
         from utils.database_manager import DatabaseManager
         self.db_manager = DatabaseManager()
+        # DB 다중 로드 배치별 상태 {batch_id: {'requested_ids', 'ready', 'current_set'}}
+        self._db_load_batches: Dict[int, dict] = {}
         
         # FSM 상태 변경 리스너 등록
         self.presenter.fsm.add_state_change_listener(self._on_state_changed)
@@ -788,6 +795,13 @@ class MainWindow(QMainWindow):
         self.progress_bar.hide()
         self.status_bar.addPermanentWidget(self.progress_bar)
         
+        # 백그라운드 로드 취소 버튼 (로딩 중에만 표시)
+        self.cancel_load_btn = QPushButton("Cancel")
+        self.cancel_load_btn.setToolTip("Cancel dataset loading")
+        self.cancel_load_btn.clicked.connect(self.presenter.cancel_loading)
+        self.cancel_load_btn.hide()
+        self.status_bar.addPermanentWidget(self.cancel_load_btn)
+        
         # FSM 상태 라벨
         self.fsm_state_label = QLabel(f"State: {self.presenter.fsm.current_state.name}")
         self.status_bar.addPermanentWidget(self.fsm_state_label)
@@ -1088,11 +1102,13 @@ class MainWindow(QMainWindow):
         
         # 상태에 따른 UI 활성화/비활성화
         if new_state in [State.LOADING_DATA, State.FILTERING, State.ANALYZING]:
+            self.progress_bar.setValue(0)
             self.progress_bar.show()
             self.status_label.setText(f"{new_state.name}...")
         else:
             self.progress_bar.hide()
             self.status_label.setText("Ready")
+        self.cancel_load_btn.setVisible(new_state == State.LOADING_DATA)
         
         # 메뉴 항목 활성화/비활성화
         self._update_menu_states(new_state)
@@ -1451,9 +1467,11 @@ class MainWindow(QMainWindow):
 
             if stored_df is not None and not stored_df.empty:
                 df = stored_df.copy()
+                source_df = stored_df   # 식별자 인덱스 캐시 조회용 (copy 전 원본 객체)
             else:
                 # fallback: 모델의 표시용 DataFrame 사용 (dtype 보존)
                 df = model.dataframe().copy() if isinstance(model, DataFrameTableModel) else pd.DataFrame()
+                source_df = df
                 tab_dataset = None
             
             # 필터 적용
@@ -1467,8 +1485,8 @@ class MainWindow(QMainWindow):
 
                 if tab_dataset_type == DatasetType.GO_ANALYSIS:
                     # GO 데이터: gene_symbols 컬럼에서 부분 포함 검색
-                    import re
                     from models.standard_columns import StandardColumns
+                    from utils.gene_sets import frame_gene_term_index
                     gs_col = StandardColumns.GENE_SYMBOLS
                     if gs_col not in df.columns:
                         QMessageBox.warning(self, "No gene_symbols Column",
@@ -1476,14 +1494,9 @@ class MainWindow(QMainWindow):
                         return
 
                     query_set = {g.strip().upper() for g in criteria.gene_list if g.strip()}
-
-                    def _count_hits(cell):
-                        if not isinstance(cell, str) or not cell.strip():
-                            return 0
-                        syms = {s.strip().upper() for s in re.split(r'[,;/\s]+', cell) if s.strip()}
-                        return len(syms & query_set)
-
-                    hit_counts = df[gs_col].apply(_count_hits)
+                    # 데이터셋별 gene → term 역색인 조회 (탭이 데이터셋 원본이면 캐시 사용)
+                    index = frame_gene_term_index(source_df, gs_col, tab_dataset)
+                    hit_counts = pd.Series(index.match_counts(query_set), index=df.index)
                     filtered_df = df[hit_counts > 0].copy()
                     filtered_df['_hit'] = hit_counts[hit_counts > 0]
                     filtered_df = filtered_df.sort_values('_hit', ascending=False).drop(columns='_hit')
@@ -1500,15 +1513,9 @@ class MainWindow(QMainWindow):
                         QMessageBox.warning(self, "No Gene Column", "No gene identifier column found.")
                         return
 
-                    # 필터링 (gene list 입력 순서 유지)
-                    gene_order = {g.upper(): i for i, g in enumerate(criteria.gene_list)}
-                    mask = df[gene_col].astype(str).str.upper().isin(gene_order)
-                    filtered_df = (
-                        df[mask]
-                        .assign(_sort_key=df.loc[mask, gene_col].astype(str).str.upper().map(gene_order))
-                        .sort_values('_sort_key')
-                        .drop(columns='_sort_key')
-                    )
+                    # 필터링 (gene list 입력 순서 유지, 대소문자 무시 식별자 인덱스 조회)
+                    index = frame_identifier_index(source_df, gene_col, tab_dataset)
+                    filtered_df = df.iloc[index.positions(criteria.gene_list)]
                     new_tab_name = f"Filtered: {tab_name} - Gene List ({len(criteria.gene_list)} genes)"
                 
             else:  # Statistical filter
@@ -1702,7 +1709,8 @@ class MainWindow(QMainWindow):
 
     def _replay_comparison(self, dataset_names, comparison_type):
         """프로젝트 복원 시 저장된 레시피로 비교 시트를 재생성."""
-        self._perform_basic_comparison(list(dataset_names), comparison_type)
+        # 복원 직후 활성 탭을 되돌리므로 비교 탭은 동기적으로 만든다
+        self._perform_basic_comparison(list(dataset_names), comparison_type, background=False)
 
     def _replay_dataset_sheets(self, loaded_ds_name, sheets):
         """프로젝트 복원: 한 데이터셋의 filtered/plot 하위 시트를 재현한다."""
@@ -1790,13 +1798,15 @@ class MainWindow(QMainWindow):
                 except Exception as e:
                     self.logger.warning(f"Failed to restore plot '{label_str}': {e}")
     
-    def _perform_basic_comparison(self, dataset_names: List[str], comparison_type: str):
+    def _perform_basic_comparison(self, dataset_names: List[str], comparison_type: str,
+                                  background: bool = True):
         """
         기본 비교 구현 (Presenter에 메서드가 없을 때)
         
         Args:
             dataset_names: 비교할 데이터셋 이름 리스트
             comparison_type: 비교 타입
+            background: Gene List / Statistics 비교를 worker 스레드에서 실행할지 여부
         """
         try:
             # 데이터셋 가져오기
@@ -1821,9 +1831,9 @@ class MainWindow(QMainWindow):
             try:
                 # 비교 타입별 처리
                 if comparison_type == "gene_list":
-                    self._compare_gene_list(datasets)
+                    self._compare_gene_list(datasets, background=background)
                 elif comparison_type == "statistics":
-                    self._compare_statistics(datasets)
+                    self._compare_statistics(datasets, background=background)
                 elif comparison_type == "go_term":
                     self._compare_go_terms(datasets)
                 else:
@@ -1837,7 +1847,7 @@ class MainWindow(QMainWindow):
             self.logger.error(f"Comparison failed: {e}")
             QMessageBox.critical(self, "Comparison Error", f"Failed to compare datasets:\n{str(e)}")
     
-    def _compare_gene_list(self, datasets):
+    def _compare_gene_list(self, datasets, background: bool = True):
         """Gene List 필터링 비교 - Wide format"""
         criteria = self.filter_panel.get_filter_criteria()
         gene_list = criteria.gene_list  # FilterCriteria 객체의 속성 사용
@@ -1849,186 +1859,89 @@ class MainWindow(QMainWindow):
         
         self.logger.info(f"Comparing {len(datasets)} datasets with {len(gene_list)} genes")
         self.logger.info(f"Gene list: {gene_list[:5]}..." if len(gene_list) > 5 else f"Gene list: {gene_list}")
-        
-        # 각 데이터셋에서 필터링된 데이터 수집
-        dataset_dfs = {}
-        for dataset in datasets:
-            df = dataset.dataframe.copy()
-            
-            self.logger.info(f"Dataset '{dataset.name}' columns: {df.columns.tolist()}")
-            
-            # gene_id 컬럼 찾기 (symbol이 먼저)
-            gene_id_col = None
-            if 'symbol' in df.columns:
-                gene_id_col = 'symbol'
-                self.logger.info(f"Using 'symbol' column as gene identifier")
-            elif 'gene_id' in df.columns:
-                gene_id_col = 'gene_id'
-                self.logger.info(f"Using 'gene_id' column as gene identifier")
-            else:
-                self.logger.warning(f"No gene identifier column found in dataset: {dataset.name}")
-                continue
-            
-            # 디버깅: 첫 5개 gene 값 출력
-            self.logger.info(f"First 5 genes in dataset: {df[gene_id_col].head().tolist()}")
-            
-            # 필터링 (gene list 입력 순서 유지)
-            gene_order = {g.upper(): i for i, g in enumerate(gene_list)}
-            mask = df[gene_id_col].isin(gene_list)
-            
-            if not mask.any():
-                self.logger.warning(f"No matching genes found in dataset: {dataset.name}")
-                # 대소문자 구분 없이 재시도
-                mask = df[gene_id_col].str.upper().isin(gene_order)
-                if not mask.any():
-                    continue
-                else:
-                    self.logger.debug(f"Found {mask.sum()} genes after case-insensitive matching")
-            else:
-                self.logger.debug(f"Found {mask.sum()} matching genes in dataset: {dataset.name}")
 
-            filtered_df = (
-                df[mask].copy()
-                .assign(_sort_key=df.loc[mask, gene_id_col].astype(str).str.upper().map(gene_order))
-                .sort_values('_sort_key')
-                .drop(columns='_sort_key')
-            )
-            
-            # 필요한 컬럼만 선택
-            result_df = pd.DataFrame()
-            
-            # gene_id와 symbol 구분해서 추출
-            if 'gene_id' in filtered_df.columns and 'symbol' in filtered_df.columns:
-                # 둘 다 있으면 각각 저장
-                result_df['gene_id'] = filtered_df['gene_id']
-                result_df['symbol'] = filtered_df['symbol']
-            elif 'symbol' in filtered_df.columns:
-                # symbol만 있는 경우: ENSMUSG 패턴이면 gene_id로, 아니면 symbol로
-                first_value = str(filtered_df['symbol'].iloc[0]) if not filtered_df.empty else ''
-                if first_value.startswith('ENSMUSG') or first_value.startswith('ENSG'):
-                    # Ensembl ID 패턴이면 gene_id로 취급
-                    result_df['gene_id'] = filtered_df['symbol']
-                    result_df['symbol'] = ''  # symbol은 비움
-                else:
-                    # 일반 gene symbol이면 symbol로 취급
-                    result_df['gene_id'] = ''
-                    result_df['symbol'] = filtered_df['symbol']
-            elif 'gene_id' in filtered_df.columns:
-                # gene_id만 있으면 gene_id로 사용
-                result_df['gene_id'] = filtered_df['gene_id']
-                result_df['symbol'] = ''
-            
-            if 'log2FC' in filtered_df.columns:
-                result_df['log2FC'] = filtered_df['log2FC']
-            elif 'log2fc' in filtered_df.columns:
-                result_df['log2FC'] = filtered_df['log2fc']
-            elif 'log2FoldChange' in filtered_df.columns:
-                result_df['log2FC'] = filtered_df['log2FoldChange']
-            elif 'Log2FoldChange' in filtered_df.columns:
-                result_df['log2FC'] = filtered_df['Log2FoldChange']
-            
-            if 'padj' in filtered_df.columns:
-                result_df['padj'] = filtered_df['padj']
-            elif 'adj_pvalue' in filtered_df.columns:
-                result_df['padj'] = filtered_df['adj_pvalue']
-            elif 'Padj' in filtered_df.columns:
-                result_df['padj'] = filtered_df['Padj']
-            
-            if 'regulation' in filtered_df.columns:
-                result_df['regulation'] = filtered_df['regulation']
-            
-            dataset_dfs[dataset.name] = result_df
-        
-        if not dataset_dfs:
-            QMessageBox.warning(self, "No Results", 
-                              "No matching genes found in selected datasets.")
+        self._run_wide_comparison('gene_list', datasets, background, gene_list=list(gene_list))
+
+    def _run_wide_comparison(self, comparison_type: str, datasets, background: bool, **params):
+        """
+        Gene List / Statistics 비교 테이블을 utils.comparison_engine 으로 생성.
+
+        background=True 면 WideComparisonWorker 에서 계산하고 완료 시 탭을 만든다.
+        프로젝트 복원(replay)처럼 탭 생성 순서가 중요하면 background=False 로 동기 실행.
+        """
+        recipe = getattr(self, '_pending_sheet_recipe', None)
+        if not background:
+            from utils.comparison_engine import build_comparison
+            result = build_comparison(comparison_type, datasets, **params)
+            self._show_wide_comparison(comparison_type, len(datasets), recipe, result)
             return
-        
-        # Wide format으로 병합
-        # 1. 모든 유전자의 gene_id와 symbol 매핑 수집
-        gene_mapping = {}  # {identifier: {'gene_id': ..., 'symbol': ...}}
-        
-        for dataset_name, df in dataset_dfs.items():
-            for idx, row in df.iterrows():
-                gene_id = row.get('gene_id', '')
-                symbol = row.get('symbol', '')
-                
-                # 실제로 값이 있는 것을 기준으로 식별자 결정
-                identifier = symbol if symbol else gene_id
-                
-                if identifier and identifier not in gene_mapping:
-                    gene_mapping[identifier] = {
-                        'gene_id': gene_id if gene_id else '',
-                        'symbol': symbol if symbol else ''
-                    }
-        
-        # 2. 결과 DataFrame 생성 (gene_list 입력 순서 기준으로 정렬)
-        result_rows = []
-        # gene_list 입력 순서대로 identifier를 순회
-        ordered_identifiers = []
-        seen_ids = set()
-        for g in gene_list:
-            g_upper = g.strip().upper()
-            for identifier in gene_mapping:
-                if str(identifier).upper() == g_upper and identifier not in seen_ids:
-                    ordered_identifiers.append(identifier)
-                    seen_ids.add(identifier)
-                    break
-        # gene_list에 없던 항목은 뒤에 추가 (안전 처리)
-        for identifier in gene_mapping:
-            if identifier not in seen_ids:
-                ordered_identifiers.append(identifier)
 
-        for identifier in ordered_identifiers:
-            row = {}
-            
-            # gene_id와 symbol 설정
-            row['gene_id'] = gene_mapping[identifier]['gene_id']
-            row['symbol'] = gene_mapping[identifier]['symbol']
-            
-            # 각 데이터셋의 log2FC, padj 추가
-            for dataset_name, df in dataset_dfs.items():
-                # identifier로 해당 행 찾기
-                gene_data = pd.DataFrame()
-                
-                if gene_mapping[identifier]['symbol']:
-                    gene_data = df[df['symbol'] == gene_mapping[identifier]['symbol']]
-                elif gene_mapping[identifier]['gene_id']:
-                    gene_data = df[df['gene_id'] == gene_mapping[identifier]['gene_id']]
-                
-                if not gene_data.empty:
-                    if 'log2FC' in gene_data.columns:
-                        row[f'{dataset_name}_log2FC'] = gene_data['log2FC'].iloc[0]
-                    if 'padj' in gene_data.columns:
-                        row[f'{dataset_name}_padj'] = gene_data['padj'].iloc[0]
-                    if 'regulation' in gene_data.columns:
-                        row[f'{dataset_name}_regulation'] = gene_data['regulation'].iloc[0]
-                else:
-                    row[f'{dataset_name}_log2FC'] = None
-                    row[f'{dataset_name}_padj'] = None
-            
-            result_rows.append(row)
-        
-        result_df = pd.DataFrame(result_rows)
-        
-        # 컬럼 순서 정렬: gene_id, symbol, D1_log2FC, D1_padj, D2_log2FC, D2_padj, ...
-        ordered_columns = ['gene_id', 'symbol']
-        dataset_names = list(dataset_dfs.keys())
-        for dataset_name in dataset_names:
-            ordered_columns.append(f'{dataset_name}_log2FC')
-            ordered_columns.append(f'{dataset_name}_padj')
-            if f'{dataset_name}_regulation' in result_df.columns:
-                ordered_columns.append(f'{dataset_name}_regulation')
-        
-        # 존재하는 컬럼만 선택
-        ordered_columns = [col for col in ordered_columns if col in result_df.columns]
-        result_df = result_df[ordered_columns]
-        
-        # 탭 생성
-        comparison_tab_name = f"Comparison: Gene List ({len(datasets)} datasets)"
-        table = self._create_data_tab(comparison_tab_name, sheet_type='comparison')
+        from gui.workers import WideComparisonWorker
+        worker = WideComparisonWorker(comparison_type, datasets, **params)
+        worker.recipe = recipe
+        # 시그널은 worker 스레드에서 방출되므로 MainWindow 메서드(큐 연결)로 받는다
+        worker.finished.connect(self._on_wide_comparison_finished)
+        worker.error.connect(self._on_wide_comparison_error)
+        self._comparison_workers.append(worker)
+        self.status_label.setText(f"Comparing {len(datasets)} datasets...")
+        worker.start()
+
+    def _release_comparison_worker(self, worker):
+        if worker in self._comparison_workers:
+            self._comparison_workers.remove(worker)
+        worker.wait()  # 시그널 방출 직후라 즉시 반환
+        worker.deleteLater()
+        self.status_label.setText("Ready")
+
+    def _on_wide_comparison_finished(self, result):
+        worker = self.sender()
+        self._release_comparison_worker(worker)
+        try:
+            self._show_wide_comparison(worker.comparison_type, len(worker.datasets),
+                                       worker.recipe, result)
+        except Exception as e:
+            self.logger.error(f"Comparison failed: {e}")
+            QMessageBox.critical(self, "Comparison Error", f"Failed to compare datasets:\n{str(e)}")
+
+    def _on_wide_comparison_error(self, message: str):
+        self._release_comparison_worker(self.sender())
+        QMessageBox.critical(self, "Comparison Error", f"Failed to compare datasets:\n{message}")
+
+    def _show_wide_comparison(self, comparison_type: str, n_datasets: int, recipe, result):
+        """비교 결과 탭 생성 (recipe 는 요청 시점의 재생성 레시피)"""
+        result_df, dataset_genes = result
+        if result_df.empty and not len(result_df.columns):
+            if comparison_type == 'gene_list':
+                QMessageBox.warning(self, "No Results", 
+                                  "No matching genes found in selected datasets.")
+            else:
+                QMessageBox.warning(self, "No Results", 
+                                  "No data matched the statistical criteria.")
+            return
+
+        title = "Gene List" if comparison_type == 'gene_list' else "Statistics"
+        comparison_tab_name = f"Comparison: {title} ({n_datasets} datasets)"
+        previous_recipe = getattr(self, '_pending_sheet_recipe', None)
+        self._pending_sheet_recipe = recipe
+        try:
+            table = self._create_data_tab(comparison_tab_name, sheet_type='comparison')
+        finally:
+            self._pending_sheet_recipe = previous_recipe
         self.populate_table(table, result_df)
-        self.logger.info(f"Gene list comparison completed: {len(result_df)} genes across {len(datasets)} datasets")
+
+        if comparison_type == 'gene_list':
+            self.logger.info(f"Gene list comparison completed: {len(result_df)} genes across {n_datasets} datasets")
+            return
+
+        # 통계 정보 로그
+        all_genes = set().union(*dataset_genes.values())
+        common_genes = set.intersection(*dataset_genes.values()) if len(dataset_genes) > 1 else all_genes
+        self.logger.info(f"Statistics comparison completed:")
+        self.logger.info(f"  - Total unique genes: {len(all_genes)}")
+        self.logger.info(f"  - Common genes (in all datasets): {len(common_genes)}")
+        for name, genes in dataset_genes.items():
+            unique_to_dataset = genes - set().union(*(g for n, g in dataset_genes.items() if n != name))
+            self.logger.info(f"  - Unique to {name}: {len(unique_to_dataset)}")
 
     def _compare_go_terms(self, datasets):
         """GO Term Comparison — Union 방식으로 여러 GO 데이터셋 비교"""
@@ -2047,11 +1960,6 @@ class MainWindow(QMainWindow):
             return
 
         tid_col  = StandardColumns.TERM_ID        # 'term_id'
-        desc_col = StandardColumns.DESCRIPTION    # 'description'
-        fe_col   = StandardColumns.FOLD_ENRICHMENT
-        fdr_col  = StandardColumns.FDR
-        gc_col   = StandardColumns.GENE_COUNT
-        ont_col  = StandardColumns.ONTOLOGY
 
         # dataset 이름 → safe column prefix (공백 → '_', 중복 시 suffix)
         def _make_safe_names(names):
@@ -2100,27 +2008,11 @@ class MainWindow(QMainWindow):
             )
             return
 
-        # Union: 전체 term_id 수집, description/ontology는 첫 발견 기준
-        # requested_ids 목록에 있는 term_id만 포함
-        term_meta = {}  # term_id → {'description': ..., 'ontology': ...}
-        for ds in datasets:
-            df = ds.dataframe
-            if df is None or tid_col not in df.columns:
-                continue
-            for _, row in df.iterrows():
-                tid = str(row[tid_col]).strip()
-                if not tid or tid == 'nan':
-                    continue
-                # requested_ids 필터 적용
-                if tid.upper() not in requested_ids:
-                    continue
-                if tid not in term_meta:
-                    term_meta[tid] = {
-                        'description': str(row[desc_col]) if desc_col in df.columns else tid,
-                        'ontology':    str(row[ont_col])  if ont_col  in df.columns else ''
-                    }
+        # Union + term_id 기준 reindex + 배치 메타 통계 (utils.comparison_engine)
+        from utils.comparison_engine import build_go_term_comparison
+        result_df = build_go_term_comparison(datasets, requested_ids, safe_names)
 
-        if not term_meta:
+        if result_df.empty:
             found_any = False
             for ds in datasets:
                 df = ds.dataframe
@@ -2141,58 +2033,6 @@ class MainWindow(QMainWindow):
                                     "No GO/KEGG terms found in selected datasets.")
             return
 
-        # 메타 결합엔 raw enrichment p-value 사용, 방향(부호)은 log2(fold enrichment)
-        pval_col = StandardColumns.PVALUE
-        from utils.meta_stats import combine_pvalues, benjamini_hochberg
-
-        # Wide-format DataFrame 조립
-        rows = []
-        for tid, meta in term_meta.items():
-            row = {'term_id': tid, 'description': meta['description'],
-                   'ontology': meta['ontology']}
-            m_pvals, m_effects = [], []   # term 수준 late aggregation 입력
-            for ds, safe in zip(datasets, safe_names):
-                df = ds.dataframe
-                if df is None or tid_col not in df.columns:
-                    row[f"{safe}_fe"]         = None
-                    row[f"{safe}_fdr"]        = None
-                    row[f"{safe}_gene_count"] = None
-                    continue
-                match = df[df[tid_col].astype(str).str.strip() == tid]
-                if match.empty:
-                    row[f"{safe}_fe"]         = None
-                    row[f"{safe}_fdr"]        = None
-                    row[f"{safe}_gene_count"] = None
-                else:
-                    first = match.iloc[0]
-                    fe_v = first[fe_col] if fe_col in df.columns else None
-                    row[f"{safe}_fe"]         = fe_v
-                    row[f"{safe}_fdr"]        = first[fdr_col] if fdr_col in df.columns else None
-                    row[f"{safe}_gene_count"] = first[gc_col]  if gc_col  in df.columns else None
-                    # 이 term이 검정된 데이터셋의 raw p + log2(FE) 수집
-                    if pval_col in df.columns:
-                        p_v = pd.to_numeric(first[pval_col], errors='coerce')
-                        fe_num = pd.to_numeric(fe_v, errors='coerce')
-                        eff = float(np.log2(fe_num)) if (np.isfinite(fe_num) and fe_num > 0) else np.nan
-                        m_pvals.append(p_v)
-                        m_effects.append(eff)
-
-            meta_res = combine_pvalues(m_pvals, m_effects)
-            if meta_res:
-                row['meta_pvalue_fisher']   = meta_res['meta_pvalue_fisher']
-                row['meta_pvalue_stouffer'] = meta_res['meta_pvalue_stouffer']
-                row['meta_log2fe_mean']     = meta_res['meta_log2fc_mean']
-                row['meta_direction']       = meta_res['meta_direction']
-                row['meta_found_in']        = f"{meta_res['meta_found_in']}/{len(datasets)}"
-            rows.append(row)
-
-        result_df = pd.DataFrame(rows)
-
-        # 메타 FDR: Fisher 결합 p를 term 전체에 대해 BH 보정
-        if 'meta_pvalue_fisher' in result_df.columns:
-            result_df['meta_fdr_fisher'] = benjamini_hochberg(
-                pd.to_numeric(result_df['meta_pvalue_fisher'], errors='coerce').to_numpy())
-
         # 컬럼 순서 정렬: term 정보 → 메타 통계 → 데이터셋별 지표
         base_cols = ['term_id', 'description', 'ontology']
         meta_cols = ['meta_pvalue_fisher', 'meta_fdr_fisher', 'meta_pvalue_stouffer',
@@ -2229,42 +2069,6 @@ class MainWindow(QMainWindow):
             f"GO term comparison: {len(result_df)} terms across {len(datasets)} datasets"
         )
 
-    def _full_gene_stats(self, df) -> dict:
-        """필터 이전 전체 df에서 유전자 식별자 → (log2fc, pvalue, lfcSE) 조회표.
-
-        메타 분석은 '유의한 데이터셋'만이 아니라 유전자가 검정된 모든 데이터셋의
-        통계를 결합해야 편향이 없으므로, 필터링 이전 전체 데이터를 사용한다.
-        Fisher/Stouffer 결합은 study 내에서 보정된 padj가 아니라 raw p-value로 하는
-        것이 정석이므로 raw pvalue를 우선 사용(없으면 padj로 폴백)한다.
-        SE(lfcSE)는 random-effects 효과크기 결합(M5)용이며, 없으면 NaN(해당 연구 제외).
-        symbol과 gene_id 양쪽을 키로 등록(첫 등장 우선)해 데이터셋 간 식별자
-        표기가 달라도 매칭되도록 한다.
-        """
-        if df is None or df.empty:
-            return {}
-        lfc_col = next((c for c in ('log2FC', 'log2fc', 'log2FoldChange', 'Log2FoldChange')
-                        if c in df.columns), None)
-        # raw p-value 우선, 없으면 adjusted p-value 폴백
-        p_col = next((c for c in ('pvalue', 'p_value', 'pval', 'PValue', 'P.Value',
-                                  'padj', 'adj_pvalue', 'Padj') if c in df.columns), None)
-        if lfc_col is None or p_col is None:
-            return {}
-        se_col = next((c for c in ('lfcse', 'lfcSE', 'lfc_se', 'stderr', 'se', 'SE')
-                       if c in df.columns), None)
-        lfc = pd.to_numeric(df[lfc_col], errors='coerce').to_numpy()
-        padj = pd.to_numeric(df[p_col], errors='coerce').to_numpy()
-        n = len(df)
-        se = (pd.to_numeric(df[se_col], errors='coerce').to_numpy()
-              if se_col else np.full(n, np.nan))
-        sym = df['symbol'].astype(str).to_numpy() if 'symbol' in df.columns else np.full(n, '')
-        gid = df['gene_id'].astype(str).to_numpy() if 'gene_id' in df.columns else np.full(n, '')
-        out = {}
-        for s, g, a, b, c in zip(sym, gid, lfc, padj, se):
-            for key in (s, g):
-                if key and key != 'nan' and key not in out:
-                    out[key] = (a, b, c)
-        return out
-
     def _harmonize_cross_species(self, datasets):
         """비인간 데이터셋을 human ortholog 심볼로 통일 (M2). 실패 시 None/원본 반환.
 
@@ -2316,9 +2120,8 @@ class MainWindow(QMainWindow):
                 "(gene_id가 Ensembl ID(ENSMUSG 등)인지 확인)\n\n" + "\n".join(lines))
         return eff
 
-    def _compare_statistics(self, datasets):
+    def _compare_statistics(self, datasets, background: bool = True):
         """Statistics 필터링 비교 - Common/Unique 표시"""
-        from utils.meta_stats import combine_pvalues, benjamini_hochberg, random_effects
         criteria = self.filter_panel.get_filter_criteria()
 
         self.logger.info(f"Statistics comparison: log2FC >= {criteria.log2fc_min}, padj <= {criteria.adj_pvalue_max}")
@@ -2331,265 +2134,15 @@ class MainWindow(QMainWindow):
             if not datasets:
                 return
 
-        # 메타 통계용: 필터 이전 전체 데이터셋의 유전자별 (log2fc, padj) 조회표
-        full_lookup = {ds.name: self._full_gene_stats(ds.dataframe) for ds in datasets}
-
-        # 각 데이터셋에 통계 필터 적용
-        dataset_dfs = {}
-        dataset_genes = {}
-        
-        for dataset in datasets:
-            df = dataset.dataframe.copy()
-            
-            # 통계 필터 적용
-            if 'log2FC' in df.columns:
-                df = df[abs(df['log2FC']) >= criteria.log2fc_min]
-            elif 'log2fc' in df.columns:
-                df = df[abs(df['log2fc']) >= criteria.log2fc_min]
-            elif 'log2FoldChange' in df.columns:
-                df = df[abs(df['log2FoldChange']) >= criteria.log2fc_min]
-            elif 'Log2FoldChange' in df.columns:
-                df = df[abs(df['Log2FoldChange']) >= criteria.log2fc_min]
-            
-            if 'padj' in df.columns:
-                df = df[df['padj'] <= criteria.adj_pvalue_max]
-            elif 'adj_pvalue' in df.columns:
-                df = df[df['adj_pvalue'] <= criteria.adj_pvalue_max]
-            elif 'Padj' in df.columns:
-                df = df[df['Padj'] <= criteria.adj_pvalue_max]
-            
-            if df.empty:
-                self.logger.warning(f"No genes passed statistical criteria in dataset: {dataset.name}")
-                continue
-            
-            self.logger.info(f"Found {len(df)} DEGs in dataset: {dataset.name}")
-            
-            # 표준 컬럼명으로 통일
-            if 'log2fc' in df.columns and 'log2FC' not in df.columns:
-                df = df.rename(columns={'log2fc': 'log2FC'})
-            if 'log2FoldChange' in df.columns and 'log2FC' not in df.columns:
-                df = df.rename(columns={'log2FoldChange': 'log2FC'})
-            if 'Log2FoldChange' in df.columns and 'log2FC' not in df.columns:
-                df = df.rename(columns={'Log2FoldChange': 'log2FC'})
-            if 'adj_pvalue' in df.columns and 'padj' not in df.columns:
-                df = df.rename(columns={'adj_pvalue': 'padj'})
-            if 'Padj' in df.columns and 'padj' not in df.columns:
-                df = df.rename(columns={'Padj': 'padj'})
-            
-            # 필요한 컬럼만 선택
-            result_df = pd.DataFrame()
-            
-            # gene_id와 symbol 구분해서 추출
-            if 'gene_id' in df.columns and 'symbol' in df.columns:
-                # 둘 다 있으면 각각 저장
-                result_df['gene_id'] = df['gene_id']
-                result_df['symbol'] = df['symbol']
-                # symbol을 사용해서 유전자 세트 생성
-                dataset_genes[dataset.name] = set(df['symbol'].dropna().unique())
-            elif 'symbol' in df.columns:
-                # symbol만 있는 경우: ENSMUSG 패턴이면 gene_id로, 아니면 symbol로
-                first_value = str(df['symbol'].iloc[0]) if not df.empty else ''
-                if first_value.startswith('ENSMUSG') or first_value.startswith('ENSG'):
-                    # Ensembl ID 패턴이면 gene_id로 취급
-                    result_df['gene_id'] = df['symbol']
-                    result_df['symbol'] = ''
-                    dataset_genes[dataset.name] = set(df['symbol'].dropna().unique())
-                else:
-                    # 일반 gene symbol이면 symbol로 취급
-                    result_df['gene_id'] = ''
-                    result_df['symbol'] = df['symbol']
-                    dataset_genes[dataset.name] = set(df['symbol'].dropna().unique())
-            elif 'gene_id' in df.columns:
-                # gene_id만 있으면 gene_id로 사용
-                result_df['gene_id'] = df['gene_id']
-                result_df['symbol'] = ''
-                dataset_genes[dataset.name] = set(df['gene_id'].dropna().unique())
-            else:
-                self.logger.warning(f"No gene identifier found in dataset: {dataset.name}")
-                continue
-            
-            self.logger.info(f"Extracted {len(dataset_genes[dataset.name])} unique genes from {dataset.name}")
-            
-            if 'log2FC' in df.columns:
-                result_df['log2FC'] = df['log2FC']
-            elif 'log2fc' in df.columns:
-                result_df['log2FC'] = df['log2fc']
-            elif 'log2FoldChange' in df.columns:
-                result_df['log2FC'] = df['log2FoldChange']
-            elif 'Log2FoldChange' in df.columns:
-                result_df['log2FC'] = df['Log2FoldChange']
-            
-            if 'padj' in df.columns:
-                result_df['padj'] = df['padj']
-            elif 'adj_pvalue' in df.columns:
-                result_df['padj'] = df['adj_pvalue']
-            elif 'Padj' in df.columns:
-                result_df['padj'] = df['Padj']
-            
-            if 'regulation' in df.columns:
-                result_df['regulation'] = df['regulation']
-            
-            dataset_dfs[dataset.name] = result_df
-        
-        if not dataset_dfs:
-            QMessageBox.warning(self, "No Results", 
-                              "No data matched the statistical criteria.")
-            return
-        
-        # 공통 유전자와 unique 유전자 계산
-        all_genes = set()
-        for genes in dataset_genes.values():
-            all_genes.update(genes)
-        
-        common_genes = set.intersection(*dataset_genes.values()) if len(dataset_genes) > 1 else all_genes
-        
-        # Comparison Panel 옵션 적용
-        common_genes_only = self.comparison_panel.common_genes_only.isChecked()
-        include_unique = self.comparison_panel.include_unique.isChecked()
-        
-        # 유전자 필터링 로직
-        if common_genes_only:
-            # 공통 유전자만 표시
-            genes_to_show = common_genes
-        elif not include_unique:
-            # Unique 제외 (교집합만)
-            genes_to_show = common_genes
-        else:
-            # 전체 유전자 (기본)
-            genes_to_show = all_genes
-        
-        # Wide format으로 병합
-        # 1. 모든 유전자의 gene_id와 symbol 매핑 수집
-        gene_mapping = {}  # {identifier: {'gene_id': ..., 'symbol': ...}}
-        
-        for dataset_name, df in dataset_dfs.items():
-            for idx, row in df.iterrows():
-                gene_id = row.get('gene_id', '')
-                symbol = row.get('symbol', '')
-                
-                # 실제로 값이 있는 것을 기준으로 식별자 결정
-                identifier = symbol if symbol else gene_id
-                
-                if identifier and identifier not in gene_mapping:
-                    gene_mapping[identifier] = {
-                        'gene_id': gene_id if gene_id else '',
-                        'symbol': symbol if symbol else ''
-                    }
-        
-        # 2. 결과 DataFrame 생성
-        result_rows = []
-        # 타입 혼합 문제 방지를 위해 문자열로 변환 후 정렬
-        for identifier in sorted(gene_mapping.keys(), key=str):
-            # 필터링 옵션에 따라 유전자 포함 여부 결정
-            if identifier not in genes_to_show:
-                continue
-            
-            row = {}
-            
-            # gene_id와 symbol 설정
-            row['gene_id'] = gene_mapping[identifier]['gene_id']
-            row['symbol'] = gene_mapping[identifier]['symbol']
-            
-            # 공통/Unique 표시
-            is_common = identifier in common_genes
-            datasets_with_gene = [name for name, genes in dataset_genes.items() if identifier in genes]
-            
-            # 공통/Unique 상태
-            if is_common:
-                row['Status'] = 'Common'
-            else:
-                row['Status'] = f"Unique ({', '.join(datasets_with_gene)})"
-            
-            row['Found_in'] = f"{len(datasets_with_gene)}/{len(datasets)}"
-            
-            # 각 데이터셋의 log2FC, padj 추가
-            for dataset_name, df in dataset_dfs.items():
-                # identifier로 해당 행 찾기
-                gene_data = pd.DataFrame()
-                
-                if gene_mapping[identifier]['symbol']:
-                    gene_data = df[df['symbol'] == gene_mapping[identifier]['symbol']]
-                elif gene_mapping[identifier]['gene_id']:
-                    gene_data = df[df['gene_id'] == gene_mapping[identifier]['gene_id']]
-                
-                if not gene_data.empty:
-                    if 'log2FC' in gene_data.columns:
-                        row[f'{dataset_name}_log2FC'] = gene_data['log2FC'].iloc[0]
-                    if 'padj' in gene_data.columns:
-                        row[f'{dataset_name}_padj'] = gene_data['padj'].iloc[0]
-                    if 'regulation' in gene_data.columns:
-                        row[f'{dataset_name}_regulation'] = gene_data['regulation'].iloc[0]
-                else:
-                    row[f'{dataset_name}_log2FC'] = None
-                    row[f'{dataset_name}_padj'] = None
-
-            # 메타 통계: 유전자가 검정된 모든 데이터셋의 (log2fc, pvalue, SE)를 결합
-            gm = gene_mapping[identifier]
-            m_pvals, m_lfcs, m_ses = [], [], []
-            for ds in datasets:
-                stats = full_lookup.get(ds.name, {})
-                v = stats.get(gm['symbol']) or stats.get(gm['gene_id'])
-                if v is not None:
-                    lfc_v, padj_v, se_v = v
-                    m_pvals.append(padj_v)
-                    m_lfcs.append(lfc_v)
-                    m_ses.append(se_v)
-            # ① p-value 결합 (Fisher/Stouffer)
-            meta = combine_pvalues(m_pvals, m_lfcs)
-            if meta:
-                row['meta_pvalue_fisher'] = meta['meta_pvalue_fisher']
-                row['meta_pvalue_stouffer'] = meta['meta_pvalue_stouffer']
-                row['meta_log2fc_mean'] = meta['meta_log2fc_mean']
-                row['meta_direction'] = meta['meta_direction']
-                row['meta_found_in'] = f"{meta['meta_found_in']}/{len(datasets)}"
-            # ② 효과크기 결합 (random-effects, lfcSE 있을 때만)
-            re_res = random_effects(m_lfcs, m_ses)
-            if re_res:
-                row['meta_effect_log2fc'] = re_res['meta_effect_log2fc']
-                row['meta_effect_se']     = re_res['meta_effect_se']
-                row['meta_ci_low']        = re_res['meta_ci_low']
-                row['meta_ci_high']       = re_res['meta_ci_high']
-                row['meta_pvalue_re']     = re_res['meta_pvalue_re']
-                row['meta_i2']            = re_res['meta_i2']
-
-            result_rows.append(row)
-
-        result_df = pd.DataFrame(result_rows)
-
-        # 메타 FDR: Fisher 결합 p-value를 유전자 전체에 대해 BH 보정
-        if 'meta_pvalue_fisher' in result_df.columns:
-            result_df['meta_fdr_fisher'] = benjamini_hochberg(
-                pd.to_numeric(result_df['meta_pvalue_fisher'], errors='coerce').to_numpy())
-
-        # 컬럼 순서 정렬: gene_id, symbol, Status, Found_in, 메타 통계, D1_log2FC, D1_padj, ...
-        ordered_columns = ['gene_id', 'symbol', 'Status', 'Found_in',
-                           'meta_pvalue_fisher', 'meta_fdr_fisher', 'meta_pvalue_stouffer',
-                           'meta_log2fc_mean', 'meta_direction', 'meta_found_in',
-                           'meta_effect_log2fc', 'meta_effect_se', 'meta_ci_low', 'meta_ci_high',
-                           'meta_pvalue_re', 'meta_i2']
-        dataset_names = list(dataset_dfs.keys())
-        for dataset_name in dataset_names:
-            ordered_columns.append(f'{dataset_name}_log2FC')
-            ordered_columns.append(f'{dataset_name}_padj')
-            if f'{dataset_name}_regulation' in result_df.columns:
-                ordered_columns.append(f'{dataset_name}_regulation')
-        
-        # 존재하는 컬럼만 선택
-        ordered_columns = [col for col in ordered_columns if col in result_df.columns]
-        result_df = result_df[ordered_columns]
-        
-        # 탭 생성
-        comparison_tab_name = f"Comparison: Statistics ({len(datasets)} datasets)"
-        table = self._create_data_tab(comparison_tab_name, sheet_type='comparison')
-        self.populate_table(table, result_df)
-
-        # 통계 정보 로그
-        self.logger.info(f"Statistics comparison completed:")
-        self.logger.info(f"  - Total unique genes: {len(all_genes)}")
-        self.logger.info(f"  - Common genes (in all datasets): {len(common_genes)}")
-        for name, genes in dataset_genes.items():
-            unique_to_dataset = genes - set.union(*(g for n, g in dataset_genes.items() if n != name))
-            self.logger.info(f"  - Unique to {name}: {len(unique_to_dataset)}")
+        # 필터/메타 통계/wide 병합은 comparison_engine 에서 (Comparison Panel 옵션은 여기서 읽음)
+        self._run_wide_comparison(
+            'statistics', datasets, background,
+            log2fc_min=criteria.log2fc_min,
+            adj_pvalue_max=criteria.adj_pvalue_max,
+            common_only=self.comparison_panel.common_genes_only.isChecked(),
+            include_unique=self.comparison_panel.include_unique.isChecked(),
+        )
+    
     
     def _update_comparison_panel_datasets(self):
         """비교 패널의 데이터셋 리스트 업데이트, Multi-Omics 패널 콤보박스도 갱신"""
@@ -2789,7 +2342,7 @@ class MainWindow(QMainWindow):
         close_btn.clicked.connect(self._close_search)
         h.addWidget(close_btn)
 
-        self._search_hidden_table = None   # 현재 행 숨김이 적용된 QTableView
+        self._search_filtered_table = None   # 현재 모델 검색 필터가 적용된 QTableView
         self._search_debounce = QTimer(self)
         self._search_debounce.setSingleShot(True)
         self._search_debounce.setInterval(150)
@@ -2846,49 +2399,33 @@ class MainWindow(QMainWindow):
         self._apply_live_search()
 
     def _close_search(self):
-        self._reset_hidden_rows()
+        self._reset_search_filter()
         self._search_bar.setVisible(False)
         self._search_toggle_btn.setChecked(False)
 
-    def _reset_hidden_rows(self):
-        t = self._search_hidden_table
-        if isinstance(t, QTableView) and t.model() is not None:
-            t.setUpdatesEnabled(False)
-            for r in range(t.model().rowCount()):
-                if t.isRowHidden(r):
-                    t.setRowHidden(r, False)
-            t.setUpdatesEnabled(True)
-        self._search_hidden_table = None
+    def _reset_search_filter(self):
+        t = self._search_filtered_table
+        if isinstance(t, QTableView) and isinstance(t.model(), DataFrameTableModel):
+            t.model().clear_search_filter()
+        self._search_filtered_table = None
 
     def _apply_live_search(self):
-        """활성 테이블에서 검색어에 맞지 않는 행을 숨긴다(모델은 그대로 유지)."""
+        """활성 테이블 모델에 검색 필터를 건다(행 숨김 대신 모델의 표시 행 순열만 거름)."""
         if not self._search_bar.isVisible():
             return
         target = self._search_table_and_col()
-        if target is None:
-            self._reset_hidden_rows()
+        if target is None or not isinstance(target[1], DataFrameTableModel):
+            self._reset_search_filter()
             self._search_count.setText("(not a table)")
             self._search_to_sheet_btn.setEnabled(False)
             return
         table, model, df, col = target
-        if self._search_hidden_table is not None and self._search_hidden_table is not table:
-            self._reset_hidden_rows()
+        if self._search_filtered_table is not None and self._search_filtered_table is not table:
+            self._reset_search_filter()
         text = self._search_input.text().strip()
         total = len(df)
-        table.setUpdatesEnabled(False)
-        if not text:
-            for r in range(total):
-                if table.isRowHidden(r):
-                    table.setRowHidden(r, False)
-            n = total
-        else:
-            mask = df[col].astype(str).str.contains(
-                text, case=False, na=False, regex=False).to_numpy()
-            for r in range(total):
-                table.setRowHidden(r, not mask[r])
-            n = int(mask.sum())
-        table.setUpdatesEnabled(True)
-        self._search_hidden_table = table
+        n = model.set_search_filter(col, text)
+        self._search_filtered_table = table
         self._search_count.setText(f"{n:,} / {total:,}  ·  {col}")
         self._search_to_sheet_btn.setEnabled(bool(text) and n > 0)
 
@@ -2909,7 +2446,7 @@ class MainWindow(QMainWindow):
 
     def _on_tab_changed(self, index: int):
         """탭 변경 시 메뉴 상태 및 current_dataset 업데이트"""
-        # 검색 바가 열려 있으면 이전 탭의 행 숨김을 해제하고 닫는다 (탭마다 별도 검색)
+        # 검색 바가 열려 있으면 이전 탭의 검색 필터를 해제하고 닫는다 (탭마다 별도 검색)
         if getattr(self, '_search_bar', None) is not None and self._search_bar.isVisible():
             self._close_search()
 
@@ -3264,6 +2801,9 @@ class MainWindow(QMainWindow):
             table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
             table.horizontalHeader().setResizeContentsPrecision(200)
             table.resizeColumnsToContents()
+            # 새 모델에는 검색 필터가 없으므로 열려 있는 검색을 다시 적용
+            if table is getattr(self, '_search_filtered_table', None):
+                self._apply_live_search()
     
     def _on_about(self):
         """About 다이얼로그"""
@@ -4198,7 +3738,8 @@ class MainWindow(QMainWindow):
                         if df_save[col].map(lambda v: isinstance(v, (set, frozenset))).any():
                             df_save[col] = df_save[col].map(
                                 lambda v: sorted(v) if isinstance(v, (set, frozenset)) else v)
-                    df_save.to_parquet(out, index=False)
+                    from utils.gene_sets import write_parquet
+                    write_parquet(df_save, out)
                     dataset_file_map[name] = str(out)
                     generated_names.add(name)
                     self.logger.info(f"Persisted generated dataset '{name}' → {out}")
@@ -4480,9 +4021,11 @@ class MainWindow(QMainWindow):
                         continue
                 else:
                     try:
+                        # 시트 replay 가 곧바로 데이터셋을 참조하므로 동기 로드
                         self.presenter.load_dataset(
                             Path(ds_file),
                             custom_name=ds_name if ds_name else None,
+                            background=False,
                         )
                         loaded_count += 1
                     except Exception as e:
@@ -4655,65 +4198,15 @@ class MainWindow(QMainWindow):
                 if reply != QMessageBox.StandardButton.Yes:
                     return
             
-            # 데이터셋 로드
-            first_dataset = None
-            for dataset_id in dataset_ids:
-                dataset = self.db_manager.load_dataset(dataset_id)
-                if dataset and dataset.dataframe is not None:
-                    # 고유 이름 생성 및 추가
-                    unique_name = self.dataset_manager._generate_unique_name(dataset.name)
-                    dataset.name = unique_name
-                    
-                    # Presenter에 추가
-                    self.presenter.datasets[unique_name] = dataset
-                    dataset.metadata['db_dataset_id'] = dataset_id  # 프로젝트 저장/복원용
-                    
-                    # Dataset Manager에 추가 (metadata와 함께)
-                    metadata = {
-                        'file_path': 'database',
-                        'dataset_type': dataset.dataset_type.value,
-                        'row_count': len(dataset.dataframe),
-                        'column_count': len(dataset.dataframe.columns)
-                    }
-                    self.dataset_manager.add_dataset(unique_name, metadata=metadata)
-                    
-                    # 첫 번째 데이터셋 기억
-                    if first_dataset is None:
-                        first_dataset = dataset
-                    
-                    self.logger.info(f"Loaded dataset from database: {dataset.name}")
-            
-            # 첫 번째 데이터셋을 현재 데이터셋으로 설정하고 GUI 업데이트
-            if first_dataset:
-                self.presenter.current_dataset = first_dataset
-                
-                # FSM 상태 전환 (현재 상태에 따라)
-                current_state = self.presenter.fsm.current_state
-                if current_state == State.IDLE:
-                    # IDLE → LOADING_DATA → DATA_LOADED
-                    self.presenter.fsm.trigger(Event.LOAD_DATA)
-                    self.presenter.fsm.trigger(Event.DATA_LOAD_SUCCESS)
-                elif current_state in [State.ERROR, State.FILTER_COMPLETE, State.ANALYSIS_COMPLETE]:
-                    # ERROR/COMPLETE → IDLE → LOADING_DATA → DATA_LOADED
-                    self.presenter.fsm.trigger(Event.RESET)
-                    self.presenter.fsm.trigger(Event.LOAD_DATA)
-                    self.presenter.fsm.trigger(Event.DATA_LOAD_SUCCESS)
-                # DATA_LOADED 상태면 그대로 유지
-                
-                # 첫 번째 데이터셋의 basic 정보를 Whole Dataset에 표시 (add_to_manager=False로 중복 방지)
-                self.presenter._update_view_with_dataset(first_dataset, add_to_manager=False)
-                
-                # Comparison panel 업데이트 (모든 데이터셋 표시)
-                self._update_comparison_panel_datasets()
-                
-                # 시그널 발생
-                self.presenter.dataset_loaded.emit(first_dataset.name, first_dataset)
-            
-            QMessageBox.information(
-                self,
-                "Load Complete",
-                f"Successfully loaded {len(dataset_ids)} dataset(s) from database."
-            )
+            # 백그라운드 병렬 로드 — 완료되는 대로 _on_database_dataset_ready 로 표시
+            # 현재 데이터셋은 완료 순서가 아닌 선택 순서로 결정 (배치별 상태)
+            batch_id = self.presenter.load_database_datasets(self.db_manager, dataset_ids)
+            if batch_id is not None:
+                self._db_load_batches[batch_id] = {
+                    'requested_ids': list(dataset_ids),
+                    'ready': {},
+                    'current_set': False,
+                }
             
         except Exception as e:
             self.logger.error(f"Failed to load datasets from database: {e}")
@@ -4723,6 +4216,71 @@ class MainWindow(QMainWindow):
                 f"Failed to load datasets from database:\n\n{str(e)}"
             )
     
+    def _on_database_dataset_ready(self, batch_id: int, dataset_id: str, dataset):
+        """DB 다중 로드 중 데이터셋 1건 완료 → 즉시 Dataset Manager 에 표시"""
+        # 고유 이름 생성 및 추가
+        unique_name = self.dataset_manager._generate_unique_name(dataset.name)
+        dataset.name = unique_name
+        
+        # Presenter에 추가
+        self.presenter.datasets[unique_name] = dataset
+        dataset.metadata['db_dataset_id'] = dataset_id  # 프로젝트 저장/복원용
+        
+        # Dataset Manager에 추가 (metadata와 함께)
+        metadata = {
+            'file_path': 'database',
+            'dataset_type': dataset.dataset_type.value,
+            'row_count': len(dataset.dataframe),
+            'column_count': len(dataset.dataframe.columns)
+        }
+        self.dataset_manager.add_dataset(unique_name, metadata=metadata)
+        self.logger.info(f"Loaded dataset from database: {dataset.name}")
+        
+        # 선택 순서상 첫 번째 데이터셋이 도착하면 바로 현재 데이터셋으로 설정
+        # (앞선 데이터셋이 실패했다면 _on_database_load_finished 에서 결정)
+        batch = self._db_load_batches.get(batch_id)
+        if batch is not None:
+            batch['ready'][dataset_id] = dataset
+            if dataset_id == batch['requested_ids'][0]:
+                self._set_database_current_dataset(batch, dataset)
+        
+        # Comparison panel 업데이트 (지금까지 로드된 모든 데이터셋 표시)
+        self._update_comparison_panel_datasets()
+    
+    def _set_database_current_dataset(self, batch: dict, dataset):
+        """DB 로드 결과를 현재 데이터셋으로 설정하고 GUI 업데이트 (배치당 한 번)"""
+        if batch['current_set']:
+            return
+        batch['current_set'] = True
+        self.presenter.current_dataset = dataset
+        # basic 정보를 Whole Dataset에 표시 (add_to_manager=False로 중복 방지)
+        self.presenter._update_view_with_dataset(dataset, add_to_manager=False)
+        self.presenter.dataset_loaded.emit(dataset.name, dataset)
+    
+    def _on_database_load_finished(self, batch_id: int, loaded: int, requested: int):
+        """DB 다중 로드 완료"""
+        # 선택 순서상 첫 번째로 성공한 데이터셋을 현재 데이터셋으로
+        batch = self._db_load_batches.pop(batch_id, None)
+        if batch is not None:
+            for dataset_id in batch['requested_ids']:
+                if dataset_id in batch['ready']:
+                    self._set_database_current_dataset(batch, batch['ready'][dataset_id])
+                    break
+        
+        if loaded == requested:
+            QMessageBox.information(
+                self,
+                "Load Complete",
+                f"Successfully loaded {loaded} dataset(s) from database."
+            )
+        else:
+            QMessageBox.warning(
+                self,
+                "Load Incomplete",
+                f"Loaded {loaded} of {requested} dataset(s) from database.\n"
+                "See the log for datasets that failed or were cancelled."
+            )
+    
     def _on_import_to_database(self):
         """현재 데이터셋을 데이터베이스로 임포트"""
         if not self.presenter.current_dataset:
@@ -5478,8 +5036,7 @@ class MainWindow(QMainWindow):
     
     def _on_progress_updated(self, progress: int):
         """진행률 업데이트"""
-        # 상태 바에 진행률 표시 (필요시 구현)
-        pass
+        self.progress_bar.setValue(progress)
     
     def _save_ui_settings(self):
         """UI 설정 저장"""
@@ -11,7 +11,6 @@ X = meta_log2fc_mean, Y = -log10(meta p-value). 임계값을 넘고 방향이 
 import logging
 from typing import List
 
-import numpy as np
 import pandas as pd
 from PyQt6.QtWidgets import (
     QVBoxLayout, QFormLayout, QGroupBox, QDoubleSpinBox, QSpinBox, QComboBox,
@@ -19,6 +18,7 @@ from PyQt6.QtWidgets import (
 )
 
 from gui.base_plot_dialog import BasePlotDialog
+from gui.hover_picker import PointPicker
 from utils.export_paths import remembered_save_path
 
 _P_SOURCES = {
@@ -44,10 +44,10 @@ class MetaVolcanoDialog(BasePlotDialog):
         self.df = df.copy()
         self._plot_df = None    # 마지막 렌더 데이터 (Export용)
         self._hover_df = None   # hover 조회용 (_x/_y/라벨/통계)
+        self._picker = None     # _hover_df 의 PointPicker
         self._label_col = None
         self.annot = None
         super().__init__("Meta Volcano Plot", parent, figsize=(8, 7))
-        self.canvas.mpl_connect("motion_notify_event", self._on_hover)
         self._update_plot()
 
     # ── Controls ──────────────────────────────────────────────────────────
@@ -60,13 +60,13 @@ class MetaVolcanoDialog(BasePlotDialog):
         # 시트에 실제로 존재하는 컬럼만 선택지로
         avail = [name for name, col in _P_SOURCES.items() if col in self.df.columns]
         self._psrc_combo.addItems(avail or list(_P_SOURCES.keys()))
-        self._psrc_combo.currentTextChanged.connect(self._update_plot)
+        self._psrc_combo.currentTextChanged.connect(self._schedule_replot)
         form.addRow("Meta p-value", self._psrc_combo)
 
         self._xsrc_combo = QComboBox()
         xavail = [name for name, col in _X_SOURCES.items() if col in self.df.columns]
         self._xsrc_combo.addItems(xavail or list(_X_SOURCES.keys()))
-        self._xsrc_combo.currentTextChanged.connect(self._update_plot)
+        self._xsrc_combo.currentTextChanged.connect(self._schedule_replot)
         form.addRow("X axis", self._xsrc_combo)
 
         self._p_spin = QDoubleSpinBox()
@@ -74,7 +74,7 @@ class MetaVolcanoDialog(BasePlotDialog):
         self._p_spin.setRange(0.0, 1.0)
         self._p_spin.setSingleStep(0.01)
         self._p_spin.setValue(0.05)
-        self._p_spin.valueChanged.connect(self._update_plot)
+        self._p_spin.valueChanged.connect(self._schedule_replot)
         form.addRow("meta p ≤", self._p_spin)
 
         self._lfc_spin = QDoubleSpinBox()
@@ -82,25 +82,25 @@ class MetaVolcanoDialog(BasePlotDialog):
         self._lfc_spin.setRange(0.0, 20.0)
         self._lfc_spin.setSingleStep(0.1)
         self._lfc_spin.setValue(1.0)
-        self._lfc_spin.valueChanged.connect(self._update_plot)
+        self._lfc_spin.valueChanged.connect(self._schedule_replot)
         form.addRow("|mean log2FC| ≥", self._lfc_spin)
 
         self._mink_spin = QSpinBox()
         self._mink_spin.setRange(2, 99)
         self._mink_spin.setValue(2)
-        self._mink_spin.valueChanged.connect(self._update_plot)
+        self._mink_spin.valueChanged.connect(self._schedule_replot)
         form.addRow("found in ≥ (datasets)", self._mink_spin)
 
         self._topn_spin = QSpinBox()
         self._topn_spin.setRange(0, 100)
         self._topn_spin.setValue(10)
-        self._topn_spin.valueChanged.connect(self._update_plot)
+        self._topn_spin.valueChanged.connect(self._schedule_replot)
         form.addRow("label top N", self._topn_spin)
 
         self._labelsize_spin = QSpinBox()
         self._labelsize_spin.setRange(6, 24)
         self._labelsize_spin.setValue(9)
-        self._labelsize_spin.valueChanged.connect(self._update_plot)
+        self._labelsize_spin.valueChanged.connect(self._schedule_replot)
         form.addRow("label font size", self._labelsize_spin)
 
         group.setLayout(form)
@@ -157,7 +157,9 @@ class MetaVolcanoDialog(BasePlotDialog):
             bbox=dict(boxstyle="round", fc="w", alpha=0.92),
             arrowprops=dict(arrowstyle="->"), zorder=1000, fontsize=lbl_size)
         self.annot.set_visible(False)
+        self._hover_controller(self._on_hover).attach(self.annot)
         self._hover_df = d   # _x/_y/_p/라벨/meta_found_in 포함
+        self._picker = PointPicker(ax, d['_x'], d['_y'])
 
         self._plot_df = d.rename(columns={'_x': 'mean_log2fc', '_p': 'meta_p', '_y': 'neg_log10_p'})
         self.figure.tight_layout()
@@ -180,31 +182,21 @@ class MetaVolcanoDialog(BasePlotDialog):
 
     def _on_hover(self, event):
         """마우스 오버 시 가장 가까운 점의 gene/term 정보 표시."""
-        if self.annot is None or self._hover_df is None:
+        if self.annot is None or self._hover_df is None or self._picker is None:
             return
         if event.inaxes is None:
-            if self.annot.get_visible():
-                self.annot.set_visible(False)
-                self.canvas.draw_idle()
+            self._hover.hide()
             return
         x, y = event.xdata, event.ydata
         if x is None or y is None:
             return
-        d = self._hover_df
         ax = event.inaxes
         xlim, ylim = ax.get_xlim(), ax.get_ylim()
-        xs = (xlim[1] - xlim[0]) or 1.0
-        ys = (ylim[1] - ylim[0]) or 1.0
-        dist = np.sqrt(((d['_x'] - x) / xs * 10) ** 2 + ((d['_y'] - y) / ys * 10) ** 2)
-        if dist.empty:
+        pos = self._picker.nearest(x, y, radius=0.05)
+        if pos is None:
+            self._hover.hide()
             return
-        idx = dist.idxmin()
-        if dist[idx] >= 0.5:
-            if self.annot.get_visible():
-                self.annot.set_visible(False)
-                self.canvas.draw_idle()
-            return
-        r = d.loc[idx]
+        r = self._hover_df.iloc[pos]
         name = (str(r[self._label_col]) if self._label_col and pd.notna(r.get(self._label_col))
                 else 'Unknown')
         text = (f"{name}\nmeta p: {r['_p']:.2e}"
@@ -216,8 +208,7 @@ class MetaVolcanoDialog(BasePlotDialog):
         ox = -120 if r['_x'] > xlim[0] + (xlim[1] - xlim[0]) * 0.80 else 16
         oy = -70 if r['_y'] > ylim[0] + (ylim[1] - ylim[0]) * 0.75 else 16
         self.annot.set_position((ox, oy))
-        self.annot.set_visible(True)
-        self.canvas.draw_idle()
+        self._hover.show()
 
     # ── Export ────────────────────────────────────────────────────────────
 
@@ -87,9 +87,9 @@ class MotifEnrichmentDialog(BasePlotDialog):
 
         for widget in [self._top_n, self._qval_cutoff, self._show_pct]:
             try:
-                widget.valueChanged.connect(self._update_plot)
+                widget.valueChanged.connect(self._schedule_replot)
             except AttributeError:
-                widget.stateChanged.connect(self._update_plot)
+                widget.stateChanged.connect(self._schedule_replot)
 
     def _extra_buttons(self) -> list:
         return [("Export Data", self._export_data)]
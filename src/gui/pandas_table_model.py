@@ -8,40 +8,99 @@ QTableWidget는 셀마다 QTableWidgetItem 객체를 만들어 전체 DataFrame
 DataFrameTableModel은 QTableView와 함께 쓰여, 화면에 보이는 셀만 data()에서 지연
 포맷한다. 셀 객체를 만들지 않으므로 메모리는 DataFrame 하나 크기로 수렴하고,
 로드/전환/스크롤 비용이 행 수와 무관해진다.
+
+정렬은 DataFrame 을 재배열하지 않고 표시 순서 순열(_source)만 바꾼다.
+컬럼/방향별 순열은 캐시되어 같은 헤더를 다시 누르면 즉시 반영된다.
+
+라이브 키워드 검색(set_search_filter)도 행을 숨기지 않고 표시 순열을 걸러낸다.
+컬럼별 casefold 문자열 배열을 한 번 만들어 두고, 검색어가 이어서 입력되면
+(이전 검색어를 포함하면) 직전 결과 행들만 다시 검사한다.
+
+data()는 pandas 스칼라 접근(iat) 대신 컬럼별 배열 버퍼를 읽고, 포맷된 문자열을
+(행 블록, 컬럼) 단위 LRU 캐시에 보관한다. float64 컬럼은 블록 단위로 한 번에
+포맷하므로, 넓은 ATAC 시트를 스크롤해도 셀마다 isinstance/f-string 을 반복하지 않는다.
 """
 
+from collections import OrderedDict
+
 import numpy as np
+import pandas as pd
 from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
 
+# 포맷 캐시 단위 (행 수) 와 보관할 최대 블록 수 (블록 x 컬럼)
+FORMAT_BLOCK_ROWS = 256
+FORMAT_CACHE_BLOCKS = 2048
+# (컬럼, 방향) 별로 보관할 정렬 순열 수
+SORT_CACHE_ENTRIES = 8
+
+
+def format_float_array(values: np.ndarray, precision: int, scientific: bool) -> list:
+    """
+    float 배열을 DataFrameTableModel._format 과 같은 규칙으로 한 번에 문자열화.
+
+    scientific=True 이면 |v| 구간별로 0 / .2f / .3f / .4f / .2e, 아니면 .{precision}f.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if not scientific:
+        return np.char.mod(f'%.{precision}f', values).tolist()
+
+    out = np.empty(len(values), dtype=object)
+    abs_values = np.abs(values)
+    zero = abs_values == 0
+    ge1 = abs_values >= 1.0
+    ge2 = ~ge1 & (abs_values >= 0.01)
+    ge4 = ~ge1 & ~ge2 & (abs_values >= 0.0001)
+    # NaN 은 어느 구간에도 들어가지 않아 기존 규칙처럼 .2e ('nan') 로 포맷된다
+    rest = ~zero & ~ge1 & ~ge2 & ~ge4
+    out[zero] = "0"
+    for mask, fmt in ((ge1, '%.2f'), (ge2, '%.3f'), (ge4, '%.4f'), (rest, '%.2e')):
+        if mask.any():
+            out[mask] = np.char.mod(fmt, values[mask]).astype(object)
+    return out.tolist()
+
 
 class DataFrameTableModel(QAbstractTableModel):
     """pandas DataFrame을 백엔드로 사용하는 읽기 전용 테이블 모델."""
 
     def __init__(self, df, decimal_precision: int = 2, scientific_cols=None, parent=None):
         super().__init__(parent)
-        # 표시용 DataFrame (컬럼 필터링이 끝난 상태로 전달됨)
+        # 표시용 DataFrame (컬럼 필터링이 끝난 상태로 전달됨, 정렬해도 변경하지 않음)
         self._df = df.reset_index(drop=True)
         self._precision = decimal_precision
         # scientific notation을 적용할 컬럼명 집합
         self._sci_cols = set(scientific_cols) if scientific_cols else set()
-        # 표시 행 → 원본 DataFrame의 위치 인덱스 매핑 (정렬 후에도 원본 행 추적)
-        self._source = np.arange(len(self._df))
+        # 정렬 순서 (원본 행 위치 순열) 와 표시 행 → 원본 행 매핑 (= 검색 필터 적용 후)
+        self._order = np.arange(len(self._df))
+        self._source = self._order
+        self._sort_cache = OrderedDict()     # (column, ascending) → 원본 행별 정렬 순위
+        self._display_df = None              # dataframe() 결과 캐시 (정렬 시 무효화)
+        # 라이브 검색: casefold 문자열 컬럼 캐시, 현재 (컬럼, 검색어, 일치 행 mask)
+        self._search_text = {}
+        self._search = None
+        # rowCount/columnCount 는 Qt 가 셀마다 호출하므로 pandas shape 대신 정수로 보관
+        self._n_rows, self._n_cols = self._df.shape
+        self._headers = [str(c) for c in self._df.columns]
+        # 컬럼별 값 버퍼와 (행 블록, 컬럼) → 포맷 문자열 LRU 캐시
+        self._columns = []
+        self._float_cols = []
+        self._format_cache = OrderedDict()
+        self._build_buffers()
 
     # ── Qt 모델 인터페이스 ────────────────────────────────────────────
     def rowCount(self, parent=QModelIndex()):
-        return 0 if parent.isValid() else len(self._df)
+        return 0 if parent.isValid() else self._n_rows
 
     def columnCount(self, parent=QModelIndex()):
-        return 0 if parent.isValid() else self._df.shape[1]
+        return 0 if parent.isValid() else self._n_cols
 
     def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
         if role != Qt.ItemDataRole.DisplayRole:
             return None
         if orientation == Qt.Orientation.Horizontal:
-            if 0 <= section < self._df.shape[1]:
-                return str(self._df.columns[section])
+            if 0 <= section < self._n_cols:
+                return self._headers[section]
         else:
-            if 0 <= section < len(self._df):
+            if 0 <= section < self._n_rows:
                 return str(section + 1)
         return None
 
@@ -50,27 +109,102 @@ class DataFrameTableModel(QAbstractTableModel):
             return None
         if role != Qt.ItemDataRole.DisplayRole:
             return None
-        value = self._df.iat[index.row(), index.column()]
-        return self._format(value, self._df.columns[index.column()])
+        row, col = index.row(), index.column()
+        block = row // FORMAT_BLOCK_ROWS
+        key = (block, col)
+        texts = self._format_cache.get(key)
+        if texts is None:
+            texts = self._format_block(block, col)
+            self._format_cache[key] = texts
+            if len(self._format_cache) > FORMAT_CACHE_BLOCKS:
+                self._format_cache.popitem(last=False)
+        else:
+            self._format_cache.move_to_end(key)
+        return texts[row - block * FORMAT_BLOCK_ROWS]
 
     def sort(self, column, order=Qt.SortOrder.AscendingOrder):
-        if not (0 <= column < self._df.shape[1]):
+        if not (0 <= column < self._n_cols):
             return
         self.layoutAboutToBeChanged.emit()
-        col = self._df.columns[column]
-        ascending = (order == Qt.SortOrder.AscendingOrder)
-        # 현재 표시 순서 기준의 위치 인덱스 (mergesort로 안정 정렬, NaN은 항상 마지막)
-        sorted_positions = self._df[col].sort_values(
-            ascending=ascending, kind='mergesort', na_position='last'
-        ).index.to_numpy()
-        self._df = self._df.iloc[sorted_positions].reset_index(drop=True)
-        self._source = self._source[sorted_positions]
+        rank = self._sort_rank(column, order == Qt.SortOrder.AscendingOrder)
+        # 현재 표시 순서를 안정 정렬 → 동률은 직전 정렬 순서 유지 (B 후 A 클릭 = A, B 다중 키)
+        self._order = self._order[np.argsort(rank[self._order], kind='stable')]
+        self._source = self._visible_rows()
+        self._display_df = None
+        self._format_cache.clear()
         self.layoutChanged.emit()
 
+    # ── 라이브 검색 ──────────────────────────────────────────────────
+    def set_search_filter(self, column, text: str) -> int:
+        """
+        column 값에 text 가 (대소문자 무시) 포함된 행만 표시. 일치 행 수 반환.
+
+        빈 text 는 필터 해제. 이전 검색어를 포함하는 검색어면 직전 일치 행만 검사한다.
+        """
+        text = (text or '').strip()
+        if not text:
+            self.clear_search_filter()
+            return self._n_rows
+        needle = text.casefold()
+        previous = self._search
+        if previous is not None and previous[0] == column and previous[1] == needle:
+            return int(len(self._source))
+
+        values = self._search_column(column)
+        if previous is not None and previous[0] == column and previous[1] in needle:
+            candidates = np.flatnonzero(previous[2])
+        else:
+            candidates = np.arange(len(values))
+        mask = np.zeros(len(values), dtype=bool)
+        if len(candidates):
+            mask[candidates] = np.fromiter((needle in v for v in values[candidates]),
+                                           dtype=bool, count=len(candidates))
+
+        self.beginResetModel()
+        self._search = (column, needle, mask)
+        self._source = self._visible_rows()
+        self._n_rows = len(self._source)
+        self._format_cache.clear()
+        self.endResetModel()
+        return self._n_rows
+
+    def clear_search_filter(self):
+        """검색 필터 해제 (정렬 순서는 유지)."""
+        if self._search is None:
+            return
+        self.beginResetModel()
+        self._search = None
+        self._source = self._order
+        self._n_rows = len(self._source)
+        self._format_cache.clear()
+        self.endResetModel()
+
+    def _search_column(self, column) -> np.ndarray:
+        """컬럼 값을 str → casefold 한 object 배열 (컬럼별로 한 번만 생성, 결측은 '')."""
+        values = self._search_text.get(column)
+        if values is None:
+            position = list(self._df.columns).index(column)
+            series = self._df.iloc[:, position]
+            values = np.array([v.casefold() if isinstance(v, str) else ''
+                               for v in series.astype(str)], dtype=object)
+            self._search_text[column] = values
+        return values
+
+    def _visible_rows(self) -> np.ndarray:
+        """정렬 순서에서 검색 필터에 걸린 행만 남긴 표시 순열."""
+        if self._search is None:
+            return self._order
+        return self._order[self._search[2][self._order]]
+
     # ── 헬퍼 ─────────────────────────────────────────────────────────
     def dataframe(self):
-        """현재 표시 순서의 DataFrame(컬럼 필터링·정렬 반영). export/재구성용."""
-        return self._df
+        """현재 정렬 순서의 DataFrame(컬럼 필터링·정렬 반영, 검색 필터와 무관). export/재구성용."""
+        if self._display_df is None:
+            if np.array_equal(self._order, np.arange(len(self._df))):
+                self._display_df = self._df
+            else:
+                self._display_df = self._df.iloc[self._order].reset_index(drop=True)
+        return self._display_df
 
     def source_row(self, display_row: int) -> int:
         """표시 행 인덱스 → 원본 DataFrame의 위치 인덱스."""
@@ -82,12 +216,60 @@ class DataFrameTableModel(QAbstractTableModel):
         """정밀도/컬럼레벨 변경 시 포맷만 갱신 (재정렬·재구성 없음)."""
         self._precision = decimal_precision
         self._sci_cols = set(scientific_cols) if scientific_cols else set()
-        if len(self._df) and self._df.shape[1]:
+        self._format_cache.clear()
+        if self._n_rows and self._n_cols:
             top_left = self.index(0, 0)
-            bottom_right = self.index(len(self._df) - 1, self._df.shape[1] - 1)
+            bottom_right = self.index(self._n_rows - 1, self._n_cols - 1)
             self.dataChanged.emit(top_left, bottom_right,
                                   [Qt.ItemDataRole.DisplayRole])
 
+    def _build_buffers(self):
+        """컬럼 값을 원본 행 순서의 배열로 꺼내 둔다 (정렬은 _source 로만 표현)."""
+        self._columns = []
+        self._float_cols = []
+        for position in range(self._n_cols):
+            series = self._df.iloc[:, position]
+            # numpy dtype 은 ndarray, 확장 dtype(Arrow/nullable)은 ExtensionArray 그대로
+            # → 원소가 iat 와 같은 스칼라가 된다
+            self._columns.append(series.to_numpy() if isinstance(series.dtype, np.dtype)
+                                 else series.array)
+            self._float_cols.append(series.dtype == np.float64)
+        self._format_cache.clear()
+
+    def _sort_rank(self, column: int, ascending: bool) -> np.ndarray:
+        """
+        컬럼 하나의 원본 행별 정렬 순위 (같은 값은 같은 순위, NaN 은 항상 마지막).
+
+        순위는 현재 표시 순서와 무관하므로 캐시할 수 있고, sort() 가 이를 현재 순서에
+        안정 정렬로 적용한다.
+        """
+        key = (column, ascending)
+        rank = self._sort_cache.get(key)
+        if rank is not None:
+            self._sort_cache.move_to_end(key)
+            return rank
+        series = self._df.iloc[:, column]
+        positions = series.sort_values(
+            ascending=ascending, kind='mergesort', na_position='last'
+        ).index.to_numpy()
+        # 정렬된 값의 등장 순서 코드 = 순위 (NaN 도 하나의 값으로 맨 뒤 순위)
+        codes, _ = pd.factorize(series.iloc[positions], use_na_sentinel=False)
+        rank = np.empty(len(positions), dtype=np.intp)
+        rank[positions] = codes
+        self._sort_cache[key] = rank
+        if len(self._sort_cache) > SORT_CACHE_ENTRIES:
+            self._sort_cache.popitem(last=False)
+        return rank
+
+    def _format_block(self, block: int, col: int):
+        """(표시 행 블록, 컬럼) 하나를 포맷. float64 컬럼은 벡터화, 나머지는 셀 단위."""
+        start = block * FORMAT_BLOCK_ROWS
+        values = self._columns[col][self._source[start:start + FORMAT_BLOCK_ROWS]]
+        col_name = self._df.columns[col]
+        if self._float_cols[col]:
+            return format_float_array(values, self._precision, col_name in self._sci_cols)
+        return [self._format(value, col_name) for value in values]
+
     def _format(self, value, col_name) -> str:
         """populate_table의 기존 포맷 규칙을 그대로 재현."""
         if isinstance(value, float):
@@ -226,7 +226,7 @@ class PCADialog(BasePlotDialog):
             self.color_by_combo.addItem("Sample", "sample")
             self.color_by_combo.setToolTip(
                 "샘플명에서 조건 그룹을 찾지 못했습니다. 각 샘플을 개별 색으로 표시합니다.")
-        self.color_by_combo.currentIndexChanged.connect(self._update_plot)
+        self.color_by_combo.currentIndexChanged.connect(self._schedule_replot)
         disp_layout.addRow("Color by:", self.color_by_combo)
 
         self.label_check = QCheckBox("Show sample labels")
@@ -0,0 +1,93 @@
+"""
+Plot Layers
+
+레이블/범례만 바뀐 재그리기에서 큰 scatter 를 다시 래스터화하지 않도록 하는 데이터 레이어 캐시.
+
+CachedDataLayer 가 axes 의 큰 collection 들을 대신 그리고(원래 artist 는 animated 로 화면
+draw 에서 제외), 그린 직후의 axes 영역 픽셀을 보관한다. reuse_next_draw() 후의 다음 화면
+draw 에서는 collection 을 그리지 않고 보관한 픽셀을 복원한다.
+
+- figure 크기·dpi, axes 위치(픽셀 단위)·축 범위·배경색이 달라졌으면 보관본을 버리고 다시 그린다.
+- 저장(savefig) 중에는 Axes 가 animated artist 도 직접 그리므로 레이어는 아무것도 하지 않는다.
+- 레이어보다 먼저 그려지는 axes 안 요소(배경, 격자, 낮은 zorder 선)는 레이블 변경으로
+  바뀌지 않으므로 함께 복원돼도 같다. 범례(zorder 5) 이상인 collection 은 묶지 않는다.
+
+Usage:
+    self._data_layers = cache_data_layers(self.figure)      # 전체 렌더 직후
+    ...
+    self._labels.apply_to_axes(ax)
+    reuse_data_layers(self._data_layers)                    # 레이블만 바꾼 재그리기
+    self.canvas.draw_idle()
+"""
+
+from operator import methodcaller
+from typing import List
+
+import numpy as np
+from matplotlib.artist import Artist
+
+
+# axes 의 collection 점 수 합이 이 이상일 때만 레이어로 묶는다
+LAYER_MIN_POINTS = 5000
+
+# 범례 기본 zorder — 이 이상인 collection 은 범례 위에 그려지므로 레이어로 묶지 않는다
+LEGEND_ZORDER = 5
+
+
+class CachedDataLayer(Artist):
+    """ax 의 collection 들을 대신 그리고 결과 픽셀을 재사용하는 artist"""
+
+    def __init__(self, ax, artists):
+        super().__init__()
+        self._ax = ax
+        self._artists = sorted(artists, key=methodcaller('get_zorder'))
+        self._region = None
+        self._key = None
+        self._reuse = False
+        for artist in self._artists:
+            artist.set_animated(True)
+        self.set_zorder(self._artists[0].get_zorder())
+        self.set_in_layout(False)
+        ax.add_artist(self)
+
+    def reuse_next_draw(self):
+        """다음 화면 draw 에서 (상태가 같으면) 보관한 픽셀을 복원한다."""
+        self._reuse = True
+
+    def _state_key(self, renderer):
+        ax = self._ax
+        # tight_layout 을 다시 돌리면 axes 가 1px 미만으로 흔들리므로 픽셀 단위로 비교한다
+        return (renderer.width, renderer.height, renderer.dpi,
+                tuple(np.round(ax.bbox.bounds)), tuple(ax.viewLim.bounds),
+                tuple(ax.patch.get_facecolor()), tuple(ax.figure.patch.get_facecolor()))
+
+    def draw(self, renderer):
+        if not self.get_visible() or self._ax.figure.canvas.is_saving():
+            return
+        reuse, self._reuse = self._reuse, False
+        key = self._state_key(renderer)
+        if reuse and self._region is not None and key == self._key:
+            renderer.restore_region(self._region)
+            return
+        for artist in self._artists:
+            artist.draw(renderer)
+        if hasattr(renderer, 'copy_from_bbox'):
+            self._region = renderer.copy_from_bbox(self._ax.bbox)
+            self._key = key
+        self.stale = False
+
+
+def cache_data_layers(figure, min_points: int = LAYER_MIN_POINTS) -> List[CachedDataLayer]:
+    """figure 의 각 axes 에서 큰 collection 들을 CachedDataLayer 로 묶는다."""
+    layers = []
+    for ax in figure.axes:
+        artists = [c for c in ax.collections
+                   if c.get_zorder() < LEGEND_ZORDER and not c.get_animated()]
+        if artists and sum(len(c.get_offsets()) for c in artists) >= min_points:
+            layers.append(CachedDataLayer(ax, artists))
+    return layers
+
+
+def reuse_data_layers(layers) -> None:
+    for layer in layers or ():
+        layer.reuse_next_draw()
@@ -15,6 +15,7 @@ from PyQt6.QtCore import Qt
 import pandas as pd
 
 from gui.base_plot_dialog import BasePlotDialog
+from gui.hover_picker import PointPicker
 
 
 class QuadrantPlotDialog(BasePlotDialog):
@@ -33,9 +34,10 @@ class QuadrantPlotDialog(BasePlotDialog):
         self.plot_title = title
 
         self._scatter_data = []
+        self._hover_points = None   # 카테고리별 scatter_data 를 이어붙인 hover 배열
+        self._picker = None
         self._annot = None
         self._ax = None
-        self._cid_mouse = None
 
         super().__init__("Quadrant Plot — RNA vs ATAC log2FC", parent, figsize=(7, 6))
         self._update_plot()
@@ -49,7 +51,7 @@ class QuadrantPlotDialog(BasePlotDialog):
         self.point_size_spin = QSpinBox()
         self.point_size_spin.setRange(5, 200)
         self.point_size_spin.setValue(30)
-        self.point_size_spin.valueChanged.connect(self._update_plot)
+        self.point_size_spin.valueChanged.connect(self._schedule_replot)
         settings_layout.addRow("Point size:", self.point_size_spin)
 
         self.alpha_spin = QDoubleSpinBox()
@@ -57,7 +59,7 @@ class QuadrantPlotDialog(BasePlotDialog):
         self.alpha_spin.setDecimals(2)
         self.alpha_spin.setSingleStep(0.05)
         self.alpha_spin.setValue(0.70)
-        self.alpha_spin.valueChanged.connect(self._update_plot)
+        self.alpha_spin.valueChanged.connect(self._schedule_replot)
         settings_layout.addRow("Alpha:", self.alpha_spin)
 
         settings_group.setLayout(settings_layout)
@@ -91,10 +93,12 @@ class QuadrantPlotDialog(BasePlotDialog):
             fontsize=8, zorder=10,
         )
         self._annot.set_visible(False)
+        self._hover_controller(self._on_mouse_move).attach(self._annot)
 
-        if self._cid_mouse is not None:
-            self.canvas.mpl_disconnect(self._cid_mouse)
-        self._cid_mouse = self.canvas.mpl_connect('motion_notify_event', self._on_mouse_move)
+        keys = ('x', 'y', 'symbol', 'concordance', 'padj')
+        self._hover_points = {k: np.concatenate([d[k] for d in self._scatter_data])
+                              if self._scatter_data else np.empty(0) for k in keys}
+        self._picker = PointPicker(ax, self._hover_points['x'], self._hover_points['y'])
         self.canvas.draw()
 
     # ── Bundle export ─────────────────────────────────────────────────────
@@ -113,60 +117,33 @@ class QuadrantPlotDialog(BasePlotDialog):
         }
 
     def _on_mouse_move(self, event):
-        if event.inaxes is None or self._ax is None:
-            if self._annot and self._annot.get_visible():
-                self._annot.set_visible(False)
-                self.canvas.draw_idle()
+        if event.inaxes is None or self._ax is None or self._picker is None:
+            self._hover.hide()
             return
 
+        # 축 정규화 거리 0.025 이내의 최근접 점 (KD-tree)
+        idx = self._picker.nearest(event.xdata, event.ydata, radius=0.025)
+        if idx is None:
+            self._hover.hide()
+            return
+
+        pts = self._hover_points
+        x, y, sym, cat, padj = (pts['x'][idx], pts['y'][idx], pts['symbol'][idx],
+                                pts['concordance'][idx], pts['padj'][idx])
+        padj_str = f"{padj:.2e}" if not np.isnan(padj) else "N/A"
+        text = (
+            f"{sym}\n"
+            f"RNA log2FC: {y:.3f}\n"
+            f"ATAC log2FC: {x:.3f}\n"
+            f"RNA padj: {padj_str}\n"
+            f"{cat}"
+        )
+        self._annot.xy = (x, y)
+        self._annot.set_text(text)
         xlim = self._ax.get_xlim()
         ylim = self._ax.get_ylim()
-        x_range = xlim[1] - xlim[0]
-        y_range = ylim[1] - ylim[0]
-
-        best_dist = float('inf')
-        best_info = None
-
-        ex, ey = event.xdata, event.ydata
-        for data in self._scatter_data:
-            if len(data['x']) == 0:
-                continue
-            dx = (data['x'] - ex) / (x_range or 1)
-            dy = (data['y'] - ey) / (y_range or 1)
-            dists = np.sqrt(dx ** 2 + dy ** 2)
-            idx = int(np.argmin(dists))
-            if dists[idx] < best_dist:
-                best_dist = dists[idx]
-                best_info = (
-                    data['x'][idx],
-                    data['y'][idx],
-                    data['symbol'][idx],
-                    data['concordance'][idx],
-                    data['padj'][idx],
-                )
-
-        real_threshold = 0.025
-        if best_dist < real_threshold and best_info is not None:
-            x, y, sym, cat, padj = best_info
-            padj_str = f"{padj:.2e}" if not np.isnan(padj) else "N/A"
-            text = (
-                f"{sym}\n"
-                f"RNA log2FC: {y:.3f}\n"
-                f"ATAC log2FC: {x:.3f}\n"
-                f"RNA padj: {padj_str}\n"
-                f"{cat}"
-            )
-            self._annot.xy = (x, y)
-            self._annot.set_text(text)
-            xlim = self._ax.get_xlim()
-            ylim = self._ax.get_ylim()
-            xoff = -90 if (x > (xlim[0] + xlim[1]) / 2) else 12
-            yoff = -60 if (y > (ylim[0] + ylim[1]) / 2) else 12
-            self._annot.xyann = (xoff, yoff)
-            self._annot.set_visible(True)
-            self.canvas.draw_idle()
-        else:
-            if self._annot and self._annot.get_visible():
-                self._annot.set_visible(False)
-                self.canvas.draw_idle()
+        xoff = -90 if (x > (xlim[0] + xlim[1]) / 2) else 12
+        yoff = -60 if (y > (ylim[0] + ylim[1]) / 2) else 12
+        self._annot.xyann = (xoff, yoff)
+        self._hover.show()
 
@@ -105,8 +105,8 @@ class TFFootprintDialog(BasePlotDialog):
         layout.addWidget(grp)
 
         for w in [self._pval_cutoff, self._min_change, self._top_n_label, self._dot_size]:
-            w.valueChanged.connect(self._update_plot)
-        self._show_diag.stateChanged.connect(self._update_plot)
+            w.valueChanged.connect(self._schedule_replot)
+        self._show_diag.stateChanged.connect(self._schedule_replot)
 
     def _extra_buttons(self) -> list:
         return [("Export Data", self._export_data)]
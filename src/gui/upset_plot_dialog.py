@@ -48,7 +48,7 @@ class UpsetPlotDialog(BasePlotDialog):
 
         self.use_sig_only = QCheckBox("Significant peaks only")
         self.use_sig_only.setChecked(True)
-        self.use_sig_only.stateChanged.connect(self._update_plot)
+        self.use_sig_only.stateChanged.connect(self._schedule_replot)
         settings_layout.addRow(self.use_sig_only)
 
         self.padj_spin = QDoubleSpinBox()
@@ -56,7 +56,7 @@ class UpsetPlotDialog(BasePlotDialog):
         self.padj_spin.setDecimals(4)
         self.padj_spin.setValue(0.05)
         self.padj_spin.setSingleStep(0.01)
-        self.padj_spin.valueChanged.connect(self._update_plot)
+        self.padj_spin.valueChanged.connect(self._schedule_replot)
         settings_layout.addRow("Adj. p-value ≤", self.padj_spin)
 
         self.log2fc_spin = QDoubleSpinBox()
@@ -64,13 +64,13 @@ class UpsetPlotDialog(BasePlotDialog):
         self.log2fc_spin.setDecimals(4)
         self.log2fc_spin.setValue(1.0)
         self.log2fc_spin.setSingleStep(0.1)
-        self.log2fc_spin.valueChanged.connect(self._update_plot)
+        self.log2fc_spin.valueChanged.connect(self._schedule_replot)
         settings_layout.addRow("|log2FC| ≥", self.log2fc_spin)
 
         self.top_n_spin = QSpinBox()
         self.top_n_spin.setRange(3, 50)
         self.top_n_spin.setValue(15)
-        self.top_n_spin.valueChanged.connect(self._update_plot)
+        self.top_n_spin.valueChanged.connect(self._schedule_replot)
         settings_layout.addRow("Max intersections shown:", self.top_n_spin)
 
         settings_group.setLayout(settings_layout)
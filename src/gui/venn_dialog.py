@@ -46,7 +46,7 @@ class VennDiagramDialog(BasePlotDialog):
             "Highly significant (|log2FC| ≥ 2, padj ≤ 0.01)",
             "Custom..."
         ])
-        self.filter_combo.currentIndexChanged.connect(self._update_plot)
+        self.filter_combo.currentIndexChanged.connect(self._schedule_replot)
         settings_layout.addRow("Filter by:", self.filter_combo)
 
         settings_group.setLayout(settings_layout)
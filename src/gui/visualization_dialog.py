@@ -28,7 +28,9 @@ from utils import figure_theme, figure_export
 from utils.figure_bundle_export import export_figure_bundle
 from gui.widgets.figure_style_panel import FigureStylePanel
 from gui.widgets.plot_labels_panel import PlotLabelsPanel
-from gui.base_plot_dialog import BasePlotDialog
+from gui.base_plot_dialog import BasePlotDialog, debounce_timer
+from gui.hover_picker import HoverController, PointPicker
+from gui.plot_layers import cache_data_layers, reuse_data_layers
 from utils.export_paths import remembered_save_path
 
 
@@ -135,6 +137,14 @@ class VolcanoPlotWidget(QWidget):
     def __init__(self, dataframe, plot_params=None, parent=None, show_pin_button=True, embed_settings=True):
         super().__init__(parent)
         self.dataframe = dataframe
+        self._significance = None  # (dataframe, SignificanceIndex) — 임계값 변경 시 재사용
+        self._hover = None         # HoverController (canvas 당 하나)
+        self._deg_picker = None    # deg_data 의 PointPicker (그릴 때마다 갱신)
+        # 스핀박스 연타는 모아서 한 번 그리고, 레이블 패널 변경은 기존 axes 에만 재적용
+        self._replot_timer = debounce_timer(self, self._plot)
+        self._restyle_timer = debounce_timer(self, self._restyle_labels)
+        self._outside_legend = None
+        self._data_layers = []     # scatter 픽셀 캐시 (레이블만 바뀐 재그리기에서 재사용)
         self._show_pin_button = show_pin_button
         self._embed_settings = embed_settings
         self._settings_panel: 'QWidget | None' = None  # set in _init_ui when embed_settings=False
@@ -410,7 +420,7 @@ class VolcanoPlotWidget(QWidget):
             ylabel=self.plot_ylabel,
         )
         self._labels.legend_check.setChecked(self.show_legend)
-        self._labels.changed.connect(self._plot)
+        self._labels.changed.connect(self._restyle_timer.start)
         labels_group = QGroupBox("Plot Labels & Legend")
         lv = QVBoxLayout(labels_group)
         lv.addWidget(self._labels)
@@ -603,13 +613,15 @@ class VolcanoPlotWidget(QWidget):
             'annotation_custom_genes': list(self.annotation_custom_genes),
         })
 
-        self._plot()
+        self._replot_timer.start()
 
     def _plot(self):
         """Volcano Plot 그리기"""
         # _init_ui 완료 전 호출 방지
         if not hasattr(self, 'figure'):
             return
+        self._replot_timer.stop()
+        self._restyle_timer.stop()
         theme = self._style.theme_name() if hasattr(self, '_style') else 'Journal (sans-serif)'
         with figure_theme.theme_context(theme):
             self._draw_plot()
@@ -630,11 +642,16 @@ class VolcanoPlotWidget(QWidget):
                 or 'padj' not in self.dataframe.columns:
             ax.text(0.5, 0.5, 'Required columns not found:\nlog2FC and padj',
                     ha='center', va='center', fontsize=14, transform=ax.transAxes)
+            self._deg_picker = None
             self.canvas.draw()
             return
 
         # 화면·번들이 공유하는 순수 렌더 (params = get_plot_params())
-        df = render_volcano(ax, self.dataframe, self.get_plot_params())
+        params = self.get_plot_params()
+        index = self._significance_index()
+        regulation = index.regulation(params['padj_threshold'], params['log2fc_threshold']) \
+            if index is not None else None
+        df = render_volcano(ax, self.dataframe, params, regulation=regulation)
 
         # DEG 데이터 저장 (hover용)
         self.deg_data = df[df['regulation'].isin(['up', 'down'])].copy()
@@ -646,15 +663,40 @@ class VolcanoPlotWidget(QWidget):
                                  arrowprops=dict(arrowstyle="->"),
                                  zorder=1000)
         self.annot.set_visible(False)
-        self.figure.canvas.mpl_connect("motion_notify_event", self._on_hover)
+        if self._hover is None:
+            self._hover = HoverController(self.canvas, self._on_hover)
+        self._hover.attach(self.annot)
+        self._deg_picker = PointPicker(ax, self.deg_data['log2FC'], self.deg_data['-log10(padj)'])
 
         # PlotLabelsPanel 재적용 (다이얼로그에선 패널이 최종 권한)
         if hasattr(self, '_labels'):
             self._labels.apply_to_axes(ax)
+            self._outside_legend = self._labels.outside_legend()
 
         self.figure.tight_layout()
+        self._data_layers = cache_data_layers(self.figure)
         self.canvas.draw()
 
+    def _restyle_labels(self):
+        """PlotLabelsPanel 변경: scatter/라벨 배치는 그대로 두고 레이블·범례만 다시 적용한다."""
+        if self._deg_picker is None or not self.figure.axes \
+                or self._labels.outside_legend() != self._outside_legend:
+            self._plot()
+            return
+        with figure_theme.theme_context(self._style.theme_name()):
+            self._labels.apply_to_axes(self.figure.axes[0])
+            self.figure.tight_layout()
+        reuse_data_layers(self._data_layers)
+        self.canvas.draw_idle()
+
+    def _significance_index(self):
+        """self.dataframe 의 SignificanceIndex (dataframe 이 바뀌면 다시 만든다)."""
+        from utils.significance_index import frame_significance_index
+        if self._significance is None or self._significance[0] is not self.dataframe:
+            self._significance = (self.dataframe,
+                                  frame_significance_index(self.dataframe, 'log2FC', 'padj'))
+        return self._significance[1]
+
     # ── Gene Annotation 관련 메서드 ───────────────────────────────────────────
 
     def _on_annot_mode_changed(self):
@@ -759,36 +801,23 @@ class VolcanoPlotWidget(QWidget):
             )
 
     def _on_hover(self, event):
-        """마우스 오버 시 DEG 정보 표시"""
+        """마우스 오버 시 DEG 정보 표시 (HoverController 가 throttle 후 호출)"""
         if event.inaxes is None:
-            self.annot.set_visible(False)
-            self.canvas.draw_idle()
+            self._hover.hide()
             return
 
         # DEG 데이터가 있는지 확인
-        if not hasattr(self, 'deg_data') or len(self.deg_data) == 0:
+        if self._deg_picker is None or len(self._deg_picker) == 0:
             return
 
-        # 마우스 위치에서 가장 가까운 DEG 점 찾기
-        x, y = event.xdata, event.ydata
-        deg_df = self.deg_data
-
-        # 거리 계산 (스케일 고려)
+        # 마우스 위치에서 가장 가까운 DEG 점 (축 정규화 거리 0.05 이내)
         ax = event.inaxes
         xlim = ax.get_xlim()
         ylim = ax.get_ylim()
-        x_scale = xlim[1] - xlim[0]
-        y_scale = ylim[1] - ylim[0]
-
-        distances = np.sqrt(((deg_df['log2FC'] - x) / x_scale * 10) ** 2 +
-                           ((deg_df['-log10(padj)'] - y) / y_scale * 10) ** 2)
+        pos = self._deg_picker.nearest(event.xdata, event.ydata, radius=0.05)
 
-        # 가장 가까운 점 (threshold 이내)
-        min_dist_idx = distances.idxmin()
-        min_dist = distances[min_dist_idx]
-
-        if min_dist < 0.5:  # 충분히 가까울 때만 표시
-            row = deg_df.loc[min_dist_idx]
+        if pos is not None:  # 충분히 가까울 때만 표시
+            row = self.deg_data.iloc[pos]
 
             # gene symbol 우선순위: nearest_gene > gene_name > symbol > gene_id
             gene_name = next(
@@ -826,11 +855,9 @@ class VolcanoPlotWidget(QWidget):
                 offset_y = 20
 
             self.annot.set_position((offset_x, offset_y))
-            self.annot.set_visible(True)
+            self._hover.show()
         else:
-            self.annot.set_visible(False)
-
-        self.canvas.draw_idle()
+            self._hover.hide()
 
     def _save_figure(self):
         """Figure 저장"""
@@ -1009,6 +1036,7 @@ class HeatmapWidget(QWidget):
         'transpose': False,
         'sorting': 'padj',
         'show_dendrogram': False,
+        'optimal_ordering': False,
         'colormap': 'RdBu_r',
         'colorbar_min': -3.0,
         'colorbar_max': 3.0,
@@ -1043,6 +1071,7 @@ class HeatmapWidget(QWidget):
         self.transpose = merged['transpose']
         self.sorting = merged['sorting']
         self.show_dendrogram = merged.get('show_dendrogram', False)
+        self.optimal_ordering = merged.get('optimal_ordering', False)
         self.colormap = merged['colormap']
         self.colorbar_min = merged['colorbar_min']
         self.colorbar_max = merged['colorbar_max']
@@ -1050,6 +1079,15 @@ class HeatmapWidget(QWidget):
         self.fig_width = merged['fig_width']
         self.fig_height = merged['fig_height']
 
+        # 스핀박스 연타는 모아서 한 번 그리고, 레이블 패널 변경은 기존 axes 에만 재적용
+        self._replot_timer = debounce_timer(self, self._plot)
+        self._restyle_timer = debounce_timer(self, self._restyle_labels)
+        self._outside_legend = None
+        # render_heatmap 의 linkage/leaf 순서 캐시, 마지막 렌더의 _layout_key(), hover 연결 id
+        self._cluster_cache = {}
+        self._drawn_layout = None
+        self._hover_cid = None
+
         self._init_ui()
 
         # PlotLabelsPanel 기본값 설정 (plot_params 복원 포함)
@@ -1071,6 +1109,7 @@ class HeatmapWidget(QWidget):
             'transpose': self.transpose,
             'sorting': self.sorting,
             'show_dendrogram': self.show_dendrogram,
+            'optimal_ordering': self.optimal_ordering,
             'colormap': self.colormap,
             'colorbar_min': self.colorbar_min,
             'colorbar_max': self.colorbar_max,
@@ -1230,6 +1269,15 @@ class HeatmapWidget(QWidget):
         self.dendro_check.stateChanged.connect(self._on_settings_changed)
         settings_layout.addRow(self.dendro_check)
 
+        self.optimal_check = QCheckBox("Optimal leaf ordering")
+        self.optimal_check.setChecked(self.optimal_ordering)
+        self.optimal_check.setToolTip(
+            "클러스터링 순서를 인접 유전자 간 거리 합이 최소가 되도록 재배열합니다.\n"
+            "유전자 1,000개 이하에서만 적용되며, 같은 유전자/정규화에서는 한 번만 계산합니다."
+        )
+        self.optimal_check.stateChanged.connect(self._on_settings_changed)
+        settings_layout.addRow(self.optimal_check)
+
         settings_group.setLayout(settings_layout)
         left_panel.addWidget(settings_group)
 
@@ -1249,7 +1297,7 @@ class HeatmapWidget(QWidget):
         labels_group = QGroupBox("Plot Labels & Legend")
         labels_vbox = QVBoxLayout()
         self._labels = PlotLabelsPanel()
-        self._labels.changed.connect(self._plot)
+        self._labels.changed.connect(self._restyle_timer.start)
         labels_vbox.addWidget(self._labels)
         labels_group.setLayout(labels_vbox)
         left_panel.addWidget(labels_group)
@@ -1351,6 +1399,7 @@ class HeatmapWidget(QWidget):
         self.colorbar_max = self.colorbar_max_spin.value()
         self.transpose = self.transpose_check.isChecked()
         self.show_dendrogram = self.dendro_check.isChecked()
+        self.optimal_ordering = self.optimal_check.isChecked()
         self.show_legend = self.legend_check.isChecked()
 
         self.__class__._saved_settings.update({
@@ -1359,18 +1408,71 @@ class HeatmapWidget(QWidget):
             'transpose': self.transpose,
             'sorting': self.sorting,
             'show_dendrogram': self.show_dendrogram,
+            'optimal_ordering': self.optimal_ordering,
             'colormap': self.colormap,
             'colorbar_min': self.colorbar_min,
             'colorbar_max': self.colorbar_max,
             'show_legend': self.show_legend
         })
 
-        self._plot()
+        # 컬러맵 / colorbar 범위만 바뀌었으면 그려진 이미지의 색만 바꾼다
+        if self._layout_key() == self._drawn_layout:
+            self._recolor()
+            return
+        self._replot_timer.start()
+
+    def _layout_key(self):
+        """다시 렌더해야 하는 설정 (컬러맵·colorbar 범위·레이블 제외)."""
+        return (self.n_genes, self.normalization, self.transpose, self.sorting,
+                self.show_dendrogram, self.optimal_ordering, self.show_legend)
+
+    def _recolor(self):
+        """히트맵 이미지의 컬러맵/범위만 갱신 (colorbar 는 mappable 변경을 따라간다)."""
+        ax = self._main_axes()
+        if ax is None or not ax.images:
+            self._replot_timer.start()
+            return
+        image = ax.images[0]
+        image.set_cmap(self.colormap)
+        image.set_clim(self.colorbar_min, self.colorbar_max)
+        self.canvas.draw_idle()
 
     def _plot(self):
+        self._replot_timer.stop()
+        self._restyle_timer.stop()
         with figure_theme.theme_context(self._style.theme_name()):
             self._draw_heatmap()
 
+    def _main_axes(self):
+        """덴드로그램/colorbar 축이 아니라 히트맵 본체 축 (render가 gid로 표시)."""
+        if not self.figure.axes:
+            return None
+        return next((a for a in self.figure.axes if a.get_gid() == 'heatmap_main'),
+                    self.figure.axes[0])
+
+    def _apply_panel_labels(self, ax):
+        """PlotLabelsPanel 재적용 (다이얼로그에선 패널이 최종 권한)"""
+        self._labels.apply_to_axes(ax)
+        self._outside_legend = self._labels.outside_legend()
+        # 덴드로그램이 켜지면 유전자 라벨은 render가 오른쪽에 둔다. PlotLabelsPanel이 왼쪽
+        # tick label/축 제목을 다시 켜서 좌우 중복이 생기므로, 좌측을 자동 비활성화한다.
+        if self.show_dendrogram and not self.transpose:
+            ax.tick_params(axis='y', labelleft=False, labelright=True)
+            ax.set_ylabel('')
+
+    def _restyle_labels(self):
+        """PlotLabelsPanel 변경: 정규화·클러스터링·imshow 는 그대로 두고 레이블만 다시 적용한다."""
+        ax = self._main_axes()
+        if ax is None or self.current_heatmap_data is None \
+                or self._labels.outside_legend() != self._outside_legend:
+            self._plot()
+            return
+        with figure_theme.theme_context(self._style.theme_name()):
+            self._apply_panel_labels(ax)
+            if not (self.show_dendrogram and not self.transpose):
+                self.figure.tight_layout()
+        self.canvas.draw_idle()
+
     def _draw_heatmap(self):
         """Heatmap 그리기.
 
@@ -1381,8 +1483,10 @@ class HeatmapWidget(QWidget):
         from plots.heatmap import render_heatmap
 
         self.figure.clear()
+        self._drawn_layout = None
         try:
-            result = render_heatmap(self.figure, self.dataframe, self.get_plot_params())
+            result = render_heatmap(self.figure, self.dataframe, self.get_plot_params(),
+                                    cluster_cache=self._cluster_cache)
         except Exception as e:
             # 렌더 실패는 앱을 종료시키지 않는다 — figure에 안내만 표시
             import logging
@@ -1399,6 +1503,7 @@ class HeatmapWidget(QWidget):
             self.canvas.draw()
             return
         heatmap_data, gene_labels = result
+        self._drawn_layout = self._layout_key()
 
         # 상태 저장 (hover / export 용)
         self.current_heatmap_data = heatmap_data
@@ -1406,19 +1511,12 @@ class HeatmapWidget(QWidget):
         self.heatmap_data = heatmap_data
         self.gene_labels = gene_labels
 
-        # 덴드로그램/colorbar 축이 아니라 히트맵 본체 축을 찾는다 (render가 gid로 표시)
-        ax = next((a for a in self.figure.axes if a.get_gid() == 'heatmap_main'),
-                  self.figure.axes[0])
-        # PlotLabelsPanel 재적용 (다이얼로그에선 패널이 최종 권한)
-        self._labels.apply_to_axes(ax)
-        # 덴드로그램이 켜지면 유전자 라벨은 render가 오른쪽에 둔다. PlotLabelsPanel이 왼쪽
-        # tick label/축 제목을 다시 켜서 좌우 중복이 생기므로, 좌측을 자동 비활성화한다.
-        if self.show_dendrogram and not self.transpose:
-            ax.tick_params(axis='y', labelleft=False, labelright=True)
-            ax.set_ylabel('')
+        ax = self._main_axes()
+        self._apply_panel_labels(ax)
 
-        # Hover (Qt 전용)
-        self.figure.canvas.mpl_connect("motion_notify_event", self._on_hover)
+        # Hover (Qt 전용) — 다시 그릴 때마다 연결이 쌓이지 않도록 한 번만
+        if self._hover_cid is None:
+            self._hover_cid = self.canvas.mpl_connect("motion_notify_event", self._on_hover)
         self.annot = ax.annotate("", xy=(0, 0), xytext=(20, 20),
                                  textcoords="offset points",
                                  bbox=dict(boxstyle="round", fc="w", alpha=0.9),
@@ -166,6 +166,14 @@ class PlotLabelsPanel(QWidget):
             if legend is not None:
                 legend.remove()
 
+    def outside_legend(self) -> bool:
+        """
+        범례를 축 밖 우측에 두는지 (apply_to_axes 가 subplots_adjust 로 여백을 줄임).
+        이 값이 바뀌면 apply_to_axes 만으로는 여백을 되돌릴 수 없으므로 호출 측이 전체를 다시 그린다.
+        """
+        return (self.legend_check.isChecked()
+                and self.legend_pos_combo.currentText() == 'outside right')
+
     def get_params(self) -> dict:
         """직렬화 / get_plot_params() 연동용."""
         return {
@@ -9,9 +9,12 @@ from PyQt6.QtCore import QThread, pyqtSignal
 from pathlib import Path
 from typing import List, Optional
 import logging
+import threading
 
 from models.data_models import Dataset, FilterCriteria
 from utils.data_loader import DataLoader
+from utils.load_pipeline import load_dataset_file, LoadCancelled
+from utils.gene_sets import warm_gene_term_index
 from utils.statistics import StatisticalAnalyzer
 
 
@@ -19,47 +22,129 @@ class DataLoadWorker(QThread):
     """
     데이터 로딩 Worker
     
-    대용량 Excel 파일을 비동기로 로드합니다.
+    utils.load_pipeline 으로 파일 종류에 맞는 로더(DE / ATAC / GO / Multi-Group /
+    chromVAR / Motif / Footprint)를 골라 비동기로 로드합니다.
+    
+    - cancel() 호출 시 단계 사이에서 중단하고 cancelled 시그널 방출
+    - 자동 컬럼 매핑이 실패하면 mapping_requested 로 GUI 스레드에 매핑을 요청하고,
+      provide_mapping() 응답이 올 때까지 대기
     """
     
     # Signals
     progress = pyqtSignal(int)  # 진행률 (0-100)
     finished = pyqtSignal(Dataset)  # 완료 시 데이터셋 반환
     error = pyqtSignal(str)  # 오류 메시지
+    cancelled = pyqtSignal()  # 사용자 취소
+    mapping_requested = pyqtSignal(object, object, object)  # df, dataset_type, auto_mapping
     
-    def __init__(self, file_path: Path, dataset_name: Optional[str] = None):
+    def __init__(self, file_path: Path, dataset_name: Optional[str] = None,
+                 data_loader: Optional[DataLoader] = None):
         super().__init__()
-        self.file_path = file_path
+        self.file_path = Path(file_path)
         self.dataset_name = dataset_name
         self.logger = logging.getLogger(__name__)
-        self.data_loader = DataLoader()
+        self.data_loader = data_loader or DataLoader()
+        self._mapping_event = threading.Event()
+        self._mapping_result: Optional[dict] = None
+    
+    def cancel(self):
+        """로드 취소 요청 (매핑 대기 중이면 즉시 깨움)"""
+        self.requestInterruption()
+        self._mapping_event.set()
+    
+    def provide_mapping(self, mapping: Optional[dict]):
+        """GUI 스레드에서 컬럼 매핑 결과 전달 (None = 사용자 취소)"""
+        self._mapping_result = mapping
+        self._mapping_event.set()
+    
+    def _request_mapping(self, df, dataset_type, auto_mapping):
+        """DataLoader 컬럼 매핑 콜백 — GUI 스레드 응답까지 블로킹"""
+        self._mapping_event.clear()
+        self._mapping_result = None
+        self.mapping_requested.emit(df, dataset_type, auto_mapping)
+        self._mapping_event.wait()
+        if self.isInterruptionRequested():
+            raise LoadCancelled(f"Loading '{self.file_path.name}' was cancelled")
+        return self._mapping_result
     
     def run(self):
         """작업 실행"""
         try:
-            self.progress.emit(10)
-            
-            # 데이터 로드
-            dataset = self.data_loader.load_from_excel(
-                self.file_path, self.dataset_name
+            dataset = load_dataset_file(
+                self.file_path,
+                self.dataset_name,
+                data_loader=self.data_loader,
+                column_mapper_callback=self._request_mapping,
+                progress_callback=self.progress.emit,
+                is_cancelled=self.isInterruptionRequested,
             )
-            
-            self.progress.emit(50)
+            # GO Gene Symbol 필터용 역색인은 GUI 스레드가 아닌 여기서 미리 생성
+            warm_gene_term_index(dataset)
             
             # 데이터 검증
             if not dataset.is_valid:
                 self.logger.warning("Dataset validation failed")
             
-            self.progress.emit(100)
-            
             # 완료
             self.finished.emit(dataset)
             
+        except LoadCancelled:
+            self.logger.info(f"Data load cancelled: {self.file_path.name}")
+            self.cancelled.emit()
         except Exception as e:
             self.logger.error(f"Data load worker failed: {e}", exc_info=True)
             self.error.emit(str(e))
 
 
+class DatabaseLoadWorker(QThread):
+    """
+    데이터베이스 다중 로드 Worker
+    
+    DatabaseManager.iter_load_datasets() 로 여러 데이터셋을 병렬 로드하고,
+    하나가 끝날 때마다 dataset_ready 로 바로 전달합니다.
+    """
+    
+    # Signals
+    progress = pyqtSignal(int)  # 진행률 (0-100)
+    dataset_ready = pyqtSignal(str, object)  # dataset_id, Dataset (실패 시 None)
+    finished = pyqtSignal(int)  # 로드 성공 개수
+    error = pyqtSignal(str)
+    
+    def __init__(self, db_manager, dataset_ids: List[str], max_workers: Optional[int] = None):
+        super().__init__()
+        self.db_manager = db_manager
+        self.dataset_ids = list(dataset_ids)
+        self.max_workers = max_workers
+        self.logger = logging.getLogger(__name__)
+    
+    def cancel(self):
+        """남은 로드 취소 요청"""
+        self.requestInterruption()
+    
+    def run(self):
+        """작업 실행"""
+        try:
+            total = len(self.dataset_ids)
+            done = 0
+            loaded = 0
+            for dataset_id, dataset in self.db_manager.iter_load_datasets(
+                self.dataset_ids,
+                max_workers=self.max_workers,
+                is_cancelled=self.isInterruptionRequested,
+            ):
+                done += 1
+                if dataset is not None:
+                    loaded += 1
+                self.dataset_ready.emit(dataset_id, dataset)
+                self.progress.emit(int(done * 100 / total))
+            
+            self.finished.emit(loaded)
+            
+        except Exception as e:
+            self.logger.error(f"Database load worker failed: {e}", exc_info=True)
+            self.error.emit(str(e))
+
+
 class FilterWorker(QThread):
     """
     필터링 Worker
@@ -191,6 +276,35 @@ class ComparisonWorker(QThread):
             self.error.emit(str(e))
 
 
+class WideComparisonWorker(QThread):
+    """
+    Wide-format 비교 Worker (Gene List / Statistics 비교 시트)
+
+    utils.comparison_engine 으로 테이블을 만들고 (result_df, dataset_genes) 를 방출합니다.
+    필터 패널/체크박스 값은 GUI 스레드에서 미리 읽어 params 로 넘깁니다.
+    """
+
+    # Signals
+    finished = pyqtSignal(object)  # (pd.DataFrame, Dict[str, set])
+    error = pyqtSignal(str)
+
+    def __init__(self, comparison_type: str, datasets: List[Dataset], **params):
+        super().__init__()
+        self.comparison_type = comparison_type
+        self.datasets = list(datasets)
+        self.params = params
+        self.logger = logging.getLogger(__name__)
+
+    def run(self):
+        """작업 실행"""
+        from utils.comparison_engine import build_comparison
+        try:
+            self.finished.emit(build_comparison(self.comparison_type, self.datasets, **self.params))
+        except Exception as e:
+            self.logger.error(f"Wide comparison worker failed: {e}", exc_info=True)
+            self.error.emit(str(e))
+
+
 class ExportWorker(QThread):
     """
     데이터 내보내기 Worker
@@ -4,6 +4,7 @@ Data Models for RNA-Seq Analysis
 RNA-Seq 데이터를 표현하는 모델 클래스들을 정의합니다.
 """
 
+import weakref
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional, List, Dict, Any
@@ -122,6 +123,10 @@ class Dataset:
     # 원본 컬럼명 참고 정보 (표준 컬럼명 -> 원본 컬럼명)
     # 표시 목적으로만 사용, 실제 데이터 접근에는 사용하지 않음
     original_columns: Dict[str, str] = field(default_factory=dict)
+
+    # 조회 인덱스 캐시: (종류, column) → (dataframe weakref, 행 수, 인덱스)
+    _index_cache: Dict[Any, Any] = field(default_factory=dict, init=False,
+                                         repr=False, compare=False)
     
     def __post_init__(self):
         """데이터셋 초기화 후 처리"""
@@ -156,6 +161,71 @@ class Dataset:
         df_cols = set(self.dataframe.columns)
         return all(col in df_cols for col in required)
     
+    def identifier_index(self, column: str):
+        """
+        column 의 정규화 식별자(strip + upper) → 행 위치 인덱스 (utils.identifier_index).
+
+        처음 요청 시 만들고 캐시하며, dataframe 이 다른 객체로 교체되면 다시 만든다.
+        """
+        from utils.identifier_index import IdentifierIndex
+        return self._cached_index('identifier', column, IdentifierIndex)
+
+    def gene_term_index(self, column: str = 'gene_symbols'):
+        """
+        GO/KEGG column(유전자 목록)의 대문자 유전자 → term 행 역색인 (utils.gene_sets).
+
+        identifier_index 와 같은 방식으로 캐시/무효화된다.
+        """
+        from utils.gene_sets import GeneTermIndex
+        return self._cached_index('gene_term', column, GeneTermIndex)
+
+    def gene_stats(self):
+        """
+        symbol/gene_id → (log2fc, pvalue, lfcSE) 열 단위 조회표 (utils.comparison_engine).
+
+        메타 분석이 비교할 때마다 전체 데이터셋을 다시 훑지 않도록 identifier_index 와
+        같은 방식으로 캐시/무효화된다.
+        """
+        from utils.comparison_engine import GeneStatsLookup
+        if self.dataframe is None:
+            return GeneStatsLookup(None)
+        return self._cached_index('gene_stats', None, GeneStatsLookup)
+
+    def numeric_column(self, column: str):
+        """
+        column 을 float 배열로 변환(pd.to_numeric(errors='coerce'))한 결과.
+        임계값 컨트롤이 바뀔 때마다 다시 변환하지 않도록 identifier_index 와 같이 캐시된다.
+        """
+        from utils.significance_index import numeric_array
+        return self._cached_index('numeric', column, numeric_array)
+
+    def significance_index(self, log2fc_col: str = 'log2fc', padj_col: str = 'adj_pvalue'):
+        """
+        padj / |log2FC| 임계값 질의 구조 (utils.significance_index).
+        같은 데이터셋에서 임계값만 바꾼 개수/마스크는 memo 및 이진 탐색으로 답한다.
+        """
+        from utils.significance_index import SignificanceIndex
+
+        def build(_padj):
+            return SignificanceIndex(self.numeric_column(log2fc_col), self.numeric_column(padj_col))
+        return self._cached_index(f'significance:{log2fc_col}', padj_col, build)
+
+    def _cached_index(self, kind: str, column: Optional[str], build):
+        """
+        column 이 None 이면 dataframe 전체로 build 한다.
+
+        캐시는 dataframe 이 다른 객체로 교체되거나 같은 객체라도 행 수가 바뀌면
+        (제자리 drop/append) 다시 만든다.
+        """
+        key = (kind, column)
+        cached = self._index_cache.get(key)
+        if (cached is not None and cached[0]() is self.dataframe
+                and cached[1] == len(self.dataframe)):
+            return cached[2]
+        index = build(self.dataframe if column is None else self.dataframe[column])
+        self._index_cache[key] = (weakref.ref(self.dataframe), len(self.dataframe), index)
+        return index
+
     def get_filtered_data(self, **filters) -> pd.DataFrame:
         """
         필터 조건에 맞는 데이터 반환
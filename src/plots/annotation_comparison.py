@@ -66,27 +66,30 @@ def render_annotation_comparison(ax, df, params):
     display = params.get('display', 'counts')
     peak_set = params.get('peak_set', 'significant')
 
-    df = df.copy() if df is not None else pd.DataFrame()
+    df = df if df is not None else pd.DataFrame()
     if df.empty or 'dataset' not in df.columns or 'annotation' not in df.columns:
         ax.text(0.5, 0.5, "No annotation data in the selected datasets.",
                 ha='center', va='center', transform=ax.transAxes, color='#888888')
         return None
 
     order = params.get('order') or list(pd.unique(df['dataset']))
-    df['_lfc'] = pd.to_numeric(df.get('log2fc'), errors='coerce')
-    df['_padj'] = pd.to_numeric(df.get('adj_pvalue'), errors='coerce')
+    lfc = pd.to_numeric(df.get('log2fc'), errors='coerce')
+    padj = pd.to_numeric(df.get('adj_pvalue'), errors='coerce')
+    is_sig = ((padj <= fdr_max) & (lfc.abs() >= lfc_min)).to_numpy(dtype=bool)
+    labels = df['dataset'].to_numpy()
 
-    def ann_counts(sub, significant):
-        s = sub
+    def ann_counts(rows, significant):
+        # 원본 문자열별로 먼저 센 뒤 정규화 — normalize 는 고유 annotation 수만큼만 호출
         if significant:
-            s = sub[(sub['_padj'] <= fdr_max) & (sub['_lfc'].abs() >= lfc_min)]
-        return s['annotation'].dropna().map(normalize).value_counts()
+            rows = rows & is_sig
+        raw = df['annotation'][rows].dropna().value_counts()
+        return raw.groupby(raw.index.map(normalize)).sum().sort_values(ascending=False)
 
-    per_all = {lbl: ann_counts(df[df['dataset'] == lbl], False) for lbl in order}
+    per_all = {lbl: ann_counts(labels == lbl, False) for lbl in order}
 
     # ── Enrichment: 배경 대비 유의 peak의 log2 enrichment (그룹 막대) ──
     if display == 'enrichment':
-        per_sig = {lbl: ann_counts(df[df['dataset'] == lbl], True) for lbl in order}
+        per_sig = {lbl: ann_counts(labels == lbl, True) for lbl in order}
         all_cats = set()
         for s in per_all.values():
             all_cats.update(s.index.tolist())
@@ -130,7 +133,7 @@ def render_annotation_comparison(ax, df, params):
 
     # ── Counts / Proportion: 데이터셋당 카테고리 누적 막대 ──
     significant = (peak_set == 'significant')
-    per_ds = {lbl: ann_counts(df[df['dataset'] == lbl], significant) for lbl in order}
+    per_ds = {lbl: ann_counts(labels == lbl, significant) for lbl in order}
     all_cats = set()
     for s in per_ds.values():
         all_cats.update(s.index.tolist())
@@ -9,10 +9,11 @@ import numpy as np
 import pandas as pd
 
 
-def render_count_summary(ax, df, params):
+def render_count_summary(ax, df, params, counts=None):
     """0 기준 up/down 막대를 ax에 그린다. counts_df(label/up/down/total) 반환.
 
     params: fdr_max(0.05), lfc_min(1.0), as_pct(bool), unit('genes'|'peaks'), order(list)
+    counts: 이미 집계된 label/up/down/total (다이얼로그가 데이터셋 캐시로 계산) — 없으면 df 에서 집계
     """
     from matplotlib.ticker import FuncFormatter
 
@@ -23,26 +24,27 @@ def render_count_summary(ax, df, params):
     as_pct = bool(params.get('as_pct', False))
     unit = params.get('unit', 'genes')
 
-    df = df.copy() if df is not None else pd.DataFrame()
+    df = df if df is not None else pd.DataFrame()
     if df.empty or 'dataset' not in df.columns:
         ax.text(0.5, 0.5, "No datasets to plot.", ha='center', va='center',
                 transform=ax.transAxes, color='#888888')
         return pd.DataFrame()
 
     order = params.get('order') or list(pd.unique(df['dataset']))
-    lfc = pd.to_numeric(df.get('log2fc'), errors='coerce')
-    padj = pd.to_numeric(df.get('adj_pvalue'), errors='coerce')
-    df = df.assign(_lfc=lfc, _padj=padj)
+    if counts is None:
+        lfc = pd.to_numeric(df.get('log2fc'), errors='coerce')
+        padj = pd.to_numeric(df.get('adj_pvalue'), errors='coerce')
+        df = df.assign(_lfc=lfc, _padj=padj)
 
-    rows = []
-    for label in order:
-        sub = df[df['dataset'] == label]
-        total = int(sub['_lfc'].notna().sum())
-        sig = sub[(sub['_padj'] <= fdr_max) & (sub['_lfc'].abs() >= lfc_min)]
-        up = int((sig['_lfc'] > 0).sum())
-        down = int((sig['_lfc'] < 0).sum())
-        rows.append({'label': label, 'up': up, 'down': down, 'total': total})
-    counts = pd.DataFrame(rows)
+        rows = []
+        for label in order:
+            sub = df[df['dataset'] == label]
+            total = int(sub['_lfc'].notna().sum())
+            sig = sub[(sub['_padj'] <= fdr_max) & (sub['_lfc'].abs() >= lfc_min)]
+            up = int((sig['_lfc'] > 0).sum())
+            down = int((sig['_lfc'] < 0).sum())
+            rows.append({'label': label, 'up': up, 'down': down, 'total': total})
+        counts = pd.DataFrame(rows)
     if counts.empty:
         ax.text(0.5, 0.5, "No datasets to plot.", ha='center', va='center',
                 transform=ax.transAxes, color='#888888')
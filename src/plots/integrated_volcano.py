@@ -8,12 +8,15 @@ render_integrated_volcano(ax, df, params) 는 IntegratedVolcanoDialog._do_plot 
 import numpy as np
 import pandas as pd
 
+from plots.large_scatter import scatter_background
+
 
 def render_integrated_volcano(ax, df, params):
     """Integrated volcano를 ax에 그린다. scatter_data(list[(sc, sub)]) 반환.
 
     params: padj_threshold(0.05), log2fc_threshold(1.0), base_size(30),
-            scale_by_peak(bool), title
+            scale_by_peak(bool), title,
+            background_mode('auto'|'vector'|'raster'|'density' — Not_significant 점)
     """
     col_lfc = 'rna_log2fc'
     col_padj = 'rna_padj'
@@ -56,10 +59,15 @@ def render_integrated_volcano(ax, df, params):
             sizes = base_sz * (1 + np.log1p(peak_cnt) * 0.8)
         else:
             sizes = base_sz
-        sc = ax.scatter(sub[col_lfc], sub['_neg_log10_padj'],
-                        c=colors.get(cat, '#CCCCCC'), s=sizes, alpha=0.75,
-                        linewidths=0.3, edgecolors='white',
-                        label=f"{cat.replace('_', ' ')} (n={len(sub)})", zorder=3)
+        kw = dict(c=colors.get(cat, '#CCCCCC'), s=sizes, alpha=0.75,
+                  linewidths=0.3, edgecolors='white',
+                  label=f"{cat.replace('_', ' ')} (n={len(sub)})", zorder=3)
+        if cat == 'Not_significant':
+            # density 모드면 빈 proxy 가 반환되어 hover 대상에서 빠진다
+            sc = scatter_background(ax, sub[col_lfc], sub['_neg_log10_padj'],
+                                    mode=params.get('background_mode', 'auto'), **kw)
+        else:
+            sc = ax.scatter(sub[col_lfc], sub['_neg_log10_padj'], **kw)
         scatter_data.append((sc, sub))
 
     ax.axhline(-np.log10(padj_thr), color='black', linestyle='--', linewidth=0.8, alpha=0.6)
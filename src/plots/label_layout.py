@@ -0,0 +1,162 @@
+"""Label layout — 산점도 점 레이블의 시간 제한 배치 (renderer 공유 헬퍼).
+
+volcano / MA / meta volcano / PCA 렌더의 상위 N개 라벨 배치에 쓴다 (adjustText 대체).
+재현 번들 스크립트에는 모듈 전체가 렌더 함수와 함께 inline 된다 (Qt 비의존).
+
+- 충돌 판정은 display(px) 좌표의 박스 배열끼리 numpy broadcasting 으로 한 번에 한다.
+- greedy: 우선순위 순서대로 점 주변 8 방향 × 거리 후보 중 겹침이 가장 적고 가까운 자리.
+- relax: greedy 결과에서 남은 겹침을 밀어내기 반복 (max_iter / time_limit 예산 안에서만).
+  레이블이 greedy_above 개를 넘으면 greedy 만 쓴다.
+- 최종 위치는 (레이블, 점 좌표, 축 범위, axes 크기, 글자 크기) 키로 캐시해 같은 입력의
+  재렌더(임계값 왕복, 테마 변경 등)에서는 계산 없이 재사용한다.
+
+Usage:
+    texts = [ax.text(x, y, name, ...) for ...]     # 각 레이블은 자기 점 위치에 만든다
+    place_labels(ax, texts)
+"""
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+# 최종 레이블 중심 오프셋(px) 캐시 — 최근 것부터 이 개수까지
+_LAYOUT_CACHE = OrderedDict()
+_LAYOUT_CACHE_SIZE = 32
+
+# greedy 후보 방향 (대각선 먼저 — 리더선이 점을 덜 가린다)
+_DIRECTIONS = np.array([(1, 1), (-1, 1), (1, -1), (-1, -1),
+                        (0, 1), (0, -1), (1, 0), (-1, 0)], dtype=float)
+
+
+def _boxes(centers, half):
+    """중심 (n, 2) + 반폭 (n, 2) 또는 (2,) → [x0, y0, x1, y1] (n, 4)."""
+    return np.hstack([centers - half, centers + half])
+
+
+def _overlap_matrix(a, b):
+    """박스 a (n, 4) × b (m, 4) 의 겹침 여부 (n, m)."""
+    return ((a[:, None, 0] < b[None, :, 2]) & (b[None, :, 0] < a[:, None, 2])
+            & (a[:, None, 1] < b[None, :, 3]) & (b[None, :, 1] < a[:, None, 3]))
+
+
+def _greedy_layout(anchors, half, frame, point_half, rings=6):
+    """레이블마다 겹침이 가장 적고 가장 가까운 후보 자리를 순서대로 고른다."""
+    n = len(anchors)
+    obstacles = _boxes(anchors, point_half)
+    placed = np.empty((n, 4))
+    centers = np.empty_like(anchors)
+    scales = np.arange(1, rings + 1, dtype=float)[:, None, None]
+    for i in range(n):
+        offsets = (_DIRECTIONS[None] * (half[i] + point_half) * scales).reshape(-1, 2)
+        cand = anchors[i] + offsets
+        boxes = _boxes(cand, half[i])
+        outside = ((boxes[:, 0] < frame[0]) | (boxes[:, 1] < frame[1])
+                   | (boxes[:, 2] > frame[2]) | (boxes[:, 3] > frame[3]))
+        hits = (_overlap_matrix(boxes, placed[:i]).sum(axis=1)
+                + _overlap_matrix(boxes, obstacles).sum(axis=1))
+        cost = outside * 1e9 + hits * 1e6 + np.hypot(offsets[:, 0], offsets[:, 1])
+        j = int(np.argmin(cost))
+        centers[i] = cand[j]
+        placed[i] = boxes[j]
+    return centers
+
+
+def _clamp(centers, half, frame):
+    lo = frame[:2] + half
+    hi = np.maximum(frame[2:] - half, lo)
+    return np.clip(centers, lo, hi)
+
+
+def _relax_layout(centers, anchors, half, frame, point_half, max_iter, deadline):
+    """레이블끼리 / 레이블-점 겹침을 짧은 축 방향으로 밀어낸다 (예산 안에서)."""
+    n = len(centers)
+    obstacles = _boxes(anchors, point_half)
+    order = np.sign(np.subtract.outer(np.arange(n), np.arange(n))).astype(float)
+    for _ in range(max_iter):
+        if time.perf_counter() > deadline:
+            break
+        boxes = _boxes(centers, half)
+        hit = _overlap_matrix(boxes, boxes)
+        np.fill_diagonal(hit, False)
+        hit_pts = _overlap_matrix(boxes, obstacles)
+        if not hit.any() and not hit_pts.any():
+            break
+        # 레이블끼리: 서로 반씩
+        d = centers[:, None, :] - centers[None, :, :]
+        depth = (half[:, None, :] + half[None, :, :]) - np.abs(d)
+        sign = np.sign(d)
+        sign[sign == 0] = np.broadcast_to(order[..., None], sign.shape)[sign == 0]
+        along_x = depth[..., 0] < depth[..., 1]
+        move = np.zeros_like(centers)
+        move[:, 0] = np.where(hit & along_x, sign[..., 0] * depth[..., 0] / 2, 0).sum(axis=1)
+        move[:, 1] = np.where(hit & ~along_x, sign[..., 1] * depth[..., 1] / 2, 0).sum(axis=1)
+        # 레이블-점: 레이블만 전부
+        d = centers[:, None, :] - anchors[None, :, :]
+        depth = (half[:, None, :] + point_half) - np.abs(d)
+        sign = np.where(d >= 0, 1.0, -1.0)
+        along_x = depth[..., 0] < depth[..., 1]
+        move[:, 0] += np.where(hit_pts & along_x, sign[..., 0] * depth[..., 0], 0).sum(axis=1)
+        move[:, 1] += np.where(hit_pts & ~along_x, sign[..., 1] * depth[..., 1], 0).sum(axis=1)
+        centers = _clamp(centers + move, half, frame)
+    return centers
+
+
+def place_labels(ax, texts, expand=(1.15, 1.4), point_radius=3.0,
+                 time_limit=0.3, max_iter=200, greedy_above=150,
+                 line_kw=None):
+    """texts(각자 점 위치에 만든 ax.text, 데이터 좌표) 를 겹치지 않게 옮기고 점까지 리더선을 그린다.
+
+    expand: 글자 박스 확대 배율 (가로, 세로). point_radius: 점 자신을 피하는 반경(px).
+    time_limit/max_iter: 밀어내기 반복 예산. greedy_above: 이보다 많으면 greedy 만.
+    line_kw: 리더선 LineCollection 인자 (기본 회색 0.5pt).
+    """
+    texts = list(texts)
+    if not texts:
+        return
+    from matplotlib.collections import LineCollection
+
+    # 대기 중인 autoscale 을 먼저 반영해야 transData 가 최종 축 범위를 쓴다
+    ax.autoscale_view()
+    to_display = ax.transData.transform
+    anchors = to_display(np.array([t.get_position() for t in texts], dtype=float))
+    for t in texts:
+        t.set_ha('center')
+        t.set_va('center')
+    sizes = np.array([(e.width, e.height) for e in (t.get_window_extent() for t in texts)])
+    half = sizes * np.asarray(expand, dtype=float) / 2
+    frame = np.asarray(ax.bbox.extents, dtype=float) + np.array([2, 2, -2, -2])
+
+    key = (tuple(t.get_text() for t in texts), np.round(anchors, 1).tobytes(),
+           np.round(sizes, 1).tobytes(), tuple(np.round(frame, 1)))
+    offsets = _LAYOUT_CACHE.get(key)
+    if offsets is not None:
+        _LAYOUT_CACHE.move_to_end(key)
+    else:
+        deadline = time.perf_counter() + time_limit
+        centers = _greedy_layout(anchors, half, frame, point_radius)
+        if len(texts) <= greedy_above:
+            centers = _relax_layout(centers, anchors, half, frame, point_radius,
+                                    max_iter, deadline)
+        offsets = centers - anchors
+        _LAYOUT_CACHE[key] = offsets
+        while len(_LAYOUT_CACHE) > _LAYOUT_CACHE_SIZE:
+            _LAYOUT_CACHE.popitem(last=False)
+
+    centers = anchors + offsets
+    to_data = ax.transData.inverted().transform
+    for t, pos in zip(texts, to_data(centers)):
+        t.set_position(pos)
+
+    # 리더선: 점 → 레이블 박스 가장자리 (점이 박스 안이면 생략)
+    d = centers - anchors
+    with np.errstate(divide='ignore', invalid='ignore'):
+        inside = np.minimum(half[:, 0] / np.abs(d[:, 0]), half[:, 1] / np.abs(d[:, 1]))
+    reach = 1 - np.minimum(inside, 1)
+    keep = reach > 0
+    if keep.any():
+        ends = anchors[keep] + d[keep] * reach[keep, None]
+        segments = np.stack([to_data(anchors[keep]), to_data(ends)], axis=1)
+        kw = dict(colors='grey', linewidths=0.5)
+        kw.update(line_kw or {})
+        zorder = min(t.get_zorder() for t in texts) - 0.5
+        ax.add_collection(LineCollection(segments, zorder=zorder, **kw), autolim=False)
@@ -0,0 +1,77 @@
+"""Large scatter — 점이 아주 많은 배경(비유의) 레이어 렌더 (renderer 공유 헬퍼).
+
+volcano / MA / integrated volcano / meta volcano 렌더가 비유의(background) 점을 그릴 때 쓴다.
+재현 번들 스크립트에는 각 렌더 함수와 함께 inline 되므로 Qt/모듈 상수에 의존하지 않는다
+(임계값은 함수 기본 인자).
+
+background_mode (params 키, 기본 'auto'):
+  'vector'  — 보통 ax.scatter
+  'raster'  — ax.scatter(rasterized=True): 화면은 같고 PDF/SVG 에는 이미지 한 장으로 들어간다
+  'density' — NumPy 2-D 히스토그램을 '점 색 + 밀도 알파' RGBA 이미지로 그린다
+              (그리기 시간·파일 크기가 점 수와 무관)
+  'auto'    — 점 수에 따라 vector → raster → density
+유의 점은 렌더 쪽에서 계속 벡터 마커로 그린다.
+"""
+import numpy as np
+
+
+def background_scatter_mode(n, mode='auto', raster_min=20_000, density_min=100_000):
+    """배경 점 n 개를 그릴 방식. mode 가 'auto' 가 아니면 그대로 쓴다."""
+    if mode in ('vector', 'raster', 'density'):
+        return mode
+    if n >= density_min:
+        return 'density'
+    if n >= raster_min:
+        return 'raster'
+    return 'vector'
+
+
+def scatter_background(ax, x, y, mode='auto', bins=400, **scatter_kw):
+    """배경 점 레이어를 그린다. 범례 항목이 되는 PathCollection 반환 (density 면 빈 proxy).
+
+    scatter_kw 는 ax.scatter 인자 그대로 (c 는 단색, label/alpha/s/zorder 등).
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    mode = background_scatter_mode(len(x), mode)
+    if mode == 'vector':
+        return ax.scatter(x, y, **scatter_kw)
+    if mode == 'raster':
+        return ax.scatter(x, y, rasterized=True, **scatter_kw)
+
+    from matplotlib.colors import to_rgba
+
+    # 범례용 빈 scatter (점별 크기 배열은 대표값 하나로)
+    proxy_kw = dict(scatter_kw)
+    if np.ndim(proxy_kw.get('s')) > 0:
+        proxy_kw['s'] = float(np.median(proxy_kw['s']))
+    proxy = ax.scatter([], [], **proxy_kw)
+
+    ok = np.isfinite(x) & np.isfinite(y)
+    x, y = x[ok], y[ok]
+    if not len(x):
+        return proxy
+    x0, x1 = float(x.min()), float(x.max())
+    y0, y1 = float(y.min()), float(y.max())
+    if x1 <= x0:
+        x0, x1 = x0 - 0.5, x1 + 0.5
+    if y1 <= y0:
+        y0, y1 = y0 - 0.5, y1 + 0.5
+    counts, _, _ = np.histogram2d(x, y, bins=bins, range=[[x0, x1], [y0, y1]])
+    counts = counts.T  # (y, x) — imshow 행 = y
+
+    # 점이 하나라도 있는 칸은 최소 0.5, 가장 빽빽한 칸은 1 (log 스케일) × scatter alpha
+    density = np.log1p(counts)
+    level = np.where(counts > 0, 0.5 + 0.5 * density / density.max(), 0.0)
+    alpha = scatter_kw.get('alpha')
+    rgba = np.empty(counts.shape + (4,))
+    rgba[..., :3] = to_rgba(scatter_kw.get('c', 'C0'))[:3]
+    rgba[..., 3] = level * (1.0 if alpha is None else float(alpha))
+
+    image = ax.imshow(rgba, origin='lower', extent=(x0, x1, y0, y1), aspect='auto',
+                      interpolation='nearest', zorder=proxy.get_zorder())
+    # imshow 는 축을 extent 에 딱 맞추므로 scatter 처럼 여백을 다시 준다
+    image.sticky_edges.x.clear()
+    image.sticky_edges.y.clear()
+    ax.autoscale_view()
+    return proxy
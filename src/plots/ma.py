@@ -6,15 +6,20 @@ X축 = log2(base_mean), Y축 = log2FC. Qt/StandardColumns 비의존(표준 컬
 import numpy as np
 import pandas as pd
 
+from plots.label_layout import place_labels
+from plots.large_scatter import scatter_background
 
-def render_ma(ax, df, params):
+
+def render_ma(ax, df, params, regulation=None):
     """MA plot을 ax에 그린다. (분류된 df) 반환. 필수 컬럼 없으면 None.
 
     params: padj_threshold, log2fc_threshold, dot_size,
             up_color/down_color/ns_color(hex), x_min/x_max/y_min/y_max,
             title/xlabel/ylabel, show_legend,
             annotation_mode('none'|'top_n'|'custom'), annotation_top_n,
-            annotation_label_size, annotation_custom_genes
+            annotation_label_size, annotation_custom_genes,
+            background_mode('auto'|'vector'|'raster'|'density' — ns 점, plots/large_scatter.py)
+    regulation: 행별 'up'/'down'/'ns' 를 미리 계산해 둔 배열(선택). 주어지면 임계값 분류를 건너뛴다.
     """
     if df is None or df.empty:
         ax.text(0.5, 0.5, 'No data available.', ha='center', va='center',
@@ -38,15 +43,21 @@ def render_ma(ax, df, params):
     df['_y'] = pd.to_numeric(df['log2fc'], errors='coerce')
 
     df['_reg'] = 'ns'
-    if 'adj_pvalue' in df.columns:
+    if regulation is not None:
+        df['_reg'] = np.array(regulation, dtype=object)
+    elif 'adj_pvalue' in df.columns:
         padj = pd.to_numeric(df['adj_pvalue'], errors='coerce')
         df.loc[(df['_y'] >= lfc_thr) & (padj <= padj_thr), '_reg'] = 'up'
         df.loc[(df['_y'] <= -lfc_thr) & (padj <= padj_thr), '_reg'] = 'down'
 
     for reg, color in [('ns', ns_c), ('down', down_c), ('up', up_c)]:
         sub = df[df['_reg'] == reg]
-        ax.scatter(sub['_x'], sub['_y'], c=color, s=dot, alpha=0.5,
-                   label=f"{reg.upper()} ({len(sub):,})", edgecolors='none')
+        kw = dict(c=color, s=dot, alpha=0.5, label=f"{reg.upper()} ({len(sub):,})", edgecolors='none')
+        if reg == 'ns':
+            scatter_background(ax, sub['_x'], sub['_y'],
+                               mode=params.get('background_mode', 'auto'), **kw)
+        else:
+            ax.scatter(sub['_x'], sub['_y'], **kw)
 
     ax.axhline(0, color='black', linewidth=0.8, alpha=0.6)
     ax.axhline(lfc_thr, color='gray', linewidth=0.8, linestyle='--', alpha=0.7)
@@ -90,13 +101,5 @@ def render_ma(ax, df, params):
                              bbox=dict(boxstyle='round,pad=0.15', fc='white', ec='none', alpha=0.7),
                              zorder=500)
                      for _, row in targets.iterrows()]
-            if texts:
-                try:
-                    from adjustText import adjust_text
-                    adjust_text(texts, ax=ax,
-                                arrowprops=dict(arrowstyle='-', color='grey', lw=0.5),
-                                expand=(1.15, 1.4), force_text=(0.4, 0.6),
-                                only_move={'text': 'xy'})
-                except ImportError:
-                    pass
+            place_labels(ax, texts)
     return df
@@ -2,13 +2,16 @@
 
 render_meta_volcano(ax, df, params) 는 MetaVolcanoDialog._do_plot 과 재현 번들 스크립트가
 공유한다. X = mean/pooled log2FC, Y = -log10(meta p-value). concordant sig 유전자는
-up(빨강)/down(파랑), discordant sig 는 주황, 나머지는 회색. 상위 N개는 adjustText 라벨.
+up(빨강)/down(파랑), discordant sig 는 주황, 나머지는 회색. 상위 N개는 place_labels 라벨.
 Qt 비의존 — 색상/라벨 상수를 함수 내부에 내장한다. 반환값 (d, label_col) 은 다이얼로그
 hover/export 에서 재사용한다.
 """
 import numpy as np
 import pandas as pd
 
+from plots.label_layout import place_labels
+from plots.large_scatter import scatter_background
+
 
 def _found_in_num(v):
     try:
@@ -21,7 +24,8 @@ def render_meta_volcano(ax, df, params):
     """Meta volcano를 ax에 그린다. (prepared_df, label_col) 반환.
 
     params: p_col, p_source_name, x_col, p_threshold, lfc_threshold,
-            min_k, top_n, label_size
+            min_k, top_n, label_size,
+            background_mode('auto'|'vector'|'raster'|'density' — n.s. 점, plots/large_scatter.py)
     """
     c_up, c_down, c_discord, c_ns = '#c0392b', '#2c6fbb', '#e08a1e', '#c8c8c8'
     x_labels = {
@@ -77,9 +81,14 @@ def render_meta_volcano(ax, df, params):
         (cat_up, c_up, 'Sig. up (concordant)'),
         (cat_down, c_down, 'Sig. down (concordant)'),
     ):
-        if mask.any():
-            ax.scatter(d.loc[mask, '_x'], d.loc[mask, '_y'], s=16,
-                       c=color, label=label, edgecolors='none', alpha=0.8)
+        if not mask.any():
+            continue
+        kw = dict(s=16, c=color, label=label, edgecolors='none', alpha=0.8)
+        if mask is cat_ns:
+            scatter_background(ax, d.loc[mask, '_x'], d.loc[mask, '_y'],
+                               mode=params.get('background_mode', 'auto'), **kw)
+        else:
+            ax.scatter(d.loc[mask, '_x'], d.loc[mask, '_y'], **kw)
 
     ax.axhline(-np.log10(p_thr), color='#888888', ls='--', lw=0.7)
     if lfc_thr > 0:
@@ -100,15 +109,7 @@ def render_meta_volcano(ax, df, params):
                                      ha='center', va='center',
                                      bbox=dict(boxstyle='round,pad=0.15', fc='white',
                                                ec='none', alpha=0.7), zorder=500))
-        if texts:
-            try:
-                from adjustText import adjust_text
-                adjust_text(texts, ax=ax,
-                            arrowprops=dict(arrowstyle='-', color='grey', lw=0.5),
-                            expand=(1.15, 1.4), force_text=(0.4, 0.6),
-                            only_move={'text': 'xy'})
-            except ImportError:
-                pass
+        place_labels(ax, texts)
 
     is_term = x_col == 'meta_log2fe_mean'
     ax.set_xlabel(x_labels.get(x_col, "Mean log2 fold change"))
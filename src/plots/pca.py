@@ -7,6 +7,8 @@ PCA는 numpy SVD로 계산(sklearn 불필요). Qt/StandardColumns 비의존 —
 import numpy as np
 import pandas as pd
 
+from plots.label_layout import place_labels
+
 
 def render_pca(fig, df, params):
     """PCA plot을 fig에 그린다. (scores_df, explained_ratio) 반환. 샘플 없으면 None.
@@ -99,20 +101,12 @@ def render_pca(fig, df, params):
                    for g in uniq_groups]
         ax.legend(handles=handles, title='Group', fontsize=8, loc='best', framealpha=0.9)
     if params.get('show_labels', True):
-        # 샘플이 모이면 라벨이 겹치므로 adjustText로 자동 배치 + 리더선
+        # 샘플이 모이면 라벨이 겹치므로 place_labels로 자동 배치 + 리더선
         texts = [ax.text(x, y, lbl, fontsize=8, color='#222', ha='center', va='center',
                          bbox=dict(boxstyle='round,pad=0.2', fc='white', alpha=0.75, ec='none'),
                          zorder=5)
                  for x, y, lbl in zip(xs, ys, sample_cols)]
-        if texts:
-            try:
-                from adjustText import adjust_text
-                adjust_text(texts, ax=ax,
-                            arrowprops=dict(arrowstyle='-', color='grey', lw=0.5),
-                            expand=(1.2, 1.4), force_text=(0.5, 0.7),
-                            only_move={'text': 'xy'})
-            except ImportError:
-                pass
+        place_labels(ax, texts, expand=(1.2, 1.4))
 
     pct_x = explained[xi] * 100 if xi < len(explained) else 0
     pct_y = explained[yi] * 100 if yi < len(explained) else 0
@@ -6,6 +6,9 @@ render_volcano(ax, df, params) 는 화면 다이얼로그(VolcanoPlotWidget._dra
 import numpy as np
 import pandas as pd
 
+from plots.label_layout import place_labels
+from plots.large_scatter import scatter_background
+
 
 def _draw_volcano_labels(ax, df, params):
     """상위 N개(유의성) 또는 커스텀 유전자 이름 레이블."""
@@ -32,7 +35,7 @@ def _draw_volcano_labels(ax, df, params):
         targets = df[df[gene_col].astype(str).str.upper().isin(wanted)]
         if targets.empty:
             return
-    # 각 대상 유전자를 Text로 생성 후 adjustText로 자동 배치(겹침 방지 + 리더선).
+    # 각 대상 유전자를 Text로 생성 후 place_labels로 자동 배치(겹침 방지 + 리더선, 시간 제한).
     texts = []
     for _, row in targets.iterrows():
         texts.append(ax.text(
@@ -41,29 +44,19 @@ def _draw_volcano_labels(ax, df, params):
             bbox=dict(boxstyle='round,pad=0.15', fc='white', ec='none', alpha=0.7),
             zorder=500,
         ))
-    if not texts:
-        return
-    try:
-        from adjustText import adjust_text
-        adjust_text(
-            texts, ax=ax,
-            arrowprops=dict(arrowstyle='-', color='grey', lw=0.5),
-            expand=(1.15, 1.4), force_text=(0.4, 0.6), only_move={'text': 'xy'},
-            max_move=None,
-        )
-    except ImportError:
-        # adjustText 미설치 환경(일부 번들 재현 등) → 라벨은 점 위에 그대로(겹칠 수 있음)
-        pass
+    place_labels(ax, texts)
 
 
-def render_volcano(ax, df, params):
+def render_volcano(ax, df, params, regulation=None):
     """Volcano plot을 ax에 그린다. 분류된 DataFrame(regulation 포함)을 반환.
 
     params 키(= VolcanoPlotWidget.get_plot_params()):
       log2fc_threshold, padj_threshold, up_color/down_color/ns_color(hex), dot_size,
       x_min/x_max/y_min/y_max, annotation_mode/annotation_top_n/annotation_label_size/
       annotation_custom_genes, labels_title/labels_xlabel/labels_ylabel,
-      show_legend/legend_position, show_xticklabels/show_yticklabels
+      show_legend/legend_position, show_xticklabels/show_yticklabels,
+      background_mode('auto'|'vector'|'raster'|'density' — ns 점, plots/large_scatter.py)
+    regulation: 행별 'up'/'down'/'ns' 를 미리 계산해 둔 배열(선택). 주어지면 임계값 분류를 건너뛴다.
     """
     df = df.copy()
     if 'log2FC' not in df.columns or 'padj' not in df.columns:
@@ -80,14 +73,22 @@ def render_volcano(ax, df, params):
 
     padj = pd.to_numeric(df['padj'], errors='coerce')
     df['-log10(padj)'] = -np.log10(padj.replace(0, 1e-300))
-    df['regulation'] = 'ns'
-    df.loc[(df['log2FC'] >= lfc_thr) & (padj <= padj_thr), 'regulation'] = 'up'
-    df.loc[(df['log2FC'] <= -lfc_thr) & (padj <= padj_thr), 'regulation'] = 'down'
+    if regulation is not None:
+        df['regulation'] = np.array(regulation, dtype=object)
+    else:
+        df['regulation'] = 'ns'
+        df.loc[(df['log2FC'] >= lfc_thr) & (padj <= padj_thr), 'regulation'] = 'up'
+        df.loc[(df['log2FC'] <= -lfc_thr) & (padj <= padj_thr), 'regulation'] = 'down'
 
     for reg, color in [('ns', ns_c), ('down', down_c), ('up', up_c)]:
         sub = df[df['regulation'] == reg]
-        ax.scatter(sub['log2FC'], sub['-log10(padj)'], c=color, s=dot, alpha=0.6,
-                   label=f'{reg.upper()} ({len(sub)})', edgecolors='none')
+        kw = dict(c=color, s=dot, alpha=0.6, label=f'{reg.upper()} ({len(sub)})', edgecolors='none')
+        if reg == 'ns':
+            # 비유의 배경은 점이 많으면 래스터/밀도 이미지로 (유의 점은 벡터 마커 유지)
+            scatter_background(ax, sub['log2FC'], sub['-log10(padj)'],
+                               mode=params.get('background_mode', 'auto'), **kw)
+        else:
+            ax.scatter(sub['log2FC'], sub['-log10(padj)'], **kw)
 
     ax.axhline(-np.log10(padj_thr), color='black', linestyle='--', linewidth=1, alpha=0.5)
     ax.axvline(lfc_thr, color='black', linestyle='--', linewidth=1, alpha=0.5)
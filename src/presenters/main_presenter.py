@@ -9,7 +9,7 @@ import logging
 from pathlib import Path
 from typing import Dict, List, Optional
 import pandas as pd
-from PyQt6.QtCore import QObject, pyqtSignal, Qt
+from PyQt6.QtCore import QObject, QThread, pyqtSignal, Qt
 
 from core.fsm import FSM, State, Event
 from core.logger import get_audit_logger
@@ -17,7 +17,9 @@ from models.data_models import Dataset, FilterCriteria, ComparisonResult, Filter
 from models.standard_columns import StandardColumns
 from utils.data_loader import DataLoader
 from utils.statistics import StatisticalAnalyzer
-from gui.workers import DataLoadWorker, FilterWorker, AnalysisWorker
+from utils.load_pipeline import load_dataset_file
+from utils.identifier_index import select_identifiers
+from gui.workers import DataLoadWorker, DatabaseLoadWorker, FilterWorker, AnalysisWorker
 
 
 class MainPresenter(QObject):
@@ -30,6 +32,8 @@ class MainPresenter(QObject):
     
     # Signals
     dataset_loaded = pyqtSignal(str, Dataset)  # dataset_name, dataset
+    database_dataset_ready = pyqtSignal(int, str, Dataset)  # batch_id, db_dataset_id, dataset (다중 DB 로드 중 1건 완료)
+    database_load_finished = pyqtSignal(int, int, int)  # batch_id, loaded, requested
     filter_completed = pyqtSignal(pd.DataFrame, str)  # filtered_data, tab_name
     analysis_completed = pyqtSignal(dict, str)  # result, analysis_type
     comparison_completed = pyqtSignal(ComparisonResult)
@@ -64,6 +68,15 @@ class MainPresenter(QObject):
         
         # Worker 참조 (비동기 작업)
         self.active_workers: List[QObject] = []
+        
+        # 백그라운드 데이터 로딩 풀 (동시 실행 한도 + 대기열)
+        self.max_concurrent_loads = max(1, min(4, QThread.idealThreadCount()))
+        self._load_queue: List[tuple] = []  # (file_path, name, start_time)
+        self._load_workers: List[QThread] = []  # DataLoadWorker / DatabaseLoadWorker
+        self._load_progress: Dict[QThread, int] = {}
+        self._batch_loaded_count = 0
+        self._load_cancelled = False
+        self._db_batch_seq = 0  # DB 로드 배치 식별자 (동시에 여러 배치 가능)
     
     def _register_fsm_callbacks(self):
         """FSM 상태 진입/이탈 콜백 등록"""
@@ -97,25 +110,35 @@ class MainPresenter(QObject):
         self.logger.error(f"Error state: {error_msg}")
         self.error_occurred.emit(error_msg)
     
-    def load_dataset(self, file_path: Path, dataset_name: Optional[str] = None, custom_name: Optional[str] = None):
+    def load_dataset(self, file_path: Path, dataset_name: Optional[str] = None,
+                     custom_name: Optional[str] = None, background: bool = True):
         """
         데이터셋 로드 (비동기)
         
+        파싱 / 타입 감지 / 컬럼 표준화는 DataLoadWorker 에서 실행되고, 완료되면
+        dataset_loaded 시그널로 전달됩니다. 동시에 최대 max_concurrent_loads 개까지
+        로드하며 나머지는 대기열에서 순서대로 시작합니다.
+        
         Args:
             file_path: Excel / CSV / Parquet 파일 경로
             dataset_name: 데이터셋 이름 (None이면 파일명 사용) - deprecated, use custom_name
             custom_name: 사용자 지정 이름 (우선순위 최상위)
+            background: False면 현재 스레드에서 즉시 로드 (프로젝트 복원 등 순서 의존 경로)
         """
         import time
         start_time = time.time()
         
         # custom_name이 있으면 우선 사용
         final_name = custom_name or dataset_name
+        file_path = Path(file_path)
         
-        # 상태 전환
-        if not self.fsm.trigger(Event.LOAD_DATA):
-            self.logger.warning("Cannot load data in current state")
-            return
+        # 상태 전환 (다른 파일이 로딩 중이면 같은 LOADING_DATA 상태에 합류)
+        if self.fsm.current_state != State.LOADING_DATA:
+            if not self.fsm.trigger(Event.LOAD_DATA):
+                self.logger.warning("Cannot load data in current state")
+                return
+            self._batch_loaded_count = 0
+            self._load_cancelled = False
         
         # Audit log
         self.audit_logger.log_action(
@@ -123,93 +146,187 @@ class MainPresenter(QObject):
             details={'file': str(file_path), 'name': final_name or file_path.stem}
         )
         
+        if background:
+            self._load_queue.append((file_path, final_name, start_time))
+            self._start_queued_loads()
+            return
+        
         try:
-            file_path = Path(file_path)
-            suffix = file_path.suffix.lower()
-
-            # ── CSV / Parquet: chromVAR diff TF 감지 ─────────────────────────
-            if suffix in ('.csv', '.parquet'):
-                from utils.chromvar_loader import ChromVARLoader
-                if ChromVARLoader.is_chromvar_file(file_path):
-                    dataset = ChromVARLoader().load(file_path, final_name or file_path.stem)
-                    self._store_and_signal_dataset(dataset, start_time)
-                    return
-
-            # ── TXT / TSV: Motif enrichment 또는 TF Footprint 파일 감지 ────────
-            if suffix in ('.txt', '.tsv'):
-                from utils.footprint_loader import FootprintLoader
-                if FootprintLoader.is_footprint_file(file_path):
-                    dataset = FootprintLoader().load(file_path, final_name or file_path.stem)
-                    self._store_and_signal_dataset(dataset, start_time)
-                    return
-                from utils.motif_loader import MotifLoader
-                if MotifLoader.is_motif_file(file_path):
-                    dataset = MotifLoader().load(file_path, final_name or file_path.stem)
-                    self._store_and_signal_dataset(dataset, start_time)
-                    return
-
-            # ── CSV / Parquet: ATAC / MultiGroup 빠른 감지 ───────────────────
-            if suffix in ('.csv', '.parquet'):
-                try:
-                    import pandas as pd
-                    peek = pd.read_csv(file_path, nrows=5) if suffix == '.csv' \
-                           else pd.read_parquet(file_path)
-
-                    from utils.atac_seq_loader import ATACSeqLoader
-                    if ATACSeqLoader.is_atac_dataframe(peek):
-                        loader = ATACSeqLoader()
-                        dataset = loader.load(file_path, final_name or file_path.stem)
-                        self._store_and_signal_dataset(dataset, start_time)
-                        return
-
-                    from utils.multi_group_loader import MultiGroupLoader
-                    if MultiGroupLoader.is_multi_group_dataframe(peek):
-                        loader = MultiGroupLoader()
-                        dataset = loader.load(file_path, final_name or file_path.stem)
-                        self._store_and_signal_dataset(dataset, start_time)
-                        return
-                except Exception as e:
-                    self.logger.warning(f"Quick detection failed: {e}, falling through")
-
-            # ── Excel: GO/KEGG 또는 DE 감지 ──────────────────────────────────
-            try:
-                test_df = pd.read_excel(file_path, nrows=10)
-                detected_type = self.data_loader._detect_dataset_type(test_df)
-                self.logger.debug(f"Quick type detection: {detected_type.value}")
-                
-                if detected_type == DatasetType.GO_ANALYSIS:
-                    from utils.go_kegg_loader import GOKEGGLoader
-                    loader = GOKEGGLoader()
-                    dataset = loader.load_from_excel(file_path, final_name or file_path.stem)
-                    self._store_and_signal_dataset(dataset, start_time)
-                    return
-            except Exception as e:
-                self.logger.warning(f"Quick type detection failed: {e}, using standard loader")
-            
-            # ── 기본: DE 데이터셋 로더 ────────────────────────────────────────
-            def column_mapper_callback(df, dataset_type, auto_mapping):
-                from gui.column_mapper_dialog import ColumnMapperDialog
-                dialog = ColumnMapperDialog(df, dataset_type, auto_mapping, self.view)
-                if dialog.exec():
-                    mapping = dialog.get_mapping()
-                    if dialog.should_save_mapping():
-                        self.data_loader.save_custom_mapping(dataset_type, mapping)
-                        self.logger.debug("User mapping saved for future use")
-                    return mapping
-                return None
-            
-            dataset = self.data_loader.load_from_excel(
+            dataset = load_dataset_file(
                 file_path,
                 final_name,
-                column_mapper_callback=column_mapper_callback
+                data_loader=self.data_loader,
+                column_mapper_callback=self._show_column_mapper,
             )
             self._store_and_signal_dataset(dataset, start_time)
             
         except Exception as e:
             self.logger.error(f"Failed to load dataset: {e}", exc_info=True)
-            self.fsm.trigger(Event.DATA_LOAD_FAILED)
+            self._finish_loading_state()
             self.error_occurred.emit(f"Failed to load dataset: {str(e)}")
 
+    def load_database_datasets(self, db_manager, dataset_ids: List[str]) -> Optional[int]:
+        """
+        데이터베이스 데이터셋 여러 개를 백그라운드에서 병렬 로드 (비동기)
+        
+        하나가 끝날 때마다 database_dataset_ready 로 전달되고, 전부 끝나면
+        database_load_finished(batch_id, loaded, requested) 가 방출됩니다.
+        cancel_loading() 으로 남은 로드를 취소할 수 있습니다.
+        
+        Returns:
+            두 시그널에 함께 실려 오는 배치 ID (로드를 시작하지 못하면 None)
+        """
+        if not dataset_ids:
+            return None
+        
+        # ERROR 상태에서도 DB 로드는 허용 (ERROR → IDLE → LOADING_DATA)
+        if self.fsm.current_state == State.ERROR:
+            self.fsm.trigger(Event.RESET)
+        if self.fsm.current_state != State.LOADING_DATA:
+            if not self.fsm.trigger(Event.LOAD_DATA):
+                self.logger.warning("Cannot load data in current state")
+                return None
+            self._batch_loaded_count = 0
+            self._load_cancelled = False
+        
+        self.audit_logger.log_action(
+            "Load Database Datasets",
+            details={'count': len(dataset_ids)}
+        )
+        
+        worker = DatabaseLoadWorker(db_manager, dataset_ids)
+        worker.requested_count = len(dataset_ids)
+        self._db_batch_seq += 1
+        worker.batch_id = self._db_batch_seq
+        worker.progress.connect(self._on_load_worker_progress)
+        worker.dataset_ready.connect(self._on_db_load_dataset_ready)
+        worker.finished.connect(self._on_db_load_finished)
+        worker.error.connect(self._on_load_worker_error)
+        self._load_workers.append(worker)
+        self._load_progress[worker] = 0
+        worker.start()
+        return worker.batch_id
+
+    def _on_db_load_dataset_ready(self, dataset_id: str, dataset):
+        if dataset is None or dataset.dataframe is None:
+            self.logger.warning(f"Failed to load dataset from database: {dataset_id}")
+            return
+        self._batch_loaded_count += 1
+        self.database_dataset_ready.emit(self.sender().batch_id, dataset_id, dataset)
+
+    def _on_db_load_finished(self, loaded: int):
+        worker = self.sender()
+        batch_id = worker.batch_id
+        requested = getattr(worker, 'requested_count', loaded)
+        self._release_load_worker(worker)
+        self._finish_loading_state()
+        self.database_load_finished.emit(batch_id, loaded, requested)
+
+    def _show_column_mapper(self, df, dataset_type, auto_mapping):
+        """자동 매핑 실패 시 컬럼 매핑 다이얼로그 (GUI 스레드 전용)"""
+        from gui.column_mapper_dialog import ColumnMapperDialog
+        dialog = ColumnMapperDialog(df, dataset_type, auto_mapping, self.view)
+        if dialog.exec():
+            mapping = dialog.get_mapping()
+            if dialog.should_save_mapping():
+                self.data_loader.save_custom_mapping(dataset_type, mapping)
+                self.logger.debug("User mapping saved for future use")
+            return mapping
+        return None
+
+    # ── 백그라운드 로딩 풀 ──────────────────────────────────────────────
+
+    def _start_queued_loads(self):
+        """대기열의 로드를 동시 실행 한도까지 시작"""
+        while self._load_queue and len(self._load_workers) < self.max_concurrent_loads:
+            file_path, final_name, start_time = self._load_queue.pop(0)
+            worker = DataLoadWorker(file_path, final_name, data_loader=self.data_loader)
+            worker.start_time = start_time
+            # 시그널은 worker 스레드에서 방출되므로 반드시 presenter 메서드(큐 연결)로 받는다
+            worker.progress.connect(self._on_load_worker_progress)
+            worker.finished.connect(self._on_load_worker_finished)
+            worker.error.connect(self._on_load_worker_error)
+            worker.cancelled.connect(self._on_load_worker_cancelled)
+            worker.mapping_requested.connect(self._on_load_worker_mapping_requested)
+            self._load_workers.append(worker)
+            self._load_progress[worker] = 0
+            self.logger.debug(f"Background load started: {file_path.name}")
+            worker.start()
+
+    def _release_load_worker(self, worker: QThread):
+        """완료된 worker 정리 후 대기열 다음 항목 시작"""
+        if worker in self._load_workers:
+            self._load_workers.remove(worker)
+        self._load_progress.pop(worker, None)
+        worker.wait()  # 시그널 방출 직후라 즉시 반환
+        worker.deleteLater()
+        self._start_queued_loads()
+
+    def is_loading(self) -> bool:
+        """실행 중이거나 대기 중인 로드가 있는지"""
+        return bool(self._load_workers or self._load_queue)
+
+    def cancel_loading(self):
+        """대기 중인 로드는 버리고, 실행 중인 로드는 취소 요청"""
+        dropped = len(self._load_queue)
+        self._load_queue.clear()
+        self._load_cancelled = True
+        for worker in list(self._load_workers):
+            worker.cancel()
+        self.logger.info(
+            f"Loading cancelled ({len(self._load_workers)} running, {dropped} queued)"
+        )
+        if not self._load_workers:
+            self._finish_loading_state()
+
+    def _finish_loading_state(self):
+        """모든 로드가 끝났을 때만 FSM 을 LOADING_DATA 에서 빠져나오게 함"""
+        if self.is_loading() or self.fsm.current_state != State.LOADING_DATA:
+            return
+        if self._batch_loaded_count > 0:
+            self.fsm.trigger(Event.DATA_LOAD_SUCCESS)
+        elif self._load_cancelled:
+            # 사용자 취소는 실패가 아님: 이전에 로드된 데이터셋이 있으면 DATA_LOADED 로 복귀
+            if self.datasets:
+                self.fsm.trigger(Event.DATA_LOAD_SUCCESS)
+            else:
+                self.fsm.trigger(Event.LOAD_CANCELLED)
+        else:
+            self.fsm.trigger(Event.DATA_LOAD_FAILED)
+
+    def _on_load_worker_progress(self, value: int):
+        worker = self.sender()
+        if worker in self._load_progress:
+            self._load_progress[worker] = value
+        if self._load_progress:
+            self.progress_updated.emit(
+                int(sum(self._load_progress.values()) / len(self._load_progress))
+            )
+
+    def _on_load_worker_finished(self, dataset: Dataset):
+        worker = self.sender()
+        start_time = getattr(worker, 'start_time', None)
+        self._release_load_worker(worker)
+        import time
+        self._store_and_signal_dataset(dataset, start_time or time.time())
+
+    def _on_load_worker_error(self, message: str):
+        worker = self.sender()
+        file_path = getattr(worker, 'file_path', None)
+        file_name = file_path.name if file_path is not None else ''
+        self._release_load_worker(worker)
+        self._finish_loading_state()
+        self.error_occurred.emit(f"Failed to load dataset {file_name}: {message}")
+
+    def _on_load_worker_cancelled(self):
+        self._release_load_worker(self.sender())
+        self._finish_loading_state()
+
+    def _on_load_worker_mapping_requested(self, df, dataset_type, auto_mapping):
+        worker = self.sender()
+        mapping = self._show_column_mapper(df, dataset_type, auto_mapping)
+        worker.provide_mapping(mapping)
+
     def _store_and_signal_dataset(self, dataset: Dataset, start_time: float):
         """데이터셋 저장, 상태 전환, Signal 방출 공통 처리"""
         import time
@@ -218,7 +335,8 @@ class MainPresenter(QObject):
         self.datasets[unique_name] = dataset
         self.current_dataset = dataset
         
-        self.fsm.trigger(Event.DATA_LOAD_SUCCESS)
+        self._batch_loaded_count += 1
+        self._finish_loading_state()
         self.dataset_loaded.emit(dataset.name, dataset)
         self._update_view_with_dataset(dataset)
         self.view._update_comparison_panel_datasets()
@@ -578,18 +696,8 @@ class MainPresenter(QObject):
             self.logger.error(f"Available columns: {df.columns.tolist()}")
             raise ValueError(f"Neither '{StandardColumns.SYMBOL}' nor 'gene_symbol' nor '{StandardColumns.GENE_ID}' column found in dataset")
         
-        # gene_list 입력 순서를 정렬 키로 사용
-        gene_order = {g.strip().lower(): i for i, g in enumerate(gene_list)}
-
-        # 대소문자 무시 매칭 후 sort_key 부여
-        mask = df[gene_col].astype(str).str.strip().str.lower().isin(gene_order)
-        filtered = (
-            df[mask]
-            .assign(_sort_key=df.loc[mask, gene_col].astype(str).str.strip().str.lower().map(gene_order))
-            .sort_values('_sort_key')
-            .drop(columns='_sort_key')
-            .copy()
-        )
+        # 데이터셋 식별자 인덱스로 대소문자 무시 hash 조회 (gene_list 입력 순서 유지)
+        filtered = select_identifiers(df, gene_col, gene_list, dataset=self.current_dataset).copy()
         
         self.logger.info(
             f"Gene list filter: {len(filtered)}/{len(df)} rows matched, "
@@ -612,7 +720,7 @@ class MainPresenter(QObject):
         Returns:
             매칭된 GO term rows (gene_symbols 히트 수 내림차순 정렬)
         """
-        import re
+        from utils.gene_sets import frame_gene_term_index
 
         gs_col = StandardColumns.GENE_SYMBOLS
         if gs_col not in df.columns:
@@ -622,17 +730,11 @@ class MainPresenter(QObject):
                 "데이터를 다시 불러오거나 컬럼 매핑을 확인하세요."
             )
 
-        query_set = {g.upper() for g in gene_list if g.strip()}
+        query_set = {g.strip().upper() for g in gene_list if g.strip()}
 
-        def count_hits(cell_value) -> int:
-            """gene_symbols 셀에서 query_set에 속하는 유전자 수 반환"""
-            if not isinstance(cell_value, str) or not cell_value.strip():
-                return 0
-            # 쉼표, 슬래시, 세미콜론, 공백 등 구분자로 분리
-            symbols = {s.strip().upper() for s in re.split(r'[,;/\s]+', cell_value) if s.strip()}
-            return len(symbols & query_set)
-
-        hit_counts = df[gs_col].apply(count_hits)
+        # 데이터셋별 gene → term 역색인 (쉼표/슬래시/세미콜론/공백 분리, 대문자) 조회 후 합산
+        index = frame_gene_term_index(df, gs_col, self.current_dataset)
+        hit_counts = pd.Series(index.match_counts(query_set), index=df.index)
         mask = hit_counts > 0
         filtered = df[mask].copy()
         filtered['_hit_count'] = hit_counts[mask]
@@ -667,20 +769,13 @@ class MainPresenter(QObject):
                 "데이터를 다시 불러오거나 컬럼 매핑을 확인하세요."
             )
 
-        # 입력 순서를 정렬 키로 사용
-        id_order = {tid.strip().upper(): i for i, tid in enumerate(term_id_list) if tid.strip()}
-        mask = df[tid_col].astype(str).str.strip().str.upper().isin(id_order)
-        filtered = (
-            df[mask]
-            .assign(_sort_key=df.loc[mask, tid_col].astype(str).str.strip().str.upper().map(id_order))
-            .sort_values('_sort_key')
-            .drop(columns='_sort_key')
-            .copy()
-        )
+        # 입력 순서 유지, 대소문자 무시 (데이터셋 식별자 인덱스 조회)
+        filtered = select_identifiers(df, tid_col, term_id_list, dataset=self.current_dataset).copy()
+        n_queries = len({tid.strip().upper() for tid in term_id_list if tid.strip()})
 
         self.logger.info(
             f"GO term-id filter: {len(filtered)}/{len(df)} terms matched "
-            f"({len(id_order)} query IDs)"
+            f"({n_queries} query IDs)"
         )
         return filtered
 
@@ -717,13 +812,9 @@ class MainPresenter(QObject):
                 self.logger.error(f"Available columns: {df.columns.tolist()}")
                 raise ValueError(f"Required columns not found: {adj_pval_col}, {log2fc_col}")
             
-            mask = (df[adj_pval_col] <= adj_pvalue_max) & (abs(df[log2fc_col]) >= log2fc_min)
-            filtered = df[mask]
-
-            if regulation_direction == "up":
-                filtered = filtered[filtered[log2fc_col] > 0]
-            elif regulation_direction == "down":
-                filtered = filtered[filtered[log2fc_col] < 0]
+            # 임계값별 마스크는 데이터셋 significance index 가 memo (슬라이더 왕복 시 재사용)
+            index = self.current_dataset.significance_index(log2fc_col, adj_pval_col)
+            filtered = df[index.mask(adj_pvalue_max, log2fc_min, regulation_direction)]
 
             self.logger.info(
                 f"Statistical filter (DE): {len(filtered)}/{len(df)} rows "
@@ -830,10 +921,13 @@ class MainPresenter(QObject):
         """
         df = self.current_dataset.dataframe.copy()
 
-        # 통계 필터
-        if 'adj_pvalue' in df.columns:
+        # 통계 필터 (둘 다 있으면 데이터셋 significance index 의 memo 마스크)
+        if 'adj_pvalue' in df.columns and 'log2fc' in df.columns:
+            index = self.current_dataset.significance_index('log2fc', 'adj_pvalue')
+            df = df[index.mask(adj_pvalue_max, log2fc_min, regulation_direction)]
+        elif 'adj_pvalue' in df.columns:
             df = df[df['adj_pvalue'] <= adj_pvalue_max]
-        if 'log2fc' in df.columns:
+        elif 'log2fc' in df.columns:
             df = df[df['log2fc'].abs() >= log2fc_min]
             if regulation_direction == "up":
                 df = df[df['log2fc'] > 0]
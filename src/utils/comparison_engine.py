@@ -0,0 +1,462 @@
+"""
+Wide-format Dataset Comparison Engine
+
+MainWindow 의 Gene List / Statistics 비교가 만들던 wide 테이블
+(gene_id, symbol, [Status, Found_in, meta_*], {ds}_log2FC, {ds}_padj, {ds}_regulation)을
+유전자 × 데이터셋 이중 루프 대신 정규 키(symbol 우선, 없으면 gene_id) 기준
+reindex 로 한 번에 만듭니다. Qt 에 의존하지 않으므로 QThread worker 에서 실행합니다.
+
+Usage:
+    result_df = build_gene_list_comparison(datasets, gene_list)
+    result_df, dataset_genes = build_comparison('statistics', datasets,
+                                                log2fc_min=1.0, adj_pvalue_max=0.05)
+"""
+
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.identifier_index import normalize_identifier
+
+
+logger = logging.getLogger(__name__)
+
+# 데이터셋마다 다른 통계 컬럼명 (앞쪽 우선)
+LFC_COLUMNS = ('log2FC', 'log2fc', 'log2FoldChange', 'Log2FoldChange')
+PADJ_COLUMNS = ('padj', 'adj_pvalue', 'Padj')
+PVALUE_COLUMNS = ('pvalue', 'p_value', 'pval', 'PValue', 'P.Value') + PADJ_COLUMNS
+SE_COLUMNS = ('lfcse', 'lfcSE', 'lfc_se', 'stderr', 'se', 'SE')
+
+META_COLUMNS = ['meta_pvalue_fisher', 'meta_fdr_fisher', 'meta_pvalue_stouffer',
+                'meta_log2fc_mean', 'meta_direction', 'meta_found_in',
+                'meta_effect_log2fc', 'meta_effect_se', 'meta_ci_low', 'meta_ci_high',
+                'meta_pvalue_re', 'meta_i2']
+
+
+def _first_column(df: pd.DataFrame, candidates: Sequence[str]) -> Optional[str]:
+    return next((c for c in candidates if c in df.columns), None)
+
+
+def _identifier_strings(values: pd.Series) -> pd.Series:
+    """식별자 컬럼 → 문자열 (결측은 '')."""
+    return values.astype(object).where(values.notna(), '').astype(str)
+
+
+def comparison_frame(df: pd.DataFrame) -> Optional[Tuple[pd.DataFrame, pd.Series]]:
+    """
+    데이터셋 DataFrame → 비교용 표준 프레임과 데이터셋 유전자 키.
+
+    Returns:
+        (frame, keys) 또는 식별자 컬럼이 없으면 None.
+        frame: gene_id, symbol, identifier, log2FC, padj, (regulation) — RangeIndex
+        keys : Common/Unique 판정에 쓰는 식별자 컬럼 값 (symbol 우선, 문자열, 결측 제외)
+
+    symbol 만 있고 값이 Ensembl ID(ENSG/ENSMUSG) 패턴이면 gene_id 로 취급한다.
+    """
+    if 'gene_id' in df.columns and 'symbol' in df.columns:
+        gene_id, symbol = df['gene_id'], df['symbol']
+        keys = df['symbol']
+    elif 'symbol' in df.columns:
+        first_value = str(df['symbol'].iloc[0]) if not df.empty else ''
+        if first_value.startswith('ENSMUSG') or first_value.startswith('ENSG'):
+            gene_id, symbol = df['symbol'], pd.Series('', index=df.index)
+        else:
+            gene_id, symbol = pd.Series('', index=df.index), df['symbol']
+        keys = df['symbol']
+    elif 'gene_id' in df.columns:
+        gene_id, symbol = df['gene_id'], pd.Series('', index=df.index)
+        keys = df['gene_id']
+    else:
+        return None
+
+    frame = pd.DataFrame({
+        'gene_id': _identifier_strings(gene_id).to_numpy(),
+        'symbol': _identifier_strings(symbol).to_numpy(),
+    })
+    # 실제로 값이 있는 쪽을 식별자로 (symbol 우선)
+    frame['identifier'] = frame['symbol'].where(frame['symbol'] != '', frame['gene_id'])
+
+    lfc_col = _first_column(df, LFC_COLUMNS)
+    padj_col = _first_column(df, PADJ_COLUMNS)
+    if lfc_col is not None:
+        frame['log2FC'] = df[lfc_col].to_numpy()
+    if padj_col is not None:
+        frame['padj'] = df[padj_col].to_numpy()
+    if 'regulation' in df.columns:
+        frame['regulation'] = df['regulation'].to_numpy()
+    keys = _identifier_strings(keys)
+    return frame, keys[keys != '']
+
+
+def _gene_mapping(frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """모든 데이터셋에서 identifier 별 첫 등장 (gene_id, symbol) — 데이터셋 순서, 행 순서."""
+    stacked = pd.concat([f[['identifier', 'gene_id', 'symbol']] for f in frames.values()],
+                        ignore_index=True)
+    stacked = stacked[stacked['identifier'] != '']
+    return stacked.drop_duplicates('identifier', keep='first').reset_index(drop=True)
+
+
+def _dataset_values(mapping: pd.DataFrame, frame: pd.DataFrame, name: str) -> pd.DataFrame:
+    """
+    mapping 의 각 유전자에 대한 한 데이터셋의 log2FC / padj / regulation.
+
+    symbol 이 있으면 symbol 로, 없으면 gene_id 로 그 데이터셋의 첫 행을 찾는다.
+    """
+    value_cols = [c for c in ('log2FC', 'padj', 'regulation') if c in frame.columns]
+    by_symbol = (frame[frame['symbol'] != ''].drop_duplicates('symbol')
+                 .set_index('symbol')[value_cols].reindex(mapping['symbol']))
+    by_gene_id = (frame[frame['gene_id'] != ''].drop_duplicates('gene_id')
+                  .set_index('gene_id')[value_cols].reindex(mapping['gene_id']))
+    use_symbol = (mapping['symbol'] != '').to_numpy()
+
+    out = pd.DataFrame(index=mapping.index)
+    for col in ('log2FC', 'padj'):
+        if col in value_cols:
+            out[f'{name}_{col}'] = np.where(use_symbol, by_symbol[col].to_numpy(),
+                                            by_gene_id[col].to_numpy())
+        else:
+            out[f'{name}_{col}'] = np.nan
+    if 'regulation' in value_cols:
+        out[f'{name}_regulation'] = np.where(use_symbol, by_symbol['regulation'].to_numpy(dtype=object),
+                                             by_gene_id['regulation'].to_numpy(dtype=object))
+    return out
+
+
+def _wide_values(mapping: pd.DataFrame, frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    parts = [_dataset_values(mapping, frame, name) for name, frame in frames.items()]
+    return pd.concat(parts, axis=1) if parts else pd.DataFrame(index=mapping.index)
+
+
+def build_gene_list_comparison(datasets: Sequence, gene_list: List[str]) -> pd.DataFrame:
+    """
+    유전자 리스트 비교 wide 테이블 (gene_list 입력 순서, 대소문자 무시).
+
+    Columns: gene_id, symbol, {ds}_log2FC, {ds}_padj, [{ds}_regulation] ...
+    일치하는 유전자가 없으면 빈 DataFrame.
+    """
+    frames: Dict[str, pd.DataFrame] = {}
+    for dataset in datasets:
+        df = dataset.dataframe
+        positions = None
+        for col in ('symbol', 'gene_id'):
+            if col in df.columns:
+                positions = dataset.identifier_index(col).positions(gene_list)
+                break
+        if positions is None:
+            logger.warning(f"No gene identifier column found in dataset: {dataset.name}")
+            continue
+        if len(positions) == 0:
+            logger.warning(f"No matching genes found in dataset: {dataset.name}")
+            continue
+        extracted = comparison_frame(df.iloc[positions])
+        if extracted is not None:
+            frames[dataset.name] = extracted[0]
+
+    if not frames:
+        return pd.DataFrame()
+
+    mapping = _gene_mapping(frames)
+
+    # gene_list 입력 순서 → 각 입력과 (대소문자 무시) 처음 일치하는 identifier, 나머지는 뒤에
+    first_by_key = {}
+    for position, key in enumerate(mapping['identifier'].map(normalize_identifier)):
+        first_by_key.setdefault(key, position)
+    ordered, seen = [], set()
+    for gene in gene_list:
+        position = first_by_key.get(normalize_identifier(gene))
+        if position is not None and position not in seen:
+            ordered.append(position)
+            seen.add(position)
+    ordered.extend(p for p in range(len(mapping)) if p not in seen)
+    mapping = mapping.iloc[ordered].reset_index(drop=True)
+
+    result_df = pd.concat([mapping[['gene_id', 'symbol']], _wide_values(mapping, frames)], axis=1)
+    logger.info(f"Gene list comparison: {len(result_df)} genes across {len(frames)} datasets")
+    return result_df
+
+
+class GeneStatsLookup:
+    """
+    필터 이전 전체 df의 유전자 식별자 → (log2fc, pvalue, lfcSE) 열 단위 조회표.
+
+    메타 분석은 '유의한 데이터셋'만이 아니라 유전자가 검정된 모든 데이터셋의
+    통계를 결합해야 편향이 없으므로, 필터링 이전 전체 데이터를 사용한다.
+    Fisher/Stouffer 결합은 study 내에서 보정된 padj가 아니라 raw p-value로 하는
+    것이 정석이므로 raw pvalue를 우선 사용(없으면 padj로 폴백)한다.
+    SE(lfcSE)는 random-effects 효과크기 결합(M5)용이며, 없으면 NaN(해당 연구 제외).
+    symbol과 gene_id 양쪽을 키로 등록(행 순서, 한 행에선 symbol 먼저 — 첫 등장 우선)해
+    데이터셋 간 식별자 표기가 달라도 매칭되도록 한다.
+
+    Dataset.gene_stats() 가 데이터셋별로 캐시하므로 같은 데이터셋을 반복 비교해도
+    다시 만들지 않는다.
+    """
+
+    def __init__(self, df: Optional[pd.DataFrame]):
+        n = 0 if df is None else len(df)
+        lfc_col = p_col = None
+        if n:
+            lfc_col = _first_column(df, LFC_COLUMNS)
+            # raw p-value 우선, 없으면 adjusted p-value 폴백
+            p_col = _first_column(df, PVALUE_COLUMNS)
+        if lfc_col is None or p_col is None:
+            self.log2fc = self.pvalue = self.se = np.empty(0)
+            self._keys, self._rows = pd.Index([], dtype=object), np.empty(0, dtype=np.intp)
+            return
+
+        se_col = _first_column(df, SE_COLUMNS)
+        self.log2fc = pd.to_numeric(df[lfc_col], errors='coerce').to_numpy(dtype=float)
+        self.pvalue = pd.to_numeric(df[p_col], errors='coerce').to_numpy(dtype=float)
+        self.se = (pd.to_numeric(df[se_col], errors='coerce').to_numpy(dtype=float)
+                   if se_col else np.full(n, np.nan))
+
+        # 키 후보: 행마다 (symbol, gene_id) 순서로 펼침 → 결측/빈 값 제외 → 첫 등장만
+        empty = np.full(n, '', dtype=object)
+        sym = _identifier_strings(df['symbol']).to_numpy() if 'symbol' in df.columns else empty
+        gid = _identifier_strings(df['gene_id']).to_numpy() if 'gene_id' in df.columns else empty
+        keys = np.column_stack([sym, gid]).ravel()
+        rows = np.repeat(np.arange(n, dtype=np.intp), 2)
+        usable = (keys != '') & (keys != 'nan')
+        keys, rows = pd.Index(keys[usable]), rows[usable]
+        first = ~keys.duplicated(keep='first')
+        self._keys, self._rows = keys[first], rows[first]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def positions(self, keys) -> np.ndarray:
+        """키별 행 위치 (없으면 -1)."""
+        found = self._keys.get_indexer(pd.Index(keys, dtype=object))
+        if not len(self._rows):
+            return found
+        return np.where(found >= 0, self._rows[np.maximum(found, 0)], -1)
+
+    def take(self, symbols, gene_ids) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (symbol, gene_id) 쌍별 (log2fc, pvalue, SE) 배열 — symbol 이 있으면 symbol, 없으면 gene_id.
+        조회되지 않는 유전자는 NaN.
+        """
+        pos = self.positions(symbols)
+        missing = pos < 0
+        if missing.any():
+            pos[missing] = self.positions(np.asarray(gene_ids, dtype=object)[missing])
+        hit = pos >= 0
+        out = []
+        for values in (self.log2fc, self.pvalue, self.se):
+            column = np.full(len(pos), np.nan)
+            column[hit] = values[pos[hit]]
+            out.append(column)
+        return tuple(out)
+
+
+def _meta_statistics(mapping: pd.DataFrame, datasets: Sequence) -> pd.DataFrame:
+    """
+    유전자별로 검정된 모든 데이터셋의 (log2fc, pvalue, SE) 를 결합한 메타 통계.
+
+    유전자 × 데이터셋 행렬(미검정 = NaN)을 만들어 meta_analysis_matrix 로 한 번에 계산한다.
+    유효 데이터셋이 2개 미만인 유전자는 빈 값이며, 모든 유전자가 그렇다면 컬럼을 만들지 않는다.
+    """
+    from utils.meta_stats import meta_analysis_matrix
+
+    shape = (len(mapping), len(datasets))
+    pvals, lfcs, ses = np.full(shape, np.nan), np.full(shape, np.nan), np.full(shape, np.nan)
+    symbols, gene_ids = mapping['symbol'].to_numpy(), mapping['gene_id'].to_numpy()
+    for j, ds in enumerate(datasets):
+        lfcs[:, j], pvals[:, j], ses[:, j] = ds.gene_stats().take(symbols, gene_ids)
+
+    meta = meta_analysis_matrix(pvals, lfcs, ses)
+    out = pd.DataFrame(index=mapping.index)
+    # ① p-value 결합 (Fisher/Stouffer)
+    combined = meta['meta_found_in'] > 0
+    if combined.any():
+        for key in ('meta_pvalue_fisher', 'meta_fdr_fisher', 'meta_pvalue_stouffer',
+                    'meta_log2fc_mean', 'meta_direction'):
+            out[key] = meta[key]
+        out['meta_found_in'] = pd.Series(
+            [f"{k}/{len(datasets)}" for k in meta['meta_found_in']], index=mapping.index
+        ).where(combined)
+    # ② 효과크기 결합 (random-effects, lfcSE 있을 때만)
+    if (meta['meta_effect_k'] > 0).any():
+        for key in ('meta_effect_log2fc', 'meta_effect_se', 'meta_ci_low', 'meta_ci_high',
+                    'meta_pvalue_re', 'meta_i2'):
+            out[key] = meta[key]
+    return out
+
+
+def _filter_significant(df: pd.DataFrame, log2fc_min: float, adj_pvalue_max: float) -> pd.DataFrame:
+    lfc_col = _first_column(df, LFC_COLUMNS)
+    if lfc_col is not None:
+        df = df[abs(df[lfc_col]) >= log2fc_min]
+    padj_col = _first_column(df, PADJ_COLUMNS)
+    if padj_col is not None:
+        df = df[df[padj_col] <= adj_pvalue_max]
+    return df
+
+
+def build_statistics_comparison(datasets: Sequence, log2fc_min: float, adj_pvalue_max: float,
+                                common_only: bool = False, include_unique: bool = True
+                                ) -> Tuple[pd.DataFrame, Dict[str, set]]:
+    """
+    통계 필터 비교 wide 테이블 (Common/Unique, 메타 통계 포함).
+
+    Args:
+        datasets: 비교할 DE Dataset 목록
+        log2fc_min / adj_pvalue_max: 데이터셋별 유의 유전자 기준
+        common_only: 모든 데이터셋에 공통인 유전자만
+        include_unique: False 면 common_only 와 같음
+
+    Returns:
+        (result_df, dataset_genes) — dataset_genes 는 데이터셋별 유의 유전자 키 집합.
+        통과한 유전자가 없으면 (빈 DataFrame, {}).
+    """
+    frames: Dict[str, pd.DataFrame] = {}
+    dataset_genes: Dict[str, set] = {}
+    for dataset in datasets:
+        df = _filter_significant(dataset.dataframe, log2fc_min, adj_pvalue_max)
+        if df.empty:
+            logger.warning(f"No genes passed statistical criteria in dataset: {dataset.name}")
+            continue
+        extracted = comparison_frame(df)
+        if extracted is None:
+            logger.warning(f"No gene identifier found in dataset: {dataset.name}")
+            continue
+        frames[dataset.name], keys = extracted
+        dataset_genes[dataset.name] = set(keys.unique())
+        logger.info(f"Found {len(df)} DEGs ({len(dataset_genes[dataset.name])} unique genes) "
+                    f"in dataset: {dataset.name}")
+
+    if not frames:
+        return pd.DataFrame(), {}
+
+    all_genes = set().union(*dataset_genes.values())
+    common_genes = set.intersection(*dataset_genes.values()) if len(dataset_genes) > 1 else all_genes
+    genes_to_show = common_genes if (common_only or not include_unique) else all_genes
+
+    mapping = _gene_mapping(frames)
+    mapping = mapping[mapping['identifier'].isin(genes_to_show)]
+    # 타입 혼합 문제 방지를 위해 문자열 기준 정렬
+    mapping = mapping.iloc[np.argsort(mapping['identifier'].astype(str).to_numpy(), kind='stable')]
+    mapping = mapping.reset_index(drop=True)
+
+    # 공통/Unique 상태: 유전자 × 데이터셋 membership
+    names = list(dataset_genes)
+    membership = np.column_stack([mapping['identifier'].isin(dataset_genes[name]).to_numpy()
+                                  for name in names]) if len(mapping) else np.zeros((0, len(names)), bool)
+    is_common = mapping['identifier'].isin(common_genes).to_numpy()
+    unique_labels = [f"Unique ({', '.join(n for n, hit in zip(names, row) if hit)})" for row in membership]
+    status = np.where(is_common, 'Common', np.array(unique_labels, dtype=object))
+    found_in = [f"{k}/{len(datasets)}" for k in membership.sum(axis=1)]
+
+    result_df = pd.concat([
+        mapping[['gene_id', 'symbol']],
+        pd.DataFrame({'Status': status, 'Found_in': found_in}, index=mapping.index),
+        _meta_statistics(mapping, datasets),
+        _wide_values(mapping, frames),
+    ], axis=1)
+
+    # 컬럼 순서: gene_id, symbol, Status, Found_in, 메타 통계, D1_log2FC, D1_padj, ...
+    ordered = ['gene_id', 'symbol', 'Status', 'Found_in'] + META_COLUMNS
+    for name in frames:
+        ordered += [f'{name}_log2FC', f'{name}_padj', f'{name}_regulation']
+    result_df = result_df[[c for c in ordered if c in result_df.columns]]
+    return result_df, dataset_genes
+
+
+def build_comparison(comparison_type: str, datasets: Sequence, **params
+                     ) -> Tuple[pd.DataFrame, Dict[str, set]]:
+    """comparison_type('gene_list' | 'statistics') 별 wide 테이블 → (result_df, dataset_genes)."""
+    if comparison_type == 'gene_list':
+        return build_gene_list_comparison(datasets, params['gene_list']), {}
+    if comparison_type == 'statistics':
+        return build_statistics_comparison(datasets, **params)
+    raise ValueError(f"Unknown comparison type: {comparison_type}")
+
+
+def _term_table(df: pd.DataFrame, requested: pd.Index) -> pd.DataFrame:
+    """GO/KEGG 결과 df → 요청된 term 행만 (strip 한 term_id 기준 첫 행, index = term_id)."""
+    from models.standard_columns import StandardColumns
+
+    tids = _identifier_strings(df[StandardColumns.TERM_ID]).str.strip()
+    keep = (tids != '') & (tids != 'nan') & (requested.get_indexer(tids.str.upper()) >= 0)
+    table = df[keep.to_numpy()].assign(_term_id=tids[keep].to_numpy())
+    return table.drop_duplicates('_term_id').set_index('_term_id')
+
+
+def build_go_term_comparison(datasets: Sequence, requested_ids: Sequence[str],
+                             safe_names: Sequence[str]) -> pd.DataFrame:
+    """
+    GO/KEGG term 비교 wide 테이블 (Union).
+
+    requested_ids(대문자)에 있는 term 만, 데이터셋 순서·행 순서로 처음 나온 term_id /
+    description / ontology 를 쓰고, 데이터셋별 {safe}_fe, {safe}_fdr, {safe}_gene_count 를
+    term_id 로 reindex 한다. 메타 결합은 raw enrichment p-value 와 log2(fold enrichment).
+
+    Returns:
+        term_id, description, ontology, meta_*, {safe}_fe, {safe}_fdr, {safe}_gene_count ...
+        요청된 term 이 하나도 없으면 빈 DataFrame.
+    """
+    from models.standard_columns import StandardColumns
+    from utils.meta_stats import meta_analysis_matrix
+
+    tid_col, desc_col, ont_col = (StandardColumns.TERM_ID, StandardColumns.DESCRIPTION,
+                                  StandardColumns.ONTOLOGY)
+    value_cols = {'fe': StandardColumns.FOLD_ENRICHMENT, 'fdr': StandardColumns.FDR,
+                  'gene_count': StandardColumns.GENE_COUNT}
+    pval_col = StandardColumns.PVALUE
+
+    requested = pd.Index(pd.unique(pd.Series(list(requested_ids), dtype=object)))
+    tables = [_term_table(ds.dataframe, requested)
+              if ds.dataframe is not None and tid_col in ds.dataframe.columns else None
+              for ds in datasets]
+
+    # Union: description/ontology 는 첫 발견 기준
+    union = []
+    for table in tables:
+        if table is None or table.empty:
+            continue
+        info = pd.DataFrame(index=table.index)
+        info['description'] = (table[desc_col].map(str) if desc_col in table.columns
+                               else table.index.to_series())
+        info['ontology'] = table[ont_col].map(str) if ont_col in table.columns else ''
+        union.append(info)
+    if not union:
+        return pd.DataFrame()
+    terms = pd.concat(union)
+    terms = terms[~terms.index.duplicated(keep='first')]
+    term_ids = terms.index
+
+    result_df = pd.DataFrame({'term_id': term_ids.to_numpy(),
+                              'description': terms['description'].to_numpy(),
+                              'ontology': terms['ontology'].to_numpy()})
+
+    # 데이터셋별 지표 + term × 데이터셋 raw p / log2(FE) 행렬 (미검정 = NaN)
+    m_pvals = np.full((len(term_ids), len(datasets)), np.nan)
+    m_effects = np.full((len(term_ids), len(datasets)), np.nan)
+    per_dataset = {}
+    for j, (table, safe) in enumerate(zip(tables, safe_names)):
+        aligned = table.reindex(term_ids) if table is not None else None
+        for suffix, col in value_cols.items():
+            per_dataset[f"{safe}_{suffix}"] = (
+                aligned[col].to_numpy() if aligned is not None and col in aligned.columns
+                else np.full(len(term_ids), np.nan))
+        if aligned is not None and pval_col in aligned.columns:
+            m_pvals[:, j] = pd.to_numeric(aligned[pval_col], errors='coerce').to_numpy(dtype=float)
+            if value_cols['fe'] in aligned.columns:
+                fe = pd.to_numeric(aligned[value_cols['fe']], errors='coerce').to_numpy(dtype=float)
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    m_effects[:, j] = np.where(np.isfinite(fe) & (fe > 0), np.log2(fe), np.nan)
+
+    # 메타 결합 + Fisher 결합 p의 term 전체 BH 보정 (유효 데이터셋 2개 미만 term은 빈 값)
+    meta = meta_analysis_matrix(m_pvals, m_effects)
+    combined = meta['meta_found_in'] > 0
+    if combined.any():
+        result_df['meta_pvalue_fisher'] = meta['meta_pvalue_fisher']
+        result_df['meta_fdr_fisher'] = meta['meta_fdr_fisher']
+        result_df['meta_pvalue_stouffer'] = meta['meta_pvalue_stouffer']
+        result_df['meta_log2fe_mean'] = meta['meta_log2fc_mean']
+        result_df['meta_direction'] = meta['meta_direction']
+        result_df['meta_found_in'] = pd.Series(
+            [f"{k}/{len(datasets)}" for k in meta['meta_found_in']]).where(combined)
+
+    return pd.concat([result_df, pd.DataFrame(per_dataset)], axis=1)
@@ -96,7 +96,8 @@ class DataLoader:
     def load_from_excel(self, file_path: Path, dataset_name: Optional[str] = None,
                        dataset_type: Optional[DatasetType] = None,
                        sheet_name: Optional[str] = None,
-                       column_mapper_callback: Optional[Callable] = None) -> Dataset:
+                       column_mapper_callback: Optional[Callable] = None,
+                       checkpoint: Optional[Callable[[float], None]] = None) -> Dataset:
         """
         Excel 파일로부터 데이터셋 로드
         
@@ -107,6 +108,8 @@ class DataLoader:
             sheet_name: 시트명 (None이면 첫 번째 시트)
             column_mapper_callback: 컬럼 매핑 UI 콜백 함수
                                    (df, dataset_type, auto_mapping) -> Dict[str, str] 반환
+            checkpoint: 단계 진행률(0-1) 보고 + 취소 확인 콜백
+                        (load_pipeline 이 넘기며, 취소되면 LoadCancelled 를 발생시킴)
             
         Returns:
             로드된 Dataset 객체
@@ -132,6 +135,8 @@ class DataLoader:
                 df = pd.read_excel(file_path)
             
             self.logger.debug(f"Loaded {len(df)} rows, {len(df.columns)} columns")
+            if checkpoint:
+                checkpoint(0.6)
             
             # 데이터셋 타입 자동 감지
             if dataset_type is None:
@@ -183,6 +188,8 @@ class DataLoader:
             
             # ✨ 컬럼명 표준화 (핵심 변경!)
             df, original_columns = self._standardize_columns(df, final_mapping, dataset_type)
+            if checkpoint:
+                checkpoint(0.8)
             
             # 낮은 발현량 유전자 제거 (메모리 최적화)
             # 이제 표준 컬럼명 사용
@@ -191,6 +198,8 @@ class DataLoader:
             removed_rows = original_rows - len(df)
             if removed_rows > 0:
                 self.logger.debug(f"Filtered out {removed_rows} low-expression genes (baseMean threshold applied) - {removed_rows/original_rows*100:.1f}% removed")
+            if checkpoint:
+                checkpoint(0.95)
             
             dataset = Dataset(
                 name=dataset_name,
@@ -212,7 +221,9 @@ class DataLoader:
             return dataset
             
         except Exception as e:
-            self.logger.error(f"Failed to load data: {e}", exc_info=True)
+            from utils.load_pipeline import LoadCancelled
+            if not isinstance(e, LoadCancelled):
+                self.logger.error(f"Failed to load data: {e}", exc_info=True)
             raise
     
     def _detect_dataset_type(self, df: pd.DataFrame) -> DatasetType:
@@ -7,16 +7,21 @@ Database Manager for Pre-loaded Datasets
 
 import json
 import logging
+import os
 import shutil
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import uuid
-import numpy as np
 import pandas as pd
 
 from models.data_models import Dataset, PreloadedDatasetMetadata, DatasetType
 from utils.data_path_config import DataPathConfig
+from utils.parquet_index import ParquetMetadataIndex
+from utils.normalized_cache import NormalizedParquetCache
+from utils.gene_sets import (
+    gene_list_types_mapper, to_gene_list_series, warm_gene_term_index, write_parquet,
+)
 
 # 3차 분석 파이프라인(seqviewer_manifest.json)이 쓰는 dataset_type 문자열 →
 # 앱의 DatasetType.value 매핑. 일치하는 값(go_analysis, chromvar_diff_tf 등)은
@@ -25,6 +30,9 @@ _MANIFEST_TYPE_MAP = {
     'differential_accessibility': DatasetType.ATAC_SEQ.value,
 }
 
+# load_multiple_datasets / iter_load_datasets 기본 동시 로드 스레드 수
+_MAX_LOAD_WORKERS = min(8, os.cpu_count() or 4)
+
 # manifest 필드명 → PreloadedDatasetMetadata 필드명 (값이 없을 때만 보완)
 _MANIFEST_FIELD_FALLBACK = {
     'gene_count': 'peak_count',
@@ -114,6 +122,12 @@ class DatabaseManager:
         
         # 파일 소스 디렉토리 매핑 (file_path -> source_dir)
         self._file_source_dirs: Dict[str, str] = {}
+
+        # datasets 폴더별 parquet 메타데이터 인덱스 (sidecar 캐시)
+        self._parquet_indexes: Dict[str, ParquetMetadataIndex] = {}
+
+        # 정규화 결과 캐시 (.seqviewer_cache/)
+        self._normalized_cache = NormalizedParquetCache()
         
         self._load_all_metadata()
     
@@ -122,6 +136,15 @@ class DatabaseManager:
         self.database_dir.mkdir(parents=True, exist_ok=True)
         self.datasets_dir.mkdir(parents=True, exist_ok=True)
     
+    def _get_parquet_index(self, datasets_dir: Path) -> ParquetMetadataIndex:
+        """datasets 폴더의 parquet 메타데이터 인덱스 (폴더당 1개, 지연 로드)"""
+        key = str(Path(datasets_dir))
+        index = self._parquet_indexes.get(key)
+        if index is None:
+            index = ParquetMetadataIndex(Path(datasets_dir))
+            self._parquet_indexes[key] = index
+        return index
+
     def _load_all_metadata(self):
         """
         모든 경로에서 메타데이터 로드
@@ -229,6 +252,7 @@ class DatabaseManager:
 
         auto_imported = 0
         claimed_files: set = set()
+        index = self._get_parquet_index(datasets_dir)
 
         try:
             known_files = {meta.file_path for meta in self.metadata_list}
@@ -280,37 +304,19 @@ class DatabaseManager:
                 if filename in known_files:
                     continue
 
-                # ── parquet 열어서 컬럼 확인 ──────────────────────────────
+                # ── 인덱스(footer 스키마 + 캐시)로 타입/통계 확인 ──────────
                 try:
-                    df = pd.read_parquet(parquet_file, engine='pyarrow')
+                    entry = index.get_entry(parquet_file)
                 except Exception as e:
                     self.logger.warning(f"Cannot read parquet (skipping): {filename} — {e}")
                     continue
 
-                cols = set(df.columns)
-
-                # ATAC / DE / GO / chromVAR 자동 판별
-                from utils.atac_seq_loader import ATACSeqLoader
-                atac_required = {'peak_id', 'log2fc', 'adj_pvalue'}
-                de_required = {'gene_id', 'log2fc', 'adj_pvalue'}
-                go_required = {'term_id', 'description', 'fdr'}
-                # seqviewer parquet 형식: tf_name, mean_zscore_compare, delta_zscore, padj
-                chromvar_required_parquet = {'tf_name', 'mean_zscore_compare', 'delta_zscore', 'padj'}
-                # diff_tf.csv → parquet 변환 형식: motif, mean_compare, delta, padj
-                chromvar_required_csv = {'motif', 'mean_compare', 'delta', 'padj'}
-
-                if ATACSeqLoader.is_atac_dataframe(df) or atac_required.issubset(cols):
-                    dataset_type = DatasetType.ATAC_SEQ
-                elif chromvar_required_parquet.issubset(cols) or chromvar_required_csv.issubset(cols):
-                    dataset_type = DatasetType.CHROMVAR_DIFF_TF
-                elif de_required.issubset(cols):
-                    dataset_type = DatasetType.DIFFERENTIAL_EXPRESSION
-                elif go_required.issubset(cols):
-                    dataset_type = DatasetType.GO_ANALYSIS
-                else:
+                cols = set(entry['columns'])
+                dataset_type = ParquetMetadataIndex.entry_dataset_type(entry)
+                if dataset_type is None:
                     self.logger.warning(
                         f"Cannot determine type of '{filename}' "
-                        f"(no ATAC, DE or GO standard columns found). Skipping."
+                        f"(no ATAC, chromVAR, Multi-Group, DE or GO standard columns found). Skipping."
                     )
                     continue
 
@@ -319,6 +325,7 @@ class DatabaseManager:
                     try:
                         from utils.go_kegg_loader import GOKEGGLoader
                         from models.standard_columns import StandardColumns as SC
+                        df = pd.read_parquet(parquet_file, engine='pyarrow')
                         go_loader = GOKEGGLoader()
                         df = go_loader._standardize_columns(df)
                         df = go_loader._extract_direction_ontology(df)
@@ -328,8 +335,9 @@ class DatabaseManager:
                             df[SC.ONTOLOGY] = 'UNKNOWN'
                         if SC.GENE_SET not in df.columns:
                             df[SC.GENE_SET] = 'UNKNOWN'
-                        df.to_parquet(parquet_file, engine='pyarrow', index=False)
-                        cols = set(df.columns)
+                        write_parquet(df, parquet_file)
+                        index.invalidate(parquet_file)
+                        entry = index.get_entry(parquet_file)
                         self.logger.info(
                             f"Re-saved '{filename}' with gene_set/direction/ontology columns added"
                         )
@@ -338,46 +346,17 @@ class DatabaseManager:
                             f"Could not enrich '{filename}' with gene_set columns: {_gs_err}"
                         )
 
-                # ── 통계 계산 ──────────────────────────────────────────────
-                row_count = len(df)
+                # ── 통계 (인덱스 캐시) ─────────────────────────────────────
+                # ATAC: peak 수, chromVAR: TF(motif) 수, DE: 유전자 수
+                row_count = entry['row_count']
                 gene_count = 0
                 significant_genes = 0
-
-                if dataset_type == DatasetType.ATAC_SEQ:
-                    gene_count = row_count  # ATAC에서는 peak_count 의미
-                    if 'adj_pvalue' in cols:
-                        try:
-                            padj_ok = pd.to_numeric(df['adj_pvalue'], errors='coerce') < 0.05
-                            if 'log2fc' in cols:
-                                lfc_ok = pd.to_numeric(df['log2fc'], errors='coerce').abs() > 1
-                                significant_genes = int((padj_ok & lfc_ok).sum())
-                            else:
-                                significant_genes = int(padj_ok.sum())
-                        except Exception:
-                            significant_genes = 0
-
-                elif dataset_type == DatasetType.DIFFERENTIAL_EXPRESSION:
+                if dataset_type in (DatasetType.ATAC_SEQ,
+                                    DatasetType.DIFFERENTIAL_EXPRESSION,
+                                    DatasetType.CHROMVAR_DIFF_TF,
+                                    DatasetType.MULTI_GROUP):
                     gene_count = row_count
-                    if 'adj_pvalue' in cols:
-                        try:
-                            padj_ok = pd.to_numeric(df['adj_pvalue'], errors='coerce') < 0.05
-                            if 'log2fc' in cols:
-                                lfc_ok = pd.to_numeric(df['log2fc'], errors='coerce').abs() > 1
-                                significant_genes = int((padj_ok & lfc_ok).sum())
-                            else:
-                                significant_genes = int(padj_ok.sum())
-                        except Exception:
-                            significant_genes = 0
-
-                elif dataset_type == DatasetType.CHROMVAR_DIFF_TF:
-                    gene_count = row_count  # chromVAR에서는 TF(motif) 개수
-                    if 'padj' in cols:
-                        try:
-                            significant_genes = int(
-                                (pd.to_numeric(df['padj'], errors='coerce') < 0.05).sum()
-                            )
-                        except Exception:
-                            significant_genes = 0
+                    significant_genes = entry.get('significant_genes') or 0
 
                 # ── alias: 파일명에서 uuid8 suffix 제거 ───────────────────
                 # 예) "MonTG_vs_nMonTF_de_b8cc6614.parquet" → "MonTG_vs_nMonTF_de"
@@ -409,6 +388,9 @@ class DatabaseManager:
                     f"{row_count} rows) from {filename}"
                 )
 
+            index.prune(p.name for p in datasets_dir.glob("*.parquet"))
+            index.save()
+
             # 새로 등록된 항목이 있으면 metadata.json 저장
             if auto_imported > 0:
                 self._save_metadata()
@@ -536,17 +518,18 @@ class DatabaseManager:
                 continue
 
             try:
-                df = pd.read_parquet(parquet_path, columns=None)
+                # 인덱스 캐시: 파일이 바뀌지 않았으면 parquet 을 읽지 않음
+                entry = self._get_parquet_index(Path(source_dir)).get_entry(parquet_path)
 
-                # log2fc 컬럼 없으면 재계산 불가 → 스킵
-                if 'log2fc' not in df.columns:
+                # log2fc / adj_pvalue 컬럼 없으면 재계산 불가 → 스킵
+                if 'log2fc' not in entry['columns']:
                     continue
-                if 'adj_pvalue' not in df.columns:
+                if 'adj_pvalue' not in entry['columns']:
                     continue
 
-                padj_ok = pd.to_numeric(df['adj_pvalue'], errors='coerce') < 0.05
-                lfc_ok  = pd.to_numeric(df['log2fc'],     errors='coerce').abs() > 1
-                new_sig = int((padj_ok & lfc_ok).sum())
+                new_sig = entry.get('significant_genes')
+                if new_sig is None:
+                    continue
 
                 if new_sig != meta.significant_genes:
                     self.logger.info(
@@ -559,6 +542,9 @@ class DatabaseManager:
             except Exception as e:
                 self.logger.warning(f"[migrate] Could not process {meta.file_path}: {e}")
 
+        for index in self._parquet_indexes.values():
+            index.save()
+
         if updated_count == 0:
             self.logger.debug("[migrate] significant_genes already up-to-date, nothing changed")
             return
@@ -791,22 +777,11 @@ class DatabaseManager:
             
             df_to_save = dataset.dataframe.copy()
             if '_gene_set' in df_to_save.columns:
-                # set(또는 parquet 왕복 후의 list/ndarray)을 '/'-구분 문자열로 변환.
-                # np.ndarray/list 등 배열형 값에 pd.isna() 를 직접 쓰면 원소별 배열이 반환돼
-                # 뒤이은 bool 평가에서 "truth value of an array ... is ambiguous" 로 죽는다
-                # (parquet 의 list<string> 컬럼은 pandas 로 읽으면 셀이 set 이 아니라 ndarray
-                # 가 되는 경우가 흔함) — 배열형인지 먼저 판별해 그 경로를 피한다.
-                def convert_set_to_str(x):
-                    if isinstance(x, (set, frozenset, list, tuple, np.ndarray)):
-                        items = sorted(str(v) for v in x)
-                        return '/'.join(items) if items else ''
-                    if pd.isna(x):  # 이 시점에 x 는 스칼라라고 보장됨
-                        return ''
-                    return str(x)
-
-                df_to_save['_gene_set'] = df_to_save['_gene_set'].apply(convert_set_to_str)
+                # Arrow list<string> 으로 그대로 저장 ('/'-join 없음). 이미 list 컬럼이면
+                # 복사 없이 통과하고, set / ndarray / 문자열 셀도 같은 형식으로 맞춘다.
+                df_to_save['_gene_set'] = to_gene_list_series(df_to_save['_gene_set'])
             
-            df_to_save.to_parquet(file_path, engine='pyarrow', compression='snappy')
+            write_parquet(df_to_save, file_path, compression='snappy')
             
             # 메타데이터 추가 및 저장
             # 기존 데이터셋 ID가 있으면 업데이트, 없으면 추가
@@ -875,118 +850,43 @@ class DatabaseManager:
                 )
                 return dataset
 
-            df = pd.read_parquet(file_path, engine='pyarrow')
-            
-            # GO 데이터의 경우 _gene_set 컬럼을 set으로 복원
-            if '_gene_set' in df.columns:
-                df['_gene_set'] = df['_gene_set'].apply(
-                    lambda x: set(x.split('/')) if isinstance(x, str) and x else set()
+            # Multi-Group(LRT)도 전용 로더로 처리 (샘플 컬럼 / 그룹 파싱)
+            if metadata.dataset_type == DatasetType.MULTI_GROUP:
+                from utils.multi_group_loader import MultiGroupLoader
+                dataset = MultiGroupLoader().load(file_path, metadata.alias)
+                dataset.metadata.update({
+                    'experiment_condition': metadata.experiment_condition,
+                    'cell_type': metadata.cell_type,
+                    'organism': metadata.organism,
+                    'tissue': metadata.tissue,
+                    'timepoint': metadata.timepoint,
+                    'import_date': metadata.import_date,
+                    'notes': metadata.notes,
+                    'tags': metadata.tags,
+                })
+                self.logger.info(
+                    f"Loaded Multi-Group dataset from database: {metadata.alias} "
+                    f"({len(dataset.dataframe)} rows)"
                 )
-            
-            # 컬럼명 표준화 (모든 database 파일을 표준화)
-            from utils.data_loader import DataLoader
-            from models.standard_columns import StandardColumns
-            loader = DataLoader()
-            
-            # 데이터셋 타입에 따라 필수 컬럼 확인
-            if metadata.dataset_type == DatasetType.DIFFERENTIAL_EXPRESSION:
-                required_standard_cols = [StandardColumns.GENE_ID, StandardColumns.LOG2FC, StandardColumns.ADJ_PVALUE]
-            elif metadata.dataset_type == DatasetType.GO_ANALYSIS:
-                required_standard_cols = [StandardColumns.TERM_ID, StandardColumns.DESCRIPTION, StandardColumns.FDR]
-            elif metadata.dataset_type == DatasetType.ATAC_SEQ:
-                required_standard_cols = [StandardColumns.PEAK_ID, StandardColumns.LOG2FC, StandardColumns.ADJ_PVALUE]
-            else:
-                required_standard_cols = []
-            
-            all_standard_present = all(col in df.columns for col in required_standard_cols) if required_standard_cols else True
-            
-            if not all_standard_present and metadata.dataset_type == DatasetType.GO_ANALYSIS:
-                # GO 데이터: GOKEGGLoader로 처리 (GO.ID + KEGG.ID 동시 매핑 지원)
-                from utils.go_kegg_loader import GOKEGGLoader
-                go_loader = GOKEGGLoader()
-                df = go_loader._standardize_columns(df)
-                original_columns = {}
-                self.logger.info(f"Applied GO column standardization via GOKEGGLoader")
-            elif not all_standard_present:
-                # 표준화되지 않은 구버전 database (DE/ATAC) - 변환 필요
-                auto_mapping = loader._map_columns(df, metadata.dataset_type)
-                df, original_columns = loader._standardize_columns(df, auto_mapping, metadata.dataset_type)
-                self.logger.info(f"Converted legacy database columns to standard format")
-            elif metadata.dataset_type == DatasetType.GO_ANALYSIS:
-                # GO 데이터는 필수 컬럼이 있어도 Gene.Set / GO.ID 등 점 구분자 컬럼이
-                # 아직 rename 안 됐을 수 있으므로 항상 표준화 파이프라인 실행
-                from utils.go_kegg_loader import GOKEGGLoader
-                go_loader = GOKEGGLoader()
-                df = go_loader._standardize_columns(df)
-                original_columns = {}
-                self.logger.info(f"Applied GO column standardization (dot-separator rename)")
-            else:
-                # 이미 표준화된 database
-                original_columns = {}
-                self.logger.info(f"Database already has standard column names")
-            
-            # gene_id와 symbol을 문자열로 변환 (ENTREZ ID 등이 정수형일 수 있음)
-            if StandardColumns.GENE_ID in df.columns:
-                df[StandardColumns.GENE_ID] = df[StandardColumns.GENE_ID].astype(str)
-            
-            if StandardColumns.SYMBOL in df.columns:
-                df[StandardColumns.SYMBOL] = df[StandardColumns.SYMBOL].astype(str)
-            
-            self.logger.info(f"Available columns: {df.columns.tolist()[:10]}")
-            
-            # GO 데이터의 경우 fold_enrichment 파생 계산 (없을 때만)
-            if metadata.dataset_type == DatasetType.GO_ANALYSIS:
-                fe_col = StandardColumns.FOLD_ENRICHMENT
-                if fe_col not in df.columns:
-                    try:
-                        df = loader._compute_fold_enrichment(df)
-                    except Exception as _fe_err:
-                        self.logger.warning(f"Could not compute fold_enrichment: {_fe_err}")
-
-                # direction / gene_set / ontology 복구
-                # parquet 직접 반입 등으로 이 컬럼들이 없을 수 있음
-                need_direction = StandardColumns.DIRECTION not in df.columns
-                need_gene_set  = StandardColumns.GENE_SET  not in df.columns
-                need_ontology  = StandardColumns.ONTOLOGY  not in df.columns
+                return dataset
 
-                if need_direction or need_gene_set or need_ontology:
-                    try:
-                        from utils.go_kegg_loader import GOKEGGLoader
-                        go_loader = GOKEGGLoader()
-                        # gene_set 컬럼이 없으면 UNKNOWN으로 채움 (스캔 단계에서 이미 재저장 시도됨)
-                        if need_gene_set:
-                            df[StandardColumns.GENE_SET] = 'UNKNOWN'
-                            self.logger.warning(
-                                f"'{metadata.alias}': gene_set column missing — "
-                                f"Gene Set filter will not work. "
-                                f"Re-import the original Excel file to enable it."
-                            )
-                        # gene_set 이 있으면 direction/ontology 추출 시도
-                        if not need_gene_set or StandardColumns.GENE_SET in df.columns:
-                            df = go_loader._extract_direction_ontology(df)
-                        # 여전히 없으면 기본값
-                        if StandardColumns.DIRECTION not in df.columns:
-                            df[StandardColumns.DIRECTION] = 'UNKNOWN'
-                        if StandardColumns.ONTOLOGY not in df.columns:
-                            df[StandardColumns.ONTOLOGY] = 'UNKNOWN'
-                        self.logger.info(
-                            f"Restored direction/ontology columns for '{metadata.alias}'"
-                        )
-                    except Exception as _dir_err:
-                        self.logger.warning(f"Could not restore direction/ontology: {_dir_err}")
-                        if StandardColumns.DIRECTION not in df.columns:
-                            df[StandardColumns.DIRECTION] = 'UNKNOWN'
-                        if StandardColumns.ONTOLOGY not in df.columns:
-                            df[StandardColumns.ONTOLOGY] = 'UNKNOWN'
-            
-            # ATAC 데이터의 경우 annotation_categories 복원
-            atac_annotation_categories = []
-            if metadata.dataset_type == DatasetType.ATAC_SEQ:
-                if StandardColumns.ANNOTATION in df.columns:
-                    from utils.atac_seq_loader import ATACSeqLoader
-                    raw_cats = df[StandardColumns.ANNOTATION].dropna().unique().tolist()
-                    atac_annotation_categories = ATACSeqLoader()._normalize_annotation_categories(raw_cats)
-                    self.logger.debug(f"Restored annotation_categories: {atac_annotation_categories}")
+            # 정규화 캐시: 원본이 바뀌지 않았고 정규화 버전·데이터셋 타입이 같으면 그대로 읽기만 함
+            cached = self._normalized_cache.read(file_path, metadata.dataset_type.value)
+            if cached is not None:
+                df, cache_info = cached
+                original_columns = cache_info.get('original_columns', {})
+                atac_annotation_categories = cache_info.get('annotation_categories', [])
+                self.logger.info(f"Loaded normalized cache for '{metadata.alias}'")
+            else:
+                # list<string>(_gene_set) 컬럼은 ArrowDtype 그대로 읽음 (행별 배열 객체 생성 없음)
+                import pyarrow.parquet as pq
+                df = pq.read_table(file_path).to_pandas(types_mapper=gene_list_types_mapper)
+                df, original_columns, atac_annotation_categories = \
+                    self._normalize_dataframe(df, metadata)
+                self._normalized_cache.write(
+                    file_path, df, original_columns, atac_annotation_categories,
+                    dataset_type=metadata.dataset_type.value,
+                )
 
             # Dataset 객체 생성
             dataset_meta = {
@@ -1017,22 +917,190 @@ class DatabaseManager:
             self.logger.error(f"Failed to load dataset: {e}")
             return None
     
-    def load_multiple_datasets(self, dataset_ids: List[str]) -> List[Dataset]:
+    def _normalize_dataframe(self, df: pd.DataFrame, metadata: PreloadedDatasetMetadata) -> tuple:
+        """
+        database parquet 을 앱 표준 형식으로 정규화 (결과는 NormalizedParquetCache 에 저장됨).
+
+        동작을 바꾸면 utils.normalized_cache.NORMALIZER_VERSION 을 올려 기존 캐시를 무효화할 것.
+
+        Returns:
+            tuple: (df, original_columns, atac_annotation_categories)
         """
-        여러 데이터셋을 한 번에 로드
+
+        # GO 데이터의 _gene_set → Arrow list<string> 컬럼 (구버전 '/'-문자열도 변환)
+        if '_gene_set' in df.columns:
+            df['_gene_set'] = to_gene_list_series(df['_gene_set'])
+
+        # 컬럼명 표준화 (모든 database 파일을 표준화)
+        from utils.data_loader import DataLoader
+        from models.standard_columns import StandardColumns
+        loader = DataLoader()
+
+        # 데이터셋 타입에 따라 필수 컬럼 확인
+        if metadata.dataset_type == DatasetType.DIFFERENTIAL_EXPRESSION:
+            required_standard_cols = [StandardColumns.GENE_ID, StandardColumns.LOG2FC, StandardColumns.ADJ_PVALUE]
+        elif metadata.dataset_type == DatasetType.GO_ANALYSIS:
+            required_standard_cols = [StandardColumns.TERM_ID, StandardColumns.DESCRIPTION, StandardColumns.FDR]
+        elif metadata.dataset_type == DatasetType.ATAC_SEQ:
+            required_standard_cols = [StandardColumns.PEAK_ID, StandardColumns.LOG2FC, StandardColumns.ADJ_PVALUE]
+        else:
+            required_standard_cols = []
+
+        all_standard_present = all(col in df.columns for col in required_standard_cols) if required_standard_cols else True
+
+        if not all_standard_present and metadata.dataset_type == DatasetType.GO_ANALYSIS:
+            # GO 데이터: GOKEGGLoader로 처리 (GO.ID + KEGG.ID 동시 매핑 지원)
+            from utils.go_kegg_loader import GOKEGGLoader
+            go_loader = GOKEGGLoader()
+            df = go_loader._standardize_columns(df)
+            original_columns = {}
+            self.logger.info(f"Applied GO column standardization via GOKEGGLoader")
+        elif not all_standard_present:
+            # 표준화되지 않은 구버전 database (DE/ATAC) - 변환 필요
+            auto_mapping = loader._map_columns(df, metadata.dataset_type)
+            df, original_columns = loader._standardize_columns(df, auto_mapping, metadata.dataset_type)
+            self.logger.info(f"Converted legacy database columns to standard format")
+        elif metadata.dataset_type == DatasetType.GO_ANALYSIS:
+            # GO 데이터는 필수 컬럼이 있어도 Gene.Set / GO.ID 등 점 구분자 컬럼이
+            # 아직 rename 안 됐을 수 있으므로 항상 표준화 파이프라인 실행
+            from utils.go_kegg_loader import GOKEGGLoader
+            go_loader = GOKEGGLoader()
+            df = go_loader._standardize_columns(df)
+            original_columns = {}
+            self.logger.info(f"Applied GO column standardization (dot-separator rename)")
+        else:
+            # 이미 표준화된 database
+            original_columns = {}
+            self.logger.info(f"Database already has standard column names")
+
+        # gene_id와 symbol을 문자열로 변환 (ENTREZ ID 등이 정수형일 수 있음)
+        if StandardColumns.GENE_ID in df.columns:
+            df[StandardColumns.GENE_ID] = df[StandardColumns.GENE_ID].astype(str)
+
+        if StandardColumns.SYMBOL in df.columns:
+            df[StandardColumns.SYMBOL] = df[StandardColumns.SYMBOL].astype(str)
+
+        self.logger.info(f"Available columns: {df.columns.tolist()[:10]}")
+
+        # GO 데이터의 경우 fold_enrichment 파생 계산 (없을 때만)
+        if metadata.dataset_type == DatasetType.GO_ANALYSIS:
+            fe_col = StandardColumns.FOLD_ENRICHMENT
+            if fe_col not in df.columns:
+                try:
+                    df = loader._compute_fold_enrichment(df)
+                except Exception as _fe_err:
+                    self.logger.warning(f"Could not compute fold_enrichment: {_fe_err}")
+
+            # direction / gene_set / ontology 복구
+            # parquet 직접 반입 등으로 이 컬럼들이 없을 수 있음
+            need_direction = StandardColumns.DIRECTION not in df.columns
+            need_gene_set  = StandardColumns.GENE_SET  not in df.columns
+            need_ontology  = StandardColumns.ONTOLOGY  not in df.columns
+
+            if need_direction or need_gene_set or need_ontology:
+                try:
+                    from utils.go_kegg_loader import GOKEGGLoader
+                    go_loader = GOKEGGLoader()
+                    # gene_set 컬럼이 없으면 UNKNOWN으로 채움 (스캔 단계에서 이미 재저장 시도됨)
+                    if need_gene_set:
+                        df[StandardColumns.GENE_SET] = 'UNKNOWN'
+                        self.logger.warning(
+                            f"'{metadata.alias}': gene_set column missing — "
+                            f"Gene Set filter will not work. "
+                            f"Re-import the original Excel file to enable it."
+                        )
+                    # gene_set 이 있으면 direction/ontology 추출 시도
+                    if not need_gene_set or StandardColumns.GENE_SET in df.columns:
+                        df = go_loader._extract_direction_ontology(df)
+                    # 여전히 없으면 기본값
+                    if StandardColumns.DIRECTION not in df.columns:
+                        df[StandardColumns.DIRECTION] = 'UNKNOWN'
+                    if StandardColumns.ONTOLOGY not in df.columns:
+                        df[StandardColumns.ONTOLOGY] = 'UNKNOWN'
+                    self.logger.info(
+                        f"Restored direction/ontology columns for '{metadata.alias}'"
+                    )
+                except Exception as _dir_err:
+                    self.logger.warning(f"Could not restore direction/ontology: {_dir_err}")
+                    if StandardColumns.DIRECTION not in df.columns:
+                        df[StandardColumns.DIRECTION] = 'UNKNOWN'
+                    if StandardColumns.ONTOLOGY not in df.columns:
+                        df[StandardColumns.ONTOLOGY] = 'UNKNOWN'
+
+        # ATAC 데이터의 경우 annotation_categories 복원
+        atac_annotation_categories = []
+        if metadata.dataset_type == DatasetType.ATAC_SEQ:
+            if StandardColumns.ANNOTATION in df.columns:
+                from utils.atac_seq_loader import ATACSeqLoader
+                raw_cats = df[StandardColumns.ANNOTATION].dropna().unique().tolist()
+                atac_annotation_categories = ATACSeqLoader()._normalize_annotation_categories(raw_cats)
+                self.logger.debug(f"Restored annotation_categories: {atac_annotation_categories}")
+
+        return df, original_columns, atac_annotation_categories
+
+    def load_multiple_datasets(self, dataset_ids: List[str],
+                               max_workers: Optional[int] = None) -> List[Dataset]:
+        """
+        여러 데이터셋을 한 번에 로드 (병렬, 결과는 입력 순서 유지)
         
         Args:
             dataset_ids: 데이터셋 ID 리스트
+            max_workers: 동시 로드 스레드 수 (None이면 기본값)
             
         Returns:
             List[Dataset]: Dataset 객체 리스트
         """
-        datasets = []
-        for dataset_id in dataset_ids:
-            dataset = self.load_dataset(dataset_id)
-            if dataset:
-                datasets.append(dataset)
-        return datasets
+        loaded = dict(self.iter_load_datasets(dataset_ids, max_workers=max_workers))
+        return [loaded[dataset_id] for dataset_id in dataset_ids if loaded.get(dataset_id)]
+
+    def iter_load_datasets(self, dataset_ids: List[str],
+                           max_workers: Optional[int] = None,
+                           is_cancelled=None):
+        """
+        여러 데이터셋을 제한된 스레드 풀에서 병렬 로드하고, 끝나는 순서대로 반환.
+
+        parquet 디코딩(pyarrow)과 pandas 벡터 연산은 대부분 GIL 을 놓으므로
+        스레드 풀만으로도 20~40개 동시 로드가 크게 빨라진다. 각 항목은
+        load_dataset() 과 동일하게 처리되며 실패하면 Dataset 대신 None 이 온다.
+        GO 데이터셋은 같은 풀 스레드에서 gene → term 역색인까지 미리 만들어 둔다.
+
+        Args:
+            dataset_ids: 데이터셋 ID 리스트
+            max_workers: 동시 로드 스레드 수 (None이면 min(8, CPU 수))
+            is_cancelled: 취소 확인 콜백 — True 를 반환하면 남은 작업을 버리고 종료
+
+        Yields:
+            (dataset_id, Optional[Dataset])
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        if not dataset_ids:
+            return
+        if max_workers is None:
+            max_workers = _MAX_LOAD_WORKERS
+        max_workers = max(1, min(max_workers, len(dataset_ids)))
+
+        with ThreadPoolExecutor(max_workers=max_workers,
+                                thread_name_prefix='db-load') as pool:
+            futures = {pool.submit(self._load_dataset_warm, dataset_id): dataset_id
+                       for dataset_id in dataset_ids}
+            try:
+                for future in as_completed(futures):
+                    if is_cancelled is not None and is_cancelled():
+                        self.logger.info("Bulk dataset load cancelled")
+                        break
+                    yield futures[future], future.result()
+            finally:
+                # 취소 / 조기 종료 시 아직 시작하지 않은 작업 폐기
+                for future in futures:
+                    future.cancel()
+    
+    def _load_dataset_warm(self, dataset_id: str) -> Optional[Dataset]:
+        """load_dataset + 조회 인덱스 미리 생성 (iter_load_datasets 풀 스레드용)"""
+        dataset = self.load_dataset(dataset_id)
+        if dataset is not None:
+            warm_gene_term_index(dataset)
+        return dataset
     
     def delete_dataset(self, dataset_id: str) -> bool:
         """
@@ -1053,6 +1121,7 @@ class DatabaseManager:
             file_path = self._find_dataset_file(metadata.file_path)
             if file_path and file_path.exists():
                 file_path.unlink()
+                self._normalized_cache.remove(file_path)
             else:
                 self.logger.warning(f"Dataset file not found during delete: {metadata.file_path}")
             
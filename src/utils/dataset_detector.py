@@ -0,0 +1,102 @@
+"""
+Dataset Type Detector
+
+parquet 파일의 타입(ATAC / chromVAR / Multi-Group / DE / GO)을 **스키마만** 읽어
+판별하는 공용 서비스입니다.
+
+pq.read_schema() 는 footer 만 읽으므로 파일 크기와 무관하게 O(1) 이고,
+스키마의 empty_table().to_pandas() 로 만든 0행 DataFrame 은 실제 로드 결과와
+컬럼명·dtype·index 가 같아 기존 판별 함수(ATACSeqLoader.is_atac_dataframe,
+MultiGroupLoader.is_multi_group_dataframe 등)를 그대로 재사용할 수 있습니다.
+스키마만으로 dtype 을 알 수 없는 컬럼(Arrow null 타입)이 있을 때만
+첫 row group 의 앞부분을 읽어 보완합니다.
+
+Usage:
+    from utils.dataset_detector import detect_parquet_type, read_schema_frame
+    dataset_type = detect_parquet_type(Path("x.parquet"))    # DatasetType 또는 None
+    frame = read_schema_frame(Path("x.parquet"))              # 0행 DataFrame
+"""
+
+from pathlib import Path
+from typing import Iterable, Optional
+
+import pandas as pd
+
+from models.data_models import DatasetType
+
+
+# 표준 컬럼 기반 필수 집합 (DatabaseManager 자동 임포트 / merge_db 공통)
+ATAC_REQUIRED = frozenset({'peak_id', 'log2fc', 'adj_pvalue'})
+DE_REQUIRED = frozenset({'gene_id', 'log2fc', 'adj_pvalue'})
+GO_REQUIRED = frozenset({'term_id', 'description', 'fdr'})
+# seqviewer parquet 형식: tf_name, mean_zscore_compare, delta_zscore, padj
+CHROMVAR_REQUIRED_PARQUET = frozenset({'tf_name', 'mean_zscore_compare', 'delta_zscore', 'padj'})
+# diff_tf.csv → parquet 변환 형식: motif, mean_compare, delta, padj
+CHROMVAR_REQUIRED_CSV = frozenset({'motif', 'mean_compare', 'delta', 'padj'})
+
+# 스키마만으로 부족할 때 읽는 최대 행 수
+PEEK_ROWS = 64
+
+
+def read_schema_frame(path: Path) -> pd.DataFrame:
+    """
+    parquet footer 의 스키마만 읽어 0행 DataFrame 생성 (데이터 페이지 디코딩 없음).
+
+    pandas 메타데이터가 있으면 index 복원까지 pd.read_parquet 과 동일하게 처리되며,
+    Arrow null 타입 컬럼이 있으면 peek_parquet() 결과로 대체합니다.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pq.read_schema(path)
+    if any(pa.types.is_null(field.type) for field in schema):
+        return peek_parquet(path)
+    return schema.empty_table().to_pandas()
+
+
+def peek_parquet(path: Path, max_rows: int = PEEK_ROWS) -> pd.DataFrame:
+    """첫 row group 에서 최대 max_rows 행만 읽기 (파일 크기와 무관한 비용)."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    pf = pq.ParquetFile(path)
+    if pf.metadata.num_row_groups == 0:
+        return pf.schema_arrow.empty_table().to_pandas()
+    batch = next(pf.iter_batches(batch_size=max_rows, row_groups=[0]), None)
+    if batch is None:
+        return pf.schema_arrow.empty_table().to_pandas()
+    return pa.Table.from_batches([batch], schema=pf.schema_arrow).to_pandas()
+
+
+def detect_columns_type(columns: Iterable[str]) -> Optional[DatasetType]:
+    """표준 컬럼명 집합만으로 판별 (dtype 정보가 없을 때; Multi-Group 은 판별 불가)."""
+    return detect_frame_type(pd.DataFrame(columns=list(columns)))
+
+
+def detect_frame_type(df: pd.DataFrame) -> Optional[DatasetType]:
+    """
+    DataFrame(0행 스키마 프레임 포함)의 컬럼으로 데이터셋 타입 판별.
+
+    우선순위: ATAC → chromVAR → Multi-Group → DE → GO.
+    판별 불가면 None.
+    """
+    from utils.atac_seq_loader import ATACSeqLoader
+    from utils.multi_group_loader import MultiGroupLoader
+
+    cols = set(df.columns)
+    if ATACSeqLoader.is_atac_dataframe(df) or ATAC_REQUIRED.issubset(cols):
+        return DatasetType.ATAC_SEQ
+    if CHROMVAR_REQUIRED_PARQUET.issubset(cols) or CHROMVAR_REQUIRED_CSV.issubset(cols):
+        return DatasetType.CHROMVAR_DIFF_TF
+    if MultiGroupLoader.is_multi_group_dataframe(df):
+        return DatasetType.MULTI_GROUP
+    if DE_REQUIRED.issubset(cols):
+        return DatasetType.DIFFERENTIAL_EXPRESSION
+    if GO_REQUIRED.issubset(cols):
+        return DatasetType.GO_ANALYSIS
+    return None
+
+
+def detect_parquet_type(path: Path) -> Optional[DatasetType]:
+    """parquet 파일 타입 판별 (스키마만 읽음). 판별 불가면 None."""
+    return detect_frame_type(read_schema_frame(Path(path)))
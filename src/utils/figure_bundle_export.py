@@ -231,6 +231,25 @@ def _render_source(module_name: str, *func_names: str) -> str | None:
         return _read_plots_module_source(module_name, mod)
 
 
+def _render_source_with_helpers(helpers: tuple, module_name: str, *func_names: str) -> str | None:
+    """plots 공유 헬퍼 모듈(large_scatter, label_layout 등) 전체를 앞에 붙인 _render_source.
+
+    헬퍼는 모듈 상수·캐시를 쓰므로 함수만이 아니라 모듈 소스를 통째로 inline 한다.
+    """
+    import importlib
+    parts = []
+    for helper in helpers:
+        try:
+            mod = importlib.import_module(f"plots.{helper}")
+        except Exception:
+            return None
+        parts.append(_read_plots_module_source(helper, mod))
+    parts.append(_render_source(module_name, *func_names))
+    if any(p is None for p in parts):
+        return None
+    return "\n\n".join(parts)
+
+
 def _read_plots_module_source(module_name: str, mod) -> str | None:
     """plots/{module}.py 소스 텍스트를 dev/frozen 여러 위치에서 찾아 반환."""
     import sys
@@ -247,7 +266,10 @@ def _read_plots_module_source(module_name: str, mod) -> str | None:
     for c in candidates:
         try:
             if c.exists():
-                return c.read_text(encoding="utf-8")
+                # 번들은 plots 패키지 없이 실행되므로 plots 내부 import 는 빼고
+                # 해당 헬퍼를 따로 inline 한다 (_render_source_with_helpers)
+                return "\n".join(line for line in c.read_text(encoding="utf-8").splitlines()
+                                 if not line.startswith("from plots."))
         except Exception:
             continue
     return None
@@ -255,7 +277,8 @@ def _read_plots_module_source(module_name: str, mod) -> str | None:
 
 def _build_volcano_plot_script(source_stem: str, params_repr: str) -> str:
     # 화면 다이얼로그와 동일한 render_volcano 를 그대로 inline (단일 진실 공급원)
-    render_src = _render_source("volcano", "_draw_volcano_labels", "render_volcano")
+    render_src = _render_source_with_helpers(
+        ("large_scatter", "label_layout"), "volcano", "_draw_volcano_labels", "render_volcano")
     if render_src is None:
         # 소스 추출 불가(frozen 등) → 이미지/데이터는 이미 저장됨, 스크립트는 generic 폴백
         return _build_generic_plot_script(source_stem, "volcano", params_repr)
@@ -272,7 +295,7 @@ matplotlib.use("Agg")
 import pandas as pd
 from matplotlib.figure import Figure
 
-# ── inlined from src/plots/volcano.py ──────────────────────────────────
+# ── inlined from src/plots/large_scatter.py, label_layout.py + volcano.py ─
 {render_src}
 # ───────────────────────────────────────────────────────────────────────
 
@@ -398,7 +421,7 @@ fig.savefig(root / "outputs" / "{source_stem}.svg", bbox_inches="tight")
 
 
 def _build_ma_plot_script(source_stem: str, params_repr: str) -> str:
-    render_src = _render_source("ma", "render_ma")
+    render_src = _render_source_with_helpers(("large_scatter", "label_layout"), "ma", "render_ma")
     if render_src is None:
         return _build_generic_plot_script(source_stem, "ma", params_repr)
 
@@ -413,7 +436,7 @@ matplotlib.use("Agg")
 import pandas as pd
 from matplotlib.figure import Figure
 
-# ── inlined from src/plots/ma.py ───────────────────────────────────────
+# ── inlined from src/plots/large_scatter.py, label_layout.py + ma.py ───
 {render_src}
 # ───────────────────────────────────────────────────────────────────────
 
@@ -433,7 +456,7 @@ fig.savefig(root / "outputs" / "{source_stem}.svg", bbox_inches="tight")
 
 
 def _build_pca_plot_script(source_stem: str, params_repr: str) -> str:
-    render_src = _render_source("pca", "render_pca")
+    render_src = _render_source_with_helpers(("label_layout",), "pca", "render_pca")
     if render_src is None:
         return _build_generic_plot_script(source_stem, "pca", params_repr)
 
@@ -448,7 +471,7 @@ matplotlib.use("Agg")
 import pandas as pd
 from matplotlib.figure import Figure
 
-# ── inlined from src/plots/pca.py ──────────────────────────────────────
+# ── inlined from src/plots/label_layout.py + pca.py ────────────────────
 {render_src}
 # ───────────────────────────────────────────────────────────────────────
 
@@ -605,7 +628,8 @@ fig.savefig(root / "outputs" / "{source_stem}.svg", bbox_inches="tight")
 
 
 def _build_integrated_volcano_plot_script(source_stem: str, params_repr: str) -> str:
-    render_src = _render_source("integrated_volcano", "render_integrated_volcano")
+    render_src = _render_source_with_helpers(
+        ("large_scatter",), "integrated_volcano", "render_integrated_volcano")
     if render_src is None:
         return _build_generic_plot_script(source_stem, "integrated_volcano", params_repr)
 
@@ -620,7 +644,7 @@ matplotlib.use("Agg")
 import pandas as pd
 from matplotlib.figure import Figure
 
-# ── inlined from src/plots/integrated_volcano.py ───────────────────────
+# ── inlined from src/plots/large_scatter.py + integrated_volcano.py ────
 {render_src}
 # ───────────────────────────────────────────────────────────────────────
 
@@ -640,14 +664,15 @@ fig.savefig(root / "outputs" / "{source_stem}.svg", bbox_inches="tight")
 
 
 def _build_meta_volcano_plot_script(source_stem: str, params_repr: str) -> str:
-    render_src = _render_source("meta_volcano", "_found_in_num", "render_meta_volcano")
+    render_src = _render_source_with_helpers(
+        ("large_scatter", "label_layout"), "meta_volcano", "_found_in_num", "render_meta_volcano")
     if render_src is None:
         return _build_generic_plot_script(source_stem, "meta_volcano", params_repr)
 
     return f'''"""Recreate the Meta Volcano plot from this bundle.
 
 render_meta_volcano 은 cmg-seqviewer 화면 렌더링과 동일한 함수를 inline 한 것이다.
-상위 N개 라벨은 adjustText가 있으면 자동 배치, 없으면 점 위에 표시된다.
+상위 N개 라벨은 inline 된 place_labels 가 겹치지 않게 배치한다 (시간 제한).
 """
 from pathlib import Path
 import numpy as np
@@ -656,7 +681,7 @@ matplotlib.use("Agg")
 import pandas as pd
 from matplotlib.figure import Figure
 
-# ── inlined from src/plots/meta_volcano.py ─────────────────────────────
+# ── inlined from src/plots/large_scatter.py, label_layout.py + meta_volcano.py ─
 {render_src}
 # ───────────────────────────────────────────────────────────────────────
 
@@ -0,0 +1,363 @@
+"""
+Gene Set Columns
+
+GO/KEGG term 별 유전자 집합(_gene_set)을 행마다 Python set 으로 두지 않고
+Arrow list<string> 컬럼(pd.ArrowDtype)으로 보관하기 위한 공용 유틸리티입니다.
+
+- 메모리: 수만 개 term 의 유전자 목록이 하나의 연속된 string 버퍼 + offsets 로 저장됨
+- parquet: list<string> 그대로 저장/로드 (행별 '/'.join / split 없음)
+- 멤버십: pyarrow.compute 로 flatten → is_in → 행별 집계 (행 단위 Python 루프 없음)
+
+GO 클러스터링, Gene Symbol 필터, GO 네트워크 다이얼로그가 같은 API 를 사용합니다.
+반복되는 Gene Symbol 필터는 데이터셋별로 캐시되는 역색인(GeneTermIndex)을 씁니다.
+역색인은 로드 워커가 warm_gene_term_index() 로 백그라운드에서 미리 만들어 둡니다.
+입력은 ArrowDtype list 컬럼뿐 아니라 기존 형식(set / list / ndarray 셀, '/'-구분
+문자열)도 받으므로, 아직 변환되지 않은 DataFrame 에도 그대로 쓸 수 있습니다.
+
+Usage:
+    from utils.gene_sets import to_gene_list_series, contains_any, match_counts
+    df['_gene_set'] = to_gene_list_series(df['gene_symbols'])
+    mask = contains_any(df['_gene_set'], ['TP53', 'MYC'])
+    hits = match_counts(df['gene_symbols'], genes, case_sensitive=False,
+                        sep=GENE_SYMBOL_SPLIT_PATTERN)
+"""
+
+import json
+import logging
+from typing import Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+logger = logging.getLogger(__name__)
+
+GENE_SET_COLUMN = '_gene_set'
+GENE_LIST_TYPE = pa.list_(pa.string())
+GENE_LIST_DTYPE = pd.ArrowDtype(GENE_LIST_TYPE)
+
+# GO 파일의 gene 목록 구분자 (clusterProfiler / DAVID 등은 '/')
+GENE_SEPARATOR = '/'
+# Gene Symbol 필터가 gene_symbols 셀을 나누는 구분자 (쉼표, 세미콜론, 슬래시, 공백)
+GENE_SYMBOL_SPLIT_PATTERN = r'[,;/\s]+'
+
+
+def gene_list_types_mapper(arrow_type: pa.DataType):
+    """pa.Table.to_pandas(types_mapper=...) 용 — list<string> 컬럼을 ArrowDtype 으로 유지."""
+    if arrow_type == GENE_LIST_TYPE or arrow_type == pa.list_(pa.large_string()):
+        return GENE_LIST_DTYPE
+    return None
+
+
+def to_arrow_table(df: pd.DataFrame, preserve_index: bool = False) -> pa.Table:
+    """
+    DataFrame → pa.Table (parquet 저장용).
+
+    pandas 가 ArrowDtype list 컬럼의 numpy_type 을 'list<item: string>[pyarrow]' 로
+    기록하면 pd.read_parquet 이 그 dtype 을 해석하지 못해 파일을 열 수 없다.
+    해당 컬럼만 'object' 로 기록해 어떤 reader 로도 읽히게 한다 (데이터는 list<string> 그대로).
+    """
+    table = pa.Table.from_pandas(df, preserve_index=preserve_index)
+    meta = dict(table.schema.metadata or {})
+    if b'pandas' not in meta:
+        return table
+    pandas_meta = json.loads(meta[b'pandas'])
+    for column in pandas_meta.get('columns', []):
+        numpy_type = str(column.get('numpy_type', ''))
+        if numpy_type.startswith(('list<', 'large_list<')) and numpy_type.endswith('[pyarrow]'):
+            column['numpy_type'] = 'object'
+    meta[b'pandas'] = json.dumps(pandas_meta).encode('utf-8')
+    return table.replace_schema_metadata(meta)
+
+
+def write_parquet(df: pd.DataFrame, path, compression: str = 'snappy',
+                  preserve_index: bool = False):
+    """_gene_set 등 ArrowDtype list 컬럼이 있어도 pd.read_parquet 으로 다시 읽히게 저장."""
+    import pyarrow.parquet as pq
+    pq.write_table(to_arrow_table(df, preserve_index), path, compression=compression)
+
+
+# ------------------------------------------------------------------ #
+#  Conversion
+# ------------------------------------------------------------------ #
+
+def gene_list_array(values, sep: str = GENE_SEPARATOR) -> pa.ListArray:
+    """
+    어떤 형식의 유전자 목록 컬럼이든 하나의 pa.ListArray(list<string>)로 변환.
+
+    - ArrowDtype list 컬럼: 복사 없이 그대로 (null 행은 빈 목록)
+    - 문자열 컬럼: sep 로 분리 (sep 가 한 글자가 아니면 정규식으로 취급),
+      공백 제거 · 빈 항목 제거 · 행 내 중복 제거
+    - set / list / tuple / ndarray 셀: 원소를 str 로 변환, 정렬
+    """
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+    if isinstance(values, pa.Array):
+        arr = values
+    elif isinstance(values, pd.Series) and isinstance(values.dtype, pd.ArrowDtype):
+        arr = pa.array(values)
+        if isinstance(arr, pa.ChunkedArray):
+            arr = arr.combine_chunks()
+    else:
+        arr = _object_values_to_array(list(values), sep)
+
+    if not (pa.types.is_list(arr.type) or pa.types.is_large_list(arr.type)):
+        return parse_gene_strings(arr, sep)
+    if pa.types.is_large_list(arr.type) or arr.type.value_type != pa.string():
+        arr = arr.cast(GENE_LIST_TYPE)
+    if arr.null_count:
+        arr = pc.if_else(pc.is_null(arr), pa.scalar([], GENE_LIST_TYPE), arr)
+    return arr
+
+
+def to_gene_list_series(values, index=None, sep: str = GENE_SEPARATOR) -> pd.Series:
+    """gene_list_array() 결과를 ArrowDtype(list<string>) Series 로 반환."""
+    if index is None and isinstance(values, pd.Series):
+        index = values.index
+    return pd.Series(pd.arrays.ArrowExtensionArray(gene_list_array(values, sep)),
+                     index=index, name=GENE_SET_COLUMN)
+
+
+def parse_gene_strings(values, sep: str = GENE_SEPARATOR) -> pa.ListArray:
+    """문자열 컬럼을 분리해 list<string> 으로 (pyarrow.compute 벡터 연산)."""
+    if isinstance(values, pa.Array):
+        strings = values if values.type == pa.string() else values.cast(pa.string())
+    else:
+        s = pd.Series(list(values), dtype=object)
+        missing = s.isna().to_numpy()
+        s = s.astype(str)
+        s[missing] = None
+        strings = pa.array(s, type=pa.string(), from_pandas=True)
+    if len(sep) == 1:
+        split = pc.split_pattern(strings, pattern=sep)
+    else:
+        split = pc.split_pattern_regex(strings, pattern=sep)
+    return _clean_lists(split, sort_items=False)
+
+
+def _object_values_to_array(values: list, sep: str) -> pa.ListArray:
+    """object 셀(문자열 / 컬렉션 / 결측 혼합) → list<string>."""
+    if all(v is None or isinstance(v, str) or _is_missing_scalar(v) for v in values):
+        return parse_gene_strings(values, sep)
+    lists = []
+    for v in values:
+        if isinstance(v, (set, frozenset, list, tuple, np.ndarray)):
+            lists.append(sorted({str(g) for g in v if g is not None and str(g).strip()}))
+        elif isinstance(v, str):
+            lists.append(v)
+        elif _is_missing_scalar(v):
+            lists.append(None)
+        else:
+            lists.append(str(v))
+    # 문자열 셀은 따로 분리해 같은 규칙으로 정리
+    str_pos = [i for i, v in enumerate(lists) if isinstance(v, str)]
+    if str_pos:
+        parsed = parse_gene_strings([lists[i] for i in str_pos], sep).to_pylist()
+        for i, items in zip(str_pos, parsed):
+            lists[i] = items
+    return pa.array(lists, type=GENE_LIST_TYPE)
+
+
+def _is_missing_scalar(v) -> bool:
+    try:
+        return v is None or bool(pd.isna(v))
+    except (TypeError, ValueError):
+        return False
+
+
+def _clean_lists(arr: pa.ListArray, sort_items: bool) -> pa.ListArray:
+    """각 행에서 공백 제거 · 빈 항목 제거 · 중복 제거 후 list<string> 재구성."""
+    n = len(arr)
+    arr = pc.if_else(pc.is_null(arr), pa.scalar([], arr.type), arr) if arr.null_count else arr
+    flat = pc.utf8_trim_whitespace(pc.list_flatten(arr))
+    parents = pc.list_parent_indices(arr).to_numpy()
+    items = pd.DataFrame({'row': parents, 'gene': flat.to_numpy(zero_copy_only=False)})
+    items = items[items['gene'].notna() & (items['gene'] != '')]
+    items = items.drop_duplicates()
+    items = items.sort_values(['row', 'gene'] if sort_items else 'row', kind='stable')
+    return _from_rows(items['row'].to_numpy(), items['gene'].to_numpy(dtype=object), n)
+
+
+def _from_rows(rows: np.ndarray, genes: np.ndarray, n_rows: int) -> pa.ListArray:
+    """(행 번호 오름차순, 유전자) 쌍 → ListArray (offsets 직접 구성)."""
+    counts = np.bincount(rows.astype(np.int64), minlength=n_rows) if len(rows) else np.zeros(n_rows, np.int64)
+    offsets = np.zeros(n_rows + 1, dtype=np.int32)
+    np.cumsum(counts, out=offsets[1:])
+    return pa.ListArray.from_arrays(pa.array(offsets, pa.int32()),
+                                    pa.array(genes, type=pa.string()))
+
+
+# ------------------------------------------------------------------ #
+#  Vectorised queries
+# ------------------------------------------------------------------ #
+
+def gene_set_sizes(values, sep: str = GENE_SEPARATOR) -> np.ndarray:
+    """행별 유전자 수 (int64 ndarray)."""
+    arr = gene_list_array(values, sep)
+    return pc.list_value_length(arr).to_numpy(zero_copy_only=False).astype(np.int64)
+
+
+def match_counts(values, genes: Iterable[str], case_sensitive: bool = True,
+                 sep: str = GENE_SEPARATOR) -> np.ndarray:
+    """행별로 genes 중 몇 개(서로 다른 유전자 수)를 포함하는지."""
+    arr = gene_list_array(values, sep)
+    query = {str(g).strip() for g in genes if str(g).strip()}
+    if not case_sensitive:
+        query = {g.upper() for g in query}
+    if not query or len(arr) == 0:
+        return np.zeros(len(arr), dtype=np.int64)
+
+    flat = pc.list_flatten(arr)
+    if not case_sensitive:
+        flat = pc.utf8_upper(flat)
+    hit = pc.fill_null(pc.is_in(flat, value_set=pa.array(sorted(query), pa.string())), False)
+    hit = hit.to_numpy(zero_copy_only=False)
+    rows = pc.list_parent_indices(arr).to_numpy()[hit]
+    if not case_sensitive and len(rows):
+        # 대소문자만 다른 중복(Tp53 / TP53)은 한 번만 센다
+        hits = pd.DataFrame({'row': rows, 'gene': flat.filter(pa.array(hit)).to_numpy(zero_copy_only=False)})
+        rows = hits.drop_duplicates()['row'].to_numpy()
+    return np.bincount(rows, minlength=len(arr)).astype(np.int64)
+
+
+def contains_any(values, genes: Iterable[str], case_sensitive: bool = True,
+                 sep: str = GENE_SEPARATOR) -> np.ndarray:
+    """genes 중 하나라도 포함하는 행 → True (bool ndarray)."""
+    return match_counts(values, genes, case_sensitive, sep) > 0
+
+
+def contains_all(values, genes: Iterable[str], case_sensitive: bool = True,
+                 sep: str = GENE_SEPARATOR) -> np.ndarray:
+    """genes 를 모두 포함하는 행 → True (bool ndarray)."""
+    query = {str(g).strip() for g in genes if str(g).strip()}
+    if not case_sensitive:
+        query = {g.upper() for g in query}
+    if not query:
+        return np.ones(len(gene_list_array(values, sep)), dtype=bool)
+    return match_counts(values, query, case_sensitive, sep) == len(query)
+
+
+def encode_gene_lists(values, sep: str = GENE_SEPARATOR
+                      ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    CSR 형태 인코딩: (indptr[n+1], gene_codes[nnz], vocabulary[n_genes]).
+
+    행 i 의 유전자는 vocabulary[gene_codes[indptr[i]:indptr[i+1]]].
+    term × gene 희소 행렬(scipy.sparse.csr_matrix)을 만들 때 그대로 쓸 수 있다.
+    """
+    arr = gene_list_array(values, sep)
+    lengths = pc.list_value_length(arr).to_numpy(zero_copy_only=False).astype(np.int64)
+    indptr = np.zeros(len(arr) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=indptr[1:])
+    encoded = pc.dictionary_encode(pc.list_flatten(arr))
+    codes = encoded.indices.to_numpy(zero_copy_only=False).astype(np.int32)
+    vocabulary = encoded.dictionary.to_numpy(zero_copy_only=False)
+    return indptr, codes, vocabulary
+
+
+def union_genes(values, sep: str = GENE_SEPARATOR) -> Set[str]:
+    """모든 행의 유전자 합집합."""
+    flat = pc.list_flatten(gene_list_array(values, sep))
+    return set(pc.unique(flat).to_pylist())
+
+
+def gene_sets(values, sep: str = GENE_SEPARATOR) -> List[Set[str]]:
+    """행별 Python set 목록 (행 단위 처리가 꼭 필요한 소수 term 에만 사용)."""
+    return [set(items) for items in gene_list_array(values, sep).to_pylist()]
+
+
+def gene_set_at(values, position: int, sep: str = GENE_SEPARATOR) -> Set[str]:
+    """위치 position 행의 유전자 set."""
+    arr = gene_list_array(values, sep)
+    items: Optional[list] = arr[position].as_py()
+    return set(items or [])
+
+
+class GeneTermIndex:
+    """
+    대문자 유전자 심볼 → 그 유전자를 가진 term 행 위치 (역색인, CSC 형태).
+
+    GO 데이터셋마다 한 번 만들어 두면, 붙여넣은 유전자 리스트의 행별 히트 수는
+    질의 유전자들의 행 목록을 이어 붙여 bincount 하는 것으로 끝난다
+    (match_counts(..., case_sensitive=False) 와 같은 결과).
+
+    Attributes:
+        term_sizes: term(행)별 서로 다른 유전자 수 (대소문자 무시)
+    """
+
+    def __init__(self, values, sep: str = GENE_SYMBOL_SPLIT_PATTERN):
+        arr = gene_list_array(values, sep)
+        self.n_terms = len(arr)
+        flat = pc.utf8_upper(pc.list_flatten(arr))
+        encoded = pc.dictionary_encode(flat)
+        codes = encoded.indices.to_numpy(zero_copy_only=False).astype(np.int64)
+        vocabulary = encoded.dictionary.to_pylist()
+        rows = pc.list_parent_indices(arr).to_numpy().astype(np.int64)
+
+        # gene 순으로 안정 정렬 (rows 는 이미 오름차순) 후 연속된 같은 (gene, row) 쌍 제거
+        # → Tp53 / TP53 같은 대소문자 변형은 한 번만 센다
+        order = np.argsort(codes, kind='stable')
+        codes, rows = codes[order], rows[order]
+        keep = np.ones(len(codes), dtype=bool)
+        keep[1:] = (codes[1:] != codes[:-1]) | (rows[1:] != rows[:-1])
+        pair_codes, self._term_rows = codes[keep], rows[keep]
+        self._indptr = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(pair_codes, minlength=len(vocabulary)), out=self._indptr[1:])
+        self._codes = {gene: code for code, gene in enumerate(vocabulary)}
+        self.term_sizes = np.bincount(self._term_rows, minlength=self.n_terms).astype(np.int64)
+
+    def __contains__(self, gene) -> bool:
+        return str(gene).strip().upper() in self._codes
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def rows(self, gene) -> np.ndarray:
+        """gene 을 가진 term 행 위치 (오름차순)."""
+        code = self._codes.get(str(gene).strip().upper())
+        if code is None:
+            return np.empty(0, dtype=np.int64)
+        return self._term_rows[self._indptr[code]:self._indptr[code + 1]]
+
+    def match_counts(self, genes: Iterable[str]) -> np.ndarray:
+        """행별로 genes 중 몇 개(서로 다른 유전자, 대소문자 무시)를 포함하는지."""
+        query = {str(g).strip().upper() for g in genes if str(g).strip()}
+        codes = [self._codes[g] for g in query if g in self._codes]
+        if not codes:
+            return np.zeros(self.n_terms, dtype=np.int64)
+        hit_rows = np.concatenate([
+            self._term_rows[self._indptr[c]:self._indptr[c + 1]] for c in codes
+        ])
+        return np.bincount(hit_rows, minlength=self.n_terms).astype(np.int64)
+
+
+def frame_gene_term_index(df: pd.DataFrame, column: str, dataset=None) -> GeneTermIndex:
+    """
+    df[column] 의 역색인. df 가 dataset.dataframe 그 자체면 데이터셋 캐시를 쓰고,
+    다른 프레임(필터된 시트 등)이면 한 번 쓰고 버리는 인덱스를 만든다.
+    """
+    if dataset is not None and getattr(dataset, 'dataframe', None) is df:
+        return dataset.gene_term_index(column)
+    return GeneTermIndex(df[column])
+
+
+def warm_gene_term_index(dataset) -> None:
+    """
+    GO/KEGG 데이터셋의 gene_symbols 역색인을 미리 만들어 데이터셋 캐시에 넣는다.
+
+    큰 GO 데이터셋은 첫 생성에 수 초가 걸리므로 로드 워커 스레드에서 호출해
+    GUI 스레드의 첫 Gene Symbol 필터가 캐시된 인덱스를 바로 쓰게 한다.
+    실패해도 로드는 계속된다 (필터가 처음 쓸 때 다시 만든다).
+    """
+    from models.data_models import DatasetType
+    from models.standard_columns import StandardColumns
+
+    df = getattr(dataset, 'dataframe', None)
+    if (df is None or dataset.dataset_type != DatasetType.GO_ANALYSIS
+            or StandardColumns.GENE_SYMBOLS not in df.columns):
+        return
+    try:
+        dataset.gene_term_index(StandardColumns.GENE_SYMBOLS)
+    except Exception as e:
+        logger.warning(f"Could not pre-build gene-term index for '{dataset.name}': {e}")
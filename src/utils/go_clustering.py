@@ -2,76 +2,215 @@
 GO Term Clustering using Jaccard Similarity + Hierarchical Clustering
 
 유사한 GO Term을 Jaccard Similarity 기반 계층적 군집화로 클러스터링합니다.
+
+term 수가 많으면(SCALABLE_MIN_TERMS 초과) N x N 거리 없이 희소 유사도 그래프 위에서
+average-linkage 를 수행하는 scalable 모드로 자동 전환됩니다 (cut / cut_k / cluster_counts 동일).
 """
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Set, Tuple, Optional
+from typing import List, Dict, Tuple, Optional
 import logging
+from scipy import sparse
 from scipy.cluster.hierarchy import linkage, fcluster
-from scipy.spatial.distance import squareform
 
 from models.standard_columns import StandardColumns
+from utils.gene_sets import encode_gene_lists, gene_set_sizes, union_genes
+
+
+# Jaccard 블록 계산 시 한 번에 처리하는 행 수 (블록 메모리 = 행 수 x term 수 x 8 bytes)
+JACCARD_BLOCK_ROWS = 512
+
+# 유효 term 이 이보다 많으면 scalable(희소 average-linkage) 모드 자동 사용
+# (dense condensed 거리 벡터: 6000 term ≈ 144 MB, 20000 term ≈ 1.6 GB)
+SCALABLE_MIN_TERMS = 6000
+
+# scalable 모드에서 저장하는 최소 Jaccard 유사도 (이보다 낮은 쌍은 유사도 0 으로 취급)
+SCALABLE_MIN_SIMILARITY = 0.1
 
 
 class GOClustering:
     """GO Term 클러스터링 클래스 (Jaccard Similarity + Hierarchical Clustering)"""
     
-    def __init__(self, similarity_threshold: float = 0.7):
+    def __init__(self, similarity_threshold: float = 0.7, block_size: int = JACCARD_BLOCK_ROWS,
+                 scalable: Optional[bool] = None,
+                 min_similarity: float = SCALABLE_MIN_SIMILARITY):
         """
         Args:
             similarity_threshold: Jaccard similarity 임계값 (기본값: 0.7)
                                  높을수록 더 타이트한 클러스터 생성
+            block_size: Jaccard 계산 시 한 번에 처리할 term(행) 수
+            scalable: True 면 N x N 거리 없이 희소 유사도 그래프로 average-linkage 수행,
+                      None 이면 유효 term 수가 SCALABLE_MIN_TERMS 를 넘을 때 자동 사용
+            min_similarity: scalable 모드에서 유지하는 최소 유사도 (그 미만은 0 으로 근사)
         """
         self.logger = logging.getLogger(__name__)
         self.similarity_threshold = similarity_threshold
+        self.block_size = max(1, int(block_size))
+        self.scalable = scalable
+        self.min_similarity = float(min_similarity)
     
-    def _calculate_jaccard_similarity_matrix(self, gene_sets: List[Set[str]]) -> np.ndarray:
+    @staticmethod
+    def _incidence_matrix(gene_sets) -> sparse.csr_matrix:
+        """
+        term × gene 희소 incidence 행렬 (CSR, int32) 을 한 번의 벡터 연산으로 생성.
+
+        Args:
+            gene_sets: _gene_set 컬럼(list<string>) 또는 set 리스트 등 utils.gene_sets 입력 형식
+        """
+        indptr, codes, vocabulary = encode_gene_lists(gene_sets)
+        n_terms = len(indptr) - 1
+        data = np.ones(len(codes), dtype=np.int32)
+        return sparse.csr_matrix((data, codes, indptr), shape=(n_terms, len(vocabulary)))
+
+    @staticmethod
+    def _jaccard_block(incidence: sparse.csr_matrix, sizes: np.ndarray,
+                       start: int, stop: int, col_start: int = 0) -> np.ndarray:
+        """행 [start, stop) 와 열 [col_start, N) term 간 Jaccard 유사도 (dense float64 블록)."""
+        # 희소 곱 → 교집합 크기 (int32 누적이라 공유 유전자 수가 많아도 overflow 없음)
+        intersection = (incidence[start:stop] @ incidence[col_start:].T).toarray().astype(np.float64)
+        union = sizes[start:stop, None] + sizes[None, col_start:] - intersection
+        with np.errstate(invalid='ignore', divide='ignore'):
+            similarity = np.where(union > 0, intersection / union, 0.0)
+        return similarity
+
+    def _calculate_jaccard_similarity_matrix(self, gene_sets) -> np.ndarray:
         """
         모든 GO Term 쌍에 대해 Jaccard Similarity를 계산하여 N x N 유사도 행렬 생성
         
         Jaccard Similarity = |A ∩ B| / |A ∪ B|
         
         Args:
-            gene_sets: 각 GO Term의 유전자 집합 리스트
+            gene_sets: 각 GO Term의 유전자 집합 (_gene_set 컬럼 또는 set 리스트)
             
         Returns:
             N x N Jaccard similarity matrix
         """
-        n_terms = len(gene_sets)
-        self.logger.info(f"Calculating Jaccard similarity matrix for {n_terms} terms...")
-        
-        # Vectorization을 위해 binary matrix 생성
-        # 모든 유전자 추출
-        all_genes = sorted(set().union(*gene_sets))
-        gene_to_idx = {gene: idx for idx, gene in enumerate(all_genes)}
-        n_genes = len(all_genes)
-        
-        # Binary matrix: [n_terms, n_genes]
-        binary_matrix = np.zeros((n_terms, n_genes), dtype=np.int8)
-        
-        for term_idx, gene_set in enumerate(gene_sets):
-            for gene in gene_set:
-                gene_idx = gene_to_idx[gene]
-                binary_matrix[term_idx, gene_idx] = 1
-        
-        # Jaccard distance를 pairwise로 계산 (numpy 구현)
-        # Jaccard distance = 1 - |A ∩ B| / |A ∪ B|
-        # binary matrix에서: intersection = dot product, union = sum(a) + sum(b) - dot
-        intersection = binary_matrix @ binary_matrix.T          # (n_terms, n_terms)
-        row_sums     = binary_matrix.sum(axis=1, keepdims=True)  # (n_terms, 1)
-        union        = row_sums + row_sums.T - intersection      # (n_terms, n_terms)
-        with np.errstate(invalid='ignore', divide='ignore'):
-            jaccard_distance = np.where(union == 0, 1.0, 1.0 - intersection / union)
-        jaccard_similarity = 1.0 - jaccard_distance
-        
-        # NaN 처리 (empty sets)
-        jaccard_similarity = np.nan_to_num(jaccard_similarity, nan=0.0)
-        
-        self.logger.info(f"Similarity matrix calculated: shape={jaccard_similarity.shape}")
-        
-        return jaccard_similarity
+        incidence = self._incidence_matrix(gene_sets)
+        n_terms = incidence.shape[0]
+        self.logger.info(f"Calculating Jaccard similarity matrix for {n_terms} terms "
+                         f"({incidence.shape[1]} genes, nnz={incidence.nnz})...")
+        sizes = np.asarray(incidence.sum(axis=1), dtype=np.float64).ravel()
+        similarity = np.empty((n_terms, n_terms), dtype=np.float64)
+        for start in range(0, n_terms, self.block_size):
+            stop = min(start + self.block_size, n_terms)
+            similarity[start:stop] = self._jaccard_block(incidence, sizes, start, stop)
+        return similarity
+
+    def _condensed_jaccard_distance(self, gene_sets) -> np.ndarray:
+        """
+        linkage() 입력용 condensed Jaccard 거리 벡터를 행 블록 단위로 직접 채운다.
+
+        N x N 유사도/거리 행렬을 만들지 않으므로 최대 메모리는
+        condensed 벡터(N(N-1)/2 float64) + 블록(block_size x N) 수준이다.
+        """
+        incidence = self._incidence_matrix(gene_sets)
+        n_terms = incidence.shape[0]
+        self.logger.info(f"Calculating condensed Jaccard distances for {n_terms} terms "
+                         f"({incidence.shape[1]} genes, nnz={incidence.nnz}, "
+                         f"block={self.block_size})...")
+        sizes = np.asarray(incidence.sum(axis=1), dtype=np.float64).ravel()
+        condensed = np.empty(n_terms * (n_terms - 1) // 2, dtype=np.float64)
+        for start in range(0, n_terms, self.block_size):
+            stop = min(start + self.block_size, n_terms)
+            # 상삼각(j > i)만 필요하므로 열도 start 부터 계산
+            block = self._jaccard_block(incidence, sizes, start, stop, col_start=start)
+            for row in range(start, stop):
+                # squareform 순서: 행 i 의 (i, i+1..N-1) 쌍이 연속 구간
+                offset = row * n_terms - row * (row + 1) // 2
+                condensed[offset:offset + n_terms - row - 1] = 1.0 - block[row - start, row + 1 - start:]
+        return condensed
     
+    def _sparse_similarity_pairs(self, gene_sets, min_similarity: float
+                                 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        유사도 >= min_similarity 인 (i < j) term 쌍만 블록 단위로 수집.
+
+        Returns:
+            (rows, cols, similarities) — 메모리는 남는 쌍 수에 비례
+        """
+        incidence = self._incidence_matrix(gene_sets)
+        n_terms = incidence.shape[0]
+        sizes = np.asarray(incidence.sum(axis=1), dtype=np.float64).ravel()
+        rows, cols, sims = [], [], []
+        for start in range(0, n_terms, self.block_size):
+            stop = min(start + self.block_size, n_terms)
+            block = self._jaccard_block(incidence, sizes, start, stop, col_start=start)
+            r, c = np.nonzero((block >= min_similarity) & (block > 0))
+            upper = c > r   # 열 오프셋이 start 이므로 c > r 이면 j > i
+            r, c = r[upper], c[upper]
+            rows.append(r + start)
+            cols.append(c + start)
+            sims.append(block[r, c])
+        rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+        cols = np.concatenate(cols) if cols else np.empty(0, dtype=np.int64)
+        sims = np.concatenate(sims) if sims else np.empty(0, dtype=np.float64)
+        self.logger.info(f"Sparse similarity graph: {n_terms} terms, {len(sims)} pairs")
+        return rows, cols, sims
+
+    @staticmethod
+    def _sparse_average_linkage(n_terms: int, rows: np.ndarray, cols: np.ndarray,
+                                sims: np.ndarray) -> np.ndarray:
+        """
+        희소 유사도 그래프 위의 average-linkage (UPGMA) → scipy linkage 행렬.
+
+        클러스터 쌍마다 '유사도 합'만 보관하고 평균 = 합 / (|A| x |B|) 로 계산한다.
+        저장되지 않은 쌍은 유사도 0 (거리 1) 으로 취급하므로, 모든 쌍을 넣으면
+        scipy linkage(method='average') 와 같은 트리가 된다. average-linkage 는
+        reducible 하므로 전역 최대 유사도 쌍을 차례로 병합하면 되고, 병합에 참여한
+        클러스터는 사라지므로 heap 의 살아있는 항목은 항상 최신 값이다.
+        서로 연결되지 않은 나머지 클러스터는 마지막에 거리 1.0 으로 합친다.
+        """
+        import heapq
+
+        neighbors: List[Dict[int, float]] = [dict() for _ in range(n_terms)]
+        for i, j, s in zip(rows.tolist(), cols.tolist(), sims.tolist()):
+            neighbors[i][j] = s
+            neighbors[j][i] = s
+        heap = [(-s, i, j) for i, j, s in zip(rows.tolist(), cols.tolist(), sims.tolist())]
+        heapq.heapify(heap)
+
+        sizes = [1] * n_terms
+        alive = [True] * n_terms
+        merges = []
+        while heap:
+            neg_sim, a, b = heapq.heappop(heap)
+            if not (alive[a] and alive[b]):
+                continue
+            new_id = len(sizes)
+            new_size = sizes[a] + sizes[b]
+            nb_a, nb_b = neighbors[a], neighbors[b]
+            nb_a.pop(b, None)
+            nb_b.pop(a, None)
+            if len(nb_a) < len(nb_b):
+                nb_a, nb_b = nb_b, nb_a
+            for x, v in nb_b.items():
+                nb_a[x] = nb_a.get(x, 0.0) + v
+            for x, v in nb_a.items():
+                nb_x = neighbors[x]
+                nb_x.pop(a, None)
+                nb_x.pop(b, None)
+                nb_x[new_id] = v
+                heapq.heappush(heap, (-v / (new_size * sizes[x]), x, new_id))
+
+            merges.append((min(a, b), max(a, b), max(0.0, 1.0 + neg_sim), new_size))
+            alive[a] = alive[b] = False
+            neighbors[a] = neighbors[b] = {}
+            neighbors.append(nb_a)
+            sizes.append(new_size)
+            alive.append(True)
+
+        # 연결 성분이 여러 개면 거리 1.0 에서 차례로 병합 (유사도 0)
+        remaining = [cid for cid, is_alive in enumerate(alive) if is_alive]
+        while len(remaining) > 1:
+            a, b = remaining.pop(), remaining.pop()
+            new_id = len(sizes)
+            sizes.append(sizes[a] + sizes[b])
+            merges.append((min(a, b), max(a, b), 1.0, sizes[new_id]))
+            remaining.append(new_id)
+
+        return np.array(merges, dtype=np.float64).reshape(-1, 4)
+
     def cluster_terms(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[int, List[int]]]:
         """
         GO Term을 Jaccard Similarity 기반 계층적 군집화로 클러스터링.
@@ -103,17 +242,27 @@ class GOClustering:
             self._trivial = True
             return self
 
-        gene_sets = [row if isinstance(row, set) else set() for row in df['_gene_set']]
-        self._valid_indices = [i for i, gs in enumerate(gene_sets) if len(gs) > 0]
+        # _gene_set 은 list<string> 컬럼 (set 셀 등 구 형식도 gene_sets 유틸이 처리)
+        sizes = gene_set_sizes(df['_gene_set'])
+        self._valid_indices = np.flatnonzero(sizes > 0).tolist()
         if len(self._valid_indices) == 0:
             self.logger.warning("No valid gene sets found - each term becomes its own cluster")
             self._trivial = True
             return self
 
-        valid_gene_sets = [gene_sets[i] for i in self._valid_indices]
-        similarity_matrix = self._calculate_jaccard_similarity_matrix(valid_gene_sets)
-        distance_matrix = 1 - similarity_matrix
-        condensed_distance = squareform(distance_matrix, checks=False)
+        valid_gene_sets = df['_gene_set'].iloc[self._valid_indices]
+        n_valid = len(self._valid_indices)
+        use_scalable = self.scalable if self.scalable is not None else n_valid > SCALABLE_MIN_TERMS
+        if use_scalable:
+            self.logger.info(
+                f"Scalable mode: sparse average linkage for {n_valid} terms "
+                f"(pairs with similarity < {self.min_similarity} treated as 0)"
+            )
+            rows, cols, sims = self._sparse_similarity_pairs(valid_gene_sets, self.min_similarity)
+            self._linkage_matrix = self._sparse_average_linkage(n_valid, rows, cols, sims)
+            return self
+
+        condensed_distance = self._condensed_jaccard_distance(valid_gene_sets)
         self.logger.info("Building linkage (average) once; cuts are now instant...")
         self._linkage_matrix = linkage(condensed_distance, method='average')
         return self
@@ -297,11 +446,7 @@ class GOClustering:
             cluster_df = df[df['cluster_id'] == cluster_id]
             
             # 클러스터 내 모든 유전자 수집
-            all_genes = set()
-            if '_gene_set' in cluster_df.columns:
-                for gene_set in cluster_df['_gene_set']:
-                    if isinstance(gene_set, set):
-                        all_genes.update(gene_set)
+            all_genes = union_genes(cluster_df['_gene_set']) if '_gene_set' in cluster_df.columns else set()
             
             stats = {
                 'cluster_id': cluster_id,
@@ -331,3 +476,75 @@ class GOClustering:
             result_df = result_df.sort_values('min_fdr')
         
         return result_df
+
+
+
+class TermSimilarityCache:
+    """
+    GO term 간 Jaccard 유사도 캐시 (네트워크 그리기용).
+
+    데이터셋 전체의 term × gene 희소 incidence 행렬을 한 번만 만들고, 요청된 term 부분집합의
+    유사도 행렬을 벡터 연산으로 계산해 마지막 부분집합 하나를 캐시한다.
+    edge 임계값만 바뀌면 캐시된 행렬을 다시 자르기만 하므로 슬라이더 조작이 즉시 반영된다.
+
+    Usage:
+        cache = TermSimilarityCache(df['gene_symbols'], df.index)
+        src, dst, weight = cache.edges(plot_df.index, threshold=0.3)
+        G.add_weighted_edges_from(zip(src, dst, weight))
+    """
+
+    def __init__(self, gene_sets, index=None):
+        """
+        Args:
+            gene_sets: term 별 유전자 목록 컬럼 (list<string> / '/'-문자열 / set 셀)
+            index: 각 term 의 라벨 (None 이면 gene_sets 의 index 또는 0..N-1)
+        """
+        if index is None:
+            index = gene_sets.index if isinstance(gene_sets, pd.Series) else range(len(gene_sets))
+        self._labels = pd.Index(index)
+        self._incidence = GOClustering._incidence_matrix(gene_sets)
+        self._sizes = np.asarray(self._incidence.sum(axis=1), dtype=np.float64).ravel()
+        self._cached_key: Optional[tuple] = None
+        self._cached_similarity: Optional[np.ndarray] = None
+
+    def _positions(self, labels) -> np.ndarray:
+        if self._labels.is_unique:
+            positions = self._labels.get_indexer(labels)
+        else:
+            positions = np.asarray([self._labels.get_loc(l) for l in labels])
+        if (positions < 0).any():
+            raise KeyError("labels not present in TermSimilarityCache")
+        return positions
+
+    def similarity(self, labels) -> np.ndarray:
+        """
+        labels term 들 사이의 Jaccard 유사도 행렬 (len x len).
+
+        두 term 모두 유전자가 없으면(합집합 0) NaN — 기존 루프가 그런 쌍을 건너뛰던 것과 동일.
+        """
+        labels = list(labels)
+        key = tuple(labels)
+        if key == self._cached_key:
+            return self._cached_similarity
+        positions = self._positions(labels)
+        sub = self._incidence[positions]
+        sizes = self._sizes[positions]
+        similarity = GOClustering._jaccard_block(sub, sizes, 0, len(positions))
+        similarity[(sizes[:, None] + sizes[None, :]) == 0] = np.nan
+        self._cached_key, self._cached_similarity = key, similarity
+        return similarity
+
+    def edges(self, labels, threshold: float, inclusive: bool = True):
+        """
+        유사도가 threshold 이상(inclusive=False 면 초과)인 (i < j) term 쌍.
+
+        Returns:
+            (source_labels, target_labels, weights) 배열 튜플
+        """
+        labels = list(labels)
+        similarity = self.similarity(labels)
+        with np.errstate(invalid='ignore'):
+            keep = similarity >= threshold if inclusive else similarity > threshold
+        rows, cols = np.nonzero(np.triu(keep, k=1))
+        label_array = np.asarray(labels, dtype=object)
+        return label_array[rows], label_array[cols], similarity[rows, cols]
@@ -6,11 +6,12 @@ GO/KEGG Enrichment Results Loader
 
 import pandas as pd
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 import logging
 
 from models.data_models import Dataset, DatasetType
 from models.standard_columns import StandardColumns
+from utils.gene_sets import to_gene_list_series
 
 
 class GOKEGGLoader:
@@ -19,7 +20,8 @@ class GOKEGGLoader:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
     
-    def load_from_excel(self, file_path: Path, name: Optional[str] = None) -> Dataset:
+    def load_from_excel(self, file_path: Path, name: Optional[str] = None,
+                        checkpoint: Optional[Callable[[float], None]] = None) -> Dataset:
         """
         Excel 파일에서 GO/KEGG 결과 로딩 (여러 시트)
         
@@ -29,6 +31,8 @@ class GOKEGGLoader:
         Args:
             file_path: Excel 파일 경로
             name: 데이터셋 이름 (기본값: 파일명)
+            checkpoint: 단계 진행률(0-1) 보고 + 취소 확인 콜백 (시트마다 호출,
+                        load_pipeline 이 넘기며 취소되면 LoadCancelled 를 발생시킴)
             
         Returns:
             통합된 Dataset 객체
@@ -40,7 +44,9 @@ class GOKEGGLoader:
             excel_file = pd.ExcelFile(file_path)
             all_dfs = []
             
-            for sheet_name in excel_file.sheet_names:
+            for sheet_no, sheet_name in enumerate(excel_file.sheet_names, start=1):
+                if checkpoint:
+                    checkpoint(0.7 * (sheet_no - 1) / len(excel_file.sheet_names))
                 # Analysis_Info 같은 메타데이터 시트는 건너뛰기
                 sheet_name_str = str(sheet_name).lower()
                 if 'info' in sheet_name_str or 'metadata' in sheet_name_str or 'analysis' in sheet_name_str:
@@ -127,6 +133,8 @@ class GOKEGGLoader:
             # 모든 시트를 하나의 DataFrame으로 병합 (이제 컬럼명이 통일됨)
             merged_df = pd.concat(all_dfs, ignore_index=True)
             self.logger.info(f"Merged {len(all_dfs)} sheets into {len(merged_df)} terms")
+            if checkpoint:
+                checkpoint(0.75)
 
             
             # Gene Set에서 Direction과 Ontology 추출
@@ -140,6 +148,8 @@ class GOKEGGLoader:
             
             # Gene Symbols를 set으로 파싱
             merged_df = self._parse_gene_symbols(merged_df)
+            if checkpoint:
+                checkpoint(0.95)
             
             # Dataset 객체 생성
             dataset_name = name or file_path.stem
@@ -155,7 +165,9 @@ class GOKEGGLoader:
             return dataset
             
         except Exception as e:
-            self.logger.error(f"Failed to load GO/KEGG Excel file: {e}")
+            from utils.load_pipeline import LoadCancelled
+            if not isinstance(e, LoadCancelled):
+                self.logger.error(f"Failed to load GO/KEGG Excel file: {e}")
             raise
     
     def load_from_csv_files(self, file_paths: List[Path], name: str = "GO/KEGG Analysis") -> Dataset:
@@ -570,7 +582,7 @@ class GOKEGGLoader:
     
     def _parse_gene_symbols(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Gene Symbols 컬럼 파싱 (/ 구분자로 분리하여 set으로 변환)
+        Gene Symbols 컬럼 파싱 (/ 구분자로 분리하여 Arrow list<string> 컬럼으로 변환)
         
         Args:
             df: DataFrame
@@ -590,14 +602,12 @@ class GOKEGGLoader:
                     break
 
         if gene_col is not None:
-            df['_gene_set'] = df[gene_col].apply(
-                lambda x: set(str(x).split('/')) if pd.notna(x) else set()
-            )
+            df['_gene_set'] = to_gene_list_series(df[gene_col])
         else:
             self.logger.warning(
                 "No gene-list column found (Gene Symbols/Genes/geneID/core_enrichment/...) — "
                 "_gene_set will be empty for all rows, so GO clustering will not merge overlapping terms."
             )
-            df['_gene_set'] = [set() for _ in range(len(df))]
+            df['_gene_set'] = to_gene_list_series([None] * len(df), index=df.index)
 
         return df
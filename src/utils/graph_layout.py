@@ -0,0 +1,242 @@
+"""
+Graph Layout Cache
+
+GO 네트워크(GONetworkDialog, GOClusteringDialog)용 그래프 배치 캐시와
+대형 그래프용 빠른 force-directed 배치입니다.
+
+- GraphLayoutCache: (배치 알고리즘, 파라미터, 그래프 구조) 키로 결과를 LRU 캐시.
+  색/라벨/크기만 바뀐 재그리기는 배치를 다시 계산하지 않고, edge 임계값 변경처럼
+  구조가 바뀌면 직전 배치 좌표에서 warm-start 하여 적은 반복으로 수렴시킨다.
+- force_directed_layout: numpy 벡터화 Fruchterman-Reingold.
+  노드가 많으면 반발력을 격자(grid) 셀 단위로 근사(Barnes-Hut 방식)해
+  O(N²) 대신 대략 O(셀 수² + 근접 쌍 수) 로 계산한다.
+
+Usage:
+    cache = GraphLayoutCache()
+    pos = cache.layout(G, 'spring', k=0.5, iterations=60, seed=42)
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+import numpy as np
+import networkx as nx
+
+
+logger = logging.getLogger(__name__)
+
+# 이보다 노드가 많으면 spring / kamada-kawai 대신 force_directed_layout 사용
+LARGE_GRAPH_NODES = 500
+KAMADA_KAWAI_MAX_NODES = 300
+
+# force_directed_layout 에서 반발력을 정확히(N x N) 계산하는 최대 노드 수
+EXACT_REPULSION_MAX_NODES = 300
+
+# warm-start 시 반복 횟수 비율 (직전 배치에서 시작하므로 적게 돌려도 충분)
+WARM_START_ITERATION_FRACTION = 0.35
+
+
+def force_directed_layout(G: nx.Graph, pos: Optional[Dict[Hashable, Any]] = None,
+                          iterations: int = 50, k: Optional[float] = None,
+                          weight: Optional[str] = 'weight', seed: int = 42,
+                          grid_size: Optional[int] = None) -> Dict[Hashable, np.ndarray]:
+    """
+    벡터화 Fruchterman-Reingold 배치. 결과는 [-1, 1] 범위로 정규화.
+
+    Args:
+        G: networkx 그래프
+        pos: 초기 좌표 (일부 노드만 있어도 됨 — 나머지는 무작위)
+        iterations: 반복 횟수
+        k: 최적 노드 간 거리 (None 이면 1/sqrt(N))
+        weight: edge 가중치 속성 (None 이면 1)
+        seed: 난수 seed
+        grid_size: 반발력 근사 격자 한 변의 셀 수 (None 이면 노드 수로 결정)
+    """
+    nodes = list(G.nodes())
+    n = len(nodes)
+    if n == 0:
+        return {}
+    if n == 1:
+        return {nodes[0]: np.zeros(2)}
+
+    rng = np.random.default_rng(seed)
+    X = rng.random((n, 2))
+    if pos:
+        known = [(i, pos[node]) for i, node in enumerate(nodes) if node in pos]
+        if known:
+            idx = np.array([i for i, _ in known])
+            X[idx] = np.asarray([p for _, p in known], dtype=np.float64)[:, :2]
+
+    adjacency = nx.to_scipy_sparse_array(G, nodelist=nodes, weight=weight, format='coo')
+    upper = adjacency.row < adjacency.col
+    src, dst = adjacency.row[upper], adjacency.col[upper]
+    edge_w = np.asarray(adjacency.data[upper], dtype=np.float64) if weight else np.ones(upper.sum())
+
+    k = k if k is not None else np.sqrt(1.0 / n)
+    extent = np.ptp(X, axis=0).max()
+    temperature = 0.1 * max(extent, 1e-3)
+    cooling = temperature / (iterations + 1)
+
+    for _ in range(iterations):
+        if n <= EXACT_REPULSION_MAX_NODES:
+            disp = _exact_repulsion(X, k)
+        else:
+            disp = _grid_repulsion(X, k, grid_size)
+
+        # 인력: edge 양 끝을 d² / k x weight 로 당김
+        if len(src):
+            delta = X[src] - X[dst]
+            dist = np.maximum(np.linalg.norm(delta, axis=1), 0.01)
+            force = (delta * (dist * edge_w / k)[:, None])
+            disp -= _scatter_add(src, force, n)
+            disp += _scatter_add(dst, force, n)
+
+        length = np.maximum(np.linalg.norm(disp, axis=1), 0.01)
+        X += disp * (np.minimum(length, temperature) / length)[:, None]
+        temperature -= cooling
+
+    X -= X.mean(axis=0)
+    scale = np.abs(X).max()
+    if scale > 0:
+        X /= scale
+    return dict(zip(nodes, X))
+
+
+def _scatter_add(index: np.ndarray, values: np.ndarray, n: int) -> np.ndarray:
+    """index 별 2D 벡터 합 (np.add.at 보다 빠른 bincount 버전)."""
+    return np.stack([np.bincount(index, weights=values[:, 0], minlength=n),
+                     np.bincount(index, weights=values[:, 1], minlength=n)], axis=1)
+
+
+def _exact_repulsion(X: np.ndarray, k: float) -> np.ndarray:
+    """모든 노드 쌍의 반발력 k² / d (N x N 벡터 연산)."""
+    delta = X[:, None, :] - X[None, :, :]
+    dist2 = np.maximum((delta ** 2).sum(axis=2), 1e-4)
+    np.fill_diagonal(dist2, np.inf)
+    return (delta * (k * k / dist2)[:, :, None]).sum(axis=1)
+
+
+def _grid_repulsion(X: np.ndarray, k: float, grid_size: Optional[int]) -> np.ndarray:
+    """
+    격자 근사 반발력 (Barnes-Hut 방식).
+
+    같은/이웃 셀(3x3)의 노드와는 정확히, 그 밖의 셀은 질량 중심 하나로 묶어 계산한다.
+    """
+    from scipy.spatial import cKDTree
+
+    n = len(X)
+    g = grid_size or int(np.clip(np.sqrt(n) / 2, 4, 48))
+    lo = X.min(axis=0)
+    cell = np.maximum((X.max(axis=0) - lo) / g, 1e-9)
+    coords = np.clip(((X - lo) / cell).astype(np.int64), 0, g - 1)
+    cell_id = coords[:, 0] * g + coords[:, 1]
+
+    mass = np.bincount(cell_id, minlength=g * g).astype(np.float64)
+    occupied = np.flatnonzero(mass)
+    centroid = np.stack([
+        np.bincount(cell_id, weights=X[:, 0], minlength=g * g)[occupied],
+        np.bincount(cell_id, weights=X[:, 1], minlength=g * g)[occupied],
+    ], axis=1) / mass[occupied, None]
+    cell_coords = np.stack([occupied // g, occupied % g], axis=1)
+
+    # 원거리: 이웃이 아닌 셀끼리 질량 중심으로 계산 (셀 수 C 에 대해 O(C²)),
+    # 같은 셀의 노드는 같은 원거리 힘을 받는다
+    delta = centroid[:, None, :] - centroid[None, :, :]
+    dist2 = np.maximum((delta ** 2).sum(axis=2), 1e-4)
+    far = np.abs(cell_coords[:, None, :] - cell_coords[None, :, :]).max(axis=2) > 1
+    strength = np.where(far, k * k * mass[occupied][None, :] / dist2, 0.0)
+    far_disp = np.zeros((g * g, 2))
+    far_disp[occupied] = (delta * strength[:, :, None]).sum(axis=1)
+    disp = far_disp[cell_id]
+
+    # 근거리: 이웃 셀 안의 노드 쌍만 정확히 (이웃 셀 노드는 최대 2√2 x 셀 크기 이내)
+    radius = 2.0 * np.sqrt(2.0) * cell.max()
+    pairs = cKDTree(X).query_pairs(r=radius, output_type='ndarray')
+    if len(pairs):
+        i, j = pairs[:, 0], pairs[:, 1]
+        near = np.abs(coords[i] - coords[j]).max(axis=1) <= 1
+        i, j = i[near], j[near]
+        delta = X[i] - X[j]
+        dist2 = np.maximum((delta ** 2).sum(axis=1), 1e-4)
+        force = delta * (k * k / dist2)[:, None]
+        disp += _scatter_add(i, force, n)
+        disp -= _scatter_add(j, force, n)
+    return disp
+
+
+class GraphLayoutCache:
+    """
+    그래프 배치 LRU 캐시 + warm-start.
+
+    키 = (알고리즘, 파라미터, 노드 집합, 가중치 포함 edge 집합).
+    알고리즘: 'spring', 'kamada_kawai', 'circular', 'spectral', 'force'.
+    """
+
+    def __init__(self, max_entries: int = 16):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, Dict[Hashable, np.ndarray]]" = OrderedDict()
+        # 알고리즘별 직전 배치 (warm-start 용)
+        self._last: Dict[str, Dict[Hashable, np.ndarray]] = {}
+
+    @staticmethod
+    def structure_key(G: nx.Graph, weight: Optional[str] = 'weight') -> tuple:
+        nodes = frozenset(G.nodes())
+        edges = frozenset(
+            (frozenset((u, v)), round(float(data.get(weight, 1.0)) if weight else 1.0, 4))
+            for u, v, data in G.edges(data=True)
+        )
+        return nodes, edges
+
+    def clear(self):
+        self._entries.clear()
+        self._last.clear()
+
+    def layout(self, G: nx.Graph, algorithm: str = 'spring', **params) -> Dict[Hashable, np.ndarray]:
+        """캐시된 배치를 반환하거나 계산 (구조가 바뀌었으면 직전 배치에서 warm-start)."""
+        key = (algorithm, tuple(sorted(params.items())), self.structure_key(G))
+        cached = self._entries.get(key)
+        if cached is not None:
+            self._entries.move_to_end(key)
+            return dict(cached)
+
+        warm = self._last.get(algorithm)
+        if warm is not None:
+            warm = {node: p for node, p in warm.items() if node in G}
+        pos = self._compute(G, algorithm, warm or None, dict(params))
+
+        self._entries[key] = pos
+        self._last[algorithm] = pos
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return dict(pos)
+
+    def _compute(self, G: nx.Graph, algorithm: str, warm: Optional[dict],
+                 params: dict) -> Dict[Hashable, np.ndarray]:
+        n = G.number_of_nodes()
+        iterations = int(params.pop('iterations', 50))
+        seed = params.pop('seed', 42)
+        k = params.pop('k', None)
+        if warm and len(warm) >= 0.8 * n:
+            iterations = max(10, int(iterations * WARM_START_ITERATION_FRACTION))
+
+        if algorithm == 'circular':
+            return nx.circular_layout(G)
+        if algorithm == 'spectral':
+            return nx.spectral_layout(G) if n > 2 else nx.spring_layout(G, seed=seed)
+
+        large = n > LARGE_GRAPH_NODES or (algorithm == 'kamada_kawai' and n > KAMADA_KAWAI_MAX_NODES)
+        if algorithm == 'force' or large:
+            if large and algorithm != 'force':
+                logger.debug(f"{n} nodes: using vectorised force-directed layout instead of {algorithm}")
+            return force_directed_layout(G, pos=warm, iterations=iterations, k=k, seed=seed)
+
+        if algorithm == 'kamada_kawai':
+            try:
+                # kamada_kawai 의 초기 좌표는 모든 노드가 있어야 함
+                init = warm if warm and len(warm) == n else None
+                return nx.kamada_kawai_layout(G, pos=init)
+            except Exception:
+                return nx.spring_layout(G, seed=seed)
+
+        return nx.spring_layout(G, k=k, pos=warm, iterations=iterations, seed=seed)
@@ -0,0 +1,89 @@
+"""
+Identifier Index
+
+식별자 컬럼(symbol, gene_id, nearest_gene, term_id 등)의 정규화 키(strip + upper)
+→ 행 위치 인덱스입니다. 유전자/term ID 리스트 필터가 매번 전체 컬럼에
+astype(str).str.strip().str.upper() 를 다시 계산하지 않고 hash 조회로 끝나게 합니다.
+
+Dataset.identifier_index(column) 이 데이터셋별로 지연 생성·캐시하며,
+dataframe 이 교체되면 다시 만듭니다.
+
+Usage:
+    index = dataset.identifier_index('symbol')
+    positions = index.positions(['Actb', 'GAPDH'])   # 입력 순서 유지
+    df.iloc[positions]
+"""
+
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def normalize_identifier(value) -> str:
+    """식별자 비교 키 (앞뒤 공백 제거 + 대문자)."""
+    return str(value).strip().upper()
+
+
+class IdentifierIndex:
+    """정규화 식별자 → 행 위치(0-based, 원래 행 순서) 매핑"""
+
+    def __init__(self, values: pd.Series):
+        keys = values.astype(str).str.strip().str.upper()
+        # 결측(NaN)은 code -1 → 인덱스에서 제외
+        codes, uniques = pd.factorize(keys)
+        order = np.argsort(codes, kind='stable')
+        sorted_codes = codes[order]
+        start = np.searchsorted(sorted_codes, 0)
+        valid, valid_codes = order[start:], sorted_codes[start:]
+        groups = np.split(valid, np.flatnonzero(np.diff(valid_codes)) + 1)
+        self._rows: Dict[str, np.ndarray] = dict(zip(uniques.tolist(), groups))
+        self.size = len(values)
+
+    def __contains__(self, key) -> bool:
+        return normalize_identifier(key) in self._rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def rows(self, key) -> np.ndarray:
+        """키 하나에 해당하는 행 위치 (없으면 빈 배열)."""
+        return self._rows.get(normalize_identifier(key), np.empty(0, dtype=np.intp))
+
+    def positions(self, keys: Iterable) -> np.ndarray:
+        """
+        입력 키 순서대로 일치하는 행 위치를 이어 붙여 반환.
+
+        같은 키가 여러 번 들어오면 처음 위치만 사용하고, 한 키에 여러 행이 있으면
+        원래 행 순서를 따른다.
+        """
+        seen = set()
+        matched = []
+        for key in keys:
+            norm = normalize_identifier(key)
+            if not norm or norm in seen:
+                continue
+            seen.add(norm)
+            rows = self._rows.get(norm)
+            if rows is not None:
+                matched.append(rows)
+        if not matched:
+            return np.empty(0, dtype=np.intp)
+        return np.concatenate(matched)
+
+
+def frame_identifier_index(df: pd.DataFrame, column: str, dataset=None) -> IdentifierIndex:
+    """
+    df 의 column 인덱스. df 가 dataset.dataframe 그 자체면 데이터셋 캐시를 쓰고,
+    (필터된 시트 등) 다른 프레임이면 한 번 쓰고 버리는 인덱스를 만든다.
+    """
+    if dataset is not None and getattr(dataset, 'dataframe', None) is df:
+        return dataset.identifier_index(column)
+    return IdentifierIndex(df[column])
+
+
+def select_identifiers(df: pd.DataFrame, column: str, keys: Iterable,
+                       dataset=None, index: Optional[IdentifierIndex] = None) -> pd.DataFrame:
+    """keys 와 일치하는 df 행을 keys 입력 순서대로 반환 (원래 index 라벨 유지)."""
+    index = index or frame_identifier_index(df, column, dataset)
+    return df.iloc[index.positions(keys)]
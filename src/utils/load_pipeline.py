@@ -0,0 +1,167 @@
+"""
+Dataset Load Pipeline
+
+파일 확장자와 내용으로 알맞은 로더(DataLoader, ATACSeqLoader, GOKEGGLoader,
+MultiGroupLoader, ChromVARLoader, MotifLoader, FootprintLoader)를 골라
+Dataset 을 만드는 Qt-독립 파이프라인입니다.
+
+MainPresenter 의 동기 로드와 gui.workers.DataLoadWorker(백그라운드)가
+같은 함수를 사용합니다. 진행률 콜백과 취소 확인 콜백을 받아, 단계 사이마다
+취소 여부를 검사하고 취소되면 LoadCancelled 를 발생시킵니다.
+
+Excel 로더(DataLoader / GOKEGGLoader)에는 checkpoint 콜백을 넘겨 파싱 도중
+(읽기 → 표준화 → 후처리, GO 는 시트마다)에도 진행률을 보고하고 취소를 확인합니다.
+나머지 전용 로더(ATAC, Multi-Group, chromVAR, Motif, Footprint)는 한 번의
+read 호출이라 읽기 중에는 중단할 수 없고, 취소는 읽기가 끝난 직후 반영됩니다
+(결과는 버려짐).
+
+Usage:
+    dataset = load_dataset_file(Path("DE.xlsx"), "My DE",
+                                progress_callback=lambda p: print(p),
+                                is_cancelled=lambda: False)
+"""
+
+import logging
+from pathlib import Path
+from typing import Callable, Optional
+
+import pandas as pd
+
+from models.data_models import Dataset, DatasetType
+from utils.data_loader import DataLoader
+
+logger = logging.getLogger(__name__)
+
+
+class LoadCancelled(Exception):
+    """사용자가 로드를 취소했을 때 발생"""
+
+
+def load_dataset_file(
+    file_path: Path,
+    name: Optional[str] = None,
+    data_loader: Optional[DataLoader] = None,
+    column_mapper_callback: Optional[Callable] = None,
+    progress_callback: Optional[Callable[[int], None]] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+) -> Dataset:
+    """
+    파일 하나를 알맞은 로더로 읽어 Dataset 반환.
+
+    Args:
+        file_path: Excel / CSV / Parquet / TXT / TSV 파일 경로
+        name: 데이터셋 이름 (None이면 파일명)
+        data_loader: DE 로드에 사용할 DataLoader (사용자 매핑 공유용, None이면 새로 생성)
+        column_mapper_callback: DataLoader.load_from_excel 의 컬럼 매핑 콜백
+        progress_callback: 진행률(0-100) 보고 콜백
+        is_cancelled: 취소 여부 확인 콜백 (True면 LoadCancelled)
+
+    Raises:
+        LoadCancelled: 단계 사이(또는 Excel 로더의 파싱 단계 사이)에서 취소가 감지된 경우
+        Exception: 로더가 발생시킨 오류 그대로
+    """
+    file_path = Path(file_path)
+    suffix = file_path.suffix.lower()
+    display_name = name or file_path.stem
+
+    def report(value: int):
+        if progress_callback is not None:
+            progress_callback(value)
+
+    def checkpoint():
+        if is_cancelled is not None and is_cancelled():
+            raise LoadCancelled(f"Loading '{file_path.name}' was cancelled")
+
+    def stage(fraction: float):
+        """로더 내부 단계 보고: 0-1 을 20-90 구간으로 환산한 뒤 취소 확인"""
+        report(20 + int(70 * fraction))
+        checkpoint()
+
+    data_loader = data_loader or DataLoader()
+
+    report(5)
+    checkpoint()
+
+    loader = _select_loader(file_path, suffix, data_loader)
+    report(20)
+    checkpoint()
+
+    if isinstance(loader, _GOExcelLoader):
+        dataset = loader.load(file_path, display_name, checkpoint=stage)
+    elif loader is not None:
+        dataset = loader.load(file_path, display_name)
+    else:
+        # ── 기본: DE 데이터셋 로더 (컬럼 표준화 + zero-abundance 제거 포함) ──
+        dataset = data_loader.load_from_excel(
+            file_path,
+            name,
+            column_mapper_callback=column_mapper_callback,
+            checkpoint=stage,
+        )
+    report(90)
+    checkpoint()
+
+    report(100)
+    return dataset
+
+
+class _GOExcelLoader:
+    """GOKEGGLoader.load_from_excel 을 load(path, name) 인터페이스로 맞추는 어댑터"""
+
+    def load(self, path: Path, name: str,
+             checkpoint: Optional[Callable[[float], None]] = None) -> Dataset:
+        from utils.go_kegg_loader import GOKEGGLoader
+        return GOKEGGLoader().load_from_excel(path, name, checkpoint=checkpoint)
+
+
+def _select_loader(file_path: Path, suffix: str, data_loader: DataLoader):
+    """
+    전용 로더 선택. DataLoader(DE 기본 경로)를 써야 하면 None.
+
+    판별 순서는 MainPresenter 기존 동작과 동일:
+    chromVAR → Footprint → Motif → ATAC / Multi-Group(빠른 감지) → GO(Excel).
+    """
+    # ── CSV / Parquet: chromVAR diff TF 감지 ─────────────────────────
+    if suffix in ('.csv', '.parquet'):
+        from utils.chromvar_loader import ChromVARLoader
+        if ChromVARLoader.is_chromvar_file(file_path):
+            return ChromVARLoader()
+
+    # ── TXT / TSV: Motif enrichment 또는 TF Footprint 파일 감지 ────────
+    if suffix in ('.txt', '.tsv'):
+        from utils.footprint_loader import FootprintLoader
+        if FootprintLoader.is_footprint_file(file_path):
+            return FootprintLoader()
+        from utils.motif_loader import MotifLoader
+        if MotifLoader.is_motif_file(file_path):
+            return MotifLoader()
+
+    # ── CSV / Parquet: ATAC / MultiGroup 빠른 감지 ───────────────────
+    if suffix in ('.csv', '.parquet'):
+        try:
+            # parquet 은 footer 스키마만 읽은 0행 프레임으로 판별 (데이터 디코딩 없음)
+            from utils.dataset_detector import read_schema_frame
+            peek = pd.read_csv(file_path, nrows=5) if suffix == '.csv' \
+                   else read_schema_frame(file_path)
+
+            from utils.atac_seq_loader import ATACSeqLoader
+            if ATACSeqLoader.is_atac_dataframe(peek):
+                return ATACSeqLoader()
+
+            from utils.multi_group_loader import MultiGroupLoader
+            if MultiGroupLoader.is_multi_group_dataframe(peek):
+                return MultiGroupLoader()
+        except Exception as e:
+            logger.warning(f"Quick detection failed: {e}, falling through")
+
+    # ── Excel: GO/KEGG 또는 DE 감지 ──────────────────────────────────
+    try:
+        test_df = pd.read_excel(file_path, nrows=10)
+        detected_type = data_loader._detect_dataset_type(test_df)
+        logger.debug(f"Quick type detection: {detected_type.value}")
+        if detected_type == DatasetType.GO_ANALYSIS:
+            return _GOExcelLoader()
+    except Exception as e:
+        logger.warning(f"Quick type detection failed: {e}, using standard loader")
+
+    return None
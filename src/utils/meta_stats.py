@@ -7,6 +7,8 @@ Late-integration meta-analysis statistics.
 - Fisher's method: p-value 유의성 크기를 결합
 - Stouffer's method: 발현 변화 방향성(부호)까지 반영한 z-score 결합
 - Random-effects (DerSimonian-Laird): log2FC + SE로 통합 효과크기·이질성(I²) 추정
+
+*_matrix 함수는 같은 계산을 유전자 × 데이터셋 행렬(NaN = 미검정)에 한 번에 적용한다.
 """
 from typing import Optional, Sequence, Dict
 
@@ -138,3 +140,116 @@ def combine_pvalues(pvals: Sequence[float],
         'meta_direction': 'concordant' if concordant else 'discordant',
         'meta_found_in': k,
     }
+
+
+def _row_mean(values: np.ndarray, k: np.ndarray) -> np.ndarray:
+    """k(유효 개수)로 나눈 행 합 — 유효하지 않은 원소는 0 으로 채워져 있어야 한다."""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return values.sum(axis=1) / k
+
+
+def combine_pvalues_matrix(pvals, lfcs) -> Dict[str, np.ndarray]:
+    """combine_pvalues 의 행렬 버전 (행 = 유전자, 열 = 데이터셋).
+
+    Args:
+        pvals: (n_genes, n_datasets) raw p-value. NaN 은 미검정으로 제외.
+        lfcs:  pvals 와 같은 shape 의 log2 fold change.
+
+    Returns:
+        combine_pvalues 와 같은 키의 길이 n_genes 배열 dict.
+        유효 데이터셋이 2개 미만인 행은 NaN (meta_direction 은 None, meta_found_in 은 0).
+    """
+    p = np.atleast_2d(np.asarray(pvals, dtype=float))
+    l = np.atleast_2d(np.asarray(lfcs, dtype=float))
+    mask = np.isfinite(p) & np.isfinite(l)
+    k = mask.sum(axis=1)
+    valid = k >= 2
+
+    p = np.where(mask, np.clip(p, 1e-300, 1.0), 1.0)
+    l = np.where(mask, l, 0.0)
+    signs = np.sign(l)
+
+    fisher = np.full(len(p), np.nan)
+    stouffer = np.full(len(p), np.nan)
+    meta_z = np.full(len(p), np.nan)
+    if valid.any():
+        chi2 = -2.0 * np.log(p[valid]).sum(axis=1)
+        fisher[valid] = st.chi2.sf(chi2, df=2 * k[valid])
+        z = np.where(mask[valid], st.norm.isf(p[valid] / 2.0) * signs[valid], 0.0)
+        meta_z[valid] = z.sum(axis=1) / np.sqrt(k[valid])
+        stouffer[valid] = 2.0 * st.norm.sf(np.abs(meta_z[valid]))
+
+    concordant = ((signs > 0) & mask).sum(axis=1) == k
+    concordant |= ((signs < 0) & mask).sum(axis=1) == k
+    direction = np.where(concordant, 'concordant', 'discordant').astype(object)
+    direction[~valid] = None
+
+    return {
+        'meta_pvalue_fisher': fisher,
+        'meta_pvalue_stouffer': stouffer,
+        'meta_z': meta_z,
+        'meta_log2fc_mean': np.where(valid, _row_mean(l, k), np.nan),
+        'meta_direction': direction,
+        'meta_found_in': np.where(valid, k, 0),
+    }
+
+
+def random_effects_matrix(effects, ses) -> Dict[str, np.ndarray]:
+    """random_effects 의 행렬 버전 (행 = 유전자, 열 = 데이터셋).
+
+    Args:
+        effects: (n_genes, n_datasets) log2FC. NaN 은 제외.
+        ses:     effects 와 같은 shape 의 표준오차. ≤0/NaN 도 제외.
+
+    Returns:
+        random_effects 와 같은 키의 길이 n_genes 배열 dict.
+        유효 데이터셋이 2개 미만인 행은 NaN (meta_effect_k 는 0).
+    """
+    y = np.atleast_2d(np.asarray(effects, dtype=float))
+    s = np.atleast_2d(np.asarray(ses, dtype=float))
+    mask = np.isfinite(y) & np.isfinite(s) & (s > 0)
+    k = mask.sum(axis=1)
+    valid = k >= 2
+    y = np.where(mask, y, 0.0)
+    v = np.where(mask, s, 1.0) ** 2          # 분산 (제외된 원소는 가중 0)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        w = np.where(mask, 1.0 / v, 0.0)     # fixed-effect 가중
+        sw = w.sum(axis=1)
+        y_fixed = (w * y).sum(axis=1) / sw
+        Q = (w * (y - y_fixed[:, None]) ** 2).sum(axis=1)
+
+        # DerSimonian-Laird τ²
+        c = sw - (w ** 2).sum(axis=1) / sw
+        tau2 = np.where(c > 0, np.maximum(0.0, (Q - (k - 1)) / c), 0.0)
+        i2 = np.where(Q > 0, np.maximum(0.0, (Q - (k - 1)) / Q) * 100.0, 0.0)
+
+        # random-effects 가중
+        w_re = np.where(mask, 1.0 / (v + tau2[:, None]), 0.0)
+        sw_re = w_re.sum(axis=1)
+        effect = (w_re * y).sum(axis=1) / sw_re
+        se = np.sqrt(1.0 / sw_re)
+        z = np.where(se > 0, effect / se, 0.0)
+    p_re = 2.0 * st.norm.sf(np.abs(z))
+
+    def _valid(values):
+        return np.where(valid, values, np.nan)
+
+    return {
+        'meta_effect_log2fc': _valid(effect),
+        'meta_effect_se':     _valid(se),
+        'meta_ci_low':        _valid(effect - 1.96 * se),
+        'meta_ci_high':       _valid(effect + 1.96 * se),
+        'meta_pvalue_re':     _valid(p_re),
+        'meta_i2':            _valid(i2),
+        'meta_effect_k':      np.where(valid, k, 0),
+    }
+
+
+def meta_analysis_matrix(pvals, lfcs, ses=None) -> Dict[str, np.ndarray]:
+    """combine_pvalues_matrix + random_effects_matrix(ses 가 있을 때) + Fisher 메타 FDR(BH)."""
+    out = combine_pvalues_matrix(pvals, lfcs)
+    out['meta_fdr_fisher'] = benjamini_hochberg(out['meta_pvalue_fisher'])
+    if ses is not None:
+        out.update(random_effects_matrix(lfcs, ses))
+    return out
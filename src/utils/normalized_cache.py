@@ -0,0 +1,127 @@
+"""
+Normalized Parquet Cache
+
+DatabaseManager.load_dataset 이 매번 다시 수행하던 정규화(표준 컬럼명 변환,
+GO direction/ontology 복구, fold_enrichment 계산, gene_id/symbol 문자열화,
+_gene_set 파싱)의 결과를 "바로 쓸 수 있는" parquet 으로 저장해 두고,
+다음 로드부터는 그대로 읽기만 합니다.
+
+캐시 파일은 원본 옆 .seqviewer_cache/ 폴더에 두며, parquet 스키마 메타데이터에
+(정규화 버전, 원본 mtime, 원본 size, dataset_type, original_columns,
+annotation_categories)를 기록합니다. 앞의 넷 중 하나라도 다르면 캐시는 무효로 보고
+원본에서 다시 정규화합니다 (정규화는 dataset_type 에 따라 컬럼 매핑과 GO/ATAC 분기가
+달라지므로, 메타데이터에서 타입만 바꿔도 다시 만든다).
+→ 정규화 로직을 바꾸면 NORMALIZER_VERSION 을 올릴 것.
+
+_gene_set 은 Arrow list<string> 으로 저장하고, 읽을 때도 ArrowDtype 컬럼으로
+유지합니다 (utils.gene_sets).
+"""
+
+import json
+import logging
+import os
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+
+from utils.gene_sets import (
+    GENE_SET_COLUMN, gene_list_types_mapper, to_arrow_table, to_gene_list_series,
+)
+
+# 정규화 파이프라인 버전 — DatabaseManager 정규화 로직이 바뀌면 올린다
+NORMALIZER_VERSION = 2
+
+CACHE_DIRNAME = ".seqviewer_cache"
+_META_KEY = b"seqviewer_normalized"
+
+
+class NormalizedParquetCache:
+    """원본 parquet 옆 .seqviewer_cache/ 에 정규화 결과를 저장/조회"""
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def cache_path(source_file: Path) -> Path:
+        source_file = Path(source_file)
+        return source_file.parent / CACHE_DIRNAME / f"{source_file.stem}.normalized.parquet"
+
+    @staticmethod
+    def _source_fingerprint(source_file: Path) -> Dict[str, Any]:
+        stat = Path(source_file).stat()
+        return {'source_mtime': stat.st_mtime, 'source_size': stat.st_size}
+
+    def read(self, source_file: Path,
+             dataset_type: Optional[str] = None) -> Optional[Tuple[pd.DataFrame, Dict[str, Any]]]:
+        """
+        유효한 캐시가 있으면 (df, info) 반환, 없거나 오래됐거나
+        다른 dataset_type(DatasetType.value)으로 정규화된 캐시면 None.
+
+        info 에는 original_columns, annotation_categories 가 들어있다.
+        """
+        import pyarrow.parquet as pq
+
+        cache_file = self.cache_path(source_file)
+        if not cache_file.exists():
+            return None
+        try:
+            schema_meta = pq.read_schema(cache_file).metadata or {}
+            info = json.loads(schema_meta.get(_META_KEY, b'{}'))
+            expected = dict(self._source_fingerprint(source_file),
+                            normalizer_version=NORMALIZER_VERSION,
+                            dataset_type=dataset_type)
+            if any(info.get(k) != v for k, v in expected.items()):
+                self.logger.debug(f"Normalized cache is stale: {cache_file.name}")
+                return None
+            # _gene_set(list<string>)은 ArrowDtype 으로 읽어 행별 Python 객체를 만들지 않음
+            df = pq.read_table(cache_file).to_pandas(types_mapper=gene_list_types_mapper)
+        except Exception as e:
+            self.logger.warning(f"Could not read normalized cache {cache_file}: {e}")
+            return None
+        return df, info
+
+    def write(self, source_file: Path, df: pd.DataFrame,
+              original_columns: Optional[Dict[str, str]] = None,
+              annotation_categories: Optional[list] = None,
+              dataset_type: Optional[str] = None) -> bool:
+        """정규화된 DataFrame 을 캐시에 기록. 실패해도 로드는 계속되므로 경고만 남긴다."""
+        import pyarrow.parquet as pq
+
+        cache_file = self.cache_path(source_file)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            df_to_save = df
+            if GENE_SET_COLUMN in df.columns:
+                df_to_save = df.copy()
+                df_to_save[GENE_SET_COLUMN] = to_gene_list_series(df[GENE_SET_COLUMN])
+
+            table = to_arrow_table(df_to_save)
+            info = dict(self._source_fingerprint(source_file),
+                        normalizer_version=NORMALIZER_VERSION,
+                        dataset_type=dataset_type,
+                        original_columns=original_columns or {},
+                        annotation_categories=annotation_categories or [])
+            schema_meta = dict(table.schema.metadata or {})
+            schema_meta[_META_KEY] = json.dumps(info, ensure_ascii=False).encode('utf-8')
+            table = table.replace_schema_metadata(schema_meta)
+
+            # 병렬 로드 중 같은 파일을 동시에 쓸 수 있으므로 임시 파일 → 원자적 교체
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{uuid.uuid4().hex[:8]}.tmp")
+            pq.write_table(table, tmp_file, compression='snappy')
+            os.replace(tmp_file, cache_file)
+            self.logger.debug(f"Wrote normalized cache: {cache_file}")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Could not write normalized cache for {Path(source_file).name}: {e}")
+            return False
+
+    def remove(self, source_file: Path):
+        """원본 삭제 시 캐시도 제거"""
+        cache_file = self.cache_path(source_file)
+        try:
+            if cache_file.exists():
+                cache_file.unlink()
+        except OSError as e:
+            self.logger.warning(f"Could not remove normalized cache {cache_file}: {e}")
@@ -0,0 +1,221 @@
+"""
+Parquet Metadata Index
+
+datasets 폴더 옆에 sidecar JSON(.seqviewer_index.json)을 두고, parquet 파일별
+컬럼 스키마 / 타입 판별 결과(utils.dataset_detector) / 행 수 / 유의 유전자 수를 캐시합니다.
+
+키는 파일명이고, (mtime, size) 지문이 바뀐 파일만 다시 읽습니다.
+행 수와 컬럼 목록은 parquet footer 에서만 읽고, 유의 유전자 수는 필요한
+두 컬럼(adj_pvalue/padj, log2fc)만 projection 으로 읽어 계산합니다.
+→ 앱 시작 / Database Browser 새로고침 시 전체 parquet 을 디코딩하지 않습니다.
+
+Usage:
+    index = ParquetMetadataIndex(datasets_dir)
+    entry = index.get_entry(datasets_dir / "foo.parquet")
+    entry['dataset_type'], entry['row_count'], entry['significant_genes']
+    index.save()   # 변경이 있을 때만 기록
+"""
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from models.data_models import DatasetType
+from utils.dataset_detector import detect_frame_type, read_schema_frame
+
+
+INDEX_FILENAME = ".seqviewer_index.json"
+
+# 항목 구조나 계산 기준이 바뀌면 올린다 → 기존 캐시 전체 무효화
+INDEX_VERSION = 2
+
+# 유의성 기준 (DatabaseManager._migrate_significant_genes 와 동일)
+SIG_PADJ_THRESHOLD = 0.05
+SIG_LOG2FC_THRESHOLD = 1.0
+
+
+def count_significant(parquet_path: Path, columns: List[str],
+                      dataset_type: Optional[DatasetType]) -> Optional[int]:
+    """
+    유의 유전자/peak/TF 수를 필요한 컬럼만 읽어 계산.
+
+    - DE / ATAC : adj_pvalue < 0.05 AND |log2fc| > 1 (log2fc 없으면 padj 만)
+    - chromVAR  : padj < 0.05
+
+    계산할 수 없는 타입/컬럼 구성이면 None.
+    """
+    if dataset_type in (DatasetType.DIFFERENTIAL_EXPRESSION, DatasetType.ATAC_SEQ):
+        if 'adj_pvalue' not in columns:
+            return None
+        wanted = ['adj_pvalue'] + (['log2fc'] if 'log2fc' in columns else [])
+        df = pd.read_parquet(parquet_path, engine='pyarrow', columns=wanted)
+        padj_ok = pd.to_numeric(df['adj_pvalue'], errors='coerce') < SIG_PADJ_THRESHOLD
+        if 'log2fc' in df.columns:
+            lfc_ok = pd.to_numeric(df['log2fc'], errors='coerce').abs() > SIG_LOG2FC_THRESHOLD
+            return int((padj_ok & lfc_ok).sum())
+        return int(padj_ok.sum())
+
+    if dataset_type == DatasetType.CHROMVAR_DIFF_TF:
+        if 'padj' not in columns:
+            return None
+        df = pd.read_parquet(parquet_path, engine='pyarrow', columns=['padj'])
+        return int((pd.to_numeric(df['padj'], errors='coerce') < SIG_PADJ_THRESHOLD).sum())
+
+    return None
+
+
+class ParquetMetadataIndex:
+    """
+    datasets 폴더 단위 parquet 메타데이터 캐시.
+
+    항목 스키마:
+        {
+          "mtime": float, "size": int,
+          "columns": [str, ...], "dtypes": {col: arrow_type_str},
+          "dataset_type": "differential_expression" | ... | None,
+          "row_count": int,
+          "significant_genes": int | None
+        }
+    """
+
+    def __init__(self, datasets_dir: Path):
+        self.logger = logging.getLogger(__name__)
+        self.datasets_dir = Path(datasets_dir)
+        self.index_file = self.datasets_dir / INDEX_FILENAME
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    # ------------------------------------------------------------------ #
+    #  Persistence
+    # ------------------------------------------------------------------ #
+
+    def _load(self):
+        """sidecar 파일 로드. 버전이 다르거나 손상되었으면 빈 인덱스로 시작."""
+        if not self.index_file.exists():
+            return
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != INDEX_VERSION:
+                self.logger.info(
+                    f"Parquet index version changed ({data.get('version')} → {INDEX_VERSION}), rebuilding"
+                )
+                self._dirty = True
+                return
+            self._entries = data.get('files', {})
+        except Exception as e:
+            self.logger.warning(f"Failed to read parquet index {self.index_file}: {e}")
+            self._entries = {}
+            self._dirty = True
+
+    def save(self):
+        """변경이 있을 때만 sidecar 파일 기록 (읽기 전용 폴더면 경고만)."""
+        if not self._dirty:
+            return
+        try:
+            data = {
+                'version': INDEX_VERSION,
+                'last_updated': datetime.now().isoformat(),
+                'files': self._entries,
+            }
+            tmp_file = self.index_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=1, ensure_ascii=False)
+            tmp_file.replace(self.index_file)
+            self._dirty = False
+            self.logger.debug(f"Saved parquet index ({len(self._entries)} files): {self.index_file}")
+        except Exception as e:
+            self.logger.warning(f"Could not save parquet index {self.index_file}: {e}")
+
+    # ------------------------------------------------------------------ #
+    #  Lookup
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def _fingerprint(parquet_path: Path) -> Dict[str, Any]:
+        stat = parquet_path.stat()
+        return {'mtime': stat.st_mtime, 'size': stat.st_size}
+
+    def get_cached(self, parquet_path: Path) -> Optional[Dict[str, Any]]:
+        """지문이 일치하는 캐시 항목만 반환 (파일을 읽지 않음)."""
+        parquet_path = Path(parquet_path)
+        entry = self._entries.get(parquet_path.name)
+        if entry is None or not parquet_path.exists():
+            return None
+        fp = self._fingerprint(parquet_path)
+        if entry.get('mtime') != fp['mtime'] or entry.get('size') != fp['size']:
+            return None
+        return entry
+
+    def get_entry(self, parquet_path: Path) -> Dict[str, Any]:
+        """
+        캐시 항목 반환. 없거나 파일이 바뀌었으면 footer + 필요한 컬럼만 읽어 재생성.
+
+        Raises:
+            parquet 을 열 수 없으면 pyarrow/OSError 예외를 그대로 전달
+        """
+        parquet_path = Path(parquet_path)
+        entry = self.get_cached(parquet_path)
+        if entry is not None:
+            return entry
+        entry = self._build_entry(parquet_path)
+        self._entries[parquet_path.name] = entry
+        self._dirty = True
+        return entry
+
+    def invalidate(self, parquet_path: Path):
+        """파일을 다시 썼거나 지웠을 때 호출."""
+        if self._entries.pop(Path(parquet_path).name, None) is not None:
+            self._dirty = True
+
+    def prune(self, existing_names):
+        """폴더에서 사라진 파일 항목 제거."""
+        existing = set(existing_names)
+        stale = [name for name in self._entries if name not in existing]
+        for name in stale:
+            del self._entries[name]
+        if stale:
+            self._dirty = True
+
+    def _build_entry(self, parquet_path: Path) -> Dict[str, Any]:
+        """footer(스키마·행 수)만 읽고, 유의 유전자 수는 최소 컬럼 projection 으로 계산."""
+        import pyarrow.parquet as pq
+
+        fp = self._fingerprint(parquet_path)
+        pf = pq.ParquetFile(parquet_path)
+        schema = pf.schema_arrow
+        columns = [name for name in schema.names if not name.startswith('__index_level_')]
+        dtypes = {field.name: str(field.type) for field in schema if field.name in columns}
+        row_count = int(pf.metadata.num_rows)
+
+        dataset_type = detect_frame_type(read_schema_frame(parquet_path))
+        try:
+            significant = count_significant(parquet_path, columns, dataset_type)
+        except Exception as e:
+            self.logger.warning(f"Could not count significant rows in {parquet_path.name}: {e}")
+            significant = None
+
+        self.logger.debug(
+            f"Indexed {parquet_path.name}: type={dataset_type.value if dataset_type else None}, "
+            f"rows={row_count}, sig={significant}"
+        )
+        return {
+            'mtime': fp['mtime'],
+            'size': fp['size'],
+            'columns': columns,
+            'dtypes': dtypes,
+            'dataset_type': dataset_type.value if dataset_type else None,
+            'row_count': row_count,
+            'significant_genes': significant,
+        }
+
+    @staticmethod
+    def entry_dataset_type(entry: Dict[str, Any]) -> Optional[DatasetType]:
+        """항목의 dataset_type 문자열 → DatasetType (판별 불가면 None)."""
+        value = entry.get('dataset_type')
+        return DatasetType(value) if value else None
@@ -0,0 +1,135 @@
+"""
+Significance Index
+
+padj ≤ 임계값 & |log2FC| ≥ 임계값 유의성 판정을 임계값 슬라이더/스핀박스가 바뀔 때마다
+전체 컬럼에서 다시 계산(pd.to_numeric + 비교)하지 않도록 하는 캐시입니다.
+
+- numeric_array: 컬럼 → float 배열 (errors='coerce'). Dataset.numeric_column 이 캐시.
+- SignificanceIndex: padj 정렬 순서를 한 번 만들어 두고,
+  · counts(): padj 임계값의 prefix(이진 탐색) 안에서 up/down |log2FC| 를 정렬해 memo →
+    같은 padj 에서 log2FC 임계값만 바뀌면 이진 탐색 두 번으로 개수를 낸다.
+  · mask() / regulation(): (padj, log2FC, direction) 키로 LRU memo.
+
+Dataset.significance_index(log2fc_col, padj_col) 이 데이터셋별로 캐시하며,
+dataframe 이 교체되면 다시 만듭니다.
+
+Usage:
+    index = dataset.significance_index()
+    up, down = index.counts(padj_max=0.05, lfc_min=1.0)
+    df[index.mask(0.05, 1.0, direction='up')]
+"""
+
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# (padj, log2FC) 임계값별로 memo 하는 결과 수 — 슬라이더 왕복 시 재사용
+SIGNIFICANCE_MEMO_ENTRIES = 32
+
+# regulation() 코드 → 라벨
+REGULATION_LABELS = np.array(['ns', 'up', 'down'], dtype=object)
+
+
+def numeric_array(values) -> np.ndarray:
+    """컬럼/배열 → float64 배열 (숫자로 바꿀 수 없는 값은 NaN)."""
+    if values is None:
+        return np.empty(0)
+    return pd.to_numeric(pd.Series(values, copy=False), errors='coerce').to_numpy(
+        dtype=np.float64, na_value=np.nan)
+
+
+class SignificanceIndex:
+    """log2FC / padj 배열 위의 임계값 질의 (원래 행 순서 기준)"""
+
+    def __init__(self, log2fc, padj):
+        self.log2fc = numeric_array(log2fc)
+        self.padj = numeric_array(padj)
+        # log2FC 가 있는 행 수
+        self.total = int(np.isfinite(self.log2fc).sum())
+        # padj 오름차순 (NaN 은 맨 뒤) — 임계값 prefix 를 이진 탐색으로 찾는다
+        self._padj_order = np.argsort(self.padj, kind='stable')
+        self._padj_sorted = self.padj[self._padj_order]
+        self._lfc_by_padj = self.log2fc[self._padj_order]
+        self._prefix_memo: "OrderedDict[float, Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+        self._mask_memo: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.log2fc)
+
+    @staticmethod
+    def _remember(memo: OrderedDict, key, value):
+        memo[key] = value
+        while len(memo) > SIGNIFICANCE_MEMO_ENTRIES:
+            memo.popitem(last=False)
+        return value
+
+    def _sorted_effects(self, padj_max: float) -> Tuple[np.ndarray, np.ndarray]:
+        """padj ≤ padj_max 인 행의 (양수 log2FC 정렬, 음수 log2FC 의 절댓값 정렬)."""
+        key = float(padj_max)
+        cached = self._prefix_memo.get(key)
+        if cached is not None:
+            self._prefix_memo.move_to_end(key)
+            return cached
+        k = int(np.searchsorted(self._padj_sorted, key, side='right'))
+        lfc = self._lfc_by_padj[:k]
+        up = np.sort(lfc[lfc > 0])
+        down = np.sort(-lfc[lfc < 0])
+        return self._remember(self._prefix_memo, key, (up, down))
+
+    def counts(self, padj_max: float, lfc_min: float) -> Tuple[int, int]:
+        """(up, down) 유의 개수: padj ≤ padj_max 이고 log2FC ≥ lfc_min / ≤ -lfc_min (0 제외)."""
+        up, down = self._sorted_effects(padj_max)
+        lfc_min = float(lfc_min)
+        return (int(len(up) - np.searchsorted(up, lfc_min, side='left')),
+                int(len(down) - np.searchsorted(down, lfc_min, side='left')))
+
+    def mask(self, padj_max: float, lfc_min: float, direction: str = 'both') -> np.ndarray:
+        """padj ≤ padj_max & |log2FC| ≥ lfc_min (direction 'up'/'down' 이면 부호 조건 추가)."""
+        key = ('mask', float(padj_max), float(lfc_min), direction)
+        cached = self._mask_memo.get(key)
+        if cached is not None:
+            self._mask_memo.move_to_end(key)
+            return cached
+        mask = np.zeros(len(self.padj), dtype=bool)
+        k = int(np.searchsorted(self._padj_sorted, float(padj_max), side='right'))
+        lfc = self._lfc_by_padj[:k]
+        hit = np.abs(lfc) >= float(lfc_min)
+        if direction == 'up':
+            hit &= lfc > 0
+        elif direction == 'down':
+            hit &= lfc < 0
+        mask[self._padj_order[:k][hit]] = True
+        mask.flags.writeable = False
+        return self._remember(self._mask_memo, key, mask)
+
+    def regulation(self, padj_max: float, lfc_min: float) -> np.ndarray:
+        """행별 'up' / 'down' / 'ns' (log2FC ≥ lfc_min / ≤ -lfc_min, padj ≤ padj_max)."""
+        key = ('regulation', float(padj_max), float(lfc_min))
+        cached = self._mask_memo.get(key)
+        if cached is not None:
+            self._mask_memo.move_to_end(key)
+            return cached
+        codes = np.zeros(len(self.padj), dtype=np.int8)
+        k = int(np.searchsorted(self._padj_sorted, float(padj_max), side='right'))
+        lfc, rows = self._lfc_by_padj[:k], self._padj_order[:k]
+        codes[rows[lfc >= float(lfc_min)]] = 1
+        codes[rows[lfc <= -float(lfc_min)]] = 2
+        labels = REGULATION_LABELS[codes]
+        labels.flags.writeable = False
+        return self._remember(self._mask_memo, key, labels)
+
+
+def frame_significance_index(df: pd.DataFrame, log2fc_col: str, padj_col: str,
+                             dataset=None) -> Optional[SignificanceIndex]:
+    """
+    df 의 SignificanceIndex. df 가 dataset.dataframe 그 자체면 데이터셋 캐시를 쓰고,
+    다른 프레임이면 새로 만든다. 컬럼이 없으면 None.
+    """
+    if df is None or log2fc_col not in df.columns or padj_col not in df.columns:
+        return None
+    if dataset is not None and getattr(dataset, 'dataframe', None) is df:
+        return dataset.significance_index(log2fc_col, padj_col)
+    return SignificanceIndex(df[log2fc_col], df[padj_col])
@@ -0,0 +1,98 @@
+"""
+Unit tests for the wide-format comparison engine
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import numpy as np
+import pandas as pd
+
+from models.data_models import Dataset, DatasetType
+from models.standard_columns import StandardColumns
+from utils.comparison_engine import (
+    build_gene_list_comparison, build_go_term_comparison, build_statistics_comparison,
+)
+
+
+def _dataset(name, symbols, log2fc, padj, **extra):
+    df = pd.DataFrame({'gene_id': [f"ENSG{s}" for s in symbols], 'symbol': symbols,
+                       'log2FC': log2fc, 'padj': padj, **extra})
+    return Dataset(name=name, dataset_type=DatasetType.DIFFERENTIAL_EXPRESSION, dataframe=df)
+
+
+def test_gene_list_comparison_keeps_input_order_and_columns():
+    a = _dataset('A', ['Tp53', 'Actb', 'Gapdh'], [1.0, -2.0, 0.5], [0.01, 0.02, 0.3],
+                 regulation=['Up', 'Down', 'NS'])
+    b = _dataset('B', ['Gapdh', 'Tp53'], [0.1, 3.0], [0.9, 0.001])
+
+    result = build_gene_list_comparison([a, b], ['gapdh', 'TP53', 'Actb'])
+
+    assert list(result.columns) == ['gene_id', 'symbol', 'A_log2FC', 'A_padj', 'A_regulation',
+                                    'B_log2FC', 'B_padj']
+    assert result['symbol'].tolist() == ['Gapdh', 'Tp53', 'Actb']
+    assert result['B_log2FC'].tolist()[:2] == [0.1, 3.0]
+    assert np.isnan(result['B_log2FC'].iloc[2])
+
+
+def test_statistics_comparison_status_and_found_in():
+    a = _dataset('A', ['Tp53', 'Actb', 'Myc'], [2.0, -2.0, 0.1], [0.01, 0.01, 0.01])
+    b = _dataset('B', ['Tp53', 'Myc'], [1.5, 3.0], [0.001, 0.01])
+
+    result, dataset_genes = build_statistics_comparison([a, b], log2fc_min=1.0, adj_pvalue_max=0.05)
+
+    assert dataset_genes == {'A': {'Tp53', 'Actb'}, 'B': {'Tp53', 'Myc'}}
+    rows = result.set_index('symbol')
+    assert rows.loc['Tp53', 'Status'] == 'Common'
+    assert rows.loc['Actb', 'Status'] == 'Unique (A)'
+    assert rows.loc['Myc', 'Found_in'] == '1/2'
+    # 필터 이전 전체 데이터로 메타 통계를 계산하므로 Myc 도 두 데이터셋에서 결합
+    assert rows.loc['Myc', 'meta_found_in'] == '2/2'
+    assert result.columns[:4].tolist() == ['gene_id', 'symbol', 'Status', 'Found_in']
+
+    common, _ = build_statistics_comparison([a, b], 1.0, 0.05, common_only=True)
+    assert common['symbol'].tolist() == ['Tp53']
+
+
+def test_gene_stats_lookup_is_cached_and_prefers_first_key():
+    ds = _dataset('A', ['Tp53', 'Actb', 'Tp53'], [1.0, -2.0, 5.0], [0.01, 0.02, 0.3],
+                  pvalue=[0.001, 0.002, 0.03], lfcSE=[0.1, 0.2, 0.3])
+    lookup = ds.gene_stats()
+    assert ds.gene_stats() is lookup
+
+    lfc, p, se = lookup.take(['Tp53', '', 'Nope'], ['ENSGTp53', 'ENSGActb', 'ENSGNope'])
+    assert lfc[:2].tolist() == [1.0, -2.0]
+    assert p[:2].tolist() == [0.001, 0.002]      # raw p-value 우선
+    assert se[:2].tolist() == [0.1, 0.2]
+    assert np.isnan(lfc[2]) and np.isnan(p[2])
+
+    ds.dataframe = ds.dataframe.iloc[::-1].reset_index(drop=True)
+    assert ds.gene_stats() is not lookup
+    assert ds.gene_stats().take(['Tp53'], [''])[0].tolist() == [5.0]
+
+
+def test_go_term_comparison_unions_requested_terms():
+    def go(name, ids, pvals, fe):
+        df = pd.DataFrame({StandardColumns.TERM_ID: ids,
+                           StandardColumns.DESCRIPTION: [f"desc {t.strip()}" for t in ids],
+                           StandardColumns.PVALUE: pvals, StandardColumns.FDR: pvals,
+                           StandardColumns.GENE_COUNT: [5] * len(ids),
+                           StandardColumns.FOLD_ENRICHMENT: fe})
+        return Dataset(name=name, dataset_type=DatasetType.GO_ANALYSIS, dataframe=df)
+
+    a = go('A', ['GO:0001', ' GO:0002', 'GO:0009'], [0.01, 0.02, 0.5], [2.0, 4.0, 1.0])
+    b = go('B', ['GO:0002', 'GO:0003'], [0.03, 0.04], [8.0, 0.5])
+
+    result = build_go_term_comparison([a, b], ['GO:0001', 'GO:0002', 'GO:0003'], ['A', 'B'])
+
+    assert result['term_id'].tolist() == ['GO:0001', 'GO:0002', 'GO:0003']
+    assert result['A_fe'].tolist()[:2] == [2.0, 4.0] and np.isnan(result['A_fe'].iloc[2])
+    assert result['B_fe'].tolist()[1:] == [8.0, 0.5]
+    assert result['meta_found_in'].tolist()[1] == '2/2'
+    assert result['meta_direction'].iloc[1] == 'concordant'
+    assert np.isnan(result['meta_pvalue_fisher'].iloc[0])
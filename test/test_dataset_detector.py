@@ -0,0 +1,43 @@
+"""
+Unit tests for schema-only dataset type detection
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.data_models import DatasetType
+from utils.dataset_detector import detect_parquet_type, read_schema_frame
+
+
+@pytest.mark.parametrize("columns, expected", [
+    ({'peak_id': ['p1'], 'log2fc': [1.0], 'adj_pvalue': [0.01]}, DatasetType.ATAC_SEQ),
+    ({'gene_id': ['g1'], 'log2fc': [1.0], 'adj_pvalue': [0.01]}, DatasetType.DIFFERENTIAL_EXPRESSION),
+    ({'term_id': ['GO:1'], 'description': ['x'], 'fdr': [0.01]}, DatasetType.GO_ANALYSIS),
+    ({'tf_name': ['CTCF'], 'mean_zscore_compare': [1.0], 'delta_zscore': [0.5], 'padj': [0.01]},
+     DatasetType.CHROMVAR_DIFF_TF),
+    ({'gene_id': ['g1'], 'padj': [0.01], 'S1': [1.0], 'S2': [2.0], 'S3': [3.0]},
+     DatasetType.MULTI_GROUP),
+    ({'foo': [1], 'bar': [2]}, None),
+])
+def test_detect_parquet_type(tmp_path, columns, expected):
+    path = tmp_path / "x.parquet"
+    pd.DataFrame(columns).to_parquet(path)
+    assert detect_parquet_type(path) == expected
+
+
+def test_schema_frame_has_no_rows_but_keeps_dtypes(tmp_path):
+    path = tmp_path / "x.parquet"
+    pd.DataFrame({'gene_id': ['a', 'b'], 'S1': np.array([1.0, 2.0])}).to_parquet(path)
+    frame = read_schema_frame(path)
+    assert len(frame) == 0
+    assert list(frame.columns) == ['gene_id', 'S1']
+    assert pd.api.types.is_float_dtype(frame['S1'])
@@ -96,6 +96,15 @@ class TestFSM:
         
         fsm.reset()
         assert fsm.current_state == State.IDLE
+    
+    def test_load_cancelled_returns_to_idle(self):
+        """로드 취소 시 ERROR 가 아닌 IDLE 로 복귀"""
+        fsm = FSM()
+        
+        fsm.trigger(Event.LOAD_DATA)
+        assert fsm.trigger(Event.LOAD_CANCELLED) is True
+        assert fsm.current_state == State.IDLE
+        assert fsm.can_trigger(Event.LOAD_DATA)
 
 
 if __name__ == "__main__":
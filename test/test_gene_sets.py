@@ -0,0 +1,75 @@
+"""
+Unit tests for gene set column utilities (utils.gene_sets)
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import numpy as np
+import pandas as pd
+
+from utils.gene_sets import (
+    GENE_LIST_DTYPE, GENE_SYMBOL_SPLIT_PATTERN, GeneTermIndex, contains_all, contains_any,
+    encode_gene_lists, frame_gene_term_index, gene_set_sizes, match_counts,
+    to_gene_list_series, warm_gene_term_index,
+)
+
+
+def test_legacy_formats_convert_to_list_column():
+    strings = to_gene_list_series(pd.Series(['A/B/ B', '', None, 'C']))
+    assert strings.dtype == GENE_LIST_DTYPE
+    assert strings.tolist() == [['A', 'B'], [], [], ['C']]
+
+    cells = to_gene_list_series(pd.Series([{'B', 'A'}, set(), np.array(['X'])]))
+    assert cells.tolist() == [['A', 'B'], [], ['X']]
+
+
+def test_membership_queries():
+    col = to_gene_list_series(pd.Series(['TP53/MYC', 'MYC', '']))
+    assert contains_any(col, ['TP53']).tolist() == [True, False, False]
+    assert contains_all(col, ['TP53', 'MYC']).tolist() == [True, False, False]
+    assert gene_set_sizes(col).tolist() == [2, 1, 0]
+
+    symbols = pd.Series(['Tp53, TP53; myc', 'EGFR', np.nan])
+    counts = match_counts(symbols, ['tp53', 'MYC'], case_sensitive=False,
+                          sep=GENE_SYMBOL_SPLIT_PATTERN)
+    assert counts.tolist() == [2, 0, 0]
+
+
+def test_encode_gene_lists_is_csr():
+    indptr, codes, vocab = encode_gene_lists(pd.Series(['A/B', '', 'B']))
+    assert indptr.tolist() == [0, 2, 2, 3]
+    assert [vocab[c] for c in codes] == ['A', 'B', 'B']
+
+
+def test_gene_term_index_matches_match_counts():
+    symbols = pd.Series(['Tp53/MYC; Egfr', 'tp53,TP53', None, 'KRAS myc'])
+    query = ['TP53', 'myc', 'Absent']
+    index = GeneTermIndex(symbols)
+    expected = match_counts(symbols, {g.upper() for g in query}, case_sensitive=False,
+                            sep=GENE_SYMBOL_SPLIT_PATTERN)
+    assert index.match_counts(query).tolist() == expected.tolist() == [2, 1, 0, 1]
+    assert index.term_sizes.tolist() == [3, 1, 0, 2]
+    assert index.rows('Myc').tolist() == [0, 3]
+
+
+def test_warmed_index_is_reused_by_filters(monkeypatch):
+    from models.data_models import Dataset, DatasetType
+    import utils.gene_sets as gene_sets
+
+    df = pd.DataFrame({'term_id': ['GO:1', 'GO:2'], 'gene_symbols': ['TP53/MYC', 'KRAS']})
+    go = Dataset(name='go', dataset_type=DatasetType.GO_ANALYSIS, dataframe=df)
+    warm_gene_term_index(go)
+
+    monkeypatch.setattr(gene_sets, 'GeneTermIndex',
+                        lambda *a: (_ for _ in ()).throw(AssertionError('rebuilt')))
+    assert frame_gene_term_index(df, 'gene_symbols', go).match_counts(['myc']).tolist() == [1, 0]
+
+    de = Dataset(name='de', dataset_type=DatasetType.DIFFERENTIAL_EXPRESSION,
+                 dataframe=df.rename(columns={'term_id': 'gene_id'}))
+    warm_gene_term_index(de)   # GO 가 아니면 아무것도 만들지 않음
@@ -0,0 +1,80 @@
+"""
+Unit tests for GOClustering sparse Jaccard engine
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import numpy as np
+import pandas as pd
+from scipy.spatial.distance import squareform
+
+from utils.gene_sets import to_gene_list_series
+from utils.go_clustering import GOClustering, TermSimilarityCache
+
+
+def _random_gene_sets(n_terms=40, seed=0):
+    rng = np.random.default_rng(seed)
+    genes = np.array([f'G{i}' for i in range(300)])
+    return [set(rng.choice(genes, rng.integers(1, 200), replace=False)) for _ in range(n_terms)]
+
+
+def test_blocked_jaccard_matches_brute_force():
+    sets = _random_gene_sets()
+    column = to_gene_list_series(pd.Series(sets))
+    expected = np.array([[len(a & b) / len(a | b) for b in sets] for a in sets])
+
+    clustering = GOClustering(block_size=7)
+    similarity = clustering._calculate_jaccard_similarity_matrix(column)
+    np.testing.assert_allclose(similarity, expected)
+
+    condensed = clustering._condensed_jaccard_distance(column)
+    np.testing.assert_allclose(condensed, squareform(1 - expected, checks=False), atol=1e-12)
+
+
+def test_large_overlaps_do_not_overflow():
+    shared = {f'G{i}' for i in range(400)}
+    column = to_gene_list_series(pd.Series([shared, shared | {'X'}]))
+    similarity = GOClustering()._calculate_jaccard_similarity_matrix(column)
+    assert similarity[0, 1] == 400 / 401
+
+
+def test_scalable_mode_matches_dense_average_linkage():
+    sets = _random_gene_sets(n_terms=60, seed=1)
+    df = pd.DataFrame({
+        'description': [f'term {i}' for i in range(len(sets))],
+        'fdr': np.linspace(0.001, 0.05, len(sets)),
+        '_gene_set': to_gene_list_series(pd.Series(sets)),
+    })
+    dense = GOClustering(scalable=False).fit(df)
+    scalable = GOClustering(scalable=True, min_similarity=0.0).fit(df)
+
+    np.testing.assert_allclose(np.sort(dense._linkage_matrix[:, 2]),
+                               np.sort(scalable._linkage_matrix[:, 2]), atol=1e-9)
+    for threshold in (0.3, 0.5, 0.7):
+        assert (dense.cluster_counts([threshold]) == scalable.cluster_counts([threshold]))
+    assert len(scalable.cut_k(5)[1]) == 5
+
+
+def test_term_similarity_cache_edges_match_pairwise_loop():
+    sets = _random_gene_sets(n_terms=25, seed=2) + [set(), set()]
+    labels = [f'T{i}' for i in range(len(sets))]
+    cache = TermSimilarityCache(to_gene_list_series(pd.Series(sets)), labels)
+
+    for threshold in (0.0, 0.2, 0.5):
+        expected = {
+            (labels[i], labels[j])
+            for i in range(len(sets)) for j in range(i + 1, len(sets))
+            if (sets[i] | sets[j]) and len(sets[i] & sets[j]) / len(sets[i] | sets[j]) >= threshold
+        }
+        src, dst, _ = cache.edges(labels, threshold)
+        assert set(zip(src, dst)) == expected
+
+    subset = labels[5:15]
+    src, dst, weights = cache.edges(subset, 0.0)
+    assert set(src) | set(dst) <= set(subset)
@@ -0,0 +1,41 @@
+"""
+Unit tests for GO network layout cache / force-directed layout
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import networkx as nx
+import numpy as np
+
+from utils.graph_layout import EXACT_REPULSION_MAX_NODES, GraphLayoutCache, force_directed_layout
+
+
+def test_layout_cache_reuses_positions_for_same_structure():
+    cache = GraphLayoutCache()
+    G = nx.karate_club_graph()
+    first = cache.layout(G, 'spring', k=0.3, iterations=30, seed=42)
+    again = cache.layout(G.copy(), 'spring', k=0.3, iterations=30, seed=42)
+    assert all(np.array_equal(first[n], again[n]) for n in G)
+
+    # 구조가 바뀌면 새로 계산 (직전 배치에서 warm-start)
+    H = G.copy()
+    H.remove_edge(0, 1)
+    moved = cache.layout(H, 'spring', k=0.3, iterations=30, seed=42)
+    assert set(moved) == set(H.nodes())
+    assert len(cache._entries) == 2
+
+
+def test_force_directed_layout_grid_path_is_finite_and_normalized():
+    n = EXACT_REPULSION_MAX_NODES + 200
+    G = nx.random_geometric_graph(n, 0.08, seed=1)
+    pos = force_directed_layout(G, iterations=15, seed=0)
+    X = np.array([pos[node] for node in G])
+    assert X.shape == (n, 2)
+    assert np.isfinite(X).all()
+    assert np.abs(X).max() <= 1.0 + 1e-9
@@ -0,0 +1,63 @@
+"""
+Unit tests for the heatmap renderer normalisation and clustering cache
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import numpy as np
+import pandas as pd
+import scipy.cluster.hierarchy as hierarchy
+from matplotlib.figure import Figure
+
+from plots.heatmap import render_heatmap
+
+
+def _expression(n=40, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(rng.lognormal(3, 1, (n, 5)), columns=[f"S{i}" for i in range(5)])
+    df['gene_id'] = [f"G{i}" for i in range(n)]
+    df['padj'] = rng.uniform(size=n)
+    return df
+
+
+def test_row_normalisations_match_per_row_formulas():
+    df = _expression()
+    expr = df[[f"S{i}" for i in range(5)]]
+
+    z, labels = render_heatmap(Figure(), df, {'n_genes': 10, 'normalization': 'z-score'})
+    rows = expr.loc[z.index]
+    expected = rows.sub(rows.mean(axis=1), axis=0).div(rows.std(axis=1) + 1e-10, axis=0)
+    assert np.allclose(z.to_numpy(), expected.to_numpy())
+    assert labels == df.loc[z.index, 'gene_id'].tolist()
+
+    mm, _ = render_heatmap(Figure(), df, {'n_genes': 10, 'normalization': 'minmax'})
+    assert np.allclose(mm.min(axis=1), 0) and np.allclose(mm.max(axis=1), 1)
+
+
+def test_cluster_cache_skips_linkage_on_restyle(monkeypatch):
+    calls = []
+    real_linkage = hierarchy.linkage
+
+    def counting_linkage(*args, **kwargs):
+        calls.append(kwargs.get('optimal_ordering'))
+        return real_linkage(*args, **kwargs)
+
+    monkeypatch.setattr(hierarchy, 'linkage', counting_linkage)
+    df = _expression()
+    cache = {}
+    params = {'n_genes': 30, 'sorting': 'clustering', 'show_dendrogram': True}
+
+    first, _ = render_heatmap(Figure(), df, params, cluster_cache=cache)
+    again, _ = render_heatmap(Figure(), df, dict(params, colormap='viridis', colorbar_max=2.0),
+                              cluster_cache=cache)
+    assert calls == [False]
+    assert first.index.tolist() == again.index.tolist()
+
+    render_heatmap(Figure(), df, dict(params, optimal_ordering=True), cluster_cache=cache)
+    assert calls == [False, True]
@@ -0,0 +1,51 @@
+"""
+Unit tests for KD-tree hover picking
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import numpy as np
+from matplotlib.figure import Figure
+
+from gui.hover_picker import PointPicker
+
+
+def _brute_nearest(x, y, qx, qy, xlim, ylim, radius):
+    dist = np.hypot((x - qx) / (xlim[1] - xlim[0]), (y - qy) / (ylim[1] - ylim[0]))
+    dist = np.where(np.isfinite(dist), dist, np.inf)
+    i = int(np.argmin(dist))
+    return i if dist[i] < radius else None
+
+
+def test_point_picker_matches_brute_force_and_follows_zoom():
+    rng = np.random.default_rng(0)
+    x, y = rng.normal(0, 3, 5000), rng.random(5000) * 50
+    x[::97] = np.nan
+    ax = Figure().add_subplot(111)
+    ax.set_xlim(-10, 10)
+    ax.set_ylim(0, 50)
+    picker = PointPicker(ax, x, y)
+
+    for limits in [((-10, 10), (0, 50)), ((-1, 1), (10, 12))]:
+        ax.set_xlim(*limits[0])
+        ax.set_ylim(*limits[1])
+        for qx, qy in rng.uniform([limits[0][0], limits[1][0]], [limits[0][1], limits[1][1]],
+                                  size=(200, 2)):
+            assert picker.nearest(qx, qy, radius=0.05) == \
+                _brute_nearest(x, y, qx, qy, *limits, radius=0.05)
+
+    assert picker.nearest(None, 1.0) is None
+
+
+def test_point_picker_neighbours_in_data_units():
+    ax = Figure().add_subplot(111)
+    picker = PointPicker(ax, [0.0, 1.0, 0.1, np.nan], [0.0, 1.0, 0.0, 0.0], normalized=False)
+    positions, distances = picker.neighbours(0.09, 0.0, radius=0.3)
+    assert positions.tolist() == [2, 0]
+    assert np.allclose(distances, [0.01, 0.09])
@@ -0,0 +1,55 @@
+"""
+Unit tests for Dataset identifier index
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import numpy as np
+import pandas as pd
+
+from models.data_models import Dataset, DatasetType
+from utils.identifier_index import select_identifiers
+
+
+def _dataset():
+    df = pd.DataFrame({'symbol': ['Actb', ' GAPDH', 'Tp53', None, 'actb'],
+                       'log2fc': [1.0, 2.0, 3.0, 4.0, 5.0]},
+                      index=[10, 11, 12, 13, 14])
+    return Dataset(name='de', dataset_type=DatasetType.DIFFERENTIAL_EXPRESSION, dataframe=df)
+
+
+def test_positions_follow_input_order_and_ignore_case():
+    ds = _dataset()
+    index = ds.identifier_index('symbol')
+    assert index.positions(['gapdh', 'ACTB', 'missing', 'Gapdh']).tolist() == [1, 0, 4]
+    assert 'tp53' in index and 'nan' not in index
+
+    selected = select_identifiers(ds.dataframe, 'symbol', ['tp53', 'gapdh'], dataset=ds)
+    assert selected.index.tolist() == [12, 11]
+
+
+def test_index_is_cached_until_dataframe_is_replaced():
+    ds = _dataset()
+    first = ds.identifier_index('symbol')
+    assert ds.identifier_index('symbol') is first
+
+    ds.dataframe = pd.DataFrame({'symbol': ['Sox2']})
+    rebuilt = ds.identifier_index('symbol')
+    assert rebuilt is not first
+    assert np.array_equal(rebuilt.positions(['SOX2']), [0])
+
+
+def test_index_is_rebuilt_when_rows_change_in_place():
+    ds = _dataset()
+    first = ds.identifier_index('symbol')
+
+    ds.dataframe.drop(index=[13, 14], inplace=True)
+    rebuilt = ds.identifier_index('symbol')
+    assert rebuilt is not first
+    assert 'tp53' in rebuilt and rebuilt.positions(['ACTB']).tolist() == [0]
@@ -0,0 +1,69 @@
+"""
+Unit tests for the bounded-time label layout
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+import plots.label_layout as label_layout
+from plots.label_layout import place_labels
+
+
+def _labelled_axes(n, seed=0):
+    fig = Figure(figsize=(6, 4))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    rng = np.random.default_rng(seed)
+    x, y = rng.normal(size=n), rng.normal(size=n)
+    ax.scatter(x, y)
+    texts = [ax.text(xi, yi, f"G{i}", fontsize=7) for i, (xi, yi) in enumerate(zip(x, y))]
+    return ax, texts
+
+
+def _extents(texts):
+    return np.array([t.get_window_extent().extents for t in texts])
+
+
+def test_small_label_sets_end_without_overlaps_inside_axes():
+    ax, texts = _labelled_axes(15)
+    place_labels(ax, texts)
+
+    boxes = _extents(texts)
+    hit = label_layout._overlap_matrix(boxes, boxes)
+    np.fill_diagonal(hit, False)
+    assert not hit.any()
+    x0, y0, x1, y1 = ax.bbox.extents
+    assert (boxes[:, 0] >= x0).all() and (boxes[:, 2] <= x1).all()
+    assert (boxes[:, 1] >= y0).all() and (boxes[:, 3] <= y1).all()
+    assert len(ax.collections) == 2   # scatter + 리더선
+
+
+def test_same_points_reuse_cached_positions(monkeypatch):
+    ax, texts = _labelled_axes(10, seed=3)
+    place_labels(ax, texts)
+    first = [t.get_position() for t in texts]
+
+    calls = []
+    monkeypatch.setattr(label_layout, '_greedy_layout',
+                        lambda *a, **k: calls.append(1))
+    ax, texts = _labelled_axes(10, seed=3)
+    place_labels(ax, texts)
+    assert calls == []
+    assert np.allclose([t.get_position() for t in texts], first)
+
+
+def test_large_label_sets_use_greedy_only(monkeypatch):
+    monkeypatch.setattr(label_layout, '_relax_layout',
+                        lambda *a, **k: (_ for _ in ()).throw(AssertionError('relaxed')))
+    ax, texts = _labelled_axes(40, seed=5)
+    place_labels(ax, texts, greedy_above=20)
+    assert np.isfinite([t.get_position() for t in texts]).all()
@@ -0,0 +1,54 @@
+"""
+Unit tests for the large-N background scatter modes
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+
+from plots.large_scatter import background_scatter_mode, scatter_background
+from plots.volcano import render_volcano
+
+
+def test_auto_mode_thresholds():
+    assert background_scatter_mode(1_000) == 'vector'
+    assert background_scatter_mode(50_000) == 'raster'
+    assert background_scatter_mode(500_000) == 'density'
+    assert background_scatter_mode(500_000, 'vector') == 'vector'
+
+
+def test_density_mode_draws_image_and_legend_proxy():
+    ax = Figure().add_subplot(111)
+    rng = np.random.default_rng(0)
+    x, y = rng.normal(size=5000), rng.normal(size=5000)
+    x[0] = np.nan
+    proxy = scatter_background(ax, x, y, mode='density', bins=50, c='#808080',
+                               s=np.full(5000, 10.0), alpha=0.6, label='ns')
+
+    assert len(proxy.get_offsets()) == 0
+    assert ax.get_legend_handles_labels()[1] == ['ns']
+    image = ax.images[0].get_array()
+    assert image.shape == (50, 50, 4)
+    assert image[..., 3].max() == 0.6
+    # 축 범위는 extent 보다 넓게 (scatter 와 같은 여백)
+    assert ax.get_xlim()[0] < np.nanmin(x) and ax.get_xlim()[1] > np.nanmax(x)
+
+
+def test_volcano_keeps_significant_points_as_vectors():
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({'log2FC': rng.normal(0, 2, 2000), 'padj': rng.uniform(0, 1, 2000) ** 3})
+    ax = Figure().add_subplot(111)
+    result = render_volcano(ax, df, {'background_mode': 'density'})
+
+    ns, down, up = ax.collections
+    assert len(ns.get_offsets()) == 0 and len(ax.images) == 1
+    assert len(up.get_offsets()) == (result['regulation'] == 'up').sum()
+    assert len(down.get_offsets()) == (result['regulation'] == 'down').sum()
@@ -0,0 +1,73 @@
+"""
+Unit tests for the dataset load pipeline progress and cancellation
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import pandas as pd
+import pytest
+
+from models.data_models import DatasetType
+from utils.load_pipeline import LoadCancelled, load_dataset_file
+
+
+def _de_excel(tmp_path):
+    path = tmp_path / "de.xlsx"
+    pd.DataFrame({'gene_id': ['A', 'B', 'C'], 'baseMean': [10.0, 20.0, 30.0],
+                  'log2FoldChange': [1.0, -2.0, 0.5], 'pvalue': [0.01, 0.02, 0.3],
+                  'padj': [0.02, 0.04, 0.5]}).to_excel(path, index=False)
+    return path
+
+
+def test_excel_parse_reports_intermediate_progress(tmp_path):
+    progress = []
+    dataset = load_dataset_file(_de_excel(tmp_path), progress_callback=progress.append)
+
+    assert dataset.dataset_type == DatasetType.DIFFERENTIAL_EXPRESSION
+    assert progress == sorted(progress) and progress[-1] == 100
+    assert any(20 < p < 90 for p in progress)
+
+
+def test_cancel_during_excel_parse_stops_before_standardising(tmp_path, monkeypatch):
+    from utils.data_loader import DataLoader
+
+    standardised = []
+    real = DataLoader._standardize_columns
+    monkeypatch.setattr(DataLoader, '_standardize_columns',
+                        lambda self, *a, **k: standardised.append(1) or real(self, *a, **k))
+    progress = []
+    with pytest.raises(LoadCancelled):
+        # 읽기 단계가 보고되는 순간 취소
+        load_dataset_file(_de_excel(tmp_path), progress_callback=progress.append,
+                          is_cancelled=lambda: any(20 < p < 90 for p in progress))
+    assert standardised == []
+
+
+def test_cancel_with_no_datasets_allows_next_load(tmp_path, monkeypatch):
+    pytest.importorskip("PyQt6")
+    from core.fsm import State
+    from presenters.main_presenter import MainPresenter
+
+    monkeypatch.chdir(tmp_path)  # 감사 로그를 임시 디렉토리에 기록
+    presenter = MainPresenter(view=None)
+    presenter.max_concurrent_loads = 0  # 대기열에만 쌓이고 worker 는 시작하지 않음
+    errors = []
+    presenter.error_occurred.connect(errors.append)
+
+    path = _de_excel(tmp_path)
+    presenter.load_dataset(path)
+    assert presenter.fsm.current_state == State.LOADING_DATA
+
+    presenter.cancel_loading()
+    assert presenter.fsm.current_state == State.IDLE
+    assert errors == []
+
+    presenter.load_dataset(path)
+    assert presenter.fsm.current_state == State.LOADING_DATA
+    assert len(presenter._load_queue) == 1
@@ -0,0 +1,53 @@
+"""
+Unit tests for batched (matrix) meta-analysis
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import numpy as np
+import pytest
+
+from utils.meta_stats import (
+    benjamini_hochberg, combine_pvalues, meta_analysis_matrix, random_effects,
+)
+
+
+def test_meta_analysis_matrix_matches_scalar_versions():
+    rng = np.random.default_rng(0)
+    pvals = rng.random((200, 6)) ** 2
+    lfcs = rng.normal(0, 1, (200, 6))
+    ses = rng.random((200, 6)) + 0.05
+    pvals[rng.random(pvals.shape) < 0.4] = np.nan
+    ses[rng.random(ses.shape) < 0.1] = np.nan
+    pvals[0, 1:] = np.nan               # 유효 데이터셋 1개 → 결합 안 함
+    lfcs[1] = np.abs(lfcs[1])           # 방향 일치
+
+    meta = meta_analysis_matrix(pvals, lfcs, ses)
+
+    for g in range(len(pvals)):
+        scalar = combine_pvalues(pvals[g], lfcs[g])
+        if scalar is None:
+            assert np.isnan(meta['meta_pvalue_fisher'][g]) and meta['meta_direction'][g] is None
+        else:
+            for key in ('meta_pvalue_fisher', 'meta_pvalue_stouffer', 'meta_z', 'meta_log2fc_mean'):
+                assert meta[key][g] == pytest.approx(scalar[key], rel=1e-9)
+            assert meta['meta_direction'][g] == scalar['meta_direction']
+            assert meta['meta_found_in'][g] == scalar['meta_found_in']
+
+        effect = random_effects(lfcs[g], ses[g])
+        if effect is None:
+            assert np.isnan(meta['meta_effect_log2fc'][g])
+        else:
+            for key in ('meta_effect_log2fc', 'meta_effect_se', 'meta_ci_low', 'meta_ci_high',
+                        'meta_pvalue_re', 'meta_i2'):
+                assert meta[key][g] == pytest.approx(effect[key], rel=1e-9, abs=1e-12)
+
+    np.testing.assert_allclose(meta['meta_fdr_fisher'],
+                               benjamini_hochberg(meta['meta_pvalue_fisher']), equal_nan=True)
+    assert meta['meta_direction'][1] == 'concordant'
@@ -0,0 +1,62 @@
+"""
+Unit tests for NormalizedParquetCache
+"""
+
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import pandas as pd
+
+from utils import normalized_cache
+from utils.normalized_cache import NormalizedParquetCache
+
+
+def _write_source(path: Path):
+    pd.DataFrame({'term_id': ['GO:1', 'GO:2'], 'genes': ['A/B', '']}).to_parquet(path)
+
+
+def test_roundtrip_keeps_gene_sets_and_info(tmp_path):
+    source = tmp_path / "go.parquet"
+    _write_source(source)
+    df = pd.DataFrame({'term_id': ['GO:1', 'GO:2'], '_gene_set': [{'B', 'A'}, set()]})
+
+    cache = NormalizedParquetCache()
+    assert cache.write(source, df, {'gene_id': 'Gene'}, ['Promoter'])
+
+    cached_df, info = cache.read(source)
+    assert cached_df['_gene_set'].tolist() == [['A', 'B'], []]
+    assert info['original_columns'] == {'gene_id': 'Gene'}
+    assert info['annotation_categories'] == ['Promoter']
+
+
+def test_stale_when_source_or_version_changes(tmp_path, monkeypatch):
+    source = tmp_path / "go.parquet"
+    _write_source(source)
+    cache = NormalizedParquetCache()
+    cache.write(source, pd.DataFrame({'term_id': ['GO:1']}))
+    assert cache.read(source) is not None
+
+    monkeypatch.setattr(normalized_cache, 'NORMALIZER_VERSION', normalized_cache.NORMALIZER_VERSION + 1)
+    assert cache.read(source) is None
+    monkeypatch.undo()
+
+    stat = source.stat()
+    os.utime(source, (stat.st_atime, stat.st_mtime + 5))
+    assert cache.read(source) is None
+
+
+def test_stale_when_dataset_type_changes(tmp_path):
+    source = tmp_path / "go.parquet"
+    _write_source(source)
+    cache = NormalizedParquetCache()
+    cache.write(source, pd.DataFrame({'term_id': ['GO:1']}), dataset_type='go_analysis')
+
+    assert cache.read(source, 'go_analysis') is not None
+    assert cache.read(source, 'differential_expression') is None
+    assert cache.read(source) is None
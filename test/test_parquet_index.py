@@ -0,0 +1,71 @@
+"""
+Unit tests for ParquetMetadataIndex
+"""
+
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import numpy as np
+import pandas as pd
+
+from models.data_models import DatasetType
+from utils import parquet_index
+from utils.parquet_index import ParquetMetadataIndex, INDEX_FILENAME
+
+
+def _write_de(path: Path, n: int = 50):
+    df = pd.DataFrame({
+        'gene_id': [f'G{i}' for i in range(n)],
+        'log2fc': np.where(np.arange(n) < 10, 2.0, 0.1),
+        'adj_pvalue': np.where(np.arange(n) < 15, 0.01, 0.5),
+    })
+    df.to_parquet(path)
+
+
+def test_entry_from_footer_and_projection(tmp_path):
+    pq_file = tmp_path / "de.parquet"
+    _write_de(pq_file)
+
+    index = ParquetMetadataIndex(tmp_path)
+    entry = index.get_entry(pq_file)
+
+    assert entry['row_count'] == 50
+    assert entry['columns'] == ['gene_id', 'log2fc', 'adj_pvalue']
+    assert ParquetMetadataIndex.entry_dataset_type(entry) == DatasetType.DIFFERENTIAL_EXPRESSION
+    assert entry['significant_genes'] == 10
+
+
+def test_cached_entry_is_reused_across_instances(tmp_path, monkeypatch):
+    pq_file = tmp_path / "de.parquet"
+    _write_de(pq_file)
+    index = ParquetMetadataIndex(tmp_path)
+    index.get_entry(pq_file)
+    index.save()
+    assert (tmp_path / INDEX_FILENAME).exists()
+
+    calls = []
+    monkeypatch.setattr(parquet_index, 'count_significant',
+                        lambda *a, **k: calls.append(a) or 0)
+    reopened = ParquetMetadataIndex(tmp_path)
+    assert reopened.get_entry(pq_file)['significant_genes'] == 10
+    assert calls == []
+
+
+def test_changed_file_is_reindexed(tmp_path):
+    pq_file = tmp_path / "de.parquet"
+    _write_de(pq_file)
+    index = ParquetMetadataIndex(tmp_path)
+    index.get_entry(pq_file)
+
+    _write_de(pq_file, n=80)
+    stat = pq_file.stat()
+    os.utime(pq_file, (stat.st_atime, stat.st_mtime + 5))
+
+    assert index.get_cached(pq_file) is None
+    assert index.get_entry(pq_file)['row_count'] == 80
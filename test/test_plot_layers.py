@@ -0,0 +1,67 @@
+"""
+Unit tests for the cached scatter data layer
+"""
+
+import io
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from gui.plot_layers import cache_data_layers, reuse_data_layers
+
+
+def _figure():
+    fig = Figure(figsize=(4, 3), dpi=50)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    rng = np.random.default_rng(0)
+    ax.scatter(rng.normal(size=3000), rng.normal(size=3000), s=4, label='a')
+    ax.scatter(rng.normal(size=3000), rng.normal(size=3000), s=4, c='r', label='b')
+    ax.legend()
+    return fig, ax
+
+
+def _pixels(fig):
+    fig.canvas.draw()
+    return np.asarray(fig.canvas.buffer_rgba()).copy()
+
+
+def test_reused_layer_matches_full_draw_and_restyles_on_top():
+    reference, ref_ax = _figure()
+    ref_ax.set_title('restyled')
+
+    fig, ax = _figure()
+    layers = cache_data_layers(fig)
+    assert len(layers) == 1
+    _pixels(fig)
+
+    ax.set_title('restyled')
+    reuse_data_layers(layers)
+    drawn = []
+    for artist in layers[0]._artists:
+        artist.draw = lambda renderer, _draw=artist.draw: (drawn.append(1), _draw(renderer))
+    assert (_pixels(fig) == _pixels(reference)).all()
+    assert drawn == []
+    # 재사용 요청은 한 번의 draw 에만 적용된다
+    _pixels(fig)
+    assert len(drawn) == 2
+
+
+def test_layer_is_skipped_for_small_plots_and_does_not_affect_saving():
+    fig, _ = _figure()
+    assert cache_data_layers(fig, min_points=10_000) == []
+
+    reference, _ = _figure()
+    cache_data_layers(fig)
+    saved, expected = io.BytesIO(), io.BytesIO()
+    fig.savefig(saved, format='png')
+    reference.savefig(expected, format='png')
+    assert saved.getvalue() == expected.getvalue()
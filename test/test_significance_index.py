@@ -0,0 +1,54 @@
+"""
+Unit tests for the memoised significance index
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import numpy as np
+import pandas as pd
+
+from models.data_models import Dataset, DatasetType
+from utils.significance_index import SignificanceIndex
+
+
+def test_significance_index_matches_brute_force():
+    rng = np.random.default_rng(0)
+    lfc = rng.normal(0, 2, 2000)
+    padj = rng.random(2000) ** 3
+    lfc[rng.random(2000) < 0.05] = np.nan
+    padj[rng.random(2000) < 0.05] = np.nan
+    lfc[:10] = 1.0                      # 임계값 경계값
+    padj[10:20] = 0.05
+    index = SignificanceIndex(lfc, padj)
+
+    for padj_max, lfc_min in [(0.05, 1.0), (0.05, 0.0), (1.0, 0.5), (0.001, 2.0), (0.05, 1.0)]:
+        sig = (padj <= padj_max) & (np.abs(lfc) >= lfc_min)
+        up, down = sig & (lfc > 0), sig & (lfc < 0)
+        assert index.counts(padj_max, lfc_min) == (up.sum(), down.sum())
+        assert np.array_equal(index.mask(padj_max, lfc_min), sig)
+        assert np.array_equal(index.mask(padj_max, lfc_min, 'up'), up)
+        assert np.array_equal(index.mask(padj_max, lfc_min, 'down'), down)
+        regulation = index.regulation(padj_max, lfc_min)
+        assert np.array_equal(regulation == 'up', (padj <= padj_max) & (lfc >= lfc_min))
+    assert index.total == int(np.isfinite(lfc).sum())
+
+
+def test_dataset_significance_index_is_cached_until_dataframe_changes():
+    df = pd.DataFrame({'gene_id': ['a', 'b', 'c'], 'log2fc': ['2', 'x', '-3'],
+                       'adj_pvalue': [0.01, 0.01, 0.2]})
+    ds = Dataset(name='A', dataset_type=DatasetType.DIFFERENTIAL_EXPRESSION, dataframe=df)
+
+    index = ds.significance_index()
+    assert ds.significance_index() is index
+    assert np.isnan(ds.numeric_column('log2fc')[1])
+    assert index.counts(0.05, 1.0) == (1, 0)
+
+    ds.dataframe = df.assign(adj_pvalue=[0.01, 0.01, 0.01])
+    assert ds.significance_index() is not index
+    assert ds.significance_index().counts(0.05, 1.0) == (1, 1)
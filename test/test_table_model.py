@@ -0,0 +1,88 @@
+"""
+Unit tests for DataFrameTableModel formatting buffers
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import numpy as np
+import pandas as pd
+from PyQt6.QtCore import Qt
+
+from gui.pandas_table_model import FORMAT_BLOCK_ROWS, DataFrameTableModel, format_float_array
+
+
+def test_format_float_array_scientific_rules():
+    values = np.array([0.0, -0.0, 12.345, 0.5, -0.0123, 0.00031, 1.5e-9, np.nan])
+    assert format_float_array(values, 2, scientific=True) == [
+        "0", "0", "12.35", "0.500", "-0.012", "0.0003", "1.50e-09", "nan",
+    ]
+    assert format_float_array(values[:3], 3, scientific=False) == ["0.000", "-0.000", "12.345"]
+
+
+def test_model_data_matches_cell_formatting():
+    n = FORMAT_BLOCK_ROWS * 2 + 7
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'padj': rng.random(n) * 10.0 ** rng.integers(-8, 2, n),
+        'log2fc': rng.standard_normal(n),
+        'gene': [f'G{i}' for i in range(n)],
+        'count': np.arange(n),
+    })
+    model = DataFrameTableModel(df, 2, ['padj'])
+    for row in (0, FORMAT_BLOCK_ROWS - 1, FORMAT_BLOCK_ROWS, n - 1):
+        for col, name in enumerate(df.columns):
+            expected = model._format(df.iat[row, col], name)
+            assert model.data(model.index(row, col)) == expected
+
+    model.set_params(4)
+    assert model.data(model.index(0, 0)) == f"{df.iat[0, 0]:.4f}"
+
+
+def test_sort_permutes_rows_without_changing_source_frame():
+    df = pd.DataFrame({'padj': [0.3, np.nan, 0.01, 0.3, 0.2], 'gene': list('abcde')})
+    model = DataFrameTableModel(df, 2, ['padj'])
+
+    model.sort(0)
+    assert list(model.dataframe()['gene']) == ['c', 'e', 'a', 'd', 'b']
+    assert [model.source_row(r) for r in range(5)] == [2, 4, 0, 3, 1]
+    assert model.data(model.index(0, 1)) == 'c'
+
+    model.sort(0, Qt.SortOrder.DescendingOrder)
+    assert list(model.dataframe()['gene']) == ['a', 'd', 'e', 'c', 'b']
+    assert list(model._df['gene']) == list('abcde')
+
+
+def test_sort_keeps_previous_order_for_ties():
+    df = pd.DataFrame({'group': ['x', 'y', 'x', 'y', 'x'], 'score': [3, 1, 1, 2, 2]})
+    model = DataFrameTableModel(df)
+
+    model.sort(1)  # score
+    model.sort(0)  # group → 같은 group 안에서는 score 순서 유지
+    assert [model.source_row(r) for r in range(5)] == [2, 4, 0, 1, 3]
+
+    model.sort(1)  # 캐시된 순위 재사용, score 동률은 직전 group 순서 유지
+    model.sort(0, Qt.SortOrder.DescendingOrder)
+    assert [model.source_row(r) for r in range(5)] == [1, 3, 2, 4, 0]
+
+
+def test_search_filter_narrows_rows_and_reuses_previous_matches():
+    df = pd.DataFrame({'symbol': ['Actb', 'ACTA2', 'Gapdh', None, 'actn1'],
+                       'log2fc': [1.0, -2.0, 0.5, 3.0, -1.0]})
+    model = DataFrameTableModel(df)
+    model.sort(1)
+
+    assert model.set_search_filter('symbol', 'act') == 3
+    assert [model.source_row(r) for r in range(model.rowCount())] == [1, 4, 0]
+    assert model.set_search_filter('symbol', 'actn') == 1
+    assert model.data(model.index(0, 0)) == 'actn1'
+    assert model.set_search_filter('symbol', 'GAP') == 1
+
+    model.clear_search_filter()
+    assert model.rowCount() == 5
+    assert len(model.dataframe()) == 5